@@ -9,7 +9,14 @@ a = Analysis(
         ('cvextract/contracts/*.json', 'cvextract/contracts'),
         ('cvextract/ml_adjustment/prompts/*.md', 'cvextract/ml_adjustment/prompts'),
     ],
-    hiddenimports=[],
+    hiddenimports=[
+        # Plugins registered as lazy "module:Class" entry points
+        'cvextract.adjusters.openai_company_research_adjuster',
+        'cvextract.adjusters.openai_job_specific_adjuster',
+        'cvextract.adjusters.openai_translate_adjuster',
+        'cvextract.extractors.openai_extractor',
+        'cvextract.renderers.docx_renderer',
+    ],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
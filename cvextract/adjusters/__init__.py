@@ -2,23 +2,49 @@
 CV adjustment interfaces and implementations.
 
 This module provides pluggable and interchangeable CV adjusters with a registry system.
+
+Built-in adjusters are registered as entry points and imported on first use,
+so importing this package does not pull in openai or requests.
 """
 
+from ..shared import load_entry_point
 from .base import CVAdjuster
-from .openai_company_research_adjuster import OpenAICompanyResearchAdjuster
-from .openai_job_specific_adjuster import OpenAIJobSpecificAdjuster
-from .openai_translate_adjuster import OpenAITranslateAdjuster
 from .adjuster_registry import (
     register_adjuster,
     get_adjuster,
     list_adjusters,
 )
 
+_LAZY_EXPORTS = {
+    "OpenAICompanyResearchAdjuster": "cvextract.adjusters.openai_company_research_adjuster:OpenAICompanyResearchAdjuster",
+    "OpenAIJobSpecificAdjuster": "cvextract.adjusters.openai_job_specific_adjuster:OpenAIJobSpecificAdjuster",
+    "OpenAITranslateAdjuster": "cvextract.adjusters.openai_translate_adjuster:OpenAITranslateAdjuster",
+}
+
 
 # Register built-in adjusters
-register_adjuster(OpenAICompanyResearchAdjuster)
-register_adjuster(OpenAIJobSpecificAdjuster)
-register_adjuster(OpenAITranslateAdjuster)
+register_adjuster(
+    _LAZY_EXPORTS["OpenAICompanyResearchAdjuster"],
+    name="openai-company-research",
+    description="Adjusts CV based on target company research using OpenAI",
+)
+register_adjuster(
+    _LAZY_EXPORTS["OpenAIJobSpecificAdjuster"],
+    name="openai-job-specific",
+    description="Adjusts CV based on a specific job description using OpenAI",
+)
+register_adjuster(
+    _LAZY_EXPORTS["OpenAITranslateAdjuster"],
+    name="openai-translate",
+    description="Translates CV JSON to a target language using OpenAI",
+)
+
+
+def __getattr__(name: str):
+    entry_point = _LAZY_EXPORTS.get(name)
+    if entry_point is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return load_entry_point(entry_point)
 
 
 __all__ = [
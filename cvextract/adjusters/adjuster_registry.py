@@ -7,25 +7,57 @@ different adjustment strategies via the CLI.
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Type
+from typing import Dict, List, Optional, Type, Union
 
+from ..shared import load_entry_point
 from .base import CVAdjuster
 
-# Global adjuster registry
-_ADJUSTER_REGISTRY: Dict[str, Type[CVAdjuster]] = {}
+# Global adjuster registry (classes, or lazy "module:Class" entry points)
+_ADJUSTER_REGISTRY: Dict[str, Union[Type[CVAdjuster], str]] = {}
+_ADJUSTER_DESCRIPTIONS: Dict[str, str] = {}
 
 
-def register_adjuster(adjuster_class: Type[CVAdjuster]) -> None:
+def register_adjuster(
+    adjuster_class: Union[Type[CVAdjuster], str],
+    *,
+    name: Optional[str] = None,
+    description: Optional[str] = None,
+) -> None:
     """
     Register an adjuster class in the global registry.
 
     Args:
-        adjuster_class: The adjuster class to register
+        adjuster_class: The adjuster class to register, or a "module:Class"
+            entry point that is imported on first use
+        name: Adjuster name; required for entry points
+        description: Description for list_adjusters(); required for entry
+            points so listing does not import them
     """
+    if isinstance(adjuster_class, str):
+        if not name or description is None:
+            raise ValueError(
+                "Lazy adjuster registration requires a name and description"
+            )
+        _ADJUSTER_REGISTRY[name] = adjuster_class
+        _ADJUSTER_DESCRIPTIONS[name] = description
+        return
+
     # Create temporary instance to get name
     instance = adjuster_class()
-    name = instance.name()
+    name = name or instance.name()
     _ADJUSTER_REGISTRY[name] = adjuster_class
+    _ADJUSTER_DESCRIPTIONS[name] = (
+        description if description is not None else instance.description()
+    )
+
+
+def _resolve_adjuster(name: str) -> Optional[Type[CVAdjuster]]:
+    """Return the registered class, importing a lazy entry point on first use."""
+    entry = _ADJUSTER_REGISTRY.get(name)
+    if isinstance(entry, str):
+        entry = load_entry_point(entry)
+        _ADJUSTER_REGISTRY[name] = entry
+    return entry
 
 
 def get_adjuster(name: str, **kwargs) -> Optional[CVAdjuster]:
@@ -39,7 +71,7 @@ def get_adjuster(name: str, **kwargs) -> Optional[CVAdjuster]:
     Returns:
         Adjuster instance, or None if not found
     """
-    adjuster_class = _ADJUSTER_REGISTRY.get(name)
+    adjuster_class = _resolve_adjuster(name)
     if adjuster_class:
         return adjuster_class(**kwargs)
     return None
@@ -53,9 +85,8 @@ def list_adjusters() -> List[Dict[str, str]]:
         List of dicts with 'name' and 'description' keys
     """
     adjusters = []
-    for name, adjuster_class in _ADJUSTER_REGISTRY.items():
-        instance = adjuster_class()
-        adjusters.append({"name": name, "description": instance.description()})
+    for name in _ADJUSTER_REGISTRY:
+        adjusters.append({"name": name, "description": _ADJUSTER_DESCRIPTIONS[name]})
     return sorted(adjusters, key=lambda x: x["name"])
 
 
@@ -67,6 +98,7 @@ def unregister_adjuster(name: str) -> None:
         name: The adjuster name to unregister
     """
     _ADJUSTER_REGISTRY.pop(name, None)
+    _ADJUSTER_DESCRIPTIONS.pop(name, None)
 
 
 __all__ = [
@@ -0,0 +1,131 @@
+"""
+JSON Patch (RFC 6902) for adjuster replies in patch mode.
+
+Instead of echoing the whole adjusted CV, the model returns the changes
+against the original JSON. Supported operations are `add`, `remove`,
+`replace`, `move` and `copy` with JSON Pointer (RFC 6901) paths; a plain
+{"/path": value} map is accepted as a list of `replace` operations.
+Patches are applied to a copy, so a failing patch leaves the original
+untouched.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Any, Dict, List, Tuple
+
+
+class JsonPatchError(ValueError):
+    """A patch is malformed or does not apply to the document."""
+
+
+def _parse_pointer(path: Any) -> List[str]:
+    if not isinstance(path, str) or (path and not path.startswith("/")):
+        raise JsonPatchError(f"invalid path: {path!r}")
+    if not path:
+        return []
+    return [
+        token.replace("~1", "/").replace("~0", "~") for token in path[1:].split("/")
+    ]
+
+
+def _index(container: List[Any], token: str, *, append: bool) -> int:
+    if append and token == "-":
+        return len(container)
+    if not token.isdigit() or (token != "0" and token.startswith("0")):
+        raise JsonPatchError(f"invalid array index: {token!r}")
+    idx = int(token)
+    if idx > len(container) or (idx == len(container) and not append):
+        raise JsonPatchError(f"array index out of range: {idx}")
+    return idx
+
+
+def _resolve(doc: Any, tokens: List[str]) -> Any:
+    node = doc
+    for token in tokens:
+        if isinstance(node, dict):
+            if token not in node:
+                raise JsonPatchError(f"missing key: {token!r}")
+            node = node[token]
+        elif isinstance(node, list):
+            node = node[_index(node, token, append=False)]
+        else:
+            raise JsonPatchError(f"cannot descend into {type(node).__name__}")
+    return node
+
+
+def _parent(doc: Any, path: Any) -> Tuple[Any, str]:
+    tokens = _parse_pointer(path)
+    if not tokens:
+        raise JsonPatchError("the document root cannot be patched")
+    return _resolve(doc, tokens[:-1]), tokens[-1]
+
+
+def _add(doc: Any, path: Any, value: Any) -> None:
+    parent, token = _parent(doc, path)
+    if isinstance(parent, dict):
+        parent[token] = value
+    elif isinstance(parent, list):
+        parent.insert(_index(parent, token, append=True), value)
+    else:
+        raise JsonPatchError(f"cannot add to {type(parent).__name__}")
+
+
+def _remove(doc: Any, path: Any) -> Any:
+    parent, token = _parent(doc, path)
+    if isinstance(parent, dict):
+        if token not in parent:
+            raise JsonPatchError(f"missing key: {token!r}")
+        return parent.pop(token)
+    if isinstance(parent, list):
+        return parent.pop(_index(parent, token, append=False))
+    raise JsonPatchError(f"cannot remove from {type(parent).__name__}")
+
+
+def _replace(doc: Any, path: Any, value: Any) -> None:
+    parent, token = _parent(doc, path)
+    if isinstance(parent, dict):
+        if token not in parent:
+            raise JsonPatchError(f"missing key: {token!r}")
+        parent[token] = value
+    elif isinstance(parent, list):
+        parent[_index(parent, token, append=False)] = value
+    else:
+        raise JsonPatchError(f"cannot replace in {type(parent).__name__}")
+
+
+def as_operations(patch: Any) -> List[Dict[str, Any]]:
+    """Normalize a patch (operation list or path -> value map) to operations."""
+    if isinstance(patch, dict):
+        return [{"op": "replace", "path": p, "value": v} for p, v in patch.items()]
+    if not isinstance(patch, list) or not all(isinstance(op, dict) for op in patch):
+        raise JsonPatchError("patch must be a list of operations or a path map")
+    return patch
+
+
+def apply_json_patch(doc: Dict[str, Any], patch: Any) -> Dict[str, Any]:
+    """Return a patched copy of doc; raises JsonPatchError if it does not apply."""
+    result = copy.deepcopy(doc)
+    for op in as_operations(patch):
+        name = op.get("op")
+        path = op.get("path")
+        if name in ("add", "replace") and "value" not in op:
+            raise JsonPatchError(f"{name} of {path!r} has no value")
+        if name == "add":
+            _add(result, path, copy.deepcopy(op["value"]))
+        elif name == "replace":
+            _replace(result, path, copy.deepcopy(op["value"]))
+        elif name == "remove":
+            _remove(result, path)
+        elif name == "move":
+            source = op.get("from")
+            if isinstance(path, str) and isinstance(source, str):
+                if path.startswith(source + "/"):
+                    raise JsonPatchError(f"cannot move {source!r} into itself")
+            _add(result, path, _remove(result, source))
+        elif name == "copy":
+            value = _resolve(result, _parse_pointer(op.get("from")))
+            _add(result, path, copy.deepcopy(value))
+        else:
+            raise JsonPatchError(f"unsupported operation: {name!r}")
+    return result
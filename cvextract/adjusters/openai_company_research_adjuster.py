@@ -11,6 +11,8 @@ Improvements included:
 - Optional deterministic retry/jitter for tests
 - Fixes small prompt template typo compatibility (keeps legacy key)
 - Better schema loading + validation guardrails
+- Patch mode (``patch`` flag): the model returns a JSON Patch against the
+  original CV instead of the whole adjusted CV
 """
 
 from __future__ import annotations
@@ -18,7 +20,7 @@ from __future__ import annotations
 import json
 import logging
 import os
-import tempfile
+import threading
 import time
 from pathlib import Path
 from typing import Any, Callable, Dict, Optional
@@ -33,21 +35,41 @@ try:
 except Exception:  # pragma: no cover
     requests = None  # type: ignore
 
+from ..llm_cache import LLMResponseCache, llm_cache_for
+from ..request_policy import (
+    CircuitBreaker,
+    HedgePolicy,
+    RetryBudget,
+    circuit_breaker_for,
+    hedge_policy_for,
+    request_pool_for,
+    request_slots_for,
+    retry_budget_for,
+    step_deadline,
+)
 from ..shared import (
+    OpenAIUsage,
+    StepName,
     UnitOfWork,
     format_prompt,
     load_input_json,
+    load_prompt,
     url_to_cache_filename,
     write_output_json,
 )
+from ..verifiers.schema_validator import get_schema_validator
 from .base import CVAdjuster
 from .openai_utils import OpenAIRetry as _OpenAIRetry
 from .openai_utils import RetryConfig as _RetryConfig
+from .openai_utils import StructuredOutput
+from .openai_utils import adjust_usage as _adjust_usage
+from .openai_utils import apply_patch_reply
+from .openai_utils import atomic_write_json as _atomic_write_json
 from .openai_utils import extract_json_object as _extract_json_object
-from .openai_utils import (
-    get_cached_resource_path,
-)
+from .openai_utils import get_cached_resource_path
 from .openai_utils import strip_markdown_fences as _strip_markdown_fences
+from .openai_utils import structured_output_for
+from .token_budget import PayloadBudget, compact_json
 
 LOG = logging.getLogger("cvextract")
 
@@ -58,19 +80,6 @@ _RESEARCH_SCHEMA: Optional[Dict[str, Any]] = None
 _SCHEMA_PATH = get_cached_resource_path("research_schema.json")
 
 
-def _atomic_write_json(path: Path, data: Dict[str, Any]) -> None:
-    """Write JSON atomically to avoid cache corruption on crash."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with tempfile.NamedTemporaryFile(
-        "w", delete=False, encoding="utf-8", dir=str(path.parent)
-    ) as tmp:
-        json.dump(data, tmp, ensure_ascii=False, indent=2)
-        tmp.flush()
-        os.fsync(tmp.fileno())
-        tmp_path = Path(tmp.name)
-    tmp_path.replace(path)
-
-
 def _load_cached_research(cache_path: Path) -> Optional[Dict[str, Any]]:
     if not cache_path.exists():
         return None
@@ -132,7 +141,8 @@ def _validate_research_data(data: Any) -> bool:
     """
     Validate that research data conforms to the company profile schema.
 
-    Uses built-in checks against research_schema.json requirements.
+    Uses the compiled research_schema.json validator; optional fields may be
+    null since models often report unknown values that way.
     """
     if not isinstance(data, dict):
         return False
@@ -142,163 +152,11 @@ def _validate_research_data(data: Any) -> bool:
         LOG.warning("Failed to load research schema for validation")
         return False
 
-    errs: list[str] = []
-    required_fields = set(schema.get("required", []))
-    required_fields.update({"name", "domains"})
-    for field in sorted(required_fields):
-        if field not in data:
+    errs = get_schema_validator(schema, nullable_optional=True)(data)
+    # The adjustment prompt relies on these even if a custom schema omits them.
+    for field in ("name", "domains"):
+        if field not in data and field not in schema.get("required", []):
             errs.append(f"missing required field: {field}")
-
-    if "name" in data:
-        if not isinstance(data["name"], str):
-            errs.append("name must be a string")
-        elif not data["name"]:
-            errs.append("name must be a non-empty string")
-
-    if "description" in data:
-        if data["description"] is not None and not isinstance(data["description"], str):
-            errs.append("description must be a string or null")
-
-    if "domains" in data:
-        domains = data["domains"]
-        if not isinstance(domains, list):
-            errs.append("domains must be an array")
-        else:
-            if not domains:
-                errs.append("domains must have at least one item")
-            elif not all(isinstance(d, str) for d in domains):
-                errs.append("domains items must be strings")
-
-    if "technology_signals" in data:
-        signals = data["technology_signals"]
-        if not isinstance(signals, list):
-            errs.append("technology_signals must be an array")
-        else:
-            for idx, signal in enumerate(signals):
-                if not isinstance(signal, dict):
-                    errs.append(f"technology_signals[{idx}] must be an object")
-                    continue
-
-                if "technology" not in signal:
-                    errs.append(
-                        f"technology_signals[{idx}] missing required field: technology"
-                    )
-                elif not isinstance(signal["technology"], str):
-                    errs.append(
-                        f"technology_signals[{idx}].technology must be a string"
-                    )
-
-                if "category" in signal and signal["category"] is not None:
-                    if not isinstance(signal["category"], str):
-                        errs.append(
-                            f"technology_signals[{idx}].category must be a string or null"
-                        )
-
-                if "interest_level" in signal:
-                    if signal["interest_level"] not in [
-                        None,
-                        "low",
-                        "medium",
-                        "high",
-                    ]:
-                        errs.append(
-                            f"technology_signals[{idx}].interest_level must be 'low', 'medium', 'high', or null"
-                        )
-
-                if "confidence" in signal:
-                    conf = signal["confidence"]
-                    if not isinstance(conf, (int, float)) or conf < 0 or conf > 1:
-                        errs.append(
-                            f"technology_signals[{idx}].confidence must be a number between 0 and 1"
-                        )
-
-                if "signals" in signal:
-                    sigs = signal["signals"]
-                    if not isinstance(sigs, list):
-                        errs.append(
-                            f"technology_signals[{idx}].signals must be an array"
-                        )
-                    elif not all(isinstance(s, str) for s in sigs):
-                        errs.append(
-                            f"technology_signals[{idx}].signals items must be strings"
-                        )
-
-                if "notes" in signal and signal["notes"] is not None:
-                    if not isinstance(signal["notes"], str):
-                        errs.append(
-                            f"technology_signals[{idx}].notes must be a string or null"
-                        )
-
-    if "industry_classification" in data:
-        ic = data["industry_classification"]
-        if ic is not None and not isinstance(ic, dict):
-            errs.append("industry_classification must be an object or null")
-        elif isinstance(ic, dict):
-            if (
-                "naics" in ic
-                and ic["naics"] is not None
-                and not isinstance(ic["naics"], str)
-            ):
-                errs.append("industry_classification.naics must be a string or null")
-            if "sic" in ic and ic["sic"] is not None and not isinstance(ic["sic"], str):
-                errs.append("industry_classification.sic must be a string or null")
-
-    if "founded_year" in data:
-        year = data["founded_year"]
-        if year is not None:
-            if not isinstance(year, int) or year < 1600 or year > 2100:
-                errs.append("founded_year must be an integer between 1600 and 2100")
-
-    if "headquarters" in data:
-        hq = data["headquarters"]
-        if hq is not None and not isinstance(hq, dict):
-            errs.append("headquarters must be an object or null")
-        elif isinstance(hq, dict):
-            if "country" not in hq:
-                errs.append("headquarters missing required field: country")
-            if (
-                "city" in hq
-                and hq["city"] is not None
-                and not isinstance(hq["city"], str)
-            ):
-                errs.append("headquarters.city must be a string or null")
-            if (
-                "state" in hq
-                and hq["state"] is not None
-                and not isinstance(hq["state"], str)
-            ):
-                errs.append("headquarters.state must be a string or null")
-            if (
-                "country" in hq
-                and hq["country"] is not None
-                and not isinstance(hq["country"], str)
-            ):
-                errs.append("headquarters.country must be a string or null")
-
-    if "company_size" in data:
-        size = data["company_size"]
-        if size not in [None, "solo", "small", "medium", "large", "enterprise"]:
-            errs.append(
-                "company_size must be 'solo', 'small', 'medium', 'large', 'enterprise', or null"
-            )
-
-    if "employee_count" in data:
-        count = data["employee_count"]
-        if count is not None:
-            if not isinstance(count, int) or count < 1:
-                errs.append("employee_count must be a positive integer or null")
-
-    if "ownership_type" in data:
-        ot = data["ownership_type"]
-        if ot not in [None, "private", "public", "nonprofit", "government"]:
-            errs.append(
-                "ownership_type must be 'private', 'public', 'nonprofit', 'government', or null"
-            )
-
-    if "website" in data:
-        if data["website"] is not None and not isinstance(data["website"], str):
-            errs.append("website must be a string or null")
-
     if errs:
         LOG.warning("Company research validation failed (%d errors)", len(errs))
         return False
@@ -314,10 +172,20 @@ def _research_company_profile(
     retry: Optional[_RetryConfig] = None,
     sleep: Callable[[float], None] = time.sleep,
     request_timeout_s: float = 60.0,
+    usage: Optional[OpenAIUsage] = None,
+    cache: Optional[LLMResponseCache] = None,
+    hedge: Optional[HedgePolicy] = None,
+    deadline: Optional[float] = None,
+    breaker: Optional[CircuitBreaker] = None,
+    budget: Optional[RetryBudget] = None,
+    slots: Optional[threading.Semaphore] = None,
+    structured: Optional[StructuredOutput] = None,
 ) -> Optional[Dict[str, Any]]:
     """
     Research a company profile from its URL using OpenAI.
 
+    With structured, the reply is constrained to research_schema.json.
+
     Returns:
         Dict containing company profile data, or None if research fails
     """
@@ -333,25 +201,34 @@ def _research_company_profile(
     research_prompt = format_prompt(
         "website_analysis_prompt",
         customer_url=customer_url,
-        schema=json.dumps(schema, indent=2),
+        schema=compact_json(schema),
     )
     if not research_prompt:
         LOG.warning("Company research skipped: failed to load prompt template")
         return None
 
     client = OpenAI(api_key=api_key)
-    retryer = _OpenAIRetry(retry=retry or _RetryConfig(), sleep=sleep)
+    retryer = _OpenAIRetry(
+        retry=retry or _RetryConfig(),
+        sleep=sleep,
+        usage=usage,
+        cache=cache,
+        hedge=hedge,
+        deadline=deadline,
+        breaker=breaker,
+        budget=budget,
+        slots=slots,
+    )
 
     try:
-        completion = retryer.call(
-            lambda: client.chat.completions.create(
-                model=model,
-                messages=[{"role": "user", "content": research_prompt}],
-                temperature=0.2,
-                timeout=float(request_timeout_s),
-            ),
-            is_write=True,
+        completion = retryer.create_completion(
+            client,
             op_name="Company research completion",
+            model=model,
+            messages=[{"role": "user", "content": research_prompt}],
+            temperature=0.2,
+            timeout=float(request_timeout_s),
+            **(structured.request if structured else {}),
         )
     except Exception as e:
         LOG.warning("Company research error (%s)", type(e).__name__)
@@ -378,10 +255,14 @@ def _research_company_profile(
 
     research_data = _extract_json_object(content)
     if not research_data:
+        retryer.record_fallback()
         LOG.warning("Company research: invalid JSON response")
         return None
+    if structured:
+        research_data = structured.clean(research_data)
 
     if not _validate_research_data(research_data):
+        retryer.record_fallback()
         LOG.warning("Company research: response failed schema validation")
         return None
 
@@ -459,6 +340,15 @@ class OpenAICompanyResearchAdjuster(CVAdjuster):
                 retry=self._retry,
                 sleep=self._sleep,
                 request_timeout_s=self._request_timeout_s,
+                usage=_adjust_usage(work),
+                cache=llm_cache_for(work),
+                hedge=hedge_policy_for(work),
+                deadline=step_deadline(work, StepName.Adjust),
+                breaker=circuit_breaker_for(work),
+                budget=retry_budget_for(work),
+                slots=request_slots_for(work),
+                pool=request_pool_for(work),
+                structured=structured_output_for(work, "research_schema.json"),
             )
             if research_data:
                 _cache_research_data(cache_path, research_data)
@@ -530,33 +420,59 @@ class OpenAICompanyResearchAdjuster(CVAdjuster):
             )
             return write_output_json(work, cv_data)
 
+        patch_prompt = None
+        if "patch" in kwargs:
+            patch_prompt = load_prompt("adjuster_prompt_patch")
+            if not patch_prompt:
+                LOG.warning(
+                    "Company research adjust: failed to load patch prompt; "
+                    "requesting the full CV."
+                )
+
         # Step 4: Create user payload with research data and cv_data
         user_payload = {
             "company_research": research_data,
             "original_json": cv_data,
-            "adjusted_json": "",
         }
+        if not patch_prompt:
+            user_payload["adjusted_json"] = ""
+        budget = PayloadBudget(self._model, system_prompt, user_payload)
+        user_payload = budget.fit()
+        messages = [{"role": "system", "content": system_prompt}]
+        if patch_prompt:
+            messages.append({"role": "system", "content": patch_prompt})
+        messages.append(
+            {"role": "user", "content": json.dumps(user_payload, ensure_ascii=False)}
+        )
 
         client = OpenAI(api_key=self._api_key)
-        retryer = _OpenAIRetry(retry=self._retry, sleep=self._sleep)
+        retryer = _OpenAIRetry(
+            retry=self._retry,
+            sleep=self._sleep,
+            usage=_adjust_usage(work),
+            cache=llm_cache_for(work),
+            hedge=hedge_policy_for(work),
+            deadline=step_deadline(work, StepName.Adjust),
+            breaker=circuit_breaker_for(work),
+            budget=retry_budget_for(work),
+            slots=request_slots_for(work),
+            pool=request_pool_for(work),
+        )
 
         # Step 5: Call OpenAI (with retries)
+        # A patch reply does not have the shape of the CV schema
+        structured = (
+            None if patch_prompt else structured_output_for(work, "cv_schema.json")
+        )
         try:
-            completion = retryer.call(
-                lambda: client.chat.completions.create(
-                    model=self._model,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {
-                            "role": "user",
-                            "content": json.dumps(user_payload, ensure_ascii=False),
-                        },
-                    ],
-                    temperature=0.2,
-                    timeout=float(self._request_timeout_s),
-                ),
-                is_write=True,
+            completion = retryer.create_completion(
+                client,
                 op_name="Company research adjust completion",
+                model=self._model,
+                messages=messages,
+                temperature=0.2,
+                timeout=float(self._request_timeout_s),
+                **(structured.request if structured else {}),
             )
         except Exception as e:
             LOG.warning(
@@ -577,12 +493,26 @@ class OpenAICompanyResearchAdjuster(CVAdjuster):
             LOG.warning("Company research adjust: empty response; using original CV.")
             return write_output_json(work, cv_data)
 
+        if patch_prompt:
+            adjusted = apply_patch_reply(content, user_payload["original_json"])
+            if adjusted is None:
+                retryer.record_fallback()
+                LOG.warning(
+                    "Company research adjust: unusable patch response; using original CV."
+                )
+                return write_output_json(work, cv_data)
+            LOG.info("The CV was adjusted to better fit the target company.")
+            return write_output_json(work, budget.restore(adjusted))
+
         adjusted = _extract_json_object(content)
         if adjusted is None:
+            retryer.record_fallback()
             LOG.warning(
                 "Company research adjust: failed to parse JSON response; using original CV."
             )
             return write_output_json(work, cv_data)
+        if structured:
+            adjusted = structured.clean(adjusted)
 
         # Step 6: Validate adjusted CV against schema
         if not isinstance(adjusted, dict):
@@ -592,4 +522,4 @@ class OpenAICompanyResearchAdjuster(CVAdjuster):
             return write_output_json(work, cv_data)
 
         LOG.info("The CV was adjusted to better fit the target company.")
-        return write_output_json(work, adjusted)
+        return write_output_json(work, budget.restore(adjusted))
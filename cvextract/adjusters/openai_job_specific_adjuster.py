@@ -9,8 +9,20 @@ Improvements included:
 - Removes stacked retry layers (SDK max_retries + custom loop) to avoid retry storms
 - Safer JSON extraction from model output (handles fenced blocks and extra text)
 - Better HTML cleaning and length limiting for fetched job descriptions
+- In-memory + on-disk job description cache with conditional (ETag/Last-Modified)
+  revalidation over a pooled HTTP session
 - Prompt template key fallback (typo + corrected name)
 - Test seams: injectable sleep + deterministic jitter option
+- Bulk mode (``bulk`` flag): a cache-friendly prompt with the job description
+  first and the CV last, optionally packing small CVs processed concurrently
+  into one request (``pack=<n>``); packed replies are checked CV by CV and
+  cached prompt tokens are counted in the step usage
+- Patch mode (``patch`` flag): the model returns a JSON Patch against the
+  original CV instead of the whole adjusted CV; it is applied and
+  schema-validated locally
+- Relevance pre-ranking (``top-experiences=<n>``, ``top-bullets=<n>``): only
+  the content scoring highest against the job (BM25) is sent; the rest is
+  spliced back into the adjusted CV
 """
 
 from __future__ import annotations
@@ -19,8 +31,11 @@ import json
 import logging
 import os
 import re
+import threading
 import time
-from typing import Any, Callable, Dict, Optional
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 try:
     import requests  # type: ignore
@@ -32,15 +47,46 @@ try:
 except Exception:  # pragma: no cover
     OpenAI = None  # type: ignore
 
-from ..shared import UnitOfWork, format_prompt, load_input_json, write_output_json
+from ..llm_cache import llm_cache_for
+from ..request_policy import (
+    circuit_breaker_for,
+    hedge_policy_for,
+    request_pool_for,
+    request_slots_for,
+    retry_budget_for,
+    step_deadline,
+)
+from ..shared import (
+    OpenAIUsage,
+    StepName,
+    UnitOfWork,
+    format_prompt,
+    load_input_json,
+    load_prompt,
+    url_to_cache_filename,
+    write_output_json,
+)
+from ..verifiers.schema_validator import get_schema_validator
 from .base import CVAdjuster
 from .openai_utils import OpenAIRetry as _OpenAIRetry
 from .openai_utils import RetryConfig as _RetryConfig
+from .openai_utils import StructuredOutput
+from .openai_utils import adjust_usage as _adjust_usage
+from .openai_utils import apply_patch_reply
+from .openai_utils import atomic_write_json as _atomic_write_json
+from .openai_utils import completion_usage as _completion_usage
 from .openai_utils import extract_json_object as _extract_json_object
-from .openai_utils import (
-    get_cached_resource_path,
-)
+from .openai_utils import get_cached_resource_path
 from .openai_utils import strip_markdown_fences as _strip_markdown_fences
+from .openai_utils import structured_output_for
+from .relevance import RelevanceFilter
+from .token_budget import (
+    PayloadBudget,
+    compact_json,
+    estimate_tokens,
+    text_budget,
+    truncate_to_tokens,
+)
 
 LOG = logging.getLogger("cvextract")
 
@@ -50,6 +96,9 @@ _CV_SCHEMA: Optional[Dict[str, Any]] = None
 
 _SCHEMA_PATH = get_cached_resource_path("cv_schema.json")
 
+# Cap on the job description embedded in the prompt (lowered for small models)
+_JOB_DESCRIPTION_MAX_TOKENS = 3000
+
 
 def _load_cv_schema() -> Optional[Dict[str, Any]]:
     """Load the CV schema from file (cached)."""
@@ -68,62 +117,347 @@ def _load_cv_schema() -> Optional[Dict[str, Any]]:
         return None
 
 
-def _fetch_job_description(url: str) -> str:
+def _clean_job_html(html: str) -> str:
+    """
+    Extract and clean text content from a job description HTML page.
+
+    Returns:
+        Cleaned text content (at most _JOB_DESCRIPTION_MAX_TOKENS tokens).
+    """
+    # Remove script/style/noscript
+    html = re.sub(
+        r"<script[^>]*>.*?</script>", "", html, flags=re.DOTALL | re.IGNORECASE
+    )
+    html = re.sub(r"<style[^>]*>.*?</style>", "", html, flags=re.DOTALL | re.IGNORECASE)
+    html = re.sub(
+        r"<noscript[^>]*>.*?</noscript>", "", html, flags=re.DOTALL | re.IGNORECASE
+    )
+
+    # Strip tags
+    text = re.sub(r"<[^>]+>", " ", html)
+
+    # Decode common HTML entities lightly (no extra deps)
+    text = (
+        text.replace("&nbsp;", " ")
+        .replace("&amp;", "&")
+        .replace("&lt;", "<")
+        .replace("&gt;", ">")
+        .replace("&quot;", '"')
+        .replace("&#39;", "'")
+    )
+
+    # Collapse whitespace
+    text = re.sub(r"\s+", " ", text).strip()
+
+    # Limit to avoid token blowups
+    return truncate_to_tokens(text, _JOB_DESCRIPTION_MAX_TOKENS) if text else ""
+
+
+# Pooled HTTP session shared by all job description fetches in this process
+_HTTP_SESSION: Optional[Any] = None
+_HTTP_SESSION_LOCK = threading.Lock()
+
+# In-memory cache of cleaned job descriptions, keyed by URL, with the
+# time.monotonic() each was last fetched or revalidated
+_JOB_DESCRIPTION_CACHE: Dict[str, Dict[str, Any]] = {}
+_JOB_DESCRIPTION_CHECKED_AT: Dict[str, float] = {}
+# In-memory entries older than this are revalidated (long-running server mode)
+_JOB_DESCRIPTION_TTL_S = 600.0
+_JOB_DESCRIPTION_LOCKS: Dict[str, threading.Lock] = {}
+_JOB_DESCRIPTION_LOCKS_GUARD = threading.Lock()
+
+
+def _get_http_session() -> Any:
+    """Return the process-wide pooled requests session (created lazily)."""
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        with _HTTP_SESSION_LOCK:
+            if _HTTP_SESSION is None:
+                _HTTP_SESSION = requests.Session()
+    return _HTTP_SESSION
+
+
+def _job_description_lock(url: str) -> threading.Lock:
+    with _JOB_DESCRIPTION_LOCKS_GUARD:
+        lock = _JOB_DESCRIPTION_LOCKS.get(url)
+        if lock is None:
+            lock = threading.Lock()
+            _JOB_DESCRIPTION_LOCKS[url] = lock
+        return lock
+
+
+def _remember_job_description(url: str, entry: Dict[str, Any]) -> str:
+    _JOB_DESCRIPTION_CACHE[url] = entry
+    _JOB_DESCRIPTION_CHECKED_AT[url] = time.monotonic()
+    return entry["text"]
+
+
+def _load_cached_job_description(cache_path: Path) -> Optional[Dict[str, Any]]:
+    if not cache_path.exists():
+        return None
+    try:
+        with cache_path.open("r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except Exception as e:
+        LOG.warning("Failed to load cached job description (%s)", type(e).__name__)
+        return None
+    if not isinstance(entry, dict) or not isinstance(entry.get("text"), str):
+        return None
+    return entry
+
+
+def _cache_job_description(cache_path: Path, entry: Dict[str, Any]) -> None:
+    try:
+        _atomic_write_json(cache_path, entry)
+    except Exception as e:
+        LOG.warning("Failed to cache job description (%s)", type(e).__name__)
+
+
+def _fetch_job_description(url: str, cache_dir: Optional[Path] = None) -> str:
     """
     Fetch job description from URL and extract/clean text content.
 
+    Cleaned descriptions are cached in memory and, when cache_dir is given,
+    on disk together with the ETag/Last-Modified validators. A disk-cached
+    entry is revalidated with a conditional GET once per process, an
+    in-memory entry once it is older than _JOB_DESCRIPTION_TTL_S; a 304
+    response reuses the cached text.
+
     Returns:
-        Cleaned text content (max 5000 chars), or empty string if fetch fails.
+        Cleaned text content, or empty string if fetch fails.
     """
     if not requests:
         return ""
-    try:
-        resp = requests.get(
-            url,
-            timeout=15,
-            headers={
-                "User-Agent": "cvextract/1.0 (+https://example.invalid)",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            },
+
+    with _job_description_lock(url):
+        cached = _JOB_DESCRIPTION_CACHE.get(url)
+        checked_at = _JOB_DESCRIPTION_CHECKED_AT.get(url, float("-inf"))
+        if (
+            cached is not None
+            and time.monotonic() - checked_at < _JOB_DESCRIPTION_TTL_S
+        ):
+            return cached["text"]
+
+        cache_path = (
+            cache_dir / url_to_cache_filename(url, kind="job") if cache_dir else None
         )
+        if cached is None and cache_path:
+            cached = _load_cached_job_description(cache_path)
+
+        headers = {
+            "User-Agent": "cvextract/1.0 (+https://example.invalid)",
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        }
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        try:
+            resp = _get_http_session().get(url, timeout=15, headers=headers)
+        except Exception:
+            if cached:
+                LOG.warning("Job description fetch failed; using cached copy")
+                return _remember_job_description(url, cached)
+            return ""
+
+        if resp.status_code == 304 and cached:
+            LOG.info("Job description not modified; using cached copy")
+            return _remember_job_description(url, cached)
+
         if resp.status_code != 200:
+            if cached:
+                LOG.warning(
+                    "Job description fetch returned HTTP %s; using cached copy",
+                    resp.status_code,
+                )
+                return _remember_job_description(url, cached)
             return ""
 
-        html = resp.text or ""
-        if not html:
+        try:
+            html = resp.text or ""
+            text = _clean_job_html(html) if html else ""
+        except Exception:
+            return ""
+        if not text:
             return ""
 
-        # Remove script/style/noscript
-        html = re.sub(
-            r"<script[^>]*>.*?</script>", "", html, flags=re.DOTALL | re.IGNORECASE
-        )
-        html = re.sub(
-            r"<style[^>]*>.*?</style>", "", html, flags=re.DOTALL | re.IGNORECASE
-        )
-        html = re.sub(
-            r"<noscript[^>]*>.*?</noscript>", "", html, flags=re.DOTALL | re.IGNORECASE
-        )
+        resp_headers = getattr(resp, "headers", None) or {}
+        etag = resp_headers.get("ETag")
+        last_modified = resp_headers.get("Last-Modified")
+        entry = {
+            "url": url,
+            "etag": etag if isinstance(etag, str) else None,
+            "last_modified": last_modified if isinstance(last_modified, str) else None,
+            "text": text,
+        }
+        if cache_path:
+            _cache_job_description(cache_path, entry)
+        return _remember_job_description(url, entry)
 
-        # Strip tags
-        text = re.sub(r"<[^>]+>", " ", html)
-
-        # Decode common HTML entities lightly (no extra deps)
-        text = (
-            text.replace("&nbsp;", " ")
-            .replace("&amp;", "&")
-            .replace("&lt;", "<")
-            .replace("&gt;", ">")
-            .replace("&quot;", '"')
-            .replace("&#39;", "'")
-        )
 
-        # Collapse whitespace
-        text = re.sub(r"\s+", " ", text).strip()
+# Bulk mode: CVs up to this many (estimated) tokens may be packed with others
+_PACK_MAX_TOKENS = 3000
+_DEFAULT_PACK_WINDOW_S = 0.5
 
-        # Limit to avoid token blowups
-        return text[:5000] if text else ""
-    except Exception:
-        return ""
+
+def _relevance_filter(job_description: str, params: Dict[str, Any]) -> RelevanceFilter:
+    """RelevanceFilter for the top-experiences / top-bullets params."""
+    limits: Dict[str, Optional[int]] = {}
+    for name in ("top-experiences", "top-bullets"):
+        value = params.get(name, params.get(name.replace("-", "_")))
+        limits[name] = None
+        if value is None:
+            continue
+        try:
+            limits[name] = max(1, int(value))
+        except (TypeError, ValueError):
+            LOG.warning("Job-specific adjust: invalid %s, sending all.", name)
+    return RelevanceFilter(
+        job_description,
+        top_experiences=limits["top-experiences"],
+        top_bullets=limits["top-bullets"],
+    )
+
+
+def _messages(
+    system_prompt: str, patch_prompt: Optional[str], payload: Dict[str, Any]
+) -> List[Dict[str, str]]:
+    """Chat messages of one CV; the patch instructions follow the job prompt."""
+    messages = [{"role": "system", "content": system_prompt}]
+    if patch_prompt:
+        messages.append({"role": "system", "content": patch_prompt})
+    messages.append({"role": "user", "content": compact_json(payload)})
+    return messages
+
+
+def _pack_mismatch(original: Dict[str, Any], adjusted: Any) -> Optional[str]:
+    """Why a packed reply item is not a valid adjustment of original, or None."""
+    if not isinstance(adjusted, dict):
+        return "is not an object"
+    identity = original.get("identity")
+    name = identity.get("full_name") if isinstance(identity, dict) else None
+    identity = adjusted.get("identity")
+    if isinstance(name, str) and (
+        not isinstance(identity, dict) or identity.get("full_name") != name
+    ):
+        return "belongs to another CV"
+    schema = _load_cv_schema()
+    errs = get_schema_validator(schema)(adjusted) if schema else []
+    if errs:
+        return "fails schema validation: " + "; ".join(errs)
+    return None
+
+
+def _charge_pack(pack: OpenAIUsage, usages: List[Optional[OpenAIUsage]]) -> None:
+    """
+    Charge the steps of a pack for its request.
+
+    The request (with its retries, backoff and hedges) is counted once, on
+    the first step; tokens are split evenly, so run totals stay exact.
+    """
+    count = len(usages)
+    for idx, usage in enumerate(usages):
+        if usage is None:
+            continue
+        share = OpenAIUsage().add(pack) if idx == 0 else OpenAIUsage()
+        for name in ("prompt_tokens", "completion_tokens", "cached_tokens"):
+            total = getattr(pack, name)
+            setattr(share, name, total // count + (total % count if idx == 0 else 0))
+        usage.add(share)
+
+
+def _earliest(deadlines: List[Optional[float]]) -> Optional[float]:
+    bounded = [d for d in deadlines if d is not None]
+    return min(bounded) if bounded else None
+
+
+class _JobMatchPacker:
+    """
+    Packs CVs tailored to the same job into shared requests.
+
+    Mirrors the translate adjuster's batcher: each caller queues its CV,
+    waits a short window so concurrently processed CVs can join, then
+    drains the queue in requests of up to pack_size CVs (which may include
+    CVs queued by other threads). A pack is sent through a retryer detached
+    from every step: it stops at the earliest deadline of the pack, and its
+    usage is charged to the steps of the pack (see _charge_pack).
+    """
+
+    def __init__(self, pack_size: int, window_s: float):
+        self.pack_size = max(1, int(pack_size))
+        self.window_s = max(0.0, float(window_s))
+        self._lock = threading.Lock()
+        self._queue: List[Tuple[Dict[str, Any], _OpenAIRetry, Future]] = []
+
+    def adjust(
+        self,
+        cv_data: Dict[str, Any],
+        retryer: _OpenAIRetry,
+        send: Callable[
+            [List[Dict[str, Any]], _OpenAIRetry],
+            Optional[List[Optional[Dict[str, Any]]]],
+        ],
+        sleep: Callable[[float], None],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return the adjusted CV, or None if its packed request failed.
+
+        send returns one item per CV, None for an item it rejected; such a
+        rejection counts as a fallback of that CV's step.
+        """
+        fut: Future = Future()
+        with self._lock:
+            self._queue.append((cv_data, retryer, fut))
+            queued = len(self._queue)
+
+        if self.window_s and queued < self.pack_size:
+            sleep(self.window_s)
+
+        while True:
+            with self._lock:
+                batch = self._queue[: self.pack_size]
+                del self._queue[: self.pack_size]
+            if not batch:
+                break
+            members = [member for _, member, _ in batch]
+            pack_usage = OpenAIUsage()
+            shared = members[0].detached(
+                usage=pack_usage,
+                deadline=_earliest([member.deadline for member in members]),
+            )
+            try:
+                results = send([cv for cv, _, _ in batch], shared)
+            except Exception as e:
+                LOG.warning("Job-specific pack failed (%s)", type(e).__name__)
+                results = None
+            _charge_pack(pack_usage, [member.usage for member in members])
+            for idx, (_, member, item_fut) in enumerate(batch):
+                item = results[idx] if results else None
+                if results and item is None:
+                    member.record_fallback()
+                item_fut.set_result(item)
+
+        return fut.result()
+
+
+# Process-wide packers so parallel workers share requests for the same job
+_PACKERS: Dict[Tuple[str, int, int, int, float], _JobMatchPacker] = {}
+_PACKERS_LOCK = threading.Lock()
+
+
+def _get_packer(
+    model: str, api_key: str, system_prompt: str, pack_size: int, window_s: float
+) -> _JobMatchPacker:
+    # CVs are only packed with CVs sent with the same key
+    key = (model, hash(api_key), hash(system_prompt), int(pack_size), float(window_s))
+    with _PACKERS_LOCK:
+        packer = _PACKERS.get(key)
+        if packer is None:
+            packer = _JobMatchPacker(pack_size, window_s)
+            _PACKERS[key] = packer
+        return packer
 
 
 class OpenAIJobSpecificAdjuster(CVAdjuster):
@@ -138,12 +472,14 @@ class OpenAIJobSpecificAdjuster(CVAdjuster):
         *,
         retry_config: Optional[_RetryConfig] = None,
         request_timeout_s: float = 60.0,
+        pack_window_s: float = _DEFAULT_PACK_WINDOW_S,
         _sleep: Callable[[float], None] = time.sleep,
     ):
         self._model = model
         self._api_key = api_key or os.environ.get("OPENAI_API_KEY")
         self._retry = retry_config or _RetryConfig()
         self._request_timeout_s = float(request_timeout_s)
+        self._pack_window_s = float(pack_window_s)
         self._sleep = _sleep
 
     def name(self) -> str:
@@ -187,13 +523,20 @@ class OpenAIJobSpecificAdjuster(CVAdjuster):
         # Get job description from URL or direct text
         if not job_description and job_url:
             LOG.info("Fetching job description from %s", job_url)
-            job_description = _fetch_job_description(job_url)
+            job_description = _fetch_job_description(
+                job_url, cache_dir=work.config.workspace.research_dir
+            )
             if not job_description:
                 LOG.warning(
                     "Job-specific adjust: failed to fetch job description from URL"
                 )
                 return write_output_json(work, cv_data)
 
+        job_description = truncate_to_tokens(
+            job_description,
+            text_budget(self._model, _JOB_DESCRIPTION_MAX_TOKENS),
+        )
+
         # Load prompt (keep typo key for compatibility, add fallback)
         system_prompt = format_prompt(
             "adjuster_promp_for_specific_job", job_description=job_description
@@ -208,37 +551,133 @@ class OpenAIJobSpecificAdjuster(CVAdjuster):
             return write_output_json(work, cv_data)
 
         client = OpenAI(api_key=self._api_key)
-        retryer = _OpenAIRetry(retry=self._retry, sleep=self._sleep)
+        retryer = _OpenAIRetry(
+            retry=self._retry,
+            sleep=self._sleep,
+            usage=_adjust_usage(work),
+            cache=llm_cache_for(work),
+            hedge=hedge_policy_for(work),
+            deadline=step_deadline(work, StepName.Adjust),
+            breaker=circuit_breaker_for(work),
+            budget=retry_budget_for(work),
+            slots=request_slots_for(work),
+            pool=request_pool_for(work),
+        )
 
-        user_payload = {
-            "job_description": job_description,
-            "original_json": cv_data,
-            "adjusted_json": "",
-        }
+        patch_prompt = None
+        if "patch" in kwargs:
+            patch_prompt = load_prompt("adjuster_prompt_patch")
+            if not patch_prompt:
+                LOG.warning(
+                    "Job-specific adjust: failed to load patch prompt; "
+                    "requesting the full CV."
+                )
+        # A patch reply does not have the shape of the CV schema
+        structured = (
+            None if patch_prompt else structured_output_for(work, "cv_schema.json")
+        )
+
+        relevance = _relevance_filter(job_description, kwargs)
+        sent_cv = relevance.fit(cv_data)
+
+        if "bulk" in kwargs or "pack" in kwargs:
+            adjusted = self._adjust_bulk(
+                sent_cv,
+                client,
+                retryer,
+                system_prompt,
+                kwargs.get("pack"),
+                structured,
+                patch_prompt,
+            )
+        else:
+            # The job description is already part of the system prompt
+            budget = PayloadBudget(
+                self._model,
+                system_prompt,
+                (
+                    {"original_json": sent_cv}
+                    if patch_prompt
+                    else {"original_json": sent_cv, "adjusted_json": ""}
+                ),
+            )
+            adjusted = self._adjust_one(
+                client, retryer, system_prompt, budget, structured, patch_prompt
+            )
+        if adjusted is None:
+            return write_output_json(work, cv_data)
+
+        restored = relevance.restore(adjusted)
+        if restored is None:
+            retryer.record_fallback()
+            LOG.warning(
+                "Job-specific adjust: could not restore unsent experiences; "
+                "using original JSON."
+            )
+            return write_output_json(work, cv_data)
 
+        LOG.info("The CV was adjusted to better fit the job description.")
+        return write_output_json(work, restored)
+
+    def _adjust_one(
+        self,
+        client: Any,
+        retryer: _OpenAIRetry,
+        system_prompt: str,
+        budget: PayloadBudget,
+        structured: Optional[StructuredOutput],
+        patch_prompt: Optional[str],
+    ) -> Optional[Dict[str, Any]]:
+        """Adjust the CV of budget's payload alone; None (logged) on failure."""
+        payload = budget.fit()
+        content = self._complete(
+            client,
+            retryer,
+            _messages(system_prompt, patch_prompt, payload),
+            structured,
+        )
+        if content is None:
+            return None
+        adjusted = self._parse(
+            content,
+            retryer,
+            structured,
+            payload["original_json"] if patch_prompt else None,
+        )
+        return budget.restore(adjusted) if adjusted is not None else None
+
+    def _complete(
+        self,
+        client: Any,
+        retryer: _OpenAIRetry,
+        messages: List[Dict[str, str]],
+        structured: Optional[StructuredOutput] = None,
+    ) -> Optional[str]:
+        """Run one completion and return its content, or None (logged) on failure."""
         # Single retry system (no stacked retries)
         try:
-            completion = retryer.call(
-                lambda: client.chat.completions.create(
-                    model=self._model,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {
-                            "role": "user",
-                            "content": json.dumps(user_payload, ensure_ascii=False),
-                        },
-                    ],
-                    temperature=0.2,
-                    timeout=self._request_timeout_s,
-                ),
-                is_write=True,
+            completion = retryer.create_completion(
+                client,
                 op_name="Job-specific adjust completion",
+                model=self._model,
+                messages=messages,
+                temperature=0.2,
+                timeout=self._request_timeout_s,
+                **(structured.request if structured else {}),
             )
         except Exception as e:
             LOG.warning(
                 "Job-specific adjust error (%s); using original JSON.", type(e).__name__
             )
-            return write_output_json(work, cv_data)
+            return None
+
+        usage = _completion_usage(completion)
+        if usage["cached_tokens"]:
+            LOG.info(
+                "Job-specific adjust: %d of %d prompt tokens served from cache.",
+                usage["cached_tokens"],
+                usage["prompt_tokens"],
+            )
 
         content = None
         finish_reason = None
@@ -256,18 +695,148 @@ class OpenAIJobSpecificAdjuster(CVAdjuster):
                 "Job-specific adjust: completion not finished (%s); using original JSON.",
                 finish_reason,
             )
-            return write_output_json(work, cv_data)
+            return None
 
         if not content:
             LOG.warning("Job-specific adjust: empty completion; using original JSON.")
-            return write_output_json(work, cv_data)
+            return None
+        return content
+
+    @staticmethod
+    def _parse(
+        content: str,
+        retryer: _OpenAIRetry,
+        structured: Optional[StructuredOutput],
+        original: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Parse an adjusted CV, or return None (logged) if it is unusable.
+
+        With original, content is a patch against it (patch mode).
+        """
+        if original is not None:
+            adjusted = apply_patch_reply(content, original)
+            if adjusted is None:
+                retryer.record_fallback()
+                LOG.warning(
+                    "Job-specific adjust: unusable patch response; using original JSON."
+                )
+            return adjusted
 
         adjusted = _extract_json_object(content)
         if adjusted is None:
+            retryer.record_fallback()
             LOG.warning(
                 "Job-specific adjust: invalid JSON response; using original JSON."
             )
-            return write_output_json(work, cv_data)
+            return None
+        return structured.clean(adjusted) if structured else adjusted
 
-        LOG.info("The CV was adjusted to better fit the job description.")
-        return write_output_json(work, adjusted)
+    def _adjust_bulk(
+        self,
+        cv_data: Dict[str, Any],
+        client: Any,
+        retryer: _OpenAIRetry,
+        system_prompt: str,
+        pack: Any,
+        structured: Optional[StructuredOutput] = None,
+        patch_prompt: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Adjust with a prompt prefix shared by every CV tailored to this job.
+
+        The system prompt (which embeds the job description) comes first and
+        is byte-identical across CVs; the CV comes last. This lets provider
+        prompt caching serve the job description for every CV after the
+        first. With pack > 1, small CVs processed concurrently are sent
+        together in one request (without structured output, as the packed
+        reply is a list of CVs). Patch mode applies to CVs sent alone.
+        """
+        try:
+            pack_size = max(1, int(pack or 1))
+        except (TypeError, ValueError):
+            LOG.warning("Job-specific adjust: invalid pack, sending CVs one by one.")
+            pack_size = 1
+
+        adjusted: Optional[Dict[str, Any]] = None
+        packable = estimate_tokens(compact_json(cv_data)) <= _PACK_MAX_TOKENS
+        if pack_size > 1 and packable:
+            packer = _get_packer(
+                self._model,
+                self._api_key,
+                system_prompt,
+                pack_size,
+                self._pack_window_s,
+            )
+            adjusted = packer.adjust(
+                cv_data,
+                retryer,
+                lambda cvs, shared: self._complete_packed(
+                    client, shared, system_prompt, cvs
+                ),
+                self._sleep,
+            )
+            if adjusted is None:
+                LOG.warning(
+                    "Job-specific adjust: packed request failed; retrying CV alone."
+                )
+
+        if adjusted is not None:
+            return adjusted
+        budget = PayloadBudget(self._model, system_prompt, {"original_json": cv_data})
+        return self._adjust_one(
+            client, retryer, system_prompt, budget, structured, patch_prompt
+        )
+
+    def _complete_packed(
+        self,
+        client: Any,
+        retryer: _OpenAIRetry,
+        system_prompt: str,
+        cvs: List[Dict[str, Any]],
+    ) -> Optional[List[Optional[Dict[str, Any]]]]:
+        """
+        Adjust cvs in one request; None if it failed.
+
+        Items are matched to cvs by position, so each must keep its CV's
+        identity.full_name and pass the CV schema; items that do not are
+        None.
+        """
+        pack_prompt = load_prompt("adjuster_prompt_job_pack")
+        if not pack_prompt:
+            return None
+        content = self._complete(
+            client,
+            retryer,
+            [
+                {"role": "system", "content": system_prompt},
+                {"role": "system", "content": pack_prompt},
+                {
+                    "role": "user",
+                    "content": compact_json({"original_jsons": cvs}),
+                },
+            ],
+        )
+        result = _extract_json_object(content) if content else None
+        adjusted = result.get("adjusted_jsons") if result else None
+        if not isinstance(adjusted, list) or len(adjusted) != len(cvs):
+            if content:
+                retryer.record_fallback()
+            return None
+
+        items: List[Optional[Dict[str, Any]]] = []
+        for original, item in zip(cvs, adjusted):
+            problem = _pack_mismatch(original, item)
+            if problem:
+                LOG.warning(
+                    "Job-specific adjust: packed reply item %s; retrying CV alone.",
+                    problem,
+                )
+                item = None
+            items.append(item)
+        LOG.info(
+            "Job-specific adjust: adjusted %d of %d CVs in one request.",
+            sum(item is not None for item in items),
+            len(cvs),
+        )
+        return items
@@ -2,6 +2,15 @@
 OpenAI-based translation adjuster.
 
 Translates CV JSON to a target language while preserving schema and identifiers.
+
+Two strategies are supported:
+- Document mode (default): the CV JSON is translated as a document. Large CVs
+  are split into an identity/sidebar/overview chunk and groups of experiences
+  that are translated concurrently, then merged and schema-validated.
+- Batch mode (``batch`` flag): unique strings are looked up in a translation
+  memory shared by all CVs of a run; only unknown strings are packed into
+  string-level requests (coalesced across concurrently processed CVs), and
+  each CV is rebuilt from the memory.
 """
 
 from __future__ import annotations
@@ -10,20 +19,42 @@ import json
 import logging
 import os
 import re
+import threading
 import time
-from typing import Any, Callable, Dict, Iterable, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 try:
     from openai import OpenAI  # type: ignore
 except Exception:  # pragma: no cover
     OpenAI = None  # type: ignore
 
-from ..shared import UnitOfWork, format_prompt, load_input_json, write_output_json
+from ..llm_cache import llm_cache_for
+from ..request_policy import (
+    circuit_breaker_for,
+    hedge_policy_for,
+    request_pool_for,
+    request_slots_for,
+    retry_budget_for,
+    step_deadline,
+)
+from ..shared import (
+    StepName,
+    UnitOfWork,
+    format_prompt,
+    load_input_json,
+    write_output_json,
+)
+from ..verifiers.schema_validator import get_schema_validator
 from .base import CVAdjuster
 from .openai_utils import OpenAIRetry as _OpenAIRetry
 from .openai_utils import RetryConfig as _RetryConfig
+from .openai_utils import StructuredOutput
+from .openai_utils import adjust_usage as _adjust_usage
 from .openai_utils import extract_json_object as _extract_json_object
-from .openai_utils import get_cached_resource_path
+from .openai_utils import get_cached_resource_path, structured_output_for
+from .token_budget import compact_json, fits_output
+from .translation_memory import TranslationMemory, get_translation_memory
 
 LOG = logging.getLogger("cvextract")
 
@@ -32,6 +63,14 @@ _SCHEMA_PATH = get_cached_resource_path("cv_schema.json")
 
 _EMAIL_RE = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b")
 _URL_RE = re.compile(r"\bhttps?://[^\s\"']+\b")
+_LETTER_RE = re.compile(r"[^\W\d_]")
+
+# Experiences per request in chunked document mode
+_DEFAULT_CHUNK_SIZE = 6
+
+# Batch mode defaults
+_DEFAULT_BATCH_SIZE = 100
+_DEFAULT_BATCH_WINDOW_S = 0.25
 
 
 def _load_cv_schema() -> Optional[Dict[str, Any]]:
@@ -52,81 +91,9 @@ def _load_cv_schema() -> Optional[Dict[str, Any]]:
 
 
 def _validate_cv_data(data: Any, schema: Dict[str, Any]) -> List[str]:
-    errs: List[str] = []
     if not isinstance(data, dict):
         return ["translated JSON must be an object"]
-
-    required_fields = schema.get("required", [])
-    for field in required_fields:
-        if field not in data:
-            errs.append(f"missing required field: {field}")
-
-    if "identity" in data:
-        identity = data["identity"]
-        identity_props = schema.get("properties", {}).get("identity", {})
-        identity_required = identity_props.get("required", [])
-        for field in identity_required:
-            if not identity or field not in identity:
-                errs.append(f"identity missing required field: {field}")
-            elif not isinstance(identity.get(field), str) or not identity.get(field):
-                errs.append(f"identity.{field} must be a non-empty string")
-
-    if "sidebar" in data:
-        sidebar = data["sidebar"]
-        if sidebar is not None and not isinstance(sidebar, dict):
-            errs.append("sidebar must be an object")
-
-    if "overview" in data:
-        overview = data["overview"]
-        if overview is not None and not isinstance(overview, str):
-            errs.append("overview must be a string")
-
-    if "experiences" in data:
-        experiences = data["experiences"]
-        if not isinstance(experiences, list):
-            errs.append("experiences must be an array")
-        else:
-            for idx, exp in enumerate(experiences):
-                if not isinstance(exp, dict):
-                    errs.append(f"experiences[{idx}] must be an object")
-                    continue
-
-                if "heading" not in exp:
-                    errs.append(f"experiences[{idx}] missing required field: heading")
-                elif not isinstance(exp["heading"], str):
-                    errs.append(f"experiences[{idx}].heading must be a string")
-
-                if "description" not in exp:
-                    errs.append(
-                        f"experiences[{idx}] missing required field: description"
-                    )
-                elif not isinstance(exp["description"], str):
-                    errs.append(f"experiences[{idx}].description must be a string")
-
-                if "bullets" in exp:
-                    if not isinstance(exp["bullets"], list):
-                        errs.append(f"experiences[{idx}].bullets must be an array")
-                    elif exp["bullets"] and not all(
-                        isinstance(b, str) for b in exp["bullets"]
-                    ):
-                        errs.append(f"experiences[{idx}].bullets items must be strings")
-
-                if "environment" in exp:
-                    env = exp["environment"]
-                    if env is not None and not isinstance(env, list):
-                        errs.append(
-                            f"experiences[{idx}].environment must be an array or null"
-                        )
-                    elif (
-                        isinstance(env, list)
-                        and env
-                        and not all(isinstance(e, str) for e in env)
-                    ):
-                        errs.append(
-                            f"experiences[{idx}].environment items must be strings"
-                        )
-
-    return errs
+    return get_schema_validator(schema)(data)
 
 
 def _collect_protected_terms(cv_data: Dict[str, Any]) -> List[str]:
@@ -169,7 +136,49 @@ def _collect_protected_terms(cv_data: Dict[str, Any]) -> List[str]:
     return deduped
 
 
+def _trie_pattern(terms: Iterable[str]) -> str:
+    """
+    Build a prefix-factored regex alternation for the given terms.
+
+    Sharing common prefixes keeps matching close to a single trie walk per
+    position instead of trying every term in turn. Longer continuations are
+    tried before a term ends, so the longest term wins at each position.
+    """
+    trie: Dict[str, Any] = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def _build(node: Dict[str, Any]) -> str:
+        ends = "" in node
+        branches = [
+            re.escape(char) + _build(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        if len(branches) == 1 and not ends:
+            return branches[0]
+        body = "(?:" + "|".join(branches) + ")"
+        return body + "?" if ends else body
+
+    return _build(trie)
+
+
 class _TextProtector:
+    """
+    Replace emails, URLs and protected terms with placeholder tokens.
+
+    All protected spans are found in one scan of a combined pattern (emails,
+    then URLs, then the terms as a prefix-factored alternation), and tokens
+    are restored with a single substitution.
+    """
+
+    _TOKEN_RE = re.compile(r"__PROTECTED_\d+__")
+
     def __init__(self, protected_terms: Iterable[str]) -> None:
         unique_terms = []
         seen = set()
@@ -182,22 +191,22 @@ class _TextProtector:
             unique_terms.append(term)
 
         unique_terms.sort(key=len, reverse=True)
-        self._term_patterns = [
-            re.compile(rf"(?<!\w){re.escape(term)}(?!\w)") for term in unique_terms
-        ]
+        self._terms = unique_terms
+        alternatives = [_EMAIL_RE.pattern, _URL_RE.pattern]
+        if unique_terms:
+            alternatives.append(rf"(?<!\w)(?:{_trie_pattern(unique_terms)})(?!\w)")
+        self._pattern = re.compile("|".join(f"(?:{alt})" for alt in alternatives))
         self._replacements: Dict[str, str] = {}
 
     def protect(self, text: str) -> str:
-        text = _EMAIL_RE.sub(self._replace, text)
-        text = _URL_RE.sub(self._replace, text)
-        for pattern in self._term_patterns:
-            text = pattern.sub(self._replace, text)
-        return text
+        return self._pattern.sub(self._replace, text)
 
     def restore(self, text: str) -> str:
-        for token, original in self._replacements.items():
-            text = text.replace(token, original)
-        return text
+        if not self._replacements:
+            return text
+        return self._TOKEN_RE.sub(
+            lambda m: self._replacements.get(m.group(0), m.group(0)), text
+        )
 
     def _replace(self, match: re.Match[str]) -> str:
         token = f"__PROTECTED_{len(self._replacements) + 1}__"
@@ -249,6 +258,237 @@ def _restore_protected_fields(
     return translated
 
 
+def _strip_protected_fields(cv_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a shallow copy of cv_data without fields that are never translated."""
+    stripped = dict(cv_data)
+
+    identity = stripped.get("identity")
+    if isinstance(identity, dict):
+        stripped["identity"] = {
+            k: v
+            for k, v in identity.items()
+            if k not in ("full_name", "first_name", "last_name")
+        }
+
+    sidebar = stripped.get("sidebar")
+    if isinstance(sidebar, dict):
+        stripped["sidebar"] = {
+            k: v for k, v in sidebar.items() if k not in ("languages", "tools")
+        }
+
+    experiences = stripped.get("experiences")
+    if isinstance(experiences, list):
+        stripped["experiences"] = [
+            (
+                {k: v for k, v in exp.items() if k != "environment"}
+                if isinstance(exp, dict)
+                else exp
+            )
+            for exp in experiences
+        ]
+
+    return stripped
+
+
+def _collect_translatable_strings(cv_data: Dict[str, Any]) -> List[str]:
+    """Collect unique strings that need translation, in document order."""
+    seen: Dict[str, None] = {}
+
+    def _collect(text: str) -> str:
+        if text.strip() and _LETTER_RE.search(text):
+            seen.setdefault(text, None)
+        return text
+
+    _map_strings(_strip_protected_fields(cv_data), _collect)
+    return list(seen)
+
+
+def _split_cv_for_translation(
+    cv_data: Dict[str, Any], chunk_size: int
+) -> List[Dict[str, Any]]:
+    """
+    Split a CV into independently translatable chunks.
+
+    The first chunk holds everything except experiences (identity, sidebar,
+    overview); experiences follow in groups of chunk_size. CVs with at most
+    chunk_size experiences (or chunk_size <= 0) stay a single chunk.
+    """
+    experiences = cv_data.get("experiences")
+    if (
+        chunk_size <= 0
+        or not isinstance(experiences, list)
+        or len(experiences) <= chunk_size
+    ):
+        return [cv_data]
+
+    head = {k: v for k, v in cv_data.items() if k != "experiences"}
+    chunks: List[Dict[str, Any]] = [head]
+    for start in range(0, len(experiences), chunk_size):
+        chunks.append({"experiences": experiences[start : start + chunk_size]})
+    return chunks
+
+
+def _merge_translated_chunks(
+    chunks: List[Dict[str, Any]], results: List[Optional[Dict[str, Any]]]
+) -> Optional[Dict[str, Any]]:
+    """
+    Merge translated chunks back into one CV.
+
+    Returns None if any chunk failed or changed the number of experiences.
+    """
+    merged: Dict[str, Any] = {}
+    experiences: List[Any] = []
+    has_experiences = False
+    for chunk, result in zip(chunks, results):
+        if result is None:
+            return None
+        if "experiences" in chunk:
+            translated = result.get("experiences")
+            if not isinstance(translated, list) or len(translated) != len(
+                chunk["experiences"]
+            ):
+                LOG.warning("Translate adjust: chunk changed experience count.")
+                return None
+            experiences.extend(translated)
+            has_experiences = True
+        for key, value in result.items():
+            if key != "experiences" and key in chunk:
+                merged[key] = value
+    if has_experiences:
+        merged["experiences"] = experiences
+    return merged
+
+
+class _TranslationBatcher:
+    """
+    Coalesces string translation requests from concurrently processed CVs.
+
+    Strings already in the translation memory are answered immediately.
+    Strings currently being translated for another CV are awaited instead
+    of being requested twice. The remaining strings are queued, and the
+    calling thread drains the queue in packed requests of up to batch_size
+    strings, which may include strings queued by other CVs.
+    """
+
+    def __init__(
+        self,
+        memory: TranslationMemory,
+        *,
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+        window_s: float = _DEFAULT_BATCH_WINDOW_S,
+    ):
+        self.memory = memory
+        self.batch_size = max(1, int(batch_size))
+        self.window_s = max(0.0, float(window_s))
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+        self._queue: List[Tuple[str, Tuple[str, ...]]] = []
+
+    def translate(
+        self,
+        strings: Iterable[str],
+        protected_terms: Iterable[str],
+        send: Callable[[List[str], List[str]], Dict[str, str]],
+        sleep: Callable[[float], None],
+    ) -> Dict[str, Optional[str]]:
+        """
+        Translate strings, using the memory and packed requests for misses.
+
+        Args:
+            strings: Source strings to translate.
+            protected_terms: Terms that must stay unchanged in these strings.
+            send: Callable translating a list of strings; returns a mapping of
+                source string to translation for the strings it could translate.
+            sleep: Sleep used for the coalescing window.
+
+        Returns:
+            Mapping of source string to translation (None if unavailable).
+        """
+        strings = list(dict.fromkeys(strings))
+        results: Dict[str, Optional[str]] = dict(self.memory.lookup(strings))
+        terms = tuple(protected_terms)
+        futures: Dict[str, Future] = {}
+
+        with self._lock:
+            for text in strings:
+                if text in results:
+                    continue
+                fut = self._inflight.get(text)
+                if fut is None:
+                    # Re-check under the lock: another CV may have just finished it.
+                    known = self.memory.get(text)
+                    if known is not None:
+                        results[text] = known
+                        continue
+                    fut = Future()
+                    self._inflight[text] = fut
+                    self._queue.append((text, terms))
+                futures[text] = fut
+            queued = len(self._queue)
+
+        if futures and self.window_s and queued < self.batch_size:
+            # Give concurrently processed CVs a chance to join the next request.
+            sleep(self.window_s)
+
+        while True:
+            with self._lock:
+                batch = self._queue[: self.batch_size]
+                del self._queue[: self.batch_size]
+            if not batch:
+                break
+            self._send_batch(batch, send)
+
+        for text, fut in futures.items():
+            results[text] = fut.result()
+        return results
+
+    def _send_batch(
+        self,
+        batch: List[Tuple[str, Tuple[str, ...]]],
+        send: Callable[[List[str], List[str]], Dict[str, str]],
+    ) -> None:
+        sources = [text for text, _ in batch]
+        terms: Dict[str, None] = {}
+        for _, item_terms in batch:
+            for term in item_terms:
+                terms.setdefault(term, None)
+
+        try:
+            translated = send(sources, list(terms))
+        except Exception as e:
+            LOG.warning("Translate batch failed (%s)", type(e).__name__)
+            translated = {}
+
+        for text in sources:
+            value = translated.get(text)
+            if isinstance(value, str):
+                self.memory.put(text, value)
+            with self._lock:
+                fut = self._inflight.pop(text, None)
+            if fut is not None:
+                fut.set_result(value if isinstance(value, str) else None)
+        self.memory.save()
+
+
+# Process-wide batchers so parallel workers coalesce their requests.
+_BATCHERS: Dict[Tuple[int, int, float], _TranslationBatcher] = {}
+_BATCHERS_LOCK = threading.Lock()
+
+
+def _get_batcher(
+    memory: TranslationMemory, batch_size: int, window_s: float
+) -> _TranslationBatcher:
+    key = (id(memory), int(batch_size), float(window_s))
+    with _BATCHERS_LOCK:
+        batcher = _BATCHERS.get(key)
+        if batcher is None:
+            batcher = _TranslationBatcher(
+                memory, batch_size=batch_size, window_s=window_s
+            )
+            _BATCHERS[key] = batcher
+        return batcher
+
+
 class OpenAITranslateAdjuster(CVAdjuster):
     """
     Adjuster that translates CV JSON into a target language.
@@ -262,6 +502,9 @@ class OpenAITranslateAdjuster(CVAdjuster):
         retry_config: Optional[_RetryConfig] = None,
         request_timeout_s: float = 60.0,
         temperature: float = 0.0,
+        batch_window_s: float = _DEFAULT_BATCH_WINDOW_S,
+        chunk_size: int = _DEFAULT_CHUNK_SIZE,
+        max_chunk_workers: int = 4,
         _sleep: Callable[[float], None] = time.sleep,
     ):
         self._model = model
@@ -269,6 +512,9 @@ class OpenAITranslateAdjuster(CVAdjuster):
         self._retry = retry_config or _RetryConfig()
         self._request_timeout_s = float(request_timeout_s)
         self._temperature = float(temperature)
+        self._batch_window_s = float(batch_window_s)
+        self._chunk_size = int(chunk_size)
+        self._max_chunk_workers = int(max_chunk_workers)
         self._sleep = _sleep
 
     def name(self) -> str:
@@ -300,11 +546,29 @@ class OpenAITranslateAdjuster(CVAdjuster):
             return write_output_json(work, cv_data)
 
         language = str(kwargs.get("language") or kwargs.get("target-language")).strip()
+
+        temperature = kwargs.get("temperature", self._temperature)
+        try:
+            temperature = float(temperature)
+        except (TypeError, ValueError):
+            LOG.warning("Translate adjust: invalid temperature, using default.")
+            temperature = self._temperature
+
+        if "batch" in kwargs:
+            try:
+                batch_size = int(kwargs.get("batch-size") or _DEFAULT_BATCH_SIZE)
+            except (TypeError, ValueError):
+                LOG.warning("Translate adjust: invalid batch-size, using default.")
+                batch_size = _DEFAULT_BATCH_SIZE
+            return self._adjust_batched(
+                work, cv_data, schema, language, temperature, batch_size
+            )
+
         protected_terms = _collect_protected_terms(cv_data)
         system_prompt = format_prompt(
             "adjuster_prompt_translate_cv",
             language=language,
-            schema=json.dumps(schema, ensure_ascii=False, indent=2),
+            schema=compact_json(schema),
             protected_terms=json.dumps(protected_terms, ensure_ascii=False),
         )
         if not system_prompt:
@@ -314,45 +578,113 @@ class OpenAITranslateAdjuster(CVAdjuster):
         protector = _TextProtector(protected_terms)
         protected_cv = _map_strings(cv_data, protector.protect)
 
-        user_payload = {
-            "language": language,
-            "original_json": protected_cv,
-            "translated_json": "",
-        }
-
-        temperature = kwargs.get("temperature", self._temperature)
         try:
-            temperature = float(temperature)
+            chunk_size = int(kwargs.get("chunk-size", self._chunk_size))
         except (TypeError, ValueError):
-            LOG.warning("Translate adjust: invalid temperature, using default.")
-            temperature = self._temperature
+            LOG.warning("Translate adjust: invalid chunk-size, using default.")
+            chunk_size = self._chunk_size
+        if chunk_size <= 0 and not fits_output(self._model, protected_cv):
+            LOG.info("Translate adjust: CV too large for one response; chunking.")
+            chunk_size = _DEFAULT_CHUNK_SIZE
 
         client = OpenAI(api_key=self._api_key)
-        retryer = _OpenAIRetry(retry=self._retry, sleep=self._sleep)
+        retryer = _OpenAIRetry(
+            retry=self._retry,
+            sleep=self._sleep,
+            usage=_adjust_usage(work),
+            cache=llm_cache_for(work),
+            hedge=hedge_policy_for(work),
+            deadline=step_deadline(work, StepName.Adjust),
+            breaker=circuit_breaker_for(work),
+            budget=retry_budget_for(work),
+            slots=request_slots_for(work),
+            pool=request_pool_for(work),
+        )
 
-        try:
-            completion = retryer.call(
-                lambda: client.chat.completions.create(
-                    model=self._model,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {
-                            "role": "user",
-                            "content": json.dumps(user_payload, ensure_ascii=False),
-                        },
-                    ],
-                    temperature=temperature,
-                    timeout=self._request_timeout_s,
-                ),
-                is_write=True,
-                op_name="Translate CV completion",
+        def _translate(chunk: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            return self._translate_chunk(
+                client,
+                retryer,
+                system_prompt,
+                language,
+                temperature,
+                chunk,
+                structured_output_for(work, "cv_schema.json", keys=chunk),
             )
-        except Exception as e:
+
+        chunks = _split_cv_for_translation(protected_cv, chunk_size)
+        if len(chunks) == 1:
+            translated = _translate(protected_cv)
+        else:
+            LOG.info("Translating CV in %d chunks.", len(chunks))
+            workers = max(1, min(len(chunks), self._max_chunk_workers))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_translate, chunks))
+            translated = _merge_translated_chunks(chunks, results)
+
+        if translated is None:
+            LOG.warning("Translate adjust: translation failed; using original JSON.")
+            return write_output_json(work, cv_data)
+
+        translated = _map_strings(translated, protector.restore)
+        translated = _restore_protected_fields(cv_data, translated)
+
+        errs = _validate_cv_data(translated, schema)
+        if errs:
+            retryer.record_fallback()
             LOG.warning(
-                "Translate adjust error (%s); using original JSON.", type(e).__name__
+                "Translate adjust: schema validation failed: %s; using original JSON.",
+                "; ".join(errs),
             )
             return write_output_json(work, cv_data)
 
+        LOG.info("Translated CV to %s.", language)
+        return write_output_json(work, translated)
+
+    def _translate_chunk(
+        self,
+        client: Any,
+        retryer: _OpenAIRetry,
+        system_prompt: str,
+        language: str,
+        temperature: float,
+        chunk: Dict[str, Any],
+        structured: Optional[StructuredOutput] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Translate a (partial) CV JSON in one completion.
+
+        A chunk of several experiences that runs into the output-token limit
+        is split in half and retried, so large CVs never come back truncated.
+        With structured, the reply is constrained to the chunk's part of the
+        CV schema.
+        """
+        user_payload = {
+            "language": language,
+            "original_json": chunk,
+            "translated_json": "",
+        }
+
+        try:
+            completion = retryer.create_completion(
+                client,
+                op_name="Translate CV completion",
+                model=self._model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {
+                        "role": "user",
+                        "content": json.dumps(user_payload, ensure_ascii=False),
+                    },
+                ],
+                temperature=temperature,
+                timeout=self._request_timeout_s,
+                **(structured.request if structured else {}),
+            )
+        except Exception as e:
+            LOG.warning("Translate adjust error (%s).", type(e).__name__)
+            return None
+
         content = None
         finish_reason = None
         try:
@@ -365,22 +697,110 @@ class OpenAITranslateAdjuster(CVAdjuster):
             finish_reason = None
 
         if isinstance(finish_reason, str) and finish_reason != "stop":
+            experiences = chunk.get("experiences")
+            if (
+                finish_reason == "length"
+                and set(chunk) == {"experiences"}
+                and isinstance(experiences, list)
+                and len(experiences) > 1
+            ):
+                LOG.info(
+                    "Translate adjust: chunk of %d experiences truncated; splitting.",
+                    len(experiences),
+                )
+                mid = len(experiences) // 2
+                halves = [
+                    {"experiences": experiences[:mid]},
+                    {"experiences": experiences[mid:]},
+                ]
+                results = [
+                    self._translate_chunk(
+                        client,
+                        retryer,
+                        system_prompt,
+                        language,
+                        temperature,
+                        half,
+                        structured,
+                    )
+                    for half in halves
+                ]
+                return _merge_translated_chunks(halves, results)
             LOG.warning(
-                "Translate adjust: completion not finished (%s); using original JSON.",
-                finish_reason,
+                "Translate adjust: completion not finished (%s).", finish_reason
             )
-            return write_output_json(work, cv_data)
+            return None
 
         if not content:
-            LOG.warning("Translate adjust: empty completion; using original JSON.")
-            return write_output_json(work, cv_data)
+            LOG.warning("Translate adjust: empty completion.")
+            return None
 
         translated = _extract_json_object(content)
         if translated is None:
-            LOG.warning("Translate adjust: invalid JSON response; using original JSON.")
+            retryer.record_fallback()
+            LOG.warning("Translate adjust: invalid JSON response.")
+            return None
+        return structured.clean(translated) if structured else translated
+
+    # --------------------------
+    # Batch mode (translation memory)
+    # --------------------------
+
+    def _adjust_batched(
+        self,
+        work: UnitOfWork,
+        cv_data: Dict[str, Any],
+        schema: Dict[str, Any],
+        language: str,
+        temperature: float,
+        batch_size: int,
+    ) -> UnitOfWork:
+        system_prompt = format_prompt(
+            "adjuster_prompt_translate_strings", language=language
+        )
+        if not system_prompt:
+            LOG.warning("Translate adjust skipped: failed to load prompt template.")
             return write_output_json(work, cv_data)
 
-        translated = _map_strings(translated, protector.restore)
+        memory = get_translation_memory(
+            work.config.workspace.translation_memory_dir, language, self._model
+        )
+        batcher = _get_batcher(memory, batch_size, self._batch_window_s)
+
+        client = OpenAI(api_key=self._api_key)
+        retryer = _OpenAIRetry(
+            retry=self._retry,
+            sleep=self._sleep,
+            usage=_adjust_usage(work),
+            cache=llm_cache_for(work),
+            hedge=hedge_policy_for(work),
+            deadline=step_deadline(work, StepName.Adjust),
+            breaker=circuit_breaker_for(work),
+            budget=retry_budget_for(work),
+            slots=request_slots_for(work),
+            pool=request_pool_for(work),
+        )
+
+        def _send(sources: List[str], terms: List[str]) -> Dict[str, str]:
+            return self._translate_strings(
+                client, retryer, system_prompt, language, temperature, sources, terms
+            )
+
+        strings = _collect_translatable_strings(cv_data)
+        known = len(memory.lookup(strings))
+        translations = batcher.translate(
+            strings, _collect_protected_terms(cv_data), _send, self._sleep
+        )
+        missing = [s for s in strings if translations.get(s) is None]
+        if missing:
+            LOG.warning(
+                "Translate adjust: %d of %d strings untranslated; using original JSON.",
+                len(missing),
+                len(strings),
+            )
+            return write_output_json(work, cv_data)
+
+        translated = _map_strings(cv_data, lambda s: translations.get(s) or s)
         translated = _restore_protected_fields(cv_data, translated)
 
         errs = _validate_cv_data(translated, schema)
@@ -391,5 +811,66 @@ class OpenAITranslateAdjuster(CVAdjuster):
             )
             return write_output_json(work, cv_data)
 
-        LOG.info("Translated CV to %s.", language)
+        LOG.info(
+            "Translated CV to %s (%d strings, %d from translation memory).",
+            language,
+            len(strings),
+            known,
+        )
         return write_output_json(work, translated)
+
+    def _translate_strings(
+        self,
+        client: Any,
+        retryer: _OpenAIRetry,
+        system_prompt: str,
+        language: str,
+        temperature: float,
+        sources: List[str],
+        protected_terms: List[str],
+    ) -> Dict[str, str]:
+        """Translate a packed list of strings in one completion."""
+        protector = _TextProtector(protected_terms)
+        user_payload = {
+            "language": language,
+            "strings": {
+                str(idx): protector.protect(text) for idx, text in enumerate(sources)
+            },
+        }
+
+        completion = retryer.create_completion(
+            client,
+            op_name="Translate strings completion",
+            model=self._model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {
+                    "role": "user",
+                    "content": json.dumps(user_payload, ensure_ascii=False),
+                },
+            ],
+            temperature=temperature,
+            timeout=self._request_timeout_s,
+        )
+
+        choice = completion.choices[0] if completion.choices else None
+        finish_reason = getattr(choice, "finish_reason", None)
+        if isinstance(finish_reason, str) and finish_reason != "stop":
+            LOG.warning("Translate batch: completion not finished (%s).", finish_reason)
+            return {}
+        content = choice.message.content if choice is not None else None
+        parsed = _extract_json_object(content) if content else None
+        if parsed is None:
+            LOG.warning("Translate batch: invalid JSON response.")
+            return {}
+
+        items = parsed.get("translations", parsed)
+        if not isinstance(items, dict):
+            return {}
+
+        translated: Dict[str, str] = {}
+        for idx, text in enumerate(sources):
+            value = items.get(str(idx))
+            if isinstance(value, str) and value.strip():
+                translated[text] = protector.restore(value)
+        return translated
@@ -5,11 +5,15 @@ Shared OpenAI helper utilities for adjusters.
 from __future__ import annotations
 
 import json
+import os
 import random
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional, TypeVar
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar
 
 try:
     # Python 3.9+
@@ -18,6 +22,21 @@ except ModuleNotFoundError:
     # Python < 3.9 backport
     from importlib_resources import as_file, files  # type: ignore
 
+from ..llm_cache import LLMResponseCache
+from ..logging_utils import LOG
+from ..request_policy import (
+    CircuitBreaker,
+    DeadlineExceeded,
+    HedgePolicy,
+    RetryBudget,
+    remaining_s,
+    request_timeout_s,
+    run_bounded,
+)
+from ..shared import OpenAIUsage, StepName, UnitOfWork, completion_usage
+from ..verifiers.schema_validator import get_schema_validator, load_contract_schema
+from .json_patch import JsonPatchError, apply_json_patch
+
 T = TypeVar("T")
 
 
@@ -50,6 +69,19 @@ def get_cached_resource_path(
         return None
 
 
+def atomic_write_json(path: Path, data: Dict[str, Any]) -> None:
+    """Write JSON atomically to avoid cache corruption on crash."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        "w", delete=False, encoding="utf-8", dir=str(path.parent)
+    ) as tmp:
+        json.dump(data, tmp, ensure_ascii=False, indent=2)
+        tmp.flush()
+        os.fsync(tmp.fileno())
+        tmp_path = Path(tmp.name)
+    tmp_path.replace(path)
+
+
 @dataclass(frozen=True)
 class RetryConfig:
     max_attempts: int = 8
@@ -103,15 +135,243 @@ def extract_json_object(text: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+# Keywords strict structured outputs reject; replies are still validated
+# against the full schema locally
+_NON_STRICT_KEYWORDS = frozenset(
+    {
+        "$schema",
+        "$id",
+        "default",
+        "format",
+        "maxItems",
+        "maxLength",
+        "maximum",
+        "minItems",
+        "minLength",
+        "minimum",
+        "uniqueItems",
+    }
+)
+
+
+def _nullable(node: Dict[str, Any]) -> Dict[str, Any]:
+    kind = node.get("type")
+    if isinstance(kind, str):
+        node["type"] = [kind, "null"]
+    elif isinstance(kind, list) and "null" not in kind:
+        node["type"] = kind + ["null"]
+    if "enum" in node and None not in node["enum"]:
+        node["enum"] = node["enum"] + [None]
+    return node
+
+
+def strict_json_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a JSON schema to the subset accepted by strict structured outputs.
+
+    Every property becomes required; optional ones are made nullable
+    instead (see StructuredOutput.clean), objects reject additional
+    properties and unsupported keywords are dropped.
+    """
+    node = {k: v for k, v in schema.items() if k not in _NON_STRICT_KEYWORDS}
+    if isinstance(node.get("items"), dict):
+        node["items"] = strict_json_schema(node["items"])
+    properties = node.get("properties")
+    if isinstance(properties, dict):
+        required = set(node.get("required", []))
+        node["properties"] = {
+            name: (
+                strict_json_schema(sub)
+                if name in required
+                else _nullable(strict_json_schema(sub))
+            )
+            for name, sub in properties.items()
+        }
+        node["required"] = list(properties)
+        node["additionalProperties"] = False
+    return node
+
+
+def _drop_optional_nulls(data: Any, schema: Dict[str, Any]) -> Any:
+    if isinstance(data, list) and isinstance(schema.get("items"), dict):
+        return [_drop_optional_nulls(item, schema["items"]) for item in data]
+    properties = schema.get("properties")
+    if not isinstance(data, dict) or not isinstance(properties, dict):
+        return data
+    required = set(schema.get("required", []))
+    cleaned = {}
+    for name, value in data.items():
+        sub = properties.get(name, {})
+        kind = sub.get("type")
+        allows_null = kind == "null" or (isinstance(kind, list) and "null" in kind)
+        if value is None and name not in required and not allows_null:
+            continue
+        cleaned[name] = _drop_optional_nulls(value, sub)
+    return cleaned
+
+
+class StructuredOutput:
+    """
+    Strict JSON-schema response format for one bundled contract.
+
+    The model is then constrained to reply with JSON matching the schema,
+    so replies no longer fail parsing and fall back to the original data.
+    """
+
+    def __init__(
+        self,
+        schema: Dict[str, Any],
+        name: str,
+        *,
+        keys: Optional[Iterable[str]] = None,
+    ):
+        if keys is not None:
+            # A partial document (e.g. a translation chunk) with these keys
+            keys = list(keys)
+            properties = schema.get("properties", {})
+            schema = {
+                "type": "object",
+                "properties": {key: properties.get(key, {}) for key in keys},
+                "required": keys,
+            }
+        self._schema = schema
+        self.request: Dict[str, Any] = {
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {
+                    "name": name,
+                    "strict": True,
+                    "schema": strict_json_schema(schema),
+                },
+            }
+        }
+
+    def clean(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Drop the nulls strict mode returns for absent optional fields."""
+        return _drop_optional_nulls(data, self._schema)
+
+
+def structured_output_for(
+    work: UnitOfWork, contract: str, *, keys: Optional[Iterable[str]] = None
+) -> Optional[StructuredOutput]:
+    """
+    Return the structured output of a contract (e.g. "cv_schema.json"), or
+    None when --structured-output is off or the schema cannot be loaded.
+    """
+    if not work.config.structured_output:
+        return None
+    try:
+        schema = load_contract_schema(contract)
+    except Exception as e:
+        LOG.warning("Structured output disabled: %s", e)
+        return None
+    name = contract.rsplit(".", 1)[0]
+    return StructuredOutput(schema, name, keys=keys)
+
+
+def apply_patch_reply(
+    content: str, original: Dict[str, Any], *, contract: str = "cv_schema.json"
+) -> Optional[Dict[str, Any]]:
+    """
+    Apply a patch-mode reply ({"patch": [...]}) to original.
+
+    Returns the patched document if it still validates against contract,
+    else None (logged). See json_patch for the accepted patch forms.
+    """
+    reply = extract_json_object(content)
+    if reply is None:
+        LOG.warning("Patch reply is not a JSON object.")
+        return None
+    patch = reply.get("patch")
+    if patch is None and reply and all(str(k).startswith("/") for k in reply):
+        # A bare {"/path": value} map
+        patch = reply
+    try:
+        patched = apply_json_patch(original, patch)
+    except JsonPatchError as e:
+        LOG.warning("Patch reply does not apply: %s", e)
+        return None
+    errs = get_schema_validator(load_contract_schema(contract))(patched)
+    if errs:
+        LOG.warning(
+            "Patched JSON failed schema validation (%d errors): %s",
+            len(errs),
+            "; ".join(errs[:3]),
+        )
+        return None
+    return patched
+
+
+def adjust_usage(work: UnitOfWork) -> OpenAIUsage:
+    """Return the usage accumulator of the Adjust step of work."""
+    return work.ensure_step_status(StepName.Adjust).usage
+
+
 class OpenAIRetry:
     def __init__(
         self,
         *,
         retry: RetryConfig,
         sleep: Callable[[float], None],
+        usage: Optional[OpenAIUsage] = None,
+        cache: Optional[LLMResponseCache] = None,
+        hedge: Optional[HedgePolicy] = None,
+        deadline: Optional[float] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        budget: Optional[RetryBudget] = None,
+        slots: Optional[threading.Semaphore] = None,
+        pool: Optional[ThreadPoolExecutor] = None,
     ):
         self._retry = retry
         self._sleep = sleep
+        # Requests, tokens, retries and backoff are recorded here when given
+        self._usage = usage
+        # Consulted by create_completion before calling the API
+        self._cache = cache
+        # Cache keys of the replies returned so far, evicted by record_fallback
+        self._served_keys: List[str] = []
+        self._served_lock = threading.Lock()
+        # Applied to calls made with hedge=True (see request_policy)
+        self._hedge = hedge
+        # time.monotonic() after which no request or retry is started
+        self._deadline = deadline
+        # Process-wide outage guards shared with every other step
+        self._breaker = breaker
+        self._budget = budget
+        # Cap on in-flight requests (see request_policy.request_slots_for)
+        self._slots = slots
+        # Threads running bounded requests (see request_policy.request_pool_for)
+        self._pool = pool
+
+    @property
+    def usage(self) -> Optional[OpenAIUsage]:
+        return self._usage
+
+    @property
+    def deadline(self) -> Optional[float]:
+        return self._deadline
+
+    def detached(
+        self, *, usage: OpenAIUsage, deadline: Optional[float]
+    ) -> "OpenAIRetry":
+        """
+        Copy for a request made on behalf of several steps.
+
+        It keeps the retry policy and the process-wide guards, records into
+        usage (for the caller to split among the steps), stops at deadline
+        and bypasses the response cache, whose entries belong to one step.
+        """
+        return OpenAIRetry(
+            retry=self._retry,
+            sleep=self._sleep,
+            usage=usage,
+            hedge=self._hedge,
+            deadline=deadline,
+            breaker=self._breaker,
+            budget=self._budget,
+            slots=self._slots,
+            pool=self._pool,
+        )
 
     def _get_status_code(self, exc: Exception) -> Optional[int]:
         for attr in ("status_code", "status", "http_status"):
@@ -167,34 +427,114 @@ class OpenAIRetry:
         )
         return any(m in msg for m in transient_markers)
 
-    def _sleep_with_backoff(
+    def _backoff_delay(
         self, attempt_idx: int, *, is_write: bool, exc: Exception
-    ) -> None:
+    ) -> float:
         retry_after = self._get_retry_after_s(exc)
         if retry_after is not None and retry_after > 0:
-            self._sleep(min(self._retry.max_delay_s, retry_after))
-            return
+            delay = min(self._retry.max_delay_s, retry_after)
+        else:
+            mult = self._retry.write_multiplier if is_write else 1.0
+            raw = self._retry.base_delay_s * (2**attempt_idx) * mult
+            capped = min(self._retry.max_delay_s, raw)
 
-        mult = self._retry.write_multiplier if is_write else 1.0
-        raw = self._retry.base_delay_s * (2**attempt_idx) * mult
-        capped = min(self._retry.max_delay_s, raw)
+            if self._retry.deterministic:
+                delay = capped
+            else:
+                delay = random.random() * capped  # full jitter
 
-        if self._retry.deterministic:
-            delay = capped
-        else:
-            delay = random.random() * capped  # full jitter
+            delay = max(0.25, delay)
+        return delay
 
-        delay = max(0.25, delay)
+    def _sleep_with_backoff(
+        self,
+        attempt_idx: int,
+        *,
+        is_write: bool,
+        exc: Exception,
+        delay: Optional[float] = None,
+    ) -> None:
+        if delay is None:
+            delay = self._backoff_delay(attempt_idx, is_write=is_write, exc=exc)
+        if self._usage is not None:
+            self._usage.record_retry(delay)
         self._sleep(delay)
 
-    def call(self, fn: Callable[[], T], *, is_write: bool, op_name: str) -> T:
+    def _run_in_slot(self, fn: Callable[[], T], *, op_name: str, hedge: bool) -> T:
+        """
+        run_bounded(fn) while holding one request slot, if capped.
+
+        The slot is held only while the request runs, not during backoff.
+        Hedged duplicates share it, and a request abandoned at the deadline
+        gives it back, so hung requests cannot starve the cap.
+        """
+
+        def _run() -> T:
+            return run_bounded(
+                fn,
+                op_name=op_name,
+                hedge=self._hedge if hedge else None,
+                deadline=self._deadline,
+                usage=self._usage,
+                pool=self._pool,
+            )
+
+        if self._slots is None:
+            return _run()
+        left = remaining_s(self._deadline)
+        if not self._slots.acquire(timeout=None if left is None else max(left, 0)):
+            raise DeadlineExceeded(f"{op_name} timed out: step deadline reached")
+        try:
+            return _run()
+        finally:
+            self._slots.release()
+
+    def call(
+        self,
+        fn: Callable[[], T],
+        *,
+        is_write: bool,
+        op_name: str,
+        hedge: bool = False,
+    ) -> T:
+        """
+        Run fn with retries on transient errors.
+
+        With a deadline, no attempt or backoff runs past it. hedge=True marks
+        fn as safe to duplicate (no side effects), enabling the hedge policy.
+        An open circuit breaker or a spent retry budget fails immediately.
+        """
+
         last_exc: Optional[Exception] = None
         for attempt in range(self._retry.max_attempts):
+            left = remaining_s(self._deadline)
+            if left is not None and left <= 0:
+                raise RuntimeError(
+                    f"{op_name} failed: step deadline reached"
+                    + (f" ({last_exc})" if last_exc else "")
+                )
+            if self._breaker is not None and not self._breaker.allow():
+                raise RuntimeError(f"{op_name} skipped: OpenAI circuit breaker is open")
+            if attempt == 0 and self._budget is not None:
+                self._budget.record_attempt()
             try:
-                return fn()
+                result = self._run_in_slot(fn, op_name=op_name, hedge=hedge)
+            except DeadlineExceeded as e:
+                # Our own time limit, not a provider failure: keep it out of
+                # the breaker's failure rate
+                if self._usage is not None:
+                    self._usage.record_request()
+                if self._breaker is not None:
+                    self._breaker.release()
+                raise RuntimeError(f"{op_name} failed: step deadline reached") from e
             except Exception as e:
                 last_exc = e
-                if not self._is_transient(e):
+                if self._usage is not None:
+                    self._usage.record_request()
+                transient = self._is_transient(e)
+                if self._breaker is not None:
+                    self._breaker.record(failed=transient)
+                if not transient:
                     raise RuntimeError(f"{op_name} failed (non-retryable): {e}") from e
                 if attempt >= self._retry.max_attempts - 1:
                     status = self._get_status_code(e)
@@ -203,6 +543,132 @@ class OpenAIRetry:
                         + (f" (HTTP {status})" if status else "")
                         + f": {e}"
                     ) from e
-                self._sleep_with_backoff(attempt, is_write=is_write, exc=e)
+                if self._budget is not None and not self._budget.try_retry():
+                    raise RuntimeError(
+                        f"{op_name} failed (retry budget exhausted): {e}"
+                    ) from e
+                delay = self._backoff_delay(attempt, is_write=is_write, exc=e)
+                left = remaining_s(self._deadline)
+                if left is not None and delay >= left:
+                    raise RuntimeError(
+                        f"{op_name} failed: step deadline reached: {e}"
+                    ) from e
+                self._sleep_with_backoff(attempt, is_write=is_write, exc=e, delay=delay)
+            else:
+                if self._breaker is not None:
+                    self._breaker.record(failed=False)
+                if self._usage is not None:
+                    self._usage.record_request(completion_usage(result))
+                return result
 
         raise RuntimeError(f"{op_name} failed unexpectedly: {last_exc}")
+
+    def record_fallback(self) -> None:
+        """
+        Count a reply discarded as unparsable or invalid.
+
+        The cached replies returned by this retryer are evicted, as the
+        rejected one is among them; the next run requests them again.
+        """
+        if self._usage is not None:
+            self._usage.record_fallback()
+        if self._cache is None:
+            return
+        with self._served_lock:
+            keys, self._served_keys = self._served_keys, []
+        for key in keys:
+            self._cache.delete(key)
+
+    def _served(self, key: str) -> None:
+        with self._served_lock:
+            self._served_keys.append(key)
+
+    def _create(self, client: Any, request: Dict[str, Any]) -> Any:
+        """Send request, its client timeout cut to the time left at the deadline."""
+        timeout = request_timeout_s(request.get("timeout"), self._deadline)
+        if timeout is not None:
+            request = {**request, "timeout": timeout}
+        return client.chat.completions.create(**request)
+
+    def create_completion(self, client: Any, *, op_name: str, **request: Any) -> Any:
+        """
+        Run client.chat.completions.create(**request) with retries.
+
+        With a response cache, an identical earlier request (the timeout is
+        not part of the key) is answered from the cache with a minimal
+        completion object. Only finished replies whose content holds a JSON
+        object are stored, and record_fallback() evicts them again, so a
+        reply the caller rejects is requested anew on the next run.
+
+        A request with a response_format the model rejects (HTTP 400, e.g.
+        a model without structured outputs) is sent once more without it.
+        """
+        key = None
+        if self._cache is not None:
+            key = self._cache.key(
+                **{name: value for name, value in request.items() if name != "timeout"}
+            )
+            content = self._cache.get(key)
+            if content is not None:
+                if self._usage is not None:
+                    self._usage.record_cache_hit()
+                self._served(key)
+                return _cached_completion(content)
+
+        # Chat completions have no side effects, so they may be hedged
+        try:
+            completion = self.call(
+                lambda: self._create(client, request),
+                is_write=True,
+                op_name=op_name,
+                hedge=True,
+            )
+        except RuntimeError as e:
+            cause = e.__cause__
+            if (
+                "response_format" not in request
+                or not isinstance(cause, Exception)
+                or self._get_status_code(cause) != 400
+            ):
+                raise
+            LOG.warning(
+                "%s: structured output rejected, retrying without it: %s",
+                op_name,
+                cause,
+            )
+            request = {k: v for k, v in request.items() if k != "response_format"}
+            completion = self.call(
+                lambda: self._create(client, request),
+                is_write=True,
+                op_name=op_name,
+                hedge=True,
+            )
+        else:
+            if "response_format" in request and self._usage is not None:
+                self._usage.record_structured()
+        if key is not None:
+            try:
+                choice = completion.choices[0]
+                content = choice.message.content
+                finish_reason = getattr(choice, "finish_reason", None)
+            except Exception:
+                content = None
+                finish_reason = None
+            if (
+                finish_reason in (None, "stop")
+                and extract_json_object(content) is not None
+            ):
+                self._cache.put(key, content)
+                self._served(key)
+        return completion
+
+
+def _cached_completion(content: str) -> Any:
+    """A completion-shaped object carrying a cached reply."""
+    return SimpleNamespace(
+        choices=[
+            SimpleNamespace(
+                finish_reason="stop", message=SimpleNamespace(content=content)
+            )
+        ]
+    )
@@ -0,0 +1,244 @@
+"""
+Local relevance pre-ranking for the job-specific adjuster.
+
+Scores the experiences of a CV (and the bullets within them) against the
+job description with Okapi BM25, so only the most relevant content is sent
+to the model. Everything left out is spliced back into the adjusted CV by
+RelevanceFilter.restore(): unsent experiences at their original positions,
+unsent bullets after the adjusted ones (they scored lowest, which is where
+the adjustment would have put them). Adjusted experiences are matched to
+the sent ones by heading, as the model may reorder them.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence
+
+LOG = logging.getLogger("cvextract")
+
+_WORD = re.compile(r"[^\W_]+(?:[+#.][^\W_]*)*", re.UNICODE)
+
+# Too common in CVs and job ads to tell experiences apart
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or our "
+    "that the this to was we were will with you your".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase words of text; keeps terms like `c++`, `c#` and `node.js`."""
+    return [
+        word
+        for word in (m.group(0).rstrip(".") for m in _WORD.finditer(text.lower()))
+        if word and word not in _STOPWORDS
+    ]
+
+
+def bm25_scores(
+    documents: Sequence[str], query: str, *, k1: float = 1.5, b: float = 0.75
+) -> List[float]:
+    """Okapi BM25 score of each document for query (0.0 for no overlap)."""
+    docs = [Counter(tokenize(doc)) for doc in documents]
+    terms = set(tokenize(query))
+    if not docs or not terms:
+        return [0.0] * len(docs)
+    lengths = [sum(doc.values()) for doc in docs]
+    avg_length = (sum(lengths) / len(docs)) or 1.0
+    idf = {}
+    for term in terms:
+        df = sum(1 for doc in docs if term in doc)
+        idf[term] = math.log(1 + (len(docs) - df + 0.5) / (df + 0.5))
+    scores = []
+    for doc, length in zip(docs, lengths):
+        score = 0.0
+        for term in terms:
+            tf = doc.get(term, 0)
+            if tf:
+                norm = tf + k1 * (1 - b + b * length / avg_length)
+                score += idf[term] * tf * (k1 + 1) / norm
+        scores.append(score)
+    return scores
+
+
+def _experience_text(experience: Dict[str, Any]) -> str:
+    parts: List[str] = []
+    for key in ("heading", "description"):
+        if isinstance(experience.get(key), str):
+            parts.append(experience[key])
+    for key in ("bullets", "environment"):
+        values = experience.get(key)
+        if isinstance(values, list):
+            parts.extend(v for v in values if isinstance(v, str))
+    return "\n".join(parts)
+
+
+def _heading(experience: Any) -> Optional[str]:
+    heading = experience.get("heading") if isinstance(experience, dict) else None
+    return heading if isinstance(heading, str) else None
+
+
+def _top_indices(scores: List[float], n: int) -> List[int]:
+    """Indices of the n highest scores, in their original order."""
+    ranked = sorted(range(len(scores)), key=lambda i: (-scores[i], i))
+    return sorted(ranked[:n])
+
+
+class RelevanceFilter:
+    """
+    Sends only the content of a CV most relevant to a job.
+
+    With top_experiences, the most recent experience and the highest scoring
+    others (up to top_experiences in total) are sent; with top_bullets, each
+    sent experience keeps its top_bullets highest scoring bullets. fit()
+    returns the reduced copy and restore() puts the rest back.
+    """
+
+    def __init__(
+        self,
+        query: str,
+        *,
+        top_experiences: Optional[int] = None,
+        top_bullets: Optional[int] = None,
+    ):
+        self._query = query
+        self._top_experiences = top_experiences
+        self._top_bullets = top_bullets
+        self._original: List[Any] = []
+        self._sent: List[int] = []
+        # Per sent experience: the bullets left out, in their original order
+        self._unsent_bullets: List[List[Any]] = []
+
+    @property
+    def active(self) -> bool:
+        return bool(self._top_experiences or self._top_bullets)
+
+    def fit(self, cv: Dict[str, Any]) -> Dict[str, Any]:
+        """Return cv reduced to its most relevant content (cv itself if whole)."""
+        experiences = cv.get("experiences")
+        if not self.active or not isinstance(experiences, list):
+            return cv
+        self._original = experiences
+        self._sent = list(range(len(experiences)))
+        if self._top_experiences and len(experiences) > self._top_experiences:
+            scores = bm25_scores(
+                [
+                    _experience_text(e) if isinstance(e, dict) else ""
+                    for e in experiences[1:]
+                ],
+                self._query,
+            )
+            # Experiences are listed newest first; always keep the latest one
+            self._sent = [0] + [
+                i + 1 for i in _top_indices(scores, self._top_experiences - 1)
+            ]
+
+        sent: List[Any] = []
+        self._unsent_bullets = []
+        for idx in self._sent:
+            experience = experiences[idx]
+            bullets = (
+                experience.get("bullets") if isinstance(experience, dict) else None
+            )
+            if (
+                not self._top_bullets
+                or not isinstance(bullets, list)
+                or len(bullets) <= self._top_bullets
+            ):
+                sent.append(experience)
+                self._unsent_bullets.append([])
+                continue
+            scores = bm25_scores(
+                [b if isinstance(b, str) else "" for b in bullets], self._query
+            )
+            keep = set(_top_indices(scores, self._top_bullets))
+            sent.append(
+                {
+                    **experience,
+                    "bullets": [b for i, b in enumerate(bullets) if i in keep],
+                }
+            )
+            self._unsent_bullets.append(
+                [b for i, b in enumerate(bullets) if i not in keep]
+            )
+
+        unsent_experiences = len(experiences) - len(self._sent)
+        unsent_bullets = sum(len(b) for b in self._unsent_bullets)
+        if not unsent_experiences and not unsent_bullets:
+            self._original = []
+            return cv
+        LOG.info(
+            "Relevance pre-ranking: sending %d of %d experiences (%d bullets held back).",
+            len(self._sent),
+            len(experiences),
+            unsent_bullets,
+        )
+        return {**cv, "experiences": sent}
+
+    def _match(self, experiences: List[Any]) -> Optional[List[int]]:
+        """
+        Position among the sent experiences of each adjusted one, or None.
+
+        Experiences are matched by heading; repeated (or missing) headings
+        are matched in order.
+        """
+        by_heading: Dict[Optional[str], List[int]] = {}
+        for pos, idx in enumerate(self._sent):
+            by_heading.setdefault(_heading(self._original[idx]), []).append(pos)
+        matched: List[int] = []
+        for experience in experiences:
+            candidates = by_heading.get(_heading(experience))
+            if not candidates:
+                return None
+            matched.append(candidates.pop(0))
+        return matched
+
+    def restore(self, adjusted: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Splice the content fit() left out back into the adjusted CV.
+
+        Returns None if the adjusted experiences cannot be matched one to
+        one to the sent experiences by heading, as the content could then
+        not be put back in place.
+        """
+        experiences = adjusted.get("experiences")
+        if not self._original:
+            return adjusted
+        if not isinstance(experiences, list) or len(experiences) != len(self._sent):
+            LOG.warning(
+                "Relevance pre-ranking: expected %d experiences back, got %s.",
+                len(self._sent),
+                len(experiences) if isinstance(experiences, list) else "none",
+            )
+            return None
+        matched = self._match(experiences)
+        if matched is None:
+            LOG.warning(
+                "Relevance pre-ranking: adjusted experience headings do not "
+                "match the sent ones."
+            )
+            return None
+
+        # Sent experience position -> adjusted experience
+        by_sent = dict(zip(matched, experiences))
+        by_position = dict(zip(self._sent, range(len(self._sent))))
+        merged: List[Any] = []
+        for idx, original in enumerate(self._original):
+            pos = by_position.get(idx)
+            if pos is None:
+                merged.append(copy.deepcopy(original))
+                continue
+            experience = by_sent[pos]
+            unsent = self._unsent_bullets[pos]
+            if unsent and isinstance(experience, dict):
+                bullets = experience.get("bullets")
+                experience["bullets"] = (
+                    bullets if isinstance(bullets, list) else []
+                ) + copy.deepcopy(unsent)
+            merged.append(experience)
+        adjusted["experiences"] = merged
+        return adjusted
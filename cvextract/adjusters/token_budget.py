@@ -0,0 +1,239 @@
+"""
+Pre-flight prompt sizing for the OpenAI adjusters.
+
+Estimates prompt sizes locally (with tiktoken when it is installed, else a
+bytes-per-token approximation), knows the context window and output limit
+of common models, and trims the lowest-value parts of an adjuster payload
+until the request fits: research evidence first, then the least important
+research sections, then the oldest experiences of the CV.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover
+    tiktoken = None
+
+LOG = logging.getLogger("cvextract")
+
+
+@dataclass(frozen=True)
+class ModelLimits:
+    context_tokens: int
+    max_output_tokens: int
+
+
+# Matched by prefix, most specific first
+_MODEL_LIMITS = (
+    ("gpt-4.1", ModelLimits(1_047_576, 32_768)),
+    ("gpt-4o", ModelLimits(128_000, 16_384)),
+    ("gpt-4-turbo", ModelLimits(128_000, 4_096)),
+    ("gpt-4", ModelLimits(8_192, 8_192)),
+    ("gpt-3.5-turbo", ModelLimits(16_385, 4_096)),
+    ("o1", ModelLimits(200_000, 100_000)),
+    ("o3", ModelLimits(200_000, 100_000)),
+    ("o4", ModelLimits(200_000, 100_000)),
+)
+_DEFAULT_LIMITS = ModelLimits(128_000, 16_384)
+
+# Per-message framing overhead of the chat format
+_MESSAGE_OVERHEAD_TOKENS = 4
+
+# The adjusted CV comes back about as large as it was sent; keep headroom
+_OUTPUT_HEADROOM = 1.15
+
+# Research sections dropped (in this order) before the CV itself is trimmed
+_LOW_VALUE_RESEARCH_KEYS = (
+    "acquisition_history",
+    "rebranding_history",
+    "industry_classification",
+    "headquarters",
+    "tags",
+)
+
+
+def model_limits(model: str) -> ModelLimits:
+    """Return the context window and output limit of model."""
+    for prefix, limits in _MODEL_LIMITS:
+        if model.startswith(prefix):
+            return limits
+    return _DEFAULT_LIMITS
+
+
+@lru_cache(maxsize=1)
+def _encoding() -> Any:
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        # Encoding files unavailable (e.g. offline); fall back to estimating
+        return None
+
+
+def estimate_tokens(text: str) -> int:
+    """Return the number of tokens text is expected to take."""
+    if not text:
+        return 0
+    encoding = _encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    # About four bytes per token; non-ASCII text tokenizes denser
+    return (len(text.encode("utf-8")) + 3) // 4
+
+
+def compact_json(data: Any) -> str:
+    """Serialize data as minified JSON for a prompt."""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut text at a word boundary so it takes at most max_tokens tokens."""
+    tokens = estimate_tokens(text)
+    if tokens <= max_tokens:
+        return text
+    end = len(text) * max_tokens // tokens
+    while end > 0:
+        cut = text[:end]
+        space = cut.rfind(" ")
+        if space > end // 2:
+            cut = cut[:space]
+        cut = cut.rstrip()
+        if estimate_tokens(cut) <= max_tokens:
+            return cut
+        end = end * 9 // 10
+    return ""
+
+
+def text_budget(model: str, cap_tokens: int) -> int:
+    """Tokens a free-text prompt section (e.g. a job description) may use."""
+    return min(cap_tokens, model_limits(model).context_tokens // 8)
+
+
+class PayloadBudget:
+    """
+    Fits the user payload of one adjuster request to a model's limits.
+
+    The payload holds the CV under cv_key (echoed back by the model, so it
+    also has to fit the output limit) and optionally company research under
+    "company_research". fit() trims a copy; experiences removed from the CV
+    are put back into the adjusted result by restore().
+    """
+
+    def __init__(
+        self,
+        model: str,
+        system_prompt: str,
+        payload: Dict[str, Any],
+        *,
+        cv_key: str = "original_json",
+    ):
+        self._limits = model_limits(model)
+        self._system_tokens = estimate_tokens(system_prompt)
+        self._cv_key = cv_key
+        self.payload = payload
+        self.trimmed: List[str] = []
+        self._removed_experiences: List[Any] = []
+
+    def _overflow(self) -> int:
+        """Tokens by which the request exceeds the model's limits (<= 0 fits)."""
+        cv_tokens = estimate_tokens(compact_json(self.payload.get(self._cv_key)))
+        output_tokens = int(cv_tokens * _OUTPUT_HEADROOM)
+        prompt_tokens = (
+            self._system_tokens
+            + estimate_tokens(compact_json(self.payload))
+            + 2 * _MESSAGE_OVERHEAD_TOKENS
+        )
+        return max(
+            output_tokens - self._limits.max_output_tokens,
+            prompt_tokens + output_tokens - self._limits.context_tokens,
+        )
+
+    def _trim_research(self) -> bool:
+        research = self.payload.get("company_research")
+        if not isinstance(research, dict):
+            return False
+        signals = research.get("technology_signals")
+        if isinstance(signals, list):
+            with_evidence = [
+                s
+                for s in signals
+                if isinstance(s, dict) and ("signals" in s or "notes" in s)
+            ]
+            if with_evidence:
+                for signal in with_evidence:
+                    signal.pop("signals", None)
+                    signal.pop("notes", None)
+                self.trimmed.append("research evidence")
+                return True
+        for key in _LOW_VALUE_RESEARCH_KEYS:
+            if key in research:
+                del research[key]
+                self.trimmed.append(f"research {key}")
+                return True
+        if isinstance(signals, list) and signals:
+            signals.pop()
+            self.trimmed.append("research technology signal")
+            return True
+        return False
+
+    def _trim_experiences(self) -> bool:
+        cv = self.payload.get(self._cv_key)
+        experiences = cv.get("experiences") if isinstance(cv, dict) else None
+        # Experiences are listed newest first; always keep the latest one
+        if not isinstance(experiences, list) or len(experiences) <= 1:
+            return False
+        self._removed_experiences.insert(0, experiences.pop())
+        self.trimmed.append("oldest experience")
+        return True
+
+    def fit(self) -> Dict[str, Any]:
+        """Return the payload, trimmed (as a copy) if it does not fit."""
+        if self._overflow() <= 0:
+            return self.payload
+        self.payload = copy.deepcopy(self.payload)
+        while self._overflow() > 0:
+            if not (self._trim_research() or self._trim_experiences()):
+                LOG.warning(
+                    "Prompt exceeds the model limits by ~%d tokens after trimming.",
+                    self._overflow(),
+                )
+                break
+        if self.trimmed:
+            LOG.info(
+                "Trimmed prompt to fit the model: %s.",
+                ", ".join(_count_labels(self.trimmed)),
+            )
+        return self.payload
+
+    def restore(self, adjusted: Dict[str, Any]) -> Dict[str, Any]:
+        """Append the experiences fit() removed to the adjusted CV."""
+        if not self._removed_experiences:
+            return adjusted
+        experiences = adjusted.get("experiences")
+        if isinstance(experiences, list):
+            adjusted["experiences"] = experiences + self._removed_experiences
+        return adjusted
+
+
+def _count_labels(labels: List[str]) -> List[str]:
+    counts: Dict[str, int] = {}
+    for label in labels:
+        counts[label] = counts.get(label, 0) + 1
+    return [
+        label if count == 1 else f"{count}x {label}" for label, count in counts.items()
+    ]
+
+
+def fits_output(model: str, data: Optional[Any]) -> bool:
+    """Whether data echoed back by the model fits its output limit."""
+    tokens = int(estimate_tokens(compact_json(data)) * _OUTPUT_HEADROOM)
+    return tokens <= model_limits(model).max_output_tokens
@@ -0,0 +1,133 @@
+"""
+Translation memory for the OpenAI translate adjuster.
+
+Stores translated strings keyed by (source string, target language, model)
+so that strings shared across many CVs (sidebar skills, industries, standard
+bullets, academic background) are translated once and reused.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from .openai_utils import atomic_write_json
+
+LOG = logging.getLogger("cvextract")
+
+
+def translation_memory_filename(language: str, model: str) -> str:
+    """
+    Return the memory filename for a (language, model) pair.
+
+    Returns:
+        "gpt-4o-mini.de.json"
+    """
+    safe_model = re.sub(r"[^A-Za-z0-9_.-]", "_", model)
+    safe_language = re.sub(r"[^A-Za-z0-9_.-]", "_", language.lower())
+    return f"{safe_model}.{safe_language}.json"
+
+
+class TranslationMemory:
+    """
+    Thread-safe store of translated strings for one (language, model) pair.
+
+    Entries are kept in memory and persisted as a flat JSON object mapping
+    source strings to their translations when a path is given.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Initialize the translation memory.
+
+        Args:
+            path: Optional JSON file used to load and persist entries.
+        """
+        self.path = path
+        self._entries: Dict[str, str] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        if path is not None:
+            self._load()
+
+    def _load(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            LOG.warning("Failed to load translation memory (%s)", type(e).__name__)
+            return
+        if not isinstance(data, dict):
+            return
+        self._entries = {
+            k: v for k, v in data.items() if isinstance(k, str) and isinstance(v, str)
+        }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, source: str) -> Optional[str]:
+        with self._lock:
+            return self._entries.get(source)
+
+    def lookup(self, sources: Iterable[str]) -> Dict[str, str]:
+        """Return the known translations for the given source strings."""
+        with self._lock:
+            return {s: self._entries[s] for s in sources if s in self._entries}
+
+    def put(self, source: str, translation: str) -> None:
+        with self._lock:
+            if self._entries.get(source) != translation:
+                self._entries[source] = translation
+                self._dirty = True
+
+    def save(self) -> None:
+        """Persist entries to disk (no-op without a path or changes)."""
+        if self.path is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            snapshot = dict(self._entries)
+            self._dirty = False
+        try:
+            atomic_write_json(self.path, snapshot)
+        except Exception as e:
+            LOG.warning("Failed to save translation memory (%s)", type(e).__name__)
+
+
+# Process-wide memories so parallel workers share one store per file.
+_MEMORIES: Dict[Tuple[Optional[Path], str, str], TranslationMemory] = {}
+_MEMORIES_LOCK = threading.Lock()
+
+
+def get_translation_memory(
+    directory: Optional[Path], language: str, model: str
+) -> TranslationMemory:
+    """
+    Return the shared translation memory for (language, model).
+
+    Args:
+        directory: Directory holding memory files, or None for in-memory only.
+        language: Target language.
+        model: OpenAI model used for translation.
+    """
+    path = (
+        directory / translation_memory_filename(language, model)
+        if directory is not None
+        else None
+    )
+    key = (path.resolve() if path is not None else None, language.lower(), model)
+    with _MEMORIES_LOCK:
+        memory = _MEMORIES.get(key)
+        if memory is None:
+            memory = TranslationMemory(path)
+            _MEMORIES[key] = memory
+        return memory
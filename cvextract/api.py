@@ -0,0 +1,171 @@
+"""
+In-process batch API.
+
+Works on in-memory buffers instead of files under a target directory, so
+services can embed cvextract without writing temporary files:
+
+    from cvextract.api import extract_many, render_many
+
+    for result in extract_many(docx_blobs, workers=8):
+        if result.ok:
+            store(result.index, result.value)
+
+Items run on a thread pool like `--parallel` and results are yielded as
+they complete. Inputs are consumed lazily, so unbounded iterables stream
+with a bounded number of items in flight.
+"""
+
+from __future__ import annotations
+
+import io
+import traceback
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Set, Tuple, Union
+
+from .extractors.docx_extractor import extract_docx_cv_data
+from .logging_utils import LOG
+from .renderers.docx_renderer import render_docx_template
+from .verifiers.schema_validator import get_schema_validator, load_contract_schema
+
+DocxInput = Union[bytes, bytearray, memoryview, Path]
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one item of a batch call."""
+
+    index: int  # Position of the item in the input iterable
+    value: Any = None  # CV data dict (extract) or .docx bytes (render)
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+def _run_one(
+    func: Callable[[Any], Tuple[Any, List[str]]], index: int, item: Any
+) -> BatchResult:
+    try:
+        value, errors = func(item)
+    except Exception as e:
+        LOG.debug(traceback.format_exc())
+        return BatchResult(index=index, errors=[f"exception: {type(e).__name__}"])
+    return BatchResult(index=index, value=value, errors=errors)
+
+
+def _run_many(
+    func: Callable[[Any], Tuple[Any, List[str]]],
+    items: Iterable[Any],
+    workers: int,
+    ordered: bool,
+) -> Iterator[BatchResult]:
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    return _iter_results(func, items, workers, ordered)
+
+
+def _iter_results(
+    func: Callable[[Any], Tuple[Any, List[str]]],
+    items: Iterable[Any],
+    workers: int,
+    ordered: bool,
+) -> Iterator[BatchResult]:
+    source = enumerate(items)
+    window = workers * 2
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="cvextract-api"
+    ) as executor:
+        pending: Set[Future] = set()
+        finished: Dict[int, BatchResult] = {}
+        next_index = 0
+        exhausted = False
+        while True:
+            # Results held back for ordering count against the window too
+            while not exhausted and len(pending) + len(finished) < window:
+                try:
+                    index, item = next(source)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending.add(executor.submit(_run_one, func, index, item))
+            if not pending:
+                break
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if ordered:
+                    finished[result.index] = result
+                else:
+                    yield result
+            while next_index in finished:
+                yield finished.pop(next_index)
+                next_index += 1
+
+
+def extract_many(
+    sources: Iterable[DocxInput],
+    *,
+    workers: int = 4,
+    ordered: bool = False,
+    verify: bool = True,
+) -> Iterator[BatchResult]:
+    """
+    Extract CV data from many .docx documents held in memory.
+
+    Uses the default DOCX extractor; nothing is written to disk.
+
+    Args:
+        sources: .docx contents as bytes (paths are accepted too).
+        workers: Number of documents processed concurrently.
+        ordered: Yield results in input order instead of completion order.
+        verify: Validate each result against the CV schema and report
+            violations in BatchResult.errors (the data is still returned).
+
+    Yields:
+        BatchResult whose value is the CV data dictionary.
+    """
+    validator = (
+        get_schema_validator(load_contract_schema("cv_schema.json")) if verify else None
+    )
+
+    def extract_one(source: DocxInput) -> Tuple[Dict[str, Any], List[str]]:
+        buffer = source if isinstance(source, Path) else io.BytesIO(source)
+        data = extract_docx_cv_data(buffer)
+        return data, validator(data) if validator else []
+
+    return _run_many(extract_one, sources, workers, ordered)
+
+
+def render_many(
+    cv_data: Iterable[Dict[str, Any]],
+    template: DocxInput,
+    *,
+    workers: int = 4,
+    ordered: bool = False,
+) -> Iterator[BatchResult]:
+    """
+    Render many CV data dictionaries into one .docx template in memory.
+
+    Args:
+        cv_data: CV data dictionaries.
+        template: Template .docx contents as bytes, or a path to it.
+        workers: Number of documents rendered concurrently.
+        ordered: Yield results in input order instead of completion order.
+
+    Yields:
+        BatchResult whose value is the rendered .docx as bytes.
+    """
+    template_bytes = (
+        template.read_bytes() if isinstance(template, Path) else bytes(template)
+    )
+
+    def render_one(data: Dict[str, Any]) -> Tuple[bytes, List[str]]:
+        output = io.BytesIO()
+        render_docx_template(io.BytesIO(template_bytes), data, output)
+        return output.getvalue(), []
+
+    return _run_many(render_one, cv_data, workers, ordered)
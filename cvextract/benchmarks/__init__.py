@@ -0,0 +1,5 @@
+"""
+Opt-in benchmarks, run as modules (e.g. `python -m cvextract.benchmarks.json_io`).
+
+Kept out of the test suite: wall-clock numbers are too noisy to assert on.
+"""
@@ -0,0 +1,100 @@
+"""
+Write and read throughput of intermediate JSON, pretty vs compact.
+
+Usage:
+    python -m cvextract.benchmarks.json_io [--count N]
+
+Writes N copies of a typical CV in each `--intermediate-json` format with
+shared.dumps_json, reads them back with shared.read_json and prints CVs
+per second and bytes per CV. orjson is used for compact JSON when installed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..shared import dumps_json, orjson, read_json
+
+# A CV of typical size: a dozen experiences with bullets and environment
+SAMPLE_CV: Dict[str, Any] = {
+    "identity": {
+        "title": "Engineer",
+        "full_name": "Ada Lövelace",
+        "first_name": "Ada",
+        "last_name": "Lövelace",
+    },
+    "sidebar": {"languages": ["English", "Français"], "tools": ["Python"] * 10},
+    "overview": "Builds things. " * 20,
+    "experiences": [
+        {
+            "heading": f"2020 - 2024 | Role {n}",
+            "description": "Did things. " * 15,
+            "bullets": [f"Bullet {b} with some detail" for b in range(6)],
+            "environment": ["Python", "AWS", "Kubernetes"],
+        }
+        for n in range(12)
+    ],
+}
+
+
+def run(
+    directory: Path, *, count: int = 200, data: Optional[Dict[str, Any]] = None
+) -> Dict[str, Dict[str, float]]:
+    """
+    Time writing and reading count files per format in directory.
+
+    Returns, per format ("pretty", "compact"): write_s, read_s and bytes
+    (size of one file).
+    """
+    data = SAMPLE_CV if data is None else data
+    results: Dict[str, Dict[str, float]] = {}
+    for fmt, compact in (("pretty", False), ("compact", True)):
+        paths: List[Path] = [directory / f"{fmt}_{i}.json" for i in range(count)]
+        start = time.perf_counter()
+        for path in paths:
+            path.write_bytes(dumps_json(data, compact=compact))
+        write_s = time.perf_counter() - start
+        start = time.perf_counter()
+        for path in paths:
+            read_json(path)
+        read_s = time.perf_counter() - start
+        results[fmt] = {
+            "write_s": write_s,
+            "read_s": read_s,
+            "bytes": float(paths[0].stat().st_size),
+        }
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m cvextract.benchmarks.json_io",
+        description="Write/read throughput of pretty vs compact intermediate JSON.",
+    )
+    parser.add_argument(
+        "--count", type=int, default=200, help="CVs written per format (default 200)"
+    )
+    args = parser.parse_args(argv)
+    if args.count < 1:
+        parser.error("--count must be at least 1")
+
+    with tempfile.TemporaryDirectory(prefix="cvextract-bench-") as tmp:
+        results = run(Path(tmp), count=args.count)
+
+    print(f"{args.count} CVs per format (orjson: {'yes' if orjson else 'no'})")
+    for fmt, result in results.items():
+        print(
+            f"{fmt:>8}: write {args.count / result['write_s']:8.0f} CVs/s, "
+            f"read {args.count / result['read_s']:8.0f} CVs/s, "
+            f"{int(result['bytes'])} bytes/CV"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -23,6 +23,7 @@ Three-phase architecture:
 
 from __future__ import annotations
 
+import sys
 import traceback
 from pathlib import Path
 from typing import List, Optional
@@ -34,6 +35,19 @@ from cvextract.logging_utils import LOG, setup_logging
 from cvextract.output_controller import VerbosityLevel, initialize_output_controller
 
 
+def _pop_server_url(args: List[str]) -> Optional[str]:
+    """Remove --server URL (or --server=URL) from args and return the URL."""
+    for idx, token in enumerate(args):
+        if token == "--server" and idx + 1 < len(args):
+            url = args[idx + 1]
+            del args[idx : idx + 2]
+            return url
+        if token.startswith("--server="):
+            del args[idx]
+            return token.split("=", 1)[1]
+    return None
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     """
     Main CLI entry point with three-phase architecture.
@@ -42,6 +56,22 @@ def main(argv: Optional[List[str]] = None) -> int:
     Phase 2: Prepare execution environment (validate, setup)
     Phase 3: Execute pipeline (run operations)
     """
+    args = sys.argv[1:] if argv is None else list(argv)
+
+    if args and args[0] == "openai-gc":
+        from cvextract.cli_openai_gc import run_openai_gc
+
+        setup_logging(False)
+        return run_openai_gc(args[1:])
+
+    # Thin client: forward the invocation to a warm server process
+    server_url = _pop_server_url(args)
+    if server_url:
+        from cvextract.cli_server import forward_to_server
+
+        setup_logging(False)
+        return forward_to_server(server_url, args)
+
     # Phase 1: Gather requirements
     config = gather_user_requirements(argv)
 
@@ -25,6 +25,7 @@ class ExtractStage:
     )
     verifier: Optional[str] = None  # Verifier name (optional)
     skip_verify: bool = False  # Skip verification for this stage
+    cascade: bool = False  # Escalate to the next extractor when verification fails
 
 
 @dataclass
@@ -36,6 +37,7 @@ class AdjusterConfig:
     openai_model: Optional[str] = (
         None  # OpenAI model to use (for OpenAI-based adjusters)
     )
+    branch: Optional[str] = None  # Fan-out branch label (optional)
 
 
 @dataclass
@@ -48,6 +50,15 @@ class AdjustStage:
     verifier: Optional[str] = None  # Verifier name (optional)
     skip_verify: bool = False  # Skip verification for this stage
 
+    @property
+    def branches(self) -> Dict[str, List[AdjusterConfig]]:
+        """Adjuster chains grouped by branch label (empty unless fanning out)."""
+        branches: Dict[str, List[AdjusterConfig]] = {}
+        for adjuster in self.adjusters:
+            if adjuster.branch is not None:
+                branches.setdefault(adjuster.branch, []).append(adjuster)
+        return branches
+
 
 @dataclass
 class RenderStage:
@@ -60,6 +71,17 @@ class RenderStage:
     )
     verifier: Optional[str] = None  # Verifier name (optional)
     skip_verify: bool = False  # Skip verification for this stage
+    templates: List[Path] = field(
+        default_factory=list
+    )  # All templates when fanning out to several (template is the first)
+
+
+@dataclass
+class WatchStage:
+    """Configuration for watching the parallel source directory."""
+
+    debounce: float = 2.0  # Seconds a file must stay unchanged before processing
+    poll: float = 1.0  # Polling interval when inotify is unavailable
 
 
 @dataclass
@@ -69,6 +91,16 @@ class ParallelStage:
     source: Path  # Input directory to scan recursively
     n: int = 1  # Number of parallel workers (default=1)
     file_type: str = "*.docx"  # File pattern to match (default=*.docx)
+    watch: Optional[WatchStage] = None  # Keep running and process new/changed files
+
+
+@dataclass
+class ServeStage:
+    """Configuration for the long-running server mode."""
+
+    host: str = "127.0.0.1"  # Interface to bind (local only by default)
+    port: int = 8765  # TCP port to listen on
+    n: int = 4  # Number of worker threads running requests concurrently
 
 
 @dataclass(frozen=True)
@@ -83,10 +115,19 @@ class UserConfig:
     adjust: Optional[AdjustStage] = None
     render: Optional[RenderStage] = None
     parallel: Optional[ParallelStage] = None
+    serve: Optional[ServeStage] = None
 
     # Execution settings
     verbosity: str = "minimal"  # Output verbosity level: minimal, verbose, debug
     skip_all_verify: bool = False  # Skip all verification steps (global override)
+    intermediate_json: str = "pretty"  # JSON only read by later stages: pretty, compact
+    llm_cache: bool = True  # Reuse cached LLM responses (disabled by --no-llm-cache)
+    openai_hedge: bool = False  # Send a duplicate of slow OpenAI requests
+    openai_deadline_s: Optional[float] = None  # Time budget of OpenAI calls per step
+    openai_breaker_threshold: float = 0.5  # Failure rate opening the breaker (0: off)
+    openai_retry_budget: float = 0.2  # Retries allowed per first OpenAI attempt
+    openai_max_concurrency: Optional[int] = None  # In-flight adjuster requests cap
+    structured_output: bool = False  # Constrain replies to the JSON schemas
     debug_external: bool = False  # Capture external provider logs (OpenAI, httpx, etc.)
     log_file: Optional[str] = None
     log_failed: Optional[Path] = None  # Optional file path to write failed files
@@ -165,3 +206,11 @@ class Workspace:
     @property
     def verification_dir(self) -> Path:
         return self.target_dir / "verification_structured_data"
+
+    @property
+    def translation_memory_dir(self) -> Path:
+        return self.target_dir / "translation_memory"
+
+    @property
+    def llm_cache_dir(self) -> Path:
+        return self.target_dir / "llm_cache"
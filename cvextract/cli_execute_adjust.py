@@ -6,12 +6,18 @@ from __future__ import annotations
 
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import replace
 from pathlib import Path
+from typing import Callable
 
 from .adjusters import get_adjuster
 from .logging_utils import LOG
-from .shared import StepName, UnitOfWork
+from .shared import OpenAIUsage, StepName, UnitOfWork, merge_step_states
+
+# Upper bound on concurrently running adjust branches; OpenAI requests are
+# further capped process-wide by the adjusters' shared request limiter
+_MAX_BRANCH_WORKERS = 4
 
 
 def execute(work: UnitOfWork) -> UnitOfWork:
@@ -61,6 +67,11 @@ def execute(work: UnitOfWork) -> UnitOfWork:
         output_path = config.adjust.output or (
             config.workspace.adjusted_json_dir / rel_path / f"{base_input.stem}.json"
         )
+        branch = config.adjust.adjusters[0].branch if config.adjust.adjusters else None
+        if branch:
+            output_path = output_path.with_name(
+                f"{output_path.stem}_{branch}{output_path.suffix}"
+            )
         adjust_work = replace(work)
         adjust_work.set_step_paths(
             StepName.Adjust, input_path=input_path, output_path=output_path
@@ -109,3 +120,57 @@ def execute(work: UnitOfWork) -> UnitOfWork:
         if config.debug:
             LOG.error("Adjustment failed: %s", traceback.format_exc())
         return base_work
+
+
+def _run_branch(
+    work: UnitOfWork,
+    label: str,
+    run: Callable[[UnitOfWork], UnitOfWork],
+) -> UnitOfWork:
+    config = work.config
+    chain = config.adjust.branches[label]
+    branch_config = replace(config, adjust=replace(config.adjust, adjusters=chain))
+    states = {
+        step: replace(
+            status,
+            warnings=list(status.warnings),
+            errors=list(status.errors),
+            usage=OpenAIUsage(),
+        )
+        for step, status in work.step_states.items()
+    }
+    LOG.info("Adjust branch '%s': %d adjuster(s)", label, len(chain))
+    return run(replace(work, config=branch_config, step_states=states))
+
+
+def execute_fanout(
+    work: UnitOfWork, run: Callable[[UnitOfWork], UnitOfWork]
+) -> UnitOfWork:
+    """
+    Run every adjust branch concurrently from the same input JSON.
+
+    Each branch is an independent adjuster chain whose output is written
+    to its own file (the branch label is appended to the JSON stem) and,
+    through `run`, verified and rendered on its own. Per-branch warnings
+    and errors are merged back into `work`, prefixed with the branch label.
+
+    Args:
+        work: UnitOfWork after extract.
+        run: Adjust (and downstream) steps for one branch.
+    """
+    labels = list(work.config.adjust.branches)
+    workers = min(len(labels), _MAX_BRANCH_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        branches = list(
+            executor.map(lambda label: _run_branch(work, label, run), labels)
+        )
+    return merge_step_states(
+        work,
+        list(zip(labels, branches)),
+        (
+            StepName.Adjust,
+            StepName.VerifyAdjust,
+            StepName.Render,
+            StepName.VerifyRender,
+        ),
+    )
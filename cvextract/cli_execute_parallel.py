@@ -12,13 +12,20 @@ from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import replace
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from .cli_config import UserConfig
 from .cli_execute_single import execute_single
 from .logging_utils import LOG
 from .output_controller import get_output_controller
-from .shared import UnitOfWork, emit_work_status
+from .shared import (
+    OpenAIUsage,
+    StepName,
+    UnitOfWork,
+    collect_usage,
+    emit_work_status,
+    format_usage_report,
+)
 
 
 def scan_directory_for_files(
@@ -115,6 +122,7 @@ def _process_future_result(
     progress_str: str,
     controller,
     config: UserConfig,
+    usage: Optional[Dict[StepName, OpenAIUsage]] = None,
 ) -> Tuple["_WorkStatus", Optional[str]]:
     log_fn = None
     log_args: tuple[str, ...] = ()
@@ -125,6 +133,8 @@ def _process_future_result(
             raise ValueError("Expected UnitOfWork from execute_single")
 
         status = _derive_work_status(work)
+        if usage is not None:
+            collect_usage(work, usage)
         summary_message = emit_work_status(work)
         if summary_message.endswith(" | -"):
             summary_message = summary_message[:-4]
@@ -172,6 +182,7 @@ def _emit_parallel_summary(
     failed_files: List[str],
     config: UserConfig,
     controller,
+    usage: Optional[Dict[StepName, OpenAIUsage]] = None,
 ) -> None:
     success_count = full_success_count + partial_success_count
     controller.direct_print("=" * 60)
@@ -197,6 +208,10 @@ def _emit_parallel_summary(
     controller.direct_print(summary_msg)
     LOG.info(summary_msg)
 
+    for line in format_usage_report(usage or {}):
+        controller.direct_print(line)
+        LOG.info("%s", line)
+
     if failed_files and config.debug:
         controller.direct_print("Failed files:")
         LOG.info("Failed files:")
@@ -239,6 +254,7 @@ def _execute_parallel_pipeline(
     failed_count = 0
     failed_files = []
     completed_count = 0  # Track completed files for progress
+    usage: Dict[StepName, OpenAIUsage] = {}  # OpenAI usage summed per step
 
     # Process files in parallel (but logging is serialized)
     with ThreadPoolExecutor(max_workers=n_workers) as executor:
@@ -266,6 +282,7 @@ def _execute_parallel_pipeline(
                 progress_str,
                 controller,
                 config,
+                usage,
             )
             if status == _WorkStatus.PARTIAL:
                 partial_success_count += 1
@@ -284,6 +301,7 @@ def _execute_parallel_pipeline(
         failed_files=failed_files,
         config=config,
         controller=controller,
+        usage=usage,
     )
 
     # Return exit code
@@ -330,6 +348,11 @@ def execute_parallel_pipeline(config: UserConfig) -> int:
         LOG.error("Input path is not a directory: %s", input_dir)
         return 1
 
+    if config.parallel.watch:
+        from .cli_execute_watch import execute_watch_pipeline
+
+        return execute_watch_pipeline(config)
+
     # Scan for files matching the pattern
     try:
         files = scan_directory_for_files(input_dir, config.parallel.file_type)
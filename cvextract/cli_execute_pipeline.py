@@ -45,6 +45,11 @@ def execute_pipeline(config: UserConfig) -> int:
 
     Returns exit code (0 = success, 1 = failure).
     """
+    if config.serve:
+        from .cli_server import serve
+
+        return serve(config.serve)
+
     if config.rerun_failed:
         from .cli_execute_parallel import _load_failed_list, _write_failed_list
 
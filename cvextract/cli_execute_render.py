@@ -4,8 +4,16 @@ Step 3: Render/Verify stage execution.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from pathlib import Path
+from typing import Callable, Optional
+
 from .pipeline_helpers import render
-from .shared import StepName, UnitOfWork
+from .shared import StepName, UnitOfWork, merge_step_states
+
+# Upper bound on concurrent renders of one CV into several templates
+_MAX_FANOUT_WORKERS = 4
 
 
 def execute(work: UnitOfWork) -> UnitOfWork:
@@ -38,3 +46,49 @@ def execute(work: UnitOfWork) -> UnitOfWork:
         return work
 
     return render(work)
+
+
+def _render_variant(
+    work: UnitOfWork,
+    template: Path,
+    verify: Optional[Callable[[UnitOfWork], UnitOfWork]],
+) -> UnitOfWork:
+    states = {
+        step: status
+        for step, status in work.step_states.items()
+        if step not in (StepName.Render, StepName.VerifyRender)
+    }
+    config = replace(work.config, render=replace(work.config.render, template=template))
+    variant = execute(replace(work, config=config, step_states=states))
+    if verify is not None:
+        variant = verify(variant)
+    return variant
+
+
+def execute_fanout(
+    work: UnitOfWork,
+    verify: Optional[Callable[[UnitOfWork], UnitOfWork]] = None,
+) -> UnitOfWork:
+    """
+    Render one CV into every configured template concurrently.
+
+    The input JSON and templates are read once (see the DOCX renderer
+    caches). Each template gets its own output via prepare_output_path;
+    per-template warnings and errors are merged into the Render and
+    VerifyRender statuses, prefixed with the template name.
+
+    Args:
+        work: UnitOfWork after extract/adjust.
+        verify: Optional per-variant verification (e.g. roundtrip).
+    """
+    templates = work.config.render.templates
+    workers = min(len(templates), _MAX_FANOUT_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        variants = list(
+            executor.map(lambda t: _render_variant(work, t, verify), templates)
+        )
+    return merge_step_states(
+        work,
+        [(template.name, variant) for template, variant in zip(templates, variants)],
+        (StepName.Render, StepName.VerifyRender),
+    )
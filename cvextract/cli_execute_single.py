@@ -7,14 +7,24 @@ from __future__ import annotations
 from dataclasses import replace
 from pathlib import Path
 
-from cvextract.pipeline_helpers import extract_cv_data
+from cvextract.pipeline_helpers import extract_cv_data, extract_verifier_names
 
 from .cli_config import UserConfig
 from .cli_execute_adjust import execute as execute_adjust
+from .cli_execute_adjust import execute_fanout as execute_adjust_fanout
 from .cli_execute_extract import execute as execute_extract
 from .cli_execute_render import execute as execute_render
+from .cli_execute_render import execute_fanout as execute_render_fanout
+from .llm_cache import evict_step_response
 from .logging_utils import LOG
-from .shared import StepName, UnitOfWork, emit_summary, emit_work_status
+from .shared import (
+    StepName,
+    UnitOfWork,
+    collect_usage,
+    emit_summary,
+    emit_work_status,
+    format_usage_report,
+)
 from .verifiers import get_verifier
 
 
@@ -104,11 +114,7 @@ def extract_verify(work: UnitOfWork) -> UnitOfWork:
         )
         return work
 
-    verifier_names = ["cv-schema-verifier", "default-extract-verifier"]
-    if config.extract and config.extract.verifier:
-        verifier_names = [
-            name.strip() for name in config.extract.verifier.split(",") if name.strip()
-        ]
+    verifier_names = extract_verifier_names(config)
 
     work.set_step_paths(StepName.VerifyExtract, output_path=output_path)
     work.ensure_step_status(StepName.VerifyExtract)
@@ -176,6 +182,38 @@ def adjust_verify(work: UnitOfWork) -> UnitOfWork:
     return work
 
 
+def _adjust_and_render(
+    work: UnitOfWork, config: UserConfig | None = None
+) -> UnitOfWork:
+    config = config or work.config
+
+    # Step 2: Adjust (if configured)
+    if config.adjust:
+        work = execute_adjust(work)
+
+        if work.has_no_errors(StepName.Adjust):
+            work = adjust_verify(work)
+
+        if not work.has_no_errors(StepName.Adjust) or not work.has_no_errors(
+            StepName.VerifyAdjust
+        ):
+            if config.render:
+                config = replace(config, render=None)
+
+    # Step 3: Render (if configured)
+    if config.render:
+        if config.render.templates:
+            verify = roundtrip_verify if config.should_compare else None
+            work = execute_render_fanout(work, verify)
+        else:
+            work = execute_render(work)
+
+            if config.should_compare:
+                work = roundtrip_verify(work)
+
+    return work
+
+
 def execute_single(config: UserConfig) -> tuple[int, UnitOfWork | None]:
     source = _resolve_input_source(config)
     if source is None:
@@ -202,6 +240,9 @@ def execute_single(config: UserConfig) -> tuple[int, UnitOfWork | None]:
 
         if work.has_no_errors(StepName.Extract):
             work = extract_verify(work)
+            if not work.has_no_errors(StepName.VerifyExtract):
+                # Do not replay a rejected extraction on the next run
+                evict_step_response(work, StepName.Extract)
 
         if not work.has_no_errors(StepName.Extract) or not work.has_no_errors(
             StepName.VerifyExtract
@@ -215,25 +256,11 @@ def execute_single(config: UserConfig) -> tuple[int, UnitOfWork | None]:
         if config.render:
             work.set_step_paths(StepName.Render, input_path=source)
 
-    # Step 2: Adjust (if configured)
-    if config.adjust:
-        work = execute_adjust(work)
-
-        if work.has_no_errors(StepName.Adjust):
-            work = adjust_verify(work)
-
-        if not work.has_no_errors(StepName.Adjust) or not work.has_no_errors(
-            StepName.VerifyAdjust
-        ):
-            if config.render:
-                config = replace(config, render=None)
-
-    # Step 3: Render (if configured)
-    if config.render:
-        work = execute_render(work)
-
-        if config.should_compare:
-            work = roundtrip_verify(work)
+    # Steps 2 and 3: Adjust and Render, once per adjust branch when fanning out
+    if config.adjust and config.adjust.branches:
+        work = execute_adjust_fanout(work, _adjust_and_render)
+    else:
+        work = _adjust_and_render(work, config)
 
     # Log result (unless suppressed for parallel mode)
     if not config.suppress_file_logging:
@@ -242,6 +269,8 @@ def execute_single(config: UserConfig) -> tuple[int, UnitOfWork | None]:
     # Log summary (unless suppressed for parallel mode)
     if not config.suppress_summary:
         LOG.info("%s", emit_summary(work))
+        for line in format_usage_report(collect_usage(work)):
+            LOG.info("%s", line)
 
     # Return exit code
     if not work.has_no_errors():
@@ -0,0 +1,334 @@
+"""
+CLI Watch Mode Module.
+
+Keeps a parallel run alive and processes files as they appear in (or change
+under) the source directory. Changes come from inotify on Linux, so the tree
+is walked only once at startup; other platforms fall back to polling.
+
+Files are debounced until their size and modification time stop changing,
+temporary Word files (~$*) are skipped, and ready files are fed into one
+persistent worker pool.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import fnmatch
+import os
+import select
+import struct
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .cli_config import UserConfig, WatchStage
+from .cli_execute_parallel import (
+    _emit_parallel_summary,
+    _execute_file,
+    _process_future_result,
+    _WorkStatus,
+    scan_directory_for_files,
+)
+from .logging_utils import LOG
+from .output_controller import get_output_controller
+from .shared import OpenAIUsage, StepName
+
+# inotify event masks (linux/inotify.h)
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE_SELF = 0x00000400
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE_SELF
+_EVENT_HEADER = struct.Struct("iIII")
+
+# (mtime_ns, size) of a file, used to detect changes
+_Signature = Tuple[int, int]
+
+
+def _signature(path: Path) -> Optional[_Signature]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class _PollingWatcher:
+    """Detects new or changed files by rescanning the tree every interval."""
+
+    def __init__(self, root: Path, interval: float):
+        self._root = root
+        self._interval = interval
+        self._snapshot = self._scan()
+        self._next_scan = time.monotonic() + interval
+
+    def _scan(self) -> Dict[Path, _Signature]:
+        snapshot: Dict[Path, _Signature] = {}
+        for dirpath, _, filenames in os.walk(self._root):
+            for name in filenames:
+                path = Path(dirpath) / name
+                signature = _signature(path)
+                if signature is not None:
+                    snapshot[path] = signature
+        return snapshot
+
+    def poll(self, timeout: float) -> List[Path]:
+        wait = self._next_scan - time.monotonic()
+        if wait > timeout:
+            time.sleep(timeout)
+            return []
+        time.sleep(max(wait, 0))
+        self._next_scan = time.monotonic() + self._interval
+        snapshot = self._scan()
+        changed = [
+            path
+            for path, signature in snapshot.items()
+            if self._snapshot.get(path) != signature
+        ]
+        self._snapshot = snapshot
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+class _InotifyWatcher:
+    """Recursive directory watcher using the Linux inotify API through ctypes."""
+
+    def __init__(self, root: Path):
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._root = root
+        self._dirs: Dict[int, Path] = {}
+        # Fails here rather than skipping, so the caller can fall back to polling
+        self._add_tree(root, strict=True)
+
+    def _add_watch(self, directory: Path) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed: {directory}")
+        self._dirs[wd] = directory
+
+    def _add_tree(self, directory: Path, *, strict: bool = False) -> List[Path]:
+        """
+        Watch a directory tree and return the files already inside it.
+
+        Unless strict, a directory that cannot be watched (removed meanwhile,
+        or the inotify watch limit reached) is logged and left unwatched.
+        """
+        files: List[Path] = []
+        for dirpath, _, filenames in os.walk(directory):
+            try:
+                self._add_watch(Path(dirpath))
+            except OSError as e:
+                if strict:
+                    raise
+                LOG.warning(
+                    "Cannot watch %s (%s); later changes are missed", dirpath, e
+                )
+            files.extend(Path(dirpath) / name for name in filenames)
+        return files
+
+    def poll(self, timeout: float) -> List[Path]:
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return []
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+
+        changed: List[Path] = []
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & _IN_Q_OVERFLOW:
+                # Events were dropped; fall back to a one-off rescan
+                LOG.warning("Watch event queue overflowed; rescanning source")
+                changed.extend(self._add_tree(self._root))
+                continue
+            if mask & (_IN_IGNORED | _IN_DELETE_SELF):
+                self._dirs.pop(wd, None)
+                continue
+            directory = self._dirs.get(wd)
+            if directory is None or not name:
+                continue
+            path = directory / os.fsdecode(name)
+            if mask & _IN_ISDIR:
+                if mask & (_IN_CREATE | _IN_MOVED_TO):
+                    changed.extend(self._add_tree(path))
+                continue
+            changed.append(path)
+        return changed
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def _create_watcher(root: Path, watch: WatchStage):
+    if sys.platform.startswith("linux"):
+        try:
+            return _InotifyWatcher(root)
+        except (OSError, AttributeError) as e:
+            LOG.warning(
+                "inotify unavailable (%s); polling source every %ss", e, watch.poll
+            )
+    return _PollingWatcher(root, watch.poll)
+
+
+class _Debouncer:
+    """Holds changed files until they stop changing for a quiet period."""
+
+    def __init__(self, quiet_period: float):
+        self._quiet_period = quiet_period
+        self._pending: Dict[Path, Tuple[float, Optional[_Signature]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def touch(self, path: Path, now: float) -> None:
+        self._pending[path] = (now, _signature(path))
+
+    def ready(self, now: float) -> List[Path]:
+        """Return files that have been quiet long enough, dropping vanished ones."""
+        ready: List[Path] = []
+        for path, (last_seen, signature) in list(self._pending.items()):
+            if now - last_seen < self._quiet_period:
+                continue
+            current = _signature(path)
+            if current is None:
+                del self._pending[path]
+            elif current != signature:
+                # Still being written; restart the quiet period
+                self._pending[path] = (now, current)
+            else:
+                del self._pending[path]
+                ready.append(path)
+        return ready
+
+
+def _is_candidate(path: Path, pattern: str, ignored: Iterable[Path]) -> bool:
+    if path.name.startswith("~$") or not fnmatch.fnmatch(path.name, pattern):
+        return False
+    resolved = path.resolve()
+    return not any(resolved.is_relative_to(root) for root in ignored)
+
+
+def execute_watch_pipeline(
+    config: UserConfig, *, stop: Optional[threading.Event] = None
+) -> int:
+    """
+    Process the parallel source directory continuously until interrupted.
+
+    Existing files are processed once at startup; afterwards only new or
+    changed files are processed.
+
+    Args:
+        config: User configuration with parallel.watch set
+        stop: Optional event that ends the watch loop when set
+
+    Returns:
+        Exit code (0 once the watch loop ends)
+    """
+    parallel = config.parallel
+    watch = parallel.watch or WatchStage()
+    source = parallel.source
+    # Outputs written under the source (e.g. rendered .docx) must not re-trigger
+    ignored = [config.target_dir.resolve()]
+    stop = stop or threading.Event()
+    controller = get_output_controller()
+
+    watcher = _create_watcher(source, watch)
+    debouncer = _Debouncer(watch.debounce)
+    processed: Dict[Path, Optional[_Signature]] = {}
+    in_flight: Dict[Future, Path] = {}
+    busy: Set[Path] = set()
+
+    counts = {status: 0 for status in _WorkStatus}
+    failed_files: List[str] = []
+    usage: Dict[StepName, OpenAIUsage] = {}
+
+    def collect(futures: List[Future]) -> None:
+        for future in futures:
+            path = in_flight.pop(future)
+            busy.discard(path)
+            completed = sum(counts.values()) + 1
+            status, failed_file = _process_future_result(
+                future, path, f"[{completed}]", controller, config, usage
+            )
+            counts[status] += 1
+            if failed_file:
+                failed_files.append(failed_file)
+
+    controller.direct_print(
+        f"Watching {source} for '{parallel.file_type}' with {parallel.n} parallel workers"
+    )
+
+    executor = ThreadPoolExecutor(max_workers=parallel.n)
+    try:
+        now = time.monotonic()
+        for path in scan_directory_for_files(source, parallel.file_type):
+            if _is_candidate(path, parallel.file_type, ignored):
+                debouncer.touch(path, now - watch.debounce)
+
+        while not stop.is_set():
+            timeout = 0.2 if len(debouncer) or in_flight else watch.poll
+            changed = watcher.poll(timeout)
+            now = time.monotonic()
+            for path in changed:
+                if _is_candidate(path, parallel.file_type, ignored):
+                    debouncer.touch(path, now)
+
+            for path in debouncer.ready(now):
+                if path in busy:
+                    # Changed again while processing; retry after it finishes
+                    debouncer.touch(path, now)
+                    continue
+                signature = _signature(path)
+                if processed.get(path) == signature:
+                    continue
+                processed[path] = signature
+                busy.add(path)
+                in_flight[executor.submit(_execute_file, path, config)] = path
+
+            collect([f for f in in_flight if f.done()])
+
+        # Stopped: report files that were already being processed
+        collect(list(in_flight))
+    except KeyboardInterrupt:
+        controller.direct_print("Stopping watch mode")
+    except Exception as e:
+        LOG.error("Watch mode failed: %s", e)
+        if config.debug:
+            LOG.error(traceback.format_exc())
+        return 1
+    finally:
+        watcher.close()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    _emit_parallel_summary(
+        total_files=sum(counts.values()),
+        full_success_count=counts[_WorkStatus.FULL],
+        partial_success_count=counts[_WorkStatus.PARTIAL],
+        failed_count=counts[_WorkStatus.FAILED],
+        failed_files=failed_files,
+        config=config,
+        controller=controller,
+        usage=usage,
+    )
+    return 0
@@ -8,6 +8,7 @@ No side effects - just parsing and conversion.
 from __future__ import annotations
 
 import argparse
+import re
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -57,9 +58,14 @@ from .cli_config import (
     ExtractStage,
     ParallelStage,
     RenderStage,
+    ServeStage,
     UserConfig,
+    WatchStage,
 )
 
+# Branch labels become part of output file names
+_BRANCH_LABEL = re.compile(r"[A-Za-z0-9._-]+")
+
 
 def _resolve_output_path(output_str: str, target_dir: Path) -> Path:
     """
@@ -116,6 +122,40 @@ def _parse_stage_params(param_list: List[str]) -> Dict[str, str]:
     return params
 
 
+def _parse_serve_stage(param_list: List[str]) -> ServeStage:
+    """Parse --serve parameters into a ServeStage."""
+    params = _parse_stage_params(param_list)
+    stage = ServeStage(host=params.get("host", ServeStage.host))
+    for key in ("port", "n"):
+        if key not in params:
+            continue
+        try:
+            value = int(params[key])
+        except ValueError:
+            raise ValueError(f"--serve parameter '{key}' must be a valid integer")
+        if value < (0 if key == "port" else 1):
+            raise ValueError(f"--serve parameter '{key}' is out of range: {value}")
+        setattr(stage, key, value)
+    return stage
+
+
+def _parse_watch_stage(param_list: List[str]) -> WatchStage:
+    """Parse --watch parameters into a WatchStage."""
+    params = _parse_stage_params(param_list)
+    stage = WatchStage()
+    for key in ("debounce", "poll"):
+        if key not in params:
+            continue
+        try:
+            value = float(params[key])
+        except ValueError:
+            raise ValueError(f"--watch parameter '{key}' must be a number of seconds")
+        if value < 0 or (key == "poll" and value == 0):
+            raise ValueError(f"--watch parameter '{key}' is out of range: {value}")
+        setattr(stage, key, value)
+    return stage
+
+
 def gather_user_requirements(argv: Optional[List[str]] = None) -> UserConfig:
     """
     Phase 1: Parse command-line arguments and return user configuration.
@@ -159,6 +199,15 @@ Examples:
       --render template=template.docx \\
       --target output/
 
+  Tailor one CV for several jobs and languages in one run:
+    python -m cvextract.cli \\
+      --extract source=cv.docx \\
+      --adjust name=openai-job-specific job-url=https://example.com/jobs/1 branch=job1 \\
+      --adjust name=openai-job-specific job-url=https://example.com/jobs/2 branch=job2 \\
+      --adjust name=openai-translate language=de branch=job2 \\
+      --render template=template.docx \\
+      --target output/
+
   Render a template to existing JSON file:
     python -m cvextract.cli \\
       --render template=template.docx data=extracted.json \\
@@ -182,8 +231,9 @@ Examples:
         metavar="PARAM",
         help="Extract stage: Extract CV data from source file to JSON. "
         "Parameters: source=<file> (required) [name=<extractor-name[,extractor-name,...]>] [output=<path>] "
-        "[verifier=<verifier-name[,verifier-name,...]>] [skip-verify]. "
-        "Defaults to default-docx-cv-extractor. Provide a comma-separated list to enable fallback. "
+        "[verifier=<verifier-name[,verifier-name,...]>] [skip-verify] [cascade]. "
+        "Defaults to default-docx-cv-extractor. Provide a comma-separated list to enable fallback; "
+        "with cascade, the next extractor is also tried when an output fails verification. "
         "Use --list extractors to see available extractors.",
     )
     parser.add_argument(
@@ -193,8 +243,9 @@ Examples:
         action="append",
         help="Adjust stage: Adjust CV data using named adjusters (can be specified multiple times for chaining). "
         "Parameters: name=<adjuster-name> [adjuster-specific params] [data=<file>] "
-        "[output=<path>] [openai-model=<model>] [verifier=<verifier-name[,verifier-name,...]>] [skip-verify]. "
-        "Use --list adjusters to see available adjusters.",
+        "[output=<path>] [openai-model=<model>] [verifier=<verifier-name[,verifier-name,...]>] [skip-verify] "
+        "[branch=<label>]. Adjusters sharing a branch label form one chain; branches run concurrently "
+        "from the same input JSON. Use --list adjusters to see available adjusters.",
     )
     parser.add_argument(
         "--render",
@@ -212,6 +263,30 @@ Examples:
         "Parameters: source=<directory> (required) [n=<number>] (default=1) [file-type=<pattern>] (default=*.docx)",
     )
 
+    parser.add_argument(
+        "--watch",
+        nargs="*",
+        metavar="PARAM",
+        help="Watch mode for --parallel: Keep running and process files as they are "
+        "added to or changed in the source directory (inotify, polling fallback). "
+        "Parameters: [debounce=<seconds>] (default=2) [poll=<seconds>] (default=1)",
+    )
+    parser.add_argument(
+        "--serve",
+        nargs="*",
+        metavar="PARAM",
+        help="Server mode: Keep extractors, renderers, schemas and prompts loaded and "
+        "run single-file requests from --server clients over a local HTTP JSON API. "
+        "Parameters: [host=<address>] (default=127.0.0.1) [port=<number>] (default=8765) "
+        "[n=<workers>] (default=4)",
+    )
+    parser.add_argument(
+        "--server",
+        metavar="URL",
+        help="Forward this invocation to a running --serve instance "
+        "(e.g., http://127.0.0.1:8765) instead of running it in this process.",
+    )
+
     # Global arguments
     parser.add_argument(
         "--list",
@@ -242,6 +317,63 @@ Examples:
         action="store_true",
         help="Skip verification across all stages in the pipeline (global override).",
     )
+    parser.add_argument(
+        "--intermediate-json",
+        choices=["pretty", "compact"],
+        default="pretty",
+        help="Format of JSON files that are only consumed by a later stage "
+        "(e.g. extracted JSON when rendering). compact skips indentation and uses "
+        "orjson when installed; final JSON outputs stay pretty. Default: pretty",
+    )
+    parser.add_argument(
+        "--no-llm-cache",
+        action="store_true",
+        help="Always call the LLM instead of reusing responses cached in "
+        "<target>/llm_cache/ for identical requests.",
+    )
+    parser.add_argument(
+        "--openai-hedge",
+        action="store_true",
+        help="When an OpenAI request is slower than the 95th percentile of its "
+        "operation, send a duplicate and use the first good response.",
+    )
+    parser.add_argument(
+        "--openai-deadline",
+        type=float,
+        metavar="SECONDS",
+        help="Stop retrying OpenAI requests of a step (e.g. extracting one CV) "
+        "once this many seconds have passed.",
+    )
+    parser.add_argument(
+        "--openai-breaker-threshold",
+        type=float,
+        default=0.5,
+        metavar="RATE",
+        help="Fail OpenAI steps immediately for a while once this fraction of "
+        "recent requests failed (provider outage); 0 disables. Default: 0.5",
+    )
+    parser.add_argument(
+        "--openai-retry-budget",
+        type=float,
+        default=0.2,
+        metavar="FRACTION",
+        help="Cap OpenAI retries across the run at this fraction of requests. "
+        "Default: 0.2",
+    )
+    parser.add_argument(
+        "--openai-max-concurrency",
+        type=int,
+        metavar="N",
+        help="Cap in-flight OpenAI adjuster requests across the run (adjust "
+        "branches and --parallel workers share it). Default: unbounded",
+    )
+    parser.add_argument(
+        "--structured-output",
+        action="store_true",
+        help="Constrain OpenAI adjuster replies to the bundled JSON schemas "
+        "(strict response_format), so invalid replies no longer fall back to "
+        "the original JSON.",
+    )
     parser.add_argument(
         "--log-failed",
         help="Write failed file paths to this file (one per line).",
@@ -260,6 +392,15 @@ Examples:
 
         sys.exit(0)
 
+    if args.serve is not None:
+        return UserConfig(
+            target_dir=Path(args.target) if args.target else Path("."),
+            serve=_parse_serve_stage(args.serve),
+            verbosity=args.verbosity,
+            debug_external=args.debug_external,
+            log_file=args.log_file,
+        )
+
     # Validate target is provided when not using --list
     if not args.target:
         raise ValueError("--target is required when not using --list")
@@ -279,6 +420,15 @@ Examples:
             "Must specify at least one stage flag (--extract, --adjust, --render, or --parallel)"
         )
 
+    if args.openai_deadline is not None and args.openai_deadline <= 0:
+        raise ValueError("--openai-deadline must be a positive number of seconds")
+    if not 0 <= args.openai_breaker_threshold <= 1:
+        raise ValueError("--openai-breaker-threshold must be between 0 and 1")
+    if args.openai_retry_budget < 0:
+        raise ValueError("--openai-retry-budget must not be negative")
+    if args.openai_max_concurrency is not None and args.openai_max_concurrency < 1:
+        raise ValueError("--openai-max-concurrency must be at least 1")
+
     # Parse stage-based interface
     extract_stage = None
     adjust_stage = None
@@ -311,6 +461,13 @@ Examples:
             file_type=file_type,
         )
 
+    if args.watch is not None:
+        if not parallel_stage or "source" not in params:
+            raise ValueError("--watch requires --parallel with a 'source' parameter")
+        if args.rerun_failed:
+            raise ValueError("--watch cannot be combined with --rerun-failed")
+        parallel_stage.watch = _parse_watch_stage(args.watch)
+
     if args.extract is not None:
         params = _parse_stage_params(args.extract if args.extract else [])
         # When parallel or rerun-failed is specified, source is optional (injected per-file)
@@ -332,6 +489,7 @@ Examples:
             ),
             verifier=params.get("verifier"),
             skip_verify="skip-verify" in params,
+            cascade="cascade" in params,
         )
 
     if args.adjust is not None:
@@ -383,20 +541,35 @@ Examples:
                     "openai-model",
                     "verifier",
                     "skip-verify",
+                    "branch",
                 )
             }
 
+            branch = params.get("branch")
+            if branch is not None and not _BRANCH_LABEL.fullmatch(branch):
+                raise ValueError(
+                    f"Invalid branch label '{branch}': "
+                    "use letters, digits, '.', '_' or '-'"
+                )
+
             adjuster_configs.append(
                 AdjusterConfig(
                     name=adjuster_name,
                     params=adjuster_params,
                     openai_model=openai_model,
+                    branch=branch,
                 )
             )
 
         if not adjuster_configs:
             raise ValueError("--adjust specified but no adjusters configured")
 
+        branched = [a.branch is not None for a in adjuster_configs]
+        if any(branched) and not all(branched):
+            raise ValueError(
+                "When fanning out, every --adjust must specify a branch= label"
+            )
+
         adjust_stage = AdjustStage(
             adjusters=adjuster_configs,
             data=data_path,
@@ -410,8 +583,15 @@ Examples:
         if "template" not in params:
             raise ValueError("--render requires 'template' parameter")
 
+        templates = [
+            Path(t.strip()) for t in params["template"].split(",") if t.strip()
+        ]
+        if not templates:
+            raise ValueError("--render requires 'template' parameter")
+
         render_stage = RenderStage(
-            template=Path(params["template"]),
+            template=templates[0],
+            templates=templates if len(templates) > 1 else [],
             data=Path(params["data"]) if "data" in params else None,
             output=(
                 _resolve_output_path(params["output"], Path(args.target))
@@ -422,6 +602,13 @@ Examples:
             skip_verify="skip-verify" in params,
         )
 
+    if adjust_stage and adjust_stage.branches:
+        if render_stage and render_stage.output:
+            raise ValueError(
+                "--render output= cannot be combined with adjust branches; "
+                "each branch writes its own document"
+            )
+
     return UserConfig(
         extract=extract_stage,
         adjust=adjust_stage,
@@ -430,6 +617,14 @@ Examples:
         target_dir=Path(args.target),
         verbosity=args.verbosity,
         skip_all_verify=args.skip_all_verify,
+        intermediate_json=args.intermediate_json,
+        llm_cache=not args.no_llm_cache,
+        openai_hedge=args.openai_hedge,
+        openai_deadline_s=args.openai_deadline,
+        openai_breaker_threshold=args.openai_breaker_threshold,
+        openai_retry_budget=args.openai_retry_budget,
+        openai_max_concurrency=args.openai_max_concurrency,
+        structured_output=args.structured_output,
         debug_external=args.debug_external,
         log_file=args.log_file,
         log_failed=Path(args.log_failed) if args.log_failed else None,
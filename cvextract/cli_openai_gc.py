@@ -0,0 +1,76 @@
+"""
+`cvextract openai-gc`: remove OpenAI resources left behind by extractions.
+
+The OpenAI extractor deletes its uploaded file and assistant in the
+background after each CV; runs that crash or are killed leave them behind.
+This sweep lists and deletes `CV Extractor` assistants and uploaded
+`cvextract-*` files older than a threshold.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from typing import List
+
+from .logging_utils import LOG
+
+
+def run_openai_gc(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="cvextract openai-gc",
+        description="Delete orphaned 'CV Extractor' assistants and "
+        "'cvextract-' files from the OpenAI account.",
+    )
+    parser.add_argument(
+        "--older-than",
+        type=float,
+        default=24.0,
+        metavar="HOURS",
+        help="Only delete resources created more than HOURS ago, so running "
+        "extractions keep theirs. Default: 24",
+    )
+    parser.add_argument(
+        "--include-unmarked-files",
+        action="store_true",
+        help="Also delete assistants-purpose files without the 'cvextract-' "
+        "name prefix, e.g. uploads of older versions. This removes such "
+        "files of every other tool using the account too.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="List what would be deleted without deleting it.",
+    )
+    args = parser.parse_args(argv)
+    if args.older_than < 0:
+        parser.error("--older-than must not be negative")
+
+    api_key = os.environ.get("OPENAI_API_KEY")
+    if not api_key:
+        LOG.error("OPENAI_API_KEY must be set to run openai-gc")
+        return 1
+
+    from openai import OpenAI
+
+    from .extractors.openai_cleanup import sweep_openai_resources
+
+    try:
+        result = sweep_openai_resources(
+            OpenAI(api_key=api_key),
+            older_than_s=args.older_than * 3600,
+            dry_run=args.dry_run,
+            include_unmarked=args.include_unmarked_files,
+        )
+    except Exception as e:
+        LOG.error("openai-gc failed: %s", e)
+        return 1
+
+    LOG.info(
+        "%s %d assistants and %d files%s",
+        "Would delete" if args.dry_run else "Deleted",
+        result.assistants,
+        result.files,
+        f" ({result.failed} failed)" if result.failed else "",
+    )
+    return 1 if result.failed else 0
@@ -7,6 +7,7 @@ No actual execution - just setup.
 
 from __future__ import annotations
 
+from dataclasses import replace
 from pathlib import Path
 from typing import List, Optional
 
@@ -49,6 +50,25 @@ def _collect_inputs(
     return [src]
 
 
+def _expand_templates(templates: List[Path]) -> List[Path]:
+    """Expand template directories into their .docx files (skipping ~$ temp files)."""
+    expanded: List[Path] = []
+    for template in templates:
+        if template.is_dir():
+            found = sorted(
+                p
+                for p in template.glob("*.docx")
+                if p.is_file() and not p.name.startswith("~$")
+            )
+            if not found:
+                LOG.error("No .docx templates found in directory: %s", template)
+                raise ValueError(f"Invalid template directory: {template}")
+            expanded.extend(found)
+        else:
+            expanded.append(template)
+    return expanded
+
+
 def prepare_execution_environment(config: UserConfig) -> UserConfig:
     """
     Phase 2: Validate inputs and prepare execution environment.
@@ -60,14 +80,27 @@ def prepare_execution_environment(config: UserConfig) -> UserConfig:
 
     Returns the same config (for chaining).
     """
-    # Validate template if render stage is configured
+    # Server mode prepares each request separately
+    if config.serve:
+        return config
+
+    # Validate templates if render stage is configured
     if config.render:
-        if (
-            not config.render.template.is_file()
-            or config.render.template.suffix.lower() != ".docx"
-        ):
-            LOG.error("Template not found or not a .docx: %s", config.render.template)
-            raise ValueError(f"Invalid template: {config.render.template}")
+        templates = _expand_templates(
+            config.render.templates or [config.render.template]
+        )
+        for template in templates:
+            if not template.is_file() or template.suffix.lower() != ".docx":
+                LOG.error("Template not found or not a .docx: %s", template)
+                raise ValueError(f"Invalid template: {template}")
+        config = replace(
+            config,
+            render=replace(
+                config.render,
+                template=templates[0],
+                templates=templates if len(templates) > 1 else [],
+            ),
+        )
 
     if not config.parallel and not config.rerun_failed:
         if config.extract:
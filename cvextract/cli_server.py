@@ -0,0 +1,244 @@
+"""
+Server mode: a warm, long-running cvextract process.
+
+`--serve` starts a local HTTP JSON API that runs single-file pipelines
+(execute_single) on a worker pool. Plugins, schemas and other per-process
+caches are loaded once instead of on every invocation. `--server <url>`
+turns the CLI into a thin client that forwards its arguments to the API.
+
+API:
+    GET  /health -> {"status": "ok", "workers": <n>}
+    POST /run    {"argv": [...]} -> {"exit_code": <int>, "status": <str>, "steps": {...}}
+"""
+
+from __future__ import annotations
+
+import json
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .cli_config import ServeStage, UserConfig
+from .cli_execute_single import execute_single
+from .cli_gather import gather_user_requirements
+from .cli_prepare import prepare_execution_environment
+from .logging_utils import LOG
+from .shared import UnitOfWork, emit_work_status
+
+# Flags and stage parameters whose values are paths relative to the client's cwd.
+# output= is resolved against --target by the gather phase, so it is left as is.
+_PATH_FLAGS = ("--target", "--log-file", "--log-failed", "--rerun-failed")
+_PATH_PARAMS = ("source", "data", "template")
+
+
+class _RequestError(Exception):
+    """A request that cannot be run (bad arguments or unsupported mode)."""
+
+
+def _absolute(value: str, cwd: Path) -> str:
+    path = Path(value).expanduser()
+    return str(path if path.is_absolute() else cwd / path)
+
+
+def absolutize_argv(argv: List[str], cwd: Path) -> List[str]:
+    """
+    Make path arguments absolute so the server resolves them like the client.
+
+    Args:
+        argv: CLI arguments as given to the client.
+        cwd: Client working directory.
+    """
+    result: List[str] = []
+    expect_path = False
+    for token in argv:
+        if expect_path:
+            result.append(_absolute(token, cwd))
+            expect_path = False
+            continue
+        if token in _PATH_FLAGS:
+            result.append(token)
+            expect_path = True
+            continue
+        key, sep, value = token.partition("=")
+        if sep and key in _PATH_FLAGS and value:
+            result.append(f"{key}={_absolute(value, cwd)}")
+        elif sep and key in _PATH_PARAMS and value:
+            # template= may list several comma-separated templates
+            paths = (_absolute(p, cwd) if p else p for p in value.split(","))
+            result.append(f"{key}={','.join(paths)}")
+        else:
+            result.append(token)
+    return result
+
+
+def _config_from_argv(argv: List[str]) -> UserConfig:
+    try:
+        config = gather_user_requirements(argv)
+    except SystemExit:
+        raise _RequestError("invalid arguments")
+    except ValueError as e:
+        raise _RequestError(str(e))
+    if config.serve or config.parallel or config.rerun_failed:
+        raise _RequestError(
+            "server mode runs one file per request; "
+            "--parallel, --rerun-failed and --serve are not supported"
+        )
+    try:
+        return prepare_execution_environment(config)
+    except (OSError, ValueError) as e:
+        raise _RequestError(str(e))
+
+
+def _work_result(exit_code: int, work: Optional[UnitOfWork]) -> Dict[str, Any]:
+    steps: Dict[str, Any] = {}
+    if work is not None:
+        for step, status in work.step_states.items():
+            steps[step.value] = {
+                "output": str(status.output) if status.output else None,
+                "errors": list(status.errors),
+                "warnings": list(status.warnings),
+            }
+    return {
+        "exit_code": exit_code,
+        "status": emit_work_status(work) if work is not None else "",
+        "steps": steps,
+    }
+
+
+def prewarm() -> None:
+    """Import plugins and compile contract schemas so requests start warm."""
+    from . import adjusters, extractors, renderers
+    from .verifiers.schema_validator import get_schema_validator, load_contract_schema
+
+    for package in (extractors, adjusters, renderers):
+        for name in package.__all__:
+            try:
+                getattr(package, name)
+            except ImportError as e:
+                LOG.warning("Server prewarm: %s unavailable (%s)", name, e)
+    get_schema_validator(load_contract_schema("cv_schema.json"))
+    get_schema_validator(
+        load_contract_schema("research_schema.json"), nullable_optional=True
+    )
+
+
+class CvextractServer(ThreadingHTTPServer):
+    """HTTP server running cvextract requests on a fixed-size worker pool."""
+
+    daemon_threads = True
+
+    def __init__(self, stage: ServeStage):
+        super().__init__((stage.host, stage.port), _RequestHandler)
+        self.workers = stage.n
+        self.executor = ThreadPoolExecutor(
+            max_workers=stage.n, thread_name_prefix="cvextract-serve"
+        )
+
+    def run_argv(self, argv: List[str]) -> Dict[str, Any]:
+        """Run one CLI invocation on the worker pool and return its result."""
+        config = _config_from_argv(argv)
+        exit_code, work = self.executor.submit(execute_single, config).result()
+        return _work_result(exit_code, work)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.executor.shutdown(wait=True)
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    server: CvextractServer
+
+    def do_GET(self) -> None:
+        if self.path != "/health":
+            self._send(404, {"error": f"unknown path: {self.path}"})
+            return
+        self._send(200, {"status": "ok", "workers": self.server.workers})
+
+    def do_POST(self) -> None:
+        if self.path != "/run":
+            self._send(404, {"error": f"unknown path: {self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except (ValueError, OSError):
+            self._send(400, {"error": "request body must be JSON"})
+            return
+        argv = payload.get("argv") if isinstance(payload, dict) else None
+        if not isinstance(argv, list) or not all(isinstance(a, str) for a in argv):
+            self._send(400, {"error": "'argv' must be a list of strings"})
+            return
+
+        try:
+            result = self.server.run_argv(argv)
+        except _RequestError as e:
+            self._send(400, {"error": str(e)})
+            return
+        except Exception as e:
+            LOG.error("Server request failed: %s", type(e).__name__)
+            self._send(500, {"error": type(e).__name__})
+            return
+        self._send(200, result)
+
+    def _send(self, code: int, body: Dict[str, Any]) -> None:
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        LOG.debug("serve: " + format, *args)
+
+
+def serve(stage: ServeStage) -> int:
+    """Run the server until interrupted. Returns the process exit code."""
+    prewarm()
+    server = CvextractServer(stage)
+    host, port = server.server_address[:2]
+    LOG.info(
+        "cvextract server listening on http://%s:%d (%d workers)", host, port, stage.n
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        LOG.info("cvextract server shutting down")
+    finally:
+        server.server_close()
+    return 0
+
+
+def forward_to_server(url: str, argv: List[str], *, cwd: Optional[Path] = None) -> int:
+    """
+    Forward CLI arguments to a running server and report its result.
+
+    Returns:
+        The exit code of the remote run, or 1 if the server cannot run it.
+    """
+    body = json.dumps({"argv": absolutize_argv(argv, cwd or Path.cwd())})
+    request = urllib.request.Request(
+        url.rstrip("/") + "/run",
+        data=body.encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+    try:
+        with urllib.request.urlopen(request) as response:
+            result = json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        try:
+            message = json.loads(e.read()).get("error")
+        except Exception:
+            message = None
+        LOG.error("cvextract server rejected the request: %s", message or e.reason)
+        return 1
+    except (urllib.error.URLError, OSError, ValueError) as e:
+        LOG.error("Could not reach cvextract server at %s: %s", url, e)
+        return 1
+
+    if result.get("status"):
+        LOG.info("%s", result["status"])
+    return int(result.get("exit_code", 1))
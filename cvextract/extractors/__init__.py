@@ -2,21 +2,44 @@
 CV extraction interfaces and implementations.
 
 This module provides pluggable and interchangeable CV extractors with a registry system.
+
+The built-in extractors are registered as entry points and imported on
+first use, so importing this package does not pull in openai, python-docx
+or lxml.
 """
 
+from ..shared import load_entry_point
 from .base import CVExtractor
-from .docx_extractor import DocxCVExtractor
-from .openai_extractor import OpenAICVExtractor
 from .extractor_registry import (
     register_extractor,
     get_extractor,
     list_extractors,
 )
 
+_LAZY_EXPORTS = {
+    "DocxCVExtractor": "cvextract.extractors.docx_extractor:DocxCVExtractor",
+    "OpenAICVExtractor": "cvextract.extractors.openai_extractor:OpenAICVExtractor",
+}
+
 
 # Register built-in extractors
-register_extractor("default-docx-cv-extractor", DocxCVExtractor)
-register_extractor("openai-extractor", OpenAICVExtractor)
+register_extractor(
+    "default-docx-cv-extractor",
+    _LAZY_EXPORTS["DocxCVExtractor"],
+    description="CV extractor for Microsoft Word .docx files.",
+)
+register_extractor(
+    "openai-extractor",
+    _LAZY_EXPORTS["OpenAICVExtractor"],
+    description="CV extractor using OpenAI API for intelligent document analysis.",
+)
+
+
+def __getattr__(name: str):
+    entry_point = _LAZY_EXPORTS.get(name)
+    if entry_point is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return load_entry_point(entry_point)
 
 
 __all__ = [
@@ -14,11 +14,10 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
-from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from ..shared import clean_text
-from .docx_utils import iter_document_paragraphs
+from .docx_utils import DocxSource, iter_document_paragraphs
 
 # ------------------------- Models -------------------------
 
@@ -88,7 +87,7 @@ def _looks_like_heading(line: str, is_bullet: bool, style: str) -> bool:
     return True
 
 
-def parse_cv_from_docx_body(docx_path: Path) -> Tuple[str, List[Dict[str, Any]]]:
+def parse_cv_from_docx_body(docx_path: DocxSource) -> Tuple[str, List[Dict[str, Any]]]:
     """
     Parse the main body directly from DOCX.
     Returns: overview (str), experiences (list of dicts).
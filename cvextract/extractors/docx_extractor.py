@@ -6,14 +6,40 @@ Extracts structured CV data from Word .docx files.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Dict
 
 from ..shared import StepName, UnitOfWork, write_output_json
 from .base import CVExtractor
 from .body_parser import parse_cv_from_docx_body
+from .docx_utils import DocxSource
 from .sidebar_parser import extract_all_header_paragraphs, split_identity_and_sidebar
 
 
+def extract_docx_cv_data(source: DocxSource) -> Dict[str, Any]:
+    """
+    Parse structured CV data from a .docx file or in-memory buffer.
+
+    Args:
+        source: Path to a .docx file, or a binary file object with its bytes.
+
+    Returns:
+        CV data dictionary conforming to the CV schema.
+    """
+    # Extract body content (overview and experiences)
+    overview, experiences = parse_cv_from_docx_body(source)
+
+    # Extract header content (identity and sidebar)
+    header_paragraphs = extract_all_header_paragraphs(source)
+    identity, sidebar = split_identity_and_sidebar(header_paragraphs)
+
+    return {
+        "identity": identity.as_dict(),
+        "sidebar": sidebar,
+        "overview": overview,
+        "experiences": experiences,
+    }
+
+
 class DocxCVExtractor(CVExtractor):
     """
     CV extractor for Microsoft Word .docx files.
@@ -48,17 +74,5 @@ class DocxCVExtractor(CVExtractor):
         if not source.is_file() or source.suffix.lower() != ".docx":
             raise ValueError(f"Source must be a .docx file: {source}")
 
-        # Extract body content (overview and experiences)
-        overview, experiences = parse_cv_from_docx_body(source)
-
-        # Extract header content (identity and sidebar)
-        header_paragraphs = extract_all_header_paragraphs(source)
-        identity, sidebar = split_identity_and_sidebar(header_paragraphs)
-
-        data: dict[str, Any] = {
-            "identity": identity.as_dict(),
-            "sidebar": sidebar,
-            "overview": overview,
-            "experiences": experiences,
-        }
+        data = extract_docx_cv_data(source)
         return write_output_json(work, data, step=StepName.Extract)
@@ -6,14 +6,17 @@ This module handles direct extraction of text and metadata from DOCX files:
 - iterating document paragraphs
 - detecting bullets and paragraph styles
 - converting Word runs into plain text
+- stripping media from a package before it is uploaded
 
 It contains no CV-specific logic; higher-level parsing is handled elsewhere.
 """
 
 from __future__ import annotations
 
+import posixpath
+from io import BytesIO
 from pathlib import Path
-from typing import Iterator, List, Tuple
+from typing import BinaryIO, Iterator, List, Set, Tuple, Union
 from zipfile import ZipFile
 
 from lxml import etree
@@ -25,6 +28,9 @@ from ..shared import (
 
 XML_PARSER = etree.XMLParser(recover=True, huge_tree=True)
 
+# A .docx file on disk or an in-memory buffer holding its bytes
+DocxSource = Union[Path, BinaryIO]
+
 # ------------------------- Patterns / section titles -------------------------
 
 W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
@@ -56,7 +62,7 @@ def dump_body_sample(docx_path: Path, n: int = 25) -> None:
     LOG.info("---------------------")
 
 
-def iter_document_paragraphs(docx_path: Path) -> Iterator[Tuple[str, bool, str]]:
+def iter_document_paragraphs(docx_path: DocxSource) -> Iterator[Tuple[str, bool, str]]:
     """
     Yield (text, is_bullet, style) for each paragraph in word/document.xml body.
     """
@@ -102,3 +108,66 @@ def _p_is_bullet(p: etree._Element) -> bool:
     if style.startswith("list") or "bullet" in style or "number" in style:
         return True
     return False
+
+
+# ------------------------------ Package compaction ------------------------------
+
+# Parts that carry no text: images, embedded fonts and preview thumbnails
+_MEDIA_PART_PREFIXES = ("word/media/", "word/fonts/", "docProps/thumbnail")
+
+
+def _rels_target(rels_name: str, target: str) -> str:
+    """Resolve a relationship target to a part name (no leading slash)."""
+    if target.startswith("/"):
+        return posixpath.normpath(target.lstrip("/"))
+    # word/_rels/document.xml.rels describes parts relative to word/
+    base = posixpath.dirname(posixpath.dirname(rels_name))
+    return posixpath.normpath(posixpath.join(base, target))
+
+
+def _prune_xml(xml_bytes: bytes, drop) -> bytes:
+    root = etree.fromstring(xml_bytes, XML_PARSER)
+    for child in list(root):
+        if drop(child):
+            root.remove(child)
+    return etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+def strip_docx_media(data: bytes) -> bytes:
+    """
+    Return a DOCX package without images, embedded fonts and thumbnails.
+
+    Relationships and content-type overrides of the removed parts are
+    dropped too, so the text parts form a consistent package. Returns data
+    unchanged when there is nothing to strip.
+    """
+    with ZipFile(BytesIO(data)) as src:
+        removed: Set[str] = {
+            name for name in src.namelist() if name.startswith(_MEDIA_PART_PREFIXES)
+        }
+        if not removed:
+            return data
+
+        def _rel_is_removed(rels_name: str, rel: etree._Element) -> bool:
+            if rel.get("TargetMode") == "External":
+                return False
+            return _rels_target(rels_name, rel.get("Target", "")) in removed
+
+        out = BytesIO()
+        with ZipFile(out, "w") as dst:
+            for info in src.infolist():
+                name = info.filename
+                if name in removed:
+                    continue
+                content = src.read(name)
+                if name.endswith(".rels"):
+                    content = _prune_xml(
+                        content, lambda rel: _rel_is_removed(name, rel)
+                    )
+                elif name == "[Content_Types].xml":
+                    content = _prune_xml(
+                        content,
+                        lambda entry: entry.get("PartName", "").lstrip("/") in removed,
+                    )
+                dst.writestr(info, content)
+    return out.getvalue()
@@ -7,23 +7,46 @@ different extraction strategies via the CLI.
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Type
+from typing import Dict, List, Optional, Type, Union
 
+from ..shared import load_entry_point
 from .base import CVExtractor
 
-# Global extractor registry
-_EXTRACTOR_REGISTRY: Dict[str, Type[CVExtractor]] = {}
+# Global extractor registry (classes, or lazy "module:Class" entry points)
+_EXTRACTOR_REGISTRY: Dict[str, Union[Type[CVExtractor], str]] = {}
+_EXTRACTOR_DESCRIPTIONS: Dict[str, str] = {}
 
 
-def register_extractor(name: str, extractor_class: Type[CVExtractor]) -> None:
+def register_extractor(
+    name: str,
+    extractor_class: Union[Type[CVExtractor], str],
+    *,
+    description: Optional[str] = None,
+) -> None:
     """
     Register an extractor class in the global registry.
 
     Args:
         name: The name to register the extractor under (e.g., "openai-extractor")
-        extractor_class: The extractor class to register
+        extractor_class: The extractor class, or a "module:Class" entry point that is
+            imported on first use
+        description: Optional description for list_extractors(), so listing does
+            not import a lazy entry point
     """
     _EXTRACTOR_REGISTRY[name] = extractor_class
+    if description is None:
+        _EXTRACTOR_DESCRIPTIONS.pop(name, None)
+    else:
+        _EXTRACTOR_DESCRIPTIONS[name] = description
+
+
+def _resolve_extractor(name: str) -> Optional[Type[CVExtractor]]:
+    """Return the registered class, importing a lazy entry point on first use."""
+    entry = _EXTRACTOR_REGISTRY.get(name)
+    if isinstance(entry, str):
+        entry = load_entry_point(entry)
+        _EXTRACTOR_REGISTRY[name] = entry
+    return entry
 
 
 def get_extractor(name: str, **kwargs) -> Optional[CVExtractor]:
@@ -37,7 +60,7 @@ def get_extractor(name: str, **kwargs) -> Optional[CVExtractor]:
     Returns:
         Extractor instance, or None if not found
     """
-    extractor_class = _EXTRACTOR_REGISTRY.get(name)
+    extractor_class = _resolve_extractor(name)
     if extractor_class:
         return extractor_class(**kwargs)
     return None
@@ -51,11 +74,13 @@ def list_extractors() -> List[Dict[str, str]]:
         List of dicts with 'name' and 'description' keys
     """
     extractors = []
-    for name, extractor_class in _EXTRACTOR_REGISTRY.items():
-        # Try to get description from class docstring
-        description = extractor_class.__doc__ or "No description available"
-        # Extract first line of docstring
-        description = description.strip().split("\n")[0]
+    for name in list(_EXTRACTOR_REGISTRY):
+        description = _EXTRACTOR_DESCRIPTIONS.get(name)
+        if description is None:
+            # Try to get description from class docstring
+            description = _resolve_extractor(name).__doc__ or "No description available"
+            # Extract first line of docstring
+            description = description.strip().split("\n")[0]
         extractors.append({"name": name, "description": description})
     return sorted(extractors, key=lambda x: x["name"])
 
@@ -68,6 +93,7 @@ def unregister_extractor(name: str) -> None:
         name: The extractor name to unregister
     """
     _EXTRACTOR_REGISTRY.pop(name, None)
+    _EXTRACTOR_DESCRIPTIONS.pop(name, None)
 
 
 __all__ = [
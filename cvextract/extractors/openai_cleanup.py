@@ -0,0 +1,184 @@
+"""
+Cleanup of OpenAI resources created by the OpenAI extractor.
+
+Every extraction uploads a file and creates an assistant. Deleting them is
+not needed for the result, so it is queued to a background thread instead
+of running in the extraction's critical path. The queue is drained in
+small batches by a single thread, so cleanup never competes with
+extractions for more than one request at a time, and it is flushed when
+the process exits.
+
+Resources left behind by crashed or killed runs are removed by the
+`cvextract openai-gc` sweep (see sweep_openai_resources).
+"""
+
+from __future__ import annotations
+
+import atexit
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Optional
+
+from ..logging_utils import LOG
+
+# Name given to every assistant the extractor creates
+ASSISTANT_NAME = "CV Extractor"
+
+# Prefix of the name of every file the extractor uploads
+UPLOAD_PREFIX = "cvextract-"
+
+# Longest wait for queued deletions when the process exits
+_EXIT_FLUSH_S = 30.0
+
+
+class CleanupQueue:
+    """
+    Background queue of best-effort cleanup jobs.
+
+    Jobs run on one daemon thread. After the first job of a batch arrives
+    the thread waits linger_s so that the deletions of concurrent
+    extractions are handled together, then runs up to batch_size jobs.
+    """
+
+    def __init__(self, *, batch_size: int = 20, linger_s: float = 0.5):
+        self._batch_size = batch_size
+        self._linger_s = linger_s
+        self._cond = threading.Condition()
+        self._jobs: Deque[Callable[[], None]] = deque()
+        # Queued plus running jobs
+        self._pending = 0
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, job: Callable[[], None]) -> None:
+        with self._cond:
+            self._jobs.append(job)
+            self._pending += 1
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="cvextract-openai-cleanup", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify_all()
+
+    @property
+    def pending(self) -> int:
+        with self._cond:
+            return self._pending
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every submitted job has run; False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: self._pending == 0, timeout=timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: bool(self._jobs))
+            time.sleep(self._linger_s)
+            with self._cond:
+                batch = [
+                    self._jobs.popleft()
+                    for _ in range(min(self._batch_size, len(self._jobs)))
+                ]
+            for job in batch:
+                try:
+                    job()
+                except Exception as e:
+                    LOG.debug("OpenAI cleanup job failed (%s)", type(e).__name__)
+                finally:
+                    with self._cond:
+                        self._pending -= 1
+                        self._cond.notify_all()
+
+
+CLEANUP_QUEUE = CleanupQueue()
+
+
+def _flush_at_exit() -> None:
+    if not CLEANUP_QUEUE.flush(timeout=_EXIT_FLUSH_S):
+        LOG.warning(
+            "%d OpenAI cleanup jobs did not finish; run `cvextract openai-gc` "
+            "to remove leftover files and assistants",
+            CLEANUP_QUEUE.pending,
+        )
+
+
+atexit.register(_flush_at_exit)
+
+
+@dataclass
+class SweepResult:
+    assistants: int = 0
+    files: int = 0
+    failed: int = 0
+
+
+def upload_filename(name: str) -> str:
+    """Name under which the extractor uploads the file called name."""
+    return f"{UPLOAD_PREFIX}{name}"
+
+
+def sweep_openai_resources(
+    client: Any,
+    *,
+    older_than_s: float,
+    dry_run: bool = False,
+    include_unmarked: bool = False,
+    now: Optional[float] = None,
+) -> SweepResult:
+    """
+    Delete orphaned extractor assistants and uploaded files.
+
+    Only resources created more than older_than_s ago are touched, so runs
+    in progress keep theirs. Files are recognized by the UPLOAD_PREFIX of
+    their name; include_unmarked also deletes every other
+    `assistants`-purpose file (e.g. uploads of older versions).
+    """
+    cutoff = (time.time() if now is None else now) - older_than_s
+    result = SweepResult()
+
+    def _sweep(kind: str, items: Any, delete: Callable[[str], Any]) -> None:
+        for item in items:
+            created_at = getattr(item, "created_at", None)
+            if not isinstance(created_at, (int, float)) or created_at >= cutoff:
+                continue
+            if kind == "assistant" and getattr(item, "name", None) != ASSISTANT_NAME:
+                continue
+            if kind == "file" and not include_unmarked:
+                filename = getattr(item, "filename", None)
+                if not isinstance(filename, str) or not filename.startswith(
+                    UPLOAD_PREFIX
+                ):
+                    continue
+            LOG.info(
+                "%s %s %s",
+                "Would delete" if dry_run else "Deleting",
+                kind,
+                item.id,
+            )
+            if dry_run:
+                ok = True
+            else:
+                try:
+                    delete(item.id)
+                    ok = True
+                except Exception as e:
+                    LOG.warning("Failed to delete %s %s (%s)", kind, item.id, e)
+                    ok = False
+            if not ok:
+                result.failed += 1
+            elif kind == "assistant":
+                result.assistants += 1
+            else:
+                result.files += 1
+
+    # The SDK's list pages fetch further pages while iterating
+    _sweep(
+        "assistant",
+        client.beta.assistants.list(limit=100),
+        client.beta.assistants.delete,
+    )
+    _sweep("file", client.files.list(purpose="assistants"), client.files.delete)
+    return result
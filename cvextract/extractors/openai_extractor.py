@@ -7,23 +7,28 @@ Sends documents directly to OpenAI for processing using the Files/Assistants API
 Key reliability improvements vs the previous version:
 - Centralized retry/backoff with full jitter for 429/5xx/transient network errors
 - Honors Retry-After when present
-- Adaptive polling with bounded timeout (dramatically reduces 429s from run.retrieve)
+- One create-and-run request whose event stream reports completion; adaptive
+  polling with bounded timeout only when the stream ends early
 - Safer message selection + robust text extraction from Assistants message content
-- Best-effort cleanup of assistant and uploaded file
+- Best-effort cleanup of assistant and uploaded file on a background queue
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import random
 import re
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
-from typing import Any, Callable, Optional, TypeVar
+from types import SimpleNamespace
+from typing import Any, Callable, List, Optional, Tuple, TypeVar
 
 from openai import OpenAI
 
@@ -34,11 +39,48 @@ except ModuleNotFoundError:
     # Python < 3.9 backport
     from importlib_resources import files, as_file  # type: ignore
 
-from ..shared import StepName, UnitOfWork, format_prompt, load_prompt, write_output_json
+from ..llm_cache import llm_cache_for
+from ..logging_utils import LOG
+from ..request_policy import (
+    CircuitBreaker,
+    DeadlineExceeded,
+    HedgePolicy,
+    RetryBudget,
+    circuit_breaker_for,
+    hedge_policy_for,
+    remaining_s,
+    request_pool_for,
+    request_timeout_s,
+    retry_budget_for,
+    run_bounded,
+    step_deadline,
+)
+from ..shared import (
+    OpenAIUsage,
+    StepName,
+    UnitOfWork,
+    completion_usage,
+    format_prompt,
+    load_prompt,
+    write_output_json,
+)
+from ..verifiers.schema_validator import get_schema_validator, load_contract_schema
 from .base import CVExtractor
+from .docx_utils import strip_docx_media
+from .openai_cleanup import ASSISTANT_NAME, CLEANUP_QUEUE, upload_filename
 
 T = TypeVar("T")
 
+# Run statuses after which no further run events arrive
+_TERMINAL_RUN_STATUSES = (
+    "completed",
+    "failed",
+    "cancelled",
+    "expired",
+    "incomplete",
+    "requires_action",
+)
+
 
 @dataclass(frozen=True)
 class _RetryConfig:
@@ -94,6 +136,15 @@ class OpenAICVExtractor(CVExtractor):
         self._retry = retry_config or _RetryConfig()
         self._sleep = _sleep
         self._time = _time
+        # Usage of the Extract step currently being processed
+        self._usage: Optional[OpenAIUsage] = None
+        # Tail-latency policies of the current run (see request_policy)
+        self._hedge: Optional[HedgePolicy] = None
+        self._deadline: Optional[float] = None
+        # Process-wide outage guards (see request_policy)
+        self._breaker: Optional[CircuitBreaker] = None
+        self._budget: Optional[RetryBudget] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
 
     @property
     def client(self) -> OpenAI:
@@ -130,12 +181,55 @@ class OpenAICVExtractor(CVExtractor):
         if not file_path.is_file():
             raise ValueError(f"Path must be a file: {file_path}")
 
+        self._usage = work.ensure_step_status(StepName.Extract).usage
+        self._hedge = hedge_policy_for(work)
+        self._deadline = step_deadline(work, StepName.Extract)
+        self._breaker = circuit_breaker_for(work)
+        self._budget = retry_budget_for(work)
+        self._pool = request_pool_for(work)
         cv_schema = self._load_cv_schema()
-        response_text = self._extract_with_openai(file_path, cv_schema)
+
+        cache = llm_cache_for(work)
+        cache_key = None
+        response_text = None
+        if cache is not None:
+            system_prompt, user_prompt = self._build_prompts(file_path, cv_schema)
+            cache_key = cache.key(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                document=hashlib.sha256(file_path.read_bytes()).hexdigest(),
+            )
+            response_text = cache.get(cache_key)
+            if response_text is not None:
+                self._usage.record_cache_hit()
+
+        from_cache = response_text is not None
+        if not from_cache:
+            response_text = self._extract_with_openai(file_path, cv_schema)
         data = self._parse_and_validate(
             response_text,
             cv_schema,
         )
+        # Whether the output comes from (or is now in) the cache
+        cached = from_cache
+        if cache is not None and not from_cache:
+            # Only schema-valid extractions are stored; one that passes the
+            # schema but fails VerifyExtract is evicted by the pipeline
+            errs = get_schema_validator(load_contract_schema("cv_schema.json"))(data)
+            if errs:
+                LOG.debug(
+                    "Not caching extraction of %s: %s",
+                    file_path.name,
+                    "; ".join(errs[:3]),
+                )
+            else:
+                cache.put(cache_key, response_text)
+                cached = True
+        if cached:
+            work.ensure_step_status(StepName.Extract).llm_cache_key = cache_key
         return write_output_json(work, data, step=StepName.Extract)
 
     def _load_cv_schema(self) -> dict[str, Any]:
@@ -260,47 +354,109 @@ class OpenAICVExtractor(CVExtractor):
         )
         return any(m in msg for m in transient_markers)
 
-    def _sleep_with_backoff(
+    def _backoff_delay(
         self, attempt_idx: int, *, is_write: bool, exc: Exception
-    ) -> None:
+    ) -> float:
         """
-        Sleep according to Retry-After when present, else exponential backoff with jitter.
+        Retry-After when present, else exponential backoff with jitter.
         attempt_idx is 0-based (0 => after first failure).
         """
         retry_after = self._get_retry_after_s(exc)
         if retry_after is not None and retry_after > 0:
             delay = min(self._retry.max_delay_s, retry_after)
-            self._sleep(delay)
-            return
+        else:
+            # exponential backoff
+            mult = self._retry.write_multiplier if is_write else 1.0
+            raw = self._retry.base_delay_s * (2**attempt_idx) * mult
+            capped = min(self._retry.max_delay_s, raw)
 
-        # exponential backoff
-        mult = self._retry.write_multiplier if is_write else 1.0
-        raw = self._retry.base_delay_s * (2**attempt_idx) * mult
-        capped = min(self._retry.max_delay_s, raw)
+            if self._retry.deterministic:
+                delay = capped
+            else:
+                # full jitter: uniform(0, capped)
+                delay = random.random() * capped
 
-        if self._retry.deterministic:
-            delay = capped
-        else:
-            # full jitter: uniform(0, capped)
-            delay = random.random() * capped
+            # avoid extremely small sleeps that can hammer the API
+            delay = max(0.25, delay)
+        return delay
 
-        # avoid extremely small sleeps that can hammer the API
-        delay = max(0.25, delay)
+    def _sleep_with_backoff(
+        self,
+        attempt_idx: int,
+        *,
+        is_write: bool,
+        exc: Exception,
+        delay: Optional[float] = None,
+    ) -> None:
+        """Sleep for the backoff delay (see _backoff_delay)."""
+        if delay is None:
+            delay = self._backoff_delay(attempt_idx, is_write=is_write, exc=exc)
+        if self._usage is not None:
+            self._usage.record_retry(delay)
         self._sleep(delay)
 
     def _call_with_retry(
-        self, fn: Callable[[], T], *, is_write: bool, op_name: str
+        self,
+        fn: Callable[[], T],
+        *,
+        is_write: bool,
+        op_name: str,
+        hedge: bool = False,
+        cleanup: bool = False,
     ) -> T:
         """
         Centralized retry wrapper for OpenAI calls.
+
+        hedge=True marks fn as safe to duplicate (reads only: duplicated
+        creates would leak resources). An open circuit breaker or a spent
+        retry budget fails immediately. Cleanup calls ignore the breaker and
+        the step deadline so uploaded files and assistants are still deleted.
+        They run on the cleanup queue after the step has been reported, so
+        they are left out of its usage and do not top up the retry budget.
         """
+        deadline = None if cleanup else self._deadline
+        usage = None if cleanup else self._usage
+        budget = None if cleanup else self._budget
         last_exc: Optional[Exception] = None
         for attempt in range(self._retry.max_attempts):
+            left = remaining_s(deadline)
+            if left is not None and left <= 0:
+                raise RuntimeError(
+                    f"{op_name} failed: step deadline reached"
+                    + (f" ({last_exc})" if last_exc else "")
+                )
+            breaker = self._breaker
+            if breaker is not None and not breaker.allow():
+                if not cleanup:
+                    raise RuntimeError(
+                        f"{op_name} skipped: OpenAI circuit breaker is open"
+                    )
+                breaker = None
+            if attempt == 0 and budget is not None:
+                budget.record_attempt()
+            if usage is not None:
+                usage.record_request()
             try:
-                return fn()
+                result = run_bounded(
+                    fn,
+                    op_name=op_name,
+                    hedge=self._hedge if hedge else None,
+                    deadline=deadline,
+                    usage=usage,
+                    pool=self._pool,
+                )
+            except DeadlineExceeded as e:
+                # Our own time limit, not a provider failure: keep it out of
+                # the breaker's failure rate
+                if breaker is not None:
+                    breaker.release()
+                raise RuntimeError(f"{op_name} failed: step deadline reached") from e
             except Exception as e:
                 last_exc = e
-                if not self._is_transient(e):
+                transient = self._is_transient(e)
+                if breaker is not None:
+                    breaker.record(failed=transient)
+                if not transient:
                     raise RuntimeError(f"{op_name} failed (non-retryable): {e}") from e
 
                 # last attempt -> raise
@@ -312,16 +468,68 @@ class OpenAICVExtractor(CVExtractor):
                         + f": {e}"
                     ) from e
 
-                # back off and retry
-                self._sleep_with_backoff(attempt, is_write=is_write, exc=e)
+                if budget is not None and not budget.try_retry():
+                    raise RuntimeError(
+                        f"{op_name} failed (retry budget exhausted): {e}"
+                    ) from e
+
+                # back off and retry, unless the deadline comes first
+                delay = self._backoff_delay(attempt, is_write=is_write, exc=e)
+                left = remaining_s(deadline)
+                if left is not None and delay >= left:
+                    raise RuntimeError(
+                        f"{op_name} failed: step deadline reached: {e}"
+                    ) from e
+                if usage is not None:
+                    usage.record_retry(delay)
+                self._sleep(delay)
+            else:
+                if breaker is not None:
+                    breaker.record(failed=False)
+                return result
 
         # Should never reach here
         raise RuntimeError(f"{op_name} failed unexpectedly: {last_exc}")
 
+    def _timeout_kwargs(self) -> dict[str, float]:
+        """
+        Client timeout of a request made now, cut to the step deadline.
+
+        A request abandoned at the deadline then frees its thread instead
+        of holding it until the client's default timeout.
+        """
+        timeout = request_timeout_s(None, self._deadline)
+        return {} if timeout is None else {"timeout": timeout}
+
     # --------------------------
     # OpenAI operations
     # --------------------------
 
+    def _upload_payload(self, file_path: Path) -> bytes:
+        """
+        Bytes to upload for file_path.
+
+        DOCX files are sent without images, embedded fonts and thumbnails,
+        which can make up most of their size but carry no CV text.
+        """
+        data = file_path.read_bytes()
+        if file_path.suffix.lower() != ".docx":
+            return data
+        try:
+            stripped = strip_docx_media(data)
+        except Exception as e:
+            LOG.debug("Uploading %s unchanged (%s)", file_path.name, e)
+            return data
+        if len(stripped) < len(data):
+            LOG.debug(
+                "Stripped media from %s: %d -> %d bytes",
+                file_path.name,
+                len(data),
+                len(stripped),
+            )
+            return stripped
+        return data
+
     def _upload_file(self, file_path: Path) -> str:
         """
         Upload a file for Assistants usage.
@@ -330,12 +538,15 @@ class OpenAICVExtractor(CVExtractor):
             file_id
         """
 
+        payload = self._upload_payload(file_path)
+
         def _do() -> Any:
-            with open(file_path, "rb") as f:
-                # Purpose 'assistants' is correct for attaching to threads / file_search.
-                return self.client.files.create(
-                    file=(file_path.name, f), purpose="assistants"
-                )
+            # Purpose 'assistants' is correct for attaching to threads / file_search.
+            return self.client.files.create(
+                file=(upload_filename(file_path.name), payload),
+                purpose="assistants",
+                **self._timeout_kwargs(),
+            )
 
         resp = self._call_with_retry(_do, is_write=True, op_name="OpenAI file upload")
         file_id = getattr(resp, "id", None)
@@ -346,10 +557,11 @@ class OpenAICVExtractor(CVExtractor):
     def _create_assistant(self, system_prompt: str) -> str:
         def _do() -> Any:
             return self.client.beta.assistants.create(
-                name="CV Extractor",
+                name=ASSISTANT_NAME,
                 instructions=system_prompt,
                 model=self.model,
                 tools=[{"type": "file_search"}],
+                **self._timeout_kwargs(),
             )
 
         resp = self._call_with_retry(_do, is_write=True, op_name="Create assistant")
@@ -358,56 +570,64 @@ class OpenAICVExtractor(CVExtractor):
             raise RuntimeError("Create assistant returned no assistant id")
         return assistant_id
 
-    def _create_thread(self) -> str:
-        def _do() -> Any:
-            return self.client.beta.threads.create()
+    def _create_and_run(
+        self, *, assistant_id: str, user_prompt: str, file_id: str
+    ) -> Any:
+        """
+        Create the thread, its message and the run in one streaming request.
 
-        resp = self._call_with_retry(_do, is_write=True, op_name="Create thread")
-        thread_id = getattr(resp, "id", None)
-        if not thread_id:
-            raise RuntimeError("Create thread returned no thread id")
-        return thread_id
+        The client timeout bounds every read of the stream, so a stream that
+        stalls without events gives up within run_timeout_s or the time left
+        before the step deadline, whichever is shorter.
 
-    def _create_message(
-        self, *, thread_id: str, user_prompt: str, file_id: str
-    ) -> None:
-        def _do() -> Any:
-            return self.client.beta.threads.messages.create(
-                thread_id=thread_id,
-                role="user",
-                content=user_prompt,
-                attachments=[{"file_id": file_id, "tools": [{"type": "file_search"}]}],
-            )
-
-        self._call_with_retry(_do, is_write=True, op_name="Create thread message")
+        Returns:
+            The run's event stream
+        """
+        timeout = request_timeout_s(self._run_timeout_s, self._deadline)
 
-    def _create_run(self, *, thread_id: str, assistant_id: str) -> str:
         def _do() -> Any:
-            return self.client.beta.threads.runs.create(
-                thread_id=thread_id, assistant_id=assistant_id
+            return self.client.beta.threads.create_and_run(
+                assistant_id=assistant_id,
+                thread={
+                    "messages": [
+                        {
+                            "role": "user",
+                            "content": user_prompt,
+                            "attachments": [
+                                {"file_id": file_id, "tools": [{"type": "file_search"}]}
+                            ],
+                        }
+                    ]
+                },
+                stream=True,
+                timeout=timeout,
             )
 
-        resp = self._call_with_retry(_do, is_write=True, op_name="Create run")
-        run_id = getattr(resp, "id", None)
-        if not run_id:
-            raise RuntimeError("Create run returned no run id")
-        return run_id
+        return self._call_with_retry(
+            _do, is_write=True, op_name="Create and run thread"
+        )
 
     def _retrieve_run(self, *, thread_id: str, run_id: str) -> Any:
         def _do() -> Any:
             return self.client.beta.threads.runs.retrieve(
-                thread_id=thread_id, run_id=run_id
+                thread_id=thread_id, run_id=run_id, **self._timeout_kwargs()
             )
 
         # retrieve is "read" op, but still can 429 hard if you poll too fast
-        return self._call_with_retry(_do, is_write=False, op_name="Retrieve run")
+        return self._call_with_retry(
+            _do, is_write=False, op_name="Retrieve run", hedge=True
+        )
 
     def _list_messages(self, *, thread_id: str) -> Any:
         def _do() -> Any:
             # You can pass limit=... in newer SDKs; keep minimal assumptions.
-            return self.client.beta.threads.messages.list(thread_id=thread_id)
+            return self.client.beta.threads.messages.list(
+                thread_id=thread_id, **self._timeout_kwargs()
+            )
 
-        return self._call_with_retry(_do, is_write=False, op_name="List messages")
+        return self._call_with_retry(
+            _do, is_write=False, op_name="List messages", hedge=True
+        )
 
     def _delete_assistant(self, assistant_id: str) -> None:
         def _do() -> Any:
@@ -415,7 +635,9 @@ class OpenAICVExtractor(CVExtractor):
 
         # Cleanup should not hard-fail the extraction if deletion rate-limits.
         try:
-            self._call_with_retry(_do, is_write=True, op_name="Delete assistant")
+            self._call_with_retry(
+                _do, is_write=True, op_name="Delete assistant", cleanup=True
+            )
         except Exception:
             pass
 
@@ -424,7 +646,9 @@ class OpenAICVExtractor(CVExtractor):
             return self.client.files.delete(file_id)
 
         try:
-            self._call_with_retry(_do, is_write=True, op_name="Delete file")
+            self._call_with_retry(
+                _do, is_write=True, op_name="Delete file", cleanup=True
+            )
         except Exception:
             pass
 
@@ -432,19 +656,15 @@ class OpenAICVExtractor(CVExtractor):
     # Main extraction flow
     # --------------------------
 
-    def _extract_with_openai(self, file_path: Path, cv_schema: dict[str, Any]) -> str:
-        """
-        Send the file to OpenAI using Assistants API and get extraction results.
-        """
-        file_id: Optional[str] = None
-        assistant_id: Optional[str] = None
-
-        # Prompts
+    def _build_prompts(
+        self, file_path: Path, cv_schema: dict[str, Any]
+    ) -> tuple[str, str]:
+        """Return the (system, user) prompts for extracting file_path."""
         system_prompt = load_prompt("cv_extraction_system")
         if not system_prompt:
             raise RuntimeError("Failed to load system prompt")
 
-        schema_str = json.dumps(cv_schema, indent=2)
+        schema_str = json.dumps(cv_schema, separators=(",", ":"))
         user_prompt = format_prompt(
             "cv_extraction_user",
             schema_json=schema_str,
@@ -452,25 +672,41 @@ class OpenAICVExtractor(CVExtractor):
         )
         if not user_prompt:
             raise RuntimeError("Failed to format user prompt")
+        return system_prompt, user_prompt
+
+    def _extract_with_openai(self, file_path: Path, cv_schema: dict[str, Any]) -> str:
+        """
+        Send the file to OpenAI using Assistants API and get extraction results.
+        """
+        file_id: Optional[str] = None
+        assistant_id: Optional[str] = None
+        system_prompt, user_prompt = self._build_prompts(file_path, cv_schema)
 
         try:
             # Upload file (retry/backoff guarded)
             file_id = self._upload_file(file_path)
 
-            # Create assistant + thread
             assistant_id = self._create_assistant(system_prompt)
-            thread_id = self._create_thread()
 
-            # Add message w/ attachment
-            self._create_message(
-                thread_id=thread_id, user_prompt=user_prompt, file_id=file_id
+            # Thread + message w/ attachment + run, followed via its events;
+            # streaming and polling share one run_timeout_s budget
+            start = self._time()
+            stream = self._create_and_run(
+                assistant_id=assistant_id, user_prompt=user_prompt, file_id=file_id
             )
-
-            # Create run
-            run_id = self._create_run(thread_id=thread_id, assistant_id=assistant_id)
-
-            # Adaptive polling to avoid 429 storms
-            run = self._wait_for_run(thread_id=thread_id, run_id=run_id)
+            run, completed_messages = self._follow_run_stream(stream, start=start)
+            if run is None:
+                raise RuntimeError("Create and run returned no run")
+            thread_id = run.thread_id
+
+            if getattr(run, "status", None) in ("queued", "in_progress"):
+                # Stream ended early: adaptive polling to avoid 429 storms
+                run = self._wait_for_run(
+                    thread_id=thread_id, run_id=run.id, start=start
+                )
+            # Token usage is reported on the finished run
+            if self._usage is not None:
+                self._usage.record_tokens(completion_usage(run))
 
             if getattr(run, "status", None) != "completed":
                 # Surface more debug if available
@@ -482,28 +718,85 @@ class OpenAICVExtractor(CVExtractor):
                     )
                 raise RuntimeError(f"Assistant run failed with status: {status}")
 
-            # Fetch messages and extract assistant output
-            messages = self._list_messages(thread_id=thread_id)
-            response_text = self._extract_text_from_messages(messages)
+            # Messages completed during the stream, newest first like the
+            # list endpoint; fetched only if the stream did not carry them
+            response_text = self._extract_text_from_messages(
+                SimpleNamespace(data=completed_messages[::-1])
+            )
+            if not response_text:
+                messages = self._list_messages(thread_id=thread_id)
+                response_text = self._extract_text_from_messages(messages)
             if not response_text:
                 raise RuntimeError("No response text found in assistant messages")
 
             return response_text
 
         finally:
-            # Best-effort cleanup
+            # Best-effort cleanup, off the critical path
             if assistant_id:
-                self._delete_assistant(assistant_id)
+                CLEANUP_QUEUE.submit(partial(self._delete_assistant, assistant_id))
             if file_id:
-                self._delete_file(file_id)
+                CLEANUP_QUEUE.submit(partial(self._delete_file, file_id))
+
+    def _follow_run_stream(
+        self, stream: Any, *, start: Optional[float] = None
+    ) -> Tuple[Optional[Any], List[Any]]:
+        """
+        Consume a run's event stream until the run stops.
 
-    def _wait_for_run(self, *, thread_id: str, run_id: str) -> Any:
+        Returns the last run object seen (terminal unless the stream broke
+        off, timed out or passed the step deadline) and the messages
+        completed on the way. run_timeout_s counts from start (default: now).
+        """
+        if start is None:
+            start = self._time()
+        run: Optional[Any] = None
+        messages: List[Any] = []
+        try:
+            for event in stream:
+                name = getattr(event, "event", "")
+                data = getattr(event, "data", None)
+                if name.startswith("thread.run.") and not name.startswith(
+                    "thread.run.step."
+                ):
+                    run = data
+                elif name == "thread.message.completed":
+                    messages.append(data)
+                elif name == "error":
+                    raise RuntimeError(
+                        f"Assistant run stream error: {getattr(data, 'message', data)}"
+                    )
+                if getattr(run, "status", None) in _TERMINAL_RUN_STATUSES:
+                    break
+                left = remaining_s(self._deadline)
+                if self._time() - start >= self._run_timeout_s or (
+                    left is not None and left <= 0
+                ):
+                    break
+        except RuntimeError:
+            raise
+        except Exception as e:
+            # The run keeps going server-side; the caller polls for it
+            if run is None:
+                raise RuntimeError(f"Create and run stream failed: {e}") from e
+        finally:
+            close = getattr(stream, "close", None)
+            if callable(close):
+                close()
+        return run, messages
+
+    def _wait_for_run(
+        self, *, thread_id: str, run_id: str, start: Optional[float] = None
+    ) -> Any:
         """
         Poll run status with adaptive backoff + hard timeout.
 
-        This is the single biggest lever to reduce 429s.
+        This is the single biggest lever to reduce 429s. The hard timeout
+        counts from start (default: now), so a run first followed through
+        its stream gets no fresh budget.
         """
-        start = self._time()
+        if start is None:
+            start = self._time()
 
         # A gentle schedule that ramps up quickly.
         schedule = [1.0, 1.0, 2.0, 3.0, 5.0, 8.0, 10.0]
@@ -519,6 +812,9 @@ class OpenAICVExtractor(CVExtractor):
                 raise RuntimeError(
                     f"Assistant run timed out after {int(self._run_timeout_s)}s"
                 )
+            left = remaining_s(self._deadline)
+            if left is not None and left <= 0:
+                raise RuntimeError("Assistant run failed: step deadline reached")
 
             delay = schedule[min(idx, len(schedule) - 1)]
             idx += 1
@@ -10,7 +10,6 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from zipfile import ZipFile
 
@@ -21,6 +20,7 @@ from ..shared import (
 )
 from .docx_utils import (
     XML_PARSER,
+    DocxSource,
     extract_text_from_w_p,
 )
 
@@ -156,7 +156,7 @@ def _extract_paragraph_texts(root: etree._Element) -> List[str]:
     return paras
 
 
-def extract_all_header_paragraphs(docx_path: Path) -> List[str]:
+def extract_all_header_paragraphs(docx_path: DocxSource) -> List[str]:
     """
     Collect header paragraphs from all header parts (word/header*.xml),
     de-duplicated while preserving order.
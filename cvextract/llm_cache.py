@@ -0,0 +1,213 @@
+"""
+Persistent cache of LLM responses.
+
+Responses are stored under `<target>/llm_cache/`, keyed by a SHA-256 of the
+request: model, messages, temperature and the version of the bundled schema
+contracts. Rerunning a stage over unchanged input (e.g. while iterating on
+templates or verifiers) is then served locally and costs no tokens. The
+cache is bounded in size; least recently used entries are evicted first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from .logging_utils import LOG
+
+try:
+    # Python 3.9+
+    from importlib.resources import files
+except ModuleNotFoundError:
+    # Python < 3.9 backport
+    from importlib_resources import files  # type: ignore
+
+if TYPE_CHECKING:
+    from .shared import StepName, UnitOfWork
+
+# Default size bound of one cache directory
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Evict down to this fraction of the bound so eviction does not run per write
+_EVICT_TO = 0.9
+
+# Bump to invalidate every cached response (e.g. when the entry format changes)
+_FORMAT_VERSION = 1
+
+
+@lru_cache(maxsize=1)
+def contracts_version() -> str:
+    """Short digest of the bundled CV and research schemas."""
+    digest = hashlib.sha256()
+    for name in ("cv_schema.json", "research_schema.json"):
+        try:
+            digest.update(files("cvextract.contracts").joinpath(name).read_bytes())
+        except Exception:
+            digest.update(name.encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+class LLMResponseCache:
+    """
+    Thread-safe, size-bounded store of response texts in one directory.
+
+    Entries live in `<directory>/<key[:2]>/<key>.json`; a hit refreshes the
+    entry's modification time, which drives least-recently-used eviction.
+    Several processes may share a directory.
+    """
+
+    def __init__(self, directory: Path, *, max_bytes: int = DEFAULT_MAX_BYTES):
+        self._dir = directory
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # Bytes on disk, computed on the first write
+        self._size: Optional[int] = None
+
+    def key(
+        self,
+        *,
+        model: str,
+        messages: Sequence[Dict[str, Any]],
+        temperature: Optional[float] = None,
+        **extra: Any,
+    ) -> str:
+        """Return the cache key of a request."""
+        request = {
+            "format": _FORMAT_VERSION,
+            "schema": contracts_version(),
+            "model": model,
+            "messages": list(messages),
+            "temperature": temperature,
+            **extra,
+        }
+        encoded = json.dumps(
+            request, sort_keys=True, ensure_ascii=False, separators=(",", ":")
+        )
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self._dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response text for key, or None."""
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            LOG.warning("Ignoring unreadable LLM cache entry (%s)", type(e).__name__)
+            return None
+        content = entry.get("content") if isinstance(entry, dict) else None
+        if not isinstance(content, str):
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return content
+
+    def put(self, key: str, content: str) -> None:
+        """Store a response text, evicting old entries when over the bound."""
+        path = self._path(key)
+        data = json.dumps({"content": content}, ensure_ascii=False).encode("utf-8")
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except OSError as e:
+            LOG.warning("Failed to write LLM cache entry (%s)", type(e).__name__)
+            return
+
+        with self._lock:
+            if self._size is None:
+                self._size = sum(size for _, size, _ in self._entries())
+            else:
+                self._size += len(data)
+            if self._size > self._max_bytes:
+                self._evict()
+
+    def delete(self, key: str) -> None:
+        """Drop the entry for key, if there is one."""
+        path = self._path(key)
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except OSError:
+            return
+        with self._lock:
+            if self._size is not None:
+                self._size = max(0, self._size - size)
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        entries = []
+        for path in self._dir.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self) -> None:
+        # Rescan: other processes may have written or evicted meanwhile
+        entries = sorted(self._entries())
+        size = sum(entry_size for _, entry_size, _ in entries)
+        target = int(self._max_bytes * _EVICT_TO)
+        removed = 0
+        for _, entry_size, path in entries:
+            if size <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            size -= entry_size
+            removed += 1
+        self._size = size
+        if removed:
+            LOG.debug("Evicted %d LLM cache entries", removed)
+
+
+_CACHES: Dict[Path, LLMResponseCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_llm_cache(directory: Path) -> LLMResponseCache:
+    """Return the process-wide cache for directory."""
+    directory = directory.resolve()
+    with _CACHES_LOCK:
+        cache = _CACHES.get(directory)
+        if cache is None:
+            cache = LLMResponseCache(directory)
+            _CACHES[directory] = cache
+        return cache
+
+
+def llm_cache_for(work: "UnitOfWork") -> Optional[LLMResponseCache]:
+    """Return the response cache of work's run, or None if disabled."""
+    if not work.config.llm_cache:
+        return None
+    return get_llm_cache(work.config.workspace.llm_cache_dir)
+
+
+def evict_step_response(work: "UnitOfWork", step: "StepName") -> None:
+    """
+    Drop the cached response step's output was made from, if any.
+
+    Called when the output fails verification, so the next run requests
+    it anew instead of replaying it.
+    """
+    status = work.step_states.get(step)
+    key = status.llm_cache_key if status is not None else None
+    cache = llm_cache_for(work)
+    if key is None or cache is None:
+        return
+    cache.delete(key)
+    status.llm_cache_key = None
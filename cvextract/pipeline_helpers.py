@@ -17,11 +17,13 @@ from dataclasses import replace
 from pathlib import Path
 from typing import List, Optional
 
-from .extractors import CVExtractor, DocxCVExtractor, get_extractor
-from .extractors.docx_utils import dump_body_sample
+from .cli_config import UserConfig
+from .extractors import CVExtractor, get_extractor
+from .llm_cache import evict_step_response
 from .logging_utils import LOG
 from .renderers import get_renderer
 from .shared import StepName, StepStatus, UnitOfWork
+from .verifiers import get_verifier
 
 
 def infer_source_root(inputs: List[Path]) -> Path:
@@ -57,6 +59,53 @@ def _resolve_extractor_names(work: UnitOfWork) -> List[str]:
     return names
 
 
+def extract_verifier_names(config: UserConfig) -> List[str]:
+    """Verifiers run on extracted JSON (configured, or the defaults)."""
+    if config.extract and config.extract.verifier:
+        return [
+            name.strip() for name in config.extract.verifier.split(",") if name.strip()
+        ]
+    return ["cv-schema-verifier", "default-extract-verifier"]
+
+
+def _should_cascade(config: UserConfig) -> bool:
+    extract = config.extract
+    return bool(
+        extract
+        and extract.cascade
+        and not (config.skip_all_verify or extract.skip_verify)
+    )
+
+
+def _passes_extract_verification(work: UnitOfWork) -> bool:
+    """
+    Run the extract verifiers on a scratch copy of work.
+
+    The result only decides whether a cascade escalates; the accepted
+    output is verified again (and reported) by the VerifyExtract step.
+    """
+    output_path = work.get_step_output(StepName.Extract)
+    if output_path is None or not output_path.exists():
+        return False
+    probe_states = dict(work.step_states)
+    probe_states[StepName.VerifyExtract] = StepStatus(
+        step=StepName.VerifyExtract, output=output_path
+    )
+    probe = replace(work, step_states=probe_states, current_step=StepName.VerifyExtract)
+    for verifier_name in extract_verifier_names(work.config):
+        verifier = get_verifier(verifier_name)
+        if not verifier:
+            # Reported by the VerifyExtract step
+            continue
+        try:
+            probe = verifier.verify(probe)
+        except Exception:
+            return False
+        if not probe.has_no_errors(StepName.VerifyExtract):
+            return False
+    return True
+
+
 def extract_cv_data(
     work: UnitOfWork, extractor: Optional[CVExtractor] = None
 ) -> UnitOfWork:
@@ -71,6 +120,8 @@ def extract_cv_data(
         UnitOfWork with output JSON populated.
     """
     if extractor is None:
+        from .extractors.docx_extractor import DocxCVExtractor
+
         extractor = DocxCVExtractor()
     return extractor.extract(work)
 
@@ -157,6 +208,10 @@ def extract_single(work: UnitOfWork) -> UnitOfWork:
     """
     Extract a single file. Returns a UnitOfWork copy with results.
 
+    Configured extractors are tried in order until one succeeds. With
+    cascade, an output that fails the extract verifiers also moves on to
+    the next extractor; if none passes, the last successful output is kept.
+
     Args:
         work: UnitOfWork describing the extraction inputs
 
@@ -189,9 +244,13 @@ def extract_single(work: UnitOfWork) -> UnitOfWork:
     last_errors: List[str] = []
     last_work = work
     had_extractor = False
+    cascade = _should_cascade(work.config)
+    unverified_work: Optional[UnitOfWork] = None
+    # OpenAI usage of every attempt, including failed fallbacks
+    usage = extract_status.usage
 
-    for extractor_name in extractor_names:
-        attempt_status = StepStatus(step=StepName.Extract)
+    for idx, extractor_name in enumerate(extractor_names):
+        attempt_status = StepStatus(step=StepName.Extract, usage=usage)
         attempt_status.input = base_input
         attempt_status.output = base_output
         attempt_states = dict(work.step_states)
@@ -224,17 +283,33 @@ def extract_single(work: UnitOfWork) -> UnitOfWork:
             extract_work = attempt_work
             if work.config.debug:
                 LOG.error(traceback.format_exc())
+                from .extractors.docx_utils import dump_body_sample
+
                 dump_body_sample(attempt_status.input, n=30)
             extract_work.add_error(StepName.Extract, f"exception: {type(e).__name__}")
 
         if extract_work.has_no_errors(StepName.Extract):
-            return extract_work
+            is_last = idx == len(extractor_names) - 1
+            if not cascade or is_last or _passes_extract_verification(extract_work):
+                return extract_work
+            LOG.info(
+                "Extractor %s output failed verification; escalating to %s",
+                extractor_name,
+                extractor_names[idx + 1],
+            )
+            evict_step_response(extract_work, StepName.Extract)
+            unverified_work = extract_work
+            continue
 
         result_status = extract_work.step_states.get(StepName.Extract)
         if result_status:
             last_errors.extend(result_status.errors)
         last_work = extract_work
 
+    if unverified_work is not None:
+        # Later extractors failed outright; keep the unverified output
+        return unverified_work
+
     if last_errors:
         final_status = last_work.ensure_step_status(StepName.Extract)
         final_status.errors = last_errors
@@ -265,6 +340,18 @@ def prepare_output_path(work: UnitOfWork, input_path: Path, rel_path: Path) -> P
             / rel_path
             / f"{input_path.stem}_NEW.docx"
         )
+    adjust = work.config.adjust
+    if adjust and adjust.adjusters and adjust.adjusters[0].branch:
+        # Fan-out adjust branches: one output per branch
+        output_docx = output_docx.with_name(
+            f"{output_docx.stem}_{adjust.adjusters[0].branch}{output_docx.suffix}"
+        )
+    if work.config.render and work.config.render.templates:
+        # Fan-out rendering: one output per template
+        template = work.config.render.template
+        output_docx = output_docx.with_name(
+            f"{output_docx.stem}_{template.stem}{output_docx.suffix}"
+        )
     output_docx.parent.mkdir(parents=True, exist_ok=True)
     return output_docx
 
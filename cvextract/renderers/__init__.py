@@ -2,19 +2,37 @@
 CV rendering interfaces and implementations.
 
 This module provides pluggable and interchangeable CV renderers with a registry system.
+
+The DOCX renderer is registered as an entry point and imported on first use,
+so importing this package does not pull in docxtpl (Jinja2, python-docx).
 """
 
+from ..shared import load_entry_point
 from .base import CVRenderer
-from .docx_renderer import DocxCVRenderer
 from .renderer_registry import (
     register_renderer,
     get_renderer,
     list_renderers,
 )
 
+_LAZY_EXPORTS = {
+    "DocxCVRenderer": "cvextract.renderers.docx_renderer:DocxCVRenderer",
+}
+
 
 # Register built-in renderers
-register_renderer("default-docx-cv-renderer", DocxCVRenderer)
+register_renderer(
+    "default-docx-cv-renderer",
+    _LAZY_EXPORTS["DocxCVRenderer"],
+    description="CV renderer for Microsoft Word .docx files.",
+)
+
+
+def __getattr__(name: str):
+    entry_point = _LAZY_EXPORTS.get(name)
+    if entry_point is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return load_entry_point(entry_point)
 
 
 __all__ = [
@@ -6,13 +6,80 @@ Renders structured CV data to Word .docx files using docxtpl templates.
 
 from __future__ import annotations
 
-import json
+import io
+import threading
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Tuple, Union
 
 from docxtpl import DocxTemplate
 
-from ..shared import StepName, UnitOfWork, sanitize_for_xml_in_obj
+from ..shared import StepName, UnitOfWork, read_json, sanitize_for_xml_in_obj
 from .base import CVRenderer
 
+# Template bytes and parsed CV data keyed by resolved path, validated against
+# (mtime_ns, size) so fan-out renders and parallel workers read each file once.
+_CACHE_LIMIT = 64
+_TEMPLATE_CACHE: Dict[Path, Tuple[Tuple[int, int], bytes]] = {}
+_DATA_CACHE: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def _cached_read(cache: Dict[Path, Tuple[Tuple[int, int], Any]], path: Path, load):
+    key = path.resolve()
+    stat = key.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _CACHE_LOCK:
+        cached = cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+    value = load(key)
+    with _CACHE_LOCK:
+        cache.pop(key, None)
+        if len(cache) >= _CACHE_LIMIT:
+            cache.pop(next(iter(cache)))
+        cache[key] = (signature, value)
+    return value
+
+
+def load_template_bytes(path: Path) -> bytes:
+    """Return the bytes of a template file, reading it once while unchanged."""
+    return _cached_read(_TEMPLATE_CACHE, path, Path.read_bytes)
+
+
+def load_cv_data(path: Path) -> Dict[str, Any]:
+    """
+    Return parsed CV data from a JSON file, parsing it once while unchanged.
+
+    The returned dictionary is shared between callers and must not be mutated.
+    """
+
+    def load(key: Path) -> Dict[str, Any]:
+        return read_json(key)
+
+    return _cached_read(_DATA_CACHE, path, load)
+
+
+def render_docx_template(
+    template: Union[Path, BinaryIO],
+    cv_data: Dict[str, Any],
+    destination: Union[Path, BinaryIO],
+) -> None:
+    """
+    Render CV data into a docxtpl template.
+
+    Args:
+        template: Template .docx path, or a binary file object with its bytes.
+        cv_data: CV data dictionary.
+        destination: Output .docx path, or a writable binary file object.
+    """
+    # Sanitize data for XML safety
+    sanitized_data = sanitize_for_xml_in_obj(cv_data)
+
+    # Load and render template
+    tpl = DocxTemplate(str(template) if isinstance(template, Path) else template)
+    tpl.render(sanitized_data, autoescape=True)
+    tpl.save(str(destination) if isinstance(destination, Path) else destination)
+
 
 class DocxCVRenderer(CVRenderer):
     """
@@ -58,20 +125,12 @@ class DocxCVRenderer(CVRenderer):
 
         if template_path.suffix.lower() != ".docx":
             raise ValueError(f"Template must be a .docx file: {template_path}")
-        with status.input.open("r", encoding="utf-8") as f:
-            cv_data = json.load(f)
-
-        # Sanitize data for XML safety
-        sanitized_data = sanitize_for_xml_in_obj(cv_data)
-
-        # Load and render template
-        tpl = DocxTemplate(str(template_path))
-        tpl.render(sanitized_data, autoescape=True)
+        cv_data = load_cv_data(status.input)
+        template = io.BytesIO(load_template_bytes(template_path))
 
         # Ensure output directory exists
         status.output.parent.mkdir(parents=True, exist_ok=True)
 
-        # Save rendered document
-        tpl.save(str(status.output))
+        render_docx_template(template, cv_data, status.output)
 
         return work
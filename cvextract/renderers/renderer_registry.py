@@ -7,23 +7,46 @@ different rendering strategies via the CLI.
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Type
+from typing import Dict, List, Optional, Type, Union
 
+from ..shared import load_entry_point
 from .base import CVRenderer
 
-# Global renderer registry
-_RENDERER_REGISTRY: Dict[str, Type[CVRenderer]] = {}
+# Global renderer registry (classes, or lazy "module:Class" entry points)
+_RENDERER_REGISTRY: Dict[str, Union[Type[CVRenderer], str]] = {}
+_RENDERER_DESCRIPTIONS: Dict[str, str] = {}
 
 
-def register_renderer(name: str, renderer_class: Type[CVRenderer]) -> None:
+def register_renderer(
+    name: str,
+    renderer_class: Union[Type[CVRenderer], str],
+    *,
+    description: Optional[str] = None,
+) -> None:
     """
     Register a renderer class in the global registry.
 
     Args:
         name: The name to register the renderer under (e.g., "default-docx-cv-renderer")
-        renderer_class: The renderer class to register
+        renderer_class: The renderer class, or a "module:Class" entry point that is
+            imported on first use
+        description: Optional description for list_renderers(), so listing does
+            not import a lazy entry point
     """
     _RENDERER_REGISTRY[name] = renderer_class
+    if description is None:
+        _RENDERER_DESCRIPTIONS.pop(name, None)
+    else:
+        _RENDERER_DESCRIPTIONS[name] = description
+
+
+def _resolve_renderer(name: str) -> Optional[Type[CVRenderer]]:
+    """Return the registered class, importing a lazy entry point on first use."""
+    entry = _RENDERER_REGISTRY.get(name)
+    if isinstance(entry, str):
+        entry = load_entry_point(entry)
+        _RENDERER_REGISTRY[name] = entry
+    return entry
 
 
 def get_renderer(name: str, **kwargs) -> Optional[CVRenderer]:
@@ -37,7 +60,7 @@ def get_renderer(name: str, **kwargs) -> Optional[CVRenderer]:
     Returns:
         Renderer instance, or None if not found
     """
-    renderer_class = _RENDERER_REGISTRY.get(name)
+    renderer_class = _resolve_renderer(name)
     if renderer_class:
         return renderer_class(**kwargs)
     return None
@@ -51,11 +74,13 @@ def list_renderers() -> List[Dict[str, str]]:
         List of dicts with 'name' and 'description' keys
     """
     renderers = []
-    for name, renderer_class in _RENDERER_REGISTRY.items():
-        # Try to get description from class docstring
-        description = renderer_class.__doc__ or "No description available"
-        # Extract first line of docstring
-        description = description.strip().split("\n")[0]
+    for name in list(_RENDERER_REGISTRY):
+        description = _RENDERER_DESCRIPTIONS.get(name)
+        if description is None:
+            # Try to get description from class docstring
+            description = _resolve_renderer(name).__doc__ or "No description available"
+            # Extract first line of docstring
+            description = description.strip().split("\n")[0]
         renderers.append({"name": name, "description": description})
     return sorted(renderers, key=lambda x: x["name"])
 
@@ -68,6 +93,7 @@ def unregister_renderer(name: str) -> None:
         name: The renderer name to unregister
     """
     _RENDERER_REGISTRY.pop(name, None)
+    _RENDERER_DESCRIPTIONS.pop(name, None)
 
 
 __all__ = [
@@ -0,0 +1,384 @@
+"""
+Tail-latency and outage controls for OpenAI requests.
+
+Two optional policies bound how long a step can spend waiting on OpenAI:
+
+- Hedging: when a request has not returned after the observed latency
+  percentile of its operation, a duplicate is sent and the first good
+  response wins. Python threads cannot be interrupted, so the slower
+  request is abandoned and its result discarded.
+- Step deadline: retries of a step stop once its time budget is spent,
+  so one CV cannot consume minutes of backoff. Each request's client
+  timeout is cut to the time left, so an abandoned request gives its
+  thread back by the deadline rather than after the client's own timeout.
+
+Bounded requests run on a process-wide thread pool sized for the run's
+parallel workers, adjust branches and hedges (request_pool_for), so they
+do not queue behind each other while their deadline runs.
+
+Two process-wide guards keep a provider outage from turning a large run
+into hours of slow failures:
+
+- Circuit breaker: once too many recent requests fail transiently, calls
+  fail immediately (adjusters then keep the original JSON) until a probe
+  request succeeds again. Requests abandoned at a step deadline say
+  nothing about the provider and are not counted.
+- Retry budget: retries are capped at a fraction of first attempts.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Deque, Dict, List, Optional, TypeVar
+
+from .logging_utils import LOG
+
+if TYPE_CHECKING:
+    from .shared import OpenAIUsage, StepName, UnitOfWork
+
+T = TypeVar("T")
+
+# Fewest threads running bounded requests of a run
+_MIN_POOL_WORKERS = 32
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    # Latency percentile (per operation) after which a duplicate is sent
+    quantile: float = 0.95
+    # Hedge delay until min_samples latencies have been observed
+    initial_delay_s: float = 20.0
+    # Never hedge sooner than this
+    min_delay_s: float = 1.0
+    min_samples: int = 20
+    # Number of recent latencies kept per operation
+    window: int = 200
+
+
+class LatencyTracker:
+    """Thread-safe window of recent successful latencies per operation."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def record(self, op_name: str, seconds: float, *, window: int = 200) -> None:
+        with self._lock:
+            samples = self._samples.get(op_name)
+            if samples is None or samples.maxlen != window:
+                samples = deque(samples or (), maxlen=window)
+                self._samples[op_name] = samples
+            samples.append(seconds)
+
+    def hedge_delay(self, op_name: str, policy: HedgePolicy) -> float:
+        """Seconds to wait for op_name before sending a duplicate."""
+        with self._lock:
+            samples = sorted(self._samples.get(op_name, ()))
+        if len(samples) < policy.min_samples:
+            return policy.initial_delay_s
+        idx = min(len(samples) - 1, int(policy.quantile * len(samples)))
+        return max(policy.min_delay_s, samples[idx])
+
+
+LATENCIES = LatencyTracker()
+
+
+class DeadlineExceeded(TimeoutError):
+    """A request was abandoned because its step deadline passed."""
+
+
+def remaining_s(deadline: Optional[float]) -> Optional[float]:
+    """Seconds left until a time.monotonic() deadline, or None if unbounded."""
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def request_timeout_s(
+    timeout: Optional[float], deadline: Optional[float]
+) -> Optional[float]:
+    """Client timeout of a request: timeout, cut to the time left at deadline."""
+    left = remaining_s(deadline)
+    if left is None:
+        return timeout
+    left = max(left, 0.001)
+    return left if timeout is None else min(timeout, left)
+
+
+def run_bounded(
+    fn: Callable[[], T],
+    *,
+    op_name: str,
+    hedge: Optional[HedgePolicy] = None,
+    deadline: Optional[float] = None,
+    usage: Optional["OpenAIUsage"] = None,
+    tracker: LatencyTracker = LATENCIES,
+    pool: Optional[ThreadPoolExecutor] = None,
+) -> T:
+    """
+    Run fn on pool, hedging it and/or giving up at deadline.
+
+    Returns the first successful result. Errors are raised only once every
+    started request has failed; the first error is raised. Running out of
+    time raises DeadlineExceeded. fn should bound its client timeout with
+    request_timeout_s() so an abandoned request frees its thread.
+    """
+    if hedge is None and deadline is None:
+        return fn()
+    if pool is None:
+        pool = _request_pool(_MIN_POOL_WORKERS)
+
+    def _timed() -> T:
+        start = time.monotonic()
+        result = fn()
+        if hedge is not None:
+            tracker.record(op_name, time.monotonic() - start, window=hedge.window)
+        return result
+
+    pending: List[Future] = [pool.submit(_timed)]
+    errors: List[BaseException] = []
+    hedge_at = (
+        time.monotonic() + tracker.hedge_delay(op_name, hedge)
+        if hedge is not None
+        else None
+    )
+    while pending:
+        waits = [
+            t for t in (remaining_s(deadline), remaining_s(hedge_at)) if t is not None
+        ]
+        timeout = max(0.0, min(waits)) if waits else None
+        done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+        for future in done:
+            pending.remove(future)
+            error = future.exception()
+            if error is None:
+                for other in pending:
+                    other.cancel()
+                return future.result()
+            errors.append(error)
+        if not pending and errors:
+            raise errors[0]
+        if deadline is not None and time.monotonic() >= deadline:
+            for other in pending:
+                other.cancel()
+            raise DeadlineExceeded(f"{op_name} timed out: step deadline reached")
+        if hedge_at is not None and time.monotonic() >= hedge_at:
+            hedge_at = None
+            if usage is not None:
+                usage.record_hedge()
+            pending.append(pool.submit(_timed))
+    raise errors[0]
+
+
+class CircuitBreaker:
+    """
+    Thread-safe breaker over the outcomes of recent OpenAI requests.
+
+    Closed: requests pass. Opens when at least min_requests of the last
+    window outcomes are known and the failure rate reaches threshold.
+    Open: requests are rejected for cooldown_s, then one probe is let
+    through; its success closes the breaker, its failure reopens it.
+    """
+
+    def __init__(
+        self,
+        *,
+        threshold: float = 0.5,
+        window: int = 50,
+        min_requests: int = 20,
+        cooldown_s: float = 30.0,
+        _time: Callable[[], float] = time.monotonic,
+    ):
+        self._threshold = threshold
+        self._min_requests = min_requests
+        self._cooldown_s = cooldown_s
+        self._time = _time
+        self._lock = threading.Lock()
+        # True for failures
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self._open_until: Optional[float] = None
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return self._open_until is not None
+
+    def allow(self) -> bool:
+        """Return whether a request may be sent now."""
+        with self._lock:
+            if self._open_until is None:
+                return True
+            if self._probing or self._time() < self._open_until:
+                return False
+            self._probing = True
+            return True
+
+    def release(self) -> None:
+        """Give up an allowed request without recording its outcome."""
+        with self._lock:
+            self._probing = False
+
+    def record(self, failed: bool) -> None:
+        """Record the outcome of an allowed request."""
+        with self._lock:
+            if self._open_until is not None:
+                if not self._probing:
+                    # Request sent before the breaker opened
+                    return
+                self._probing = False
+                if failed:
+                    self._open_until = self._time() + self._cooldown_s
+                else:
+                    self._open_until = None
+                    self._outcomes.clear()
+                    LOG.info("OpenAI circuit breaker closed: probe succeeded")
+                return
+
+            self._outcomes.append(failed)
+            failures = sum(self._outcomes)
+            if len(
+                self._outcomes
+            ) >= self._min_requests and failures >= self._threshold * len(
+                self._outcomes
+            ):
+                self._open_until = self._time() + self._cooldown_s
+                LOG.warning(
+                    "OpenAI circuit breaker opened: %d of the last %d requests "
+                    "failed; failing fast for %ds",
+                    failures,
+                    len(self._outcomes),
+                    int(self._cooldown_s),
+                )
+
+
+class RetryBudget:
+    """
+    Token bucket limiting retries to a fraction of first attempts.
+
+    Every first attempt deposits ratio tokens, every retry withdraws one;
+    the bucket starts full at max_tokens so isolated failures can retry.
+    """
+
+    def __init__(self, *, ratio: float = 0.2, max_tokens: float = 20.0):
+        self._ratio = ratio
+        self._max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    def record_attempt(self) -> None:
+        with self._lock:
+            self._tokens = min(self._max_tokens, self._tokens + self._ratio)
+
+    def try_retry(self) -> bool:
+        """Withdraw a token for a retry; False if the budget is spent."""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+_GUARDS_LOCK = threading.Lock()
+_BREAKERS: Dict[float, CircuitBreaker] = {}
+_BUDGETS: Dict[float, RetryBudget] = {}
+_SLOTS: Dict[int, threading.BoundedSemaphore] = {}
+_POOLS: Dict[int, ThreadPoolExecutor] = {}
+
+
+def circuit_breaker_for(work: "UnitOfWork") -> Optional[CircuitBreaker]:
+    """Return the process-wide breaker of work's run, or None if disabled."""
+    threshold = work.config.openai_breaker_threshold
+    if not threshold:
+        return None
+    with _GUARDS_LOCK:
+        breaker = _BREAKERS.get(threshold)
+        if breaker is None:
+            breaker = CircuitBreaker(threshold=threshold)
+            _BREAKERS[threshold] = breaker
+        return breaker
+
+
+def retry_budget_for(work: "UnitOfWork") -> RetryBudget:
+    """Return the process-wide retry budget of work's run."""
+    ratio = work.config.openai_retry_budget
+    with _GUARDS_LOCK:
+        budget = _BUDGETS.get(ratio)
+        if budget is None:
+            budget = RetryBudget(ratio=ratio)
+            _BUDGETS[ratio] = budget
+        return budget
+
+
+def request_slots_for(work: "UnitOfWork") -> Optional[threading.BoundedSemaphore]:
+    """
+    Return the process-wide cap on in-flight adjuster requests, or None.
+
+    Shared by every adjuster, so concurrent adjust branches and parallel
+    workers draw from one budget. Unbounded unless configured.
+    """
+    limit = work.config.openai_max_concurrency
+    if not limit:
+        return None
+    with _GUARDS_LOCK:
+        slots = _SLOTS.get(limit)
+        if slots is None:
+            slots = threading.BoundedSemaphore(limit)
+            _SLOTS[limit] = slots
+        return slots
+
+
+def _request_pool(workers: int) -> ThreadPoolExecutor:
+    with _GUARDS_LOCK:
+        pool = _POOLS.get(workers)
+        if pool is None:
+            pool = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="cvextract-openai"
+            )
+            _POOLS[workers] = pool
+        return pool
+
+
+def request_pool_for(work: "UnitOfWork") -> ThreadPoolExecutor:
+    """
+    Return the process-wide threads running work's bounded requests.
+
+    Sized for one request per parallel worker and adjust branch, doubled
+    when hedging, and never below _MIN_POOL_WORKERS.
+    """
+    config = work.config
+    workers = 1
+    if config.parallel is not None:
+        workers = config.parallel.n
+    elif config.serve is not None:
+        workers = config.serve.n
+    if config.adjust is not None:
+        workers *= max(1, len(config.adjust.branches))
+    if config.openai_hedge:
+        workers *= 2
+    return _request_pool(max(_MIN_POOL_WORKERS, workers))
+
+
+def step_deadline(work: "UnitOfWork", step: "StepName") -> Optional[float]:
+    """
+    time.monotonic() by which OpenAI calls of step must be done, or None.
+
+    The clock starts at the first call of the step and is shared by every
+    request of that step.
+    """
+    seconds = work.config.openai_deadline_s
+    if not seconds:
+        return None
+    status = work.ensure_step_status(step)
+    if status.deadline is None:
+        status.deadline = time.monotonic() + seconds
+    return status.deadline
+
+
+def hedge_policy_for(work: "UnitOfWork") -> Optional[HedgePolicy]:
+    """Return the hedging policy of work's run, or None if disabled."""
+    return HedgePolicy() if work.config.openai_hedge else None
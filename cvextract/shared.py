@@ -8,16 +8,23 @@ and text normalization helpers used across extraction, parsing, and rendering.
 from __future__ import annotations
 
 import hashlib
+import importlib
 import json
 import re
+import threading
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from .cli_config import UserConfig
 from .logging_utils import LOG
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 
 # ------------------------- Models -------------------------
 @dataclass
@@ -138,8 +145,7 @@ def load_input_json(work: UnitOfWork, *, step: StepName = None) -> Dict[str, Any
     status = work.ensure_step_status(step)
     if status.input is None:
         raise ValueError(f"{step.value} input path is not set")
-    with status.input.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return read_json(status.input)
 
 
 def write_output_json(
@@ -159,11 +165,46 @@ def write_output_json(
     if status.output is None:
         raise ValueError(f"{step.value} output path is not set")
     status.output.parent.mkdir(parents=True, exist_ok=True)
-    with status.output.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    compact = work.config.intermediate_json == "compact" and _is_intermediate_json(
+        work.config, step
+    )
+    status.output.write_bytes(dumps_json(data, compact=compact))
     return work
 
 
+def _is_intermediate_json(config: UserConfig, step: StepName) -> bool:
+    """Whether JSON written for step is only consumed by a later stage."""
+    if step == StepName.Extract:
+        return bool(config.adjust or config.render) and not (
+            config.extract and config.extract.output
+        )
+    if step == StepName.Adjust:
+        return bool(config.render) and not (config.adjust and config.adjust.output)
+    return False
+
+
+def dumps_json(data: Any, *, compact: bool = False) -> bytes:
+    """
+    Serialize data as UTF-8 JSON.
+
+    Pretty JSON (2-space indent) is meant for people; compact JSON has no
+    whitespace and uses orjson when it is installed.
+    """
+    if not compact:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def read_json(path: Path) -> Any:
+    """Load a JSON file (pretty or compact), using orjson when installed."""
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 class StepName(str, Enum):
     Extract = "Extract"
     Adjust = "Adjust"
@@ -174,6 +215,115 @@ class StepName(str, Enum):
     Verify = "Verify"
 
 
+def completion_usage(response: Any) -> Dict[str, int]:
+    """
+    Return the token counts an OpenAI response (completion or run) reports.
+
+    Missing or non-integer fields (older SDKs, test doubles) count as 0.
+    cached_tokens is the part of the prompt served from the provider's
+    prompt cache.
+    """
+    usage = getattr(response, "usage", None)
+    details = getattr(usage, "prompt_tokens_details", None)
+    counts = {
+        "prompt_tokens": getattr(usage, "prompt_tokens", 0),
+        "completion_tokens": getattr(usage, "completion_tokens", 0),
+        "cached_tokens": getattr(details, "cached_tokens", 0),
+    }
+    return {key: val if isinstance(val, int) else 0 for key, val in counts.items()}
+
+
+@dataclass
+class OpenAIUsage:
+    """OpenAI requests, tokens and backoff accumulated by one step."""
+
+    requests: int = 0
+    retries: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0
+    sleep_s: float = 0.0
+    # Responses served from the LLM response cache instead of the API
+    cache_hits: int = 0
+    # Duplicate requests sent because the first one was slow
+    hedges: int = 0
+    # Replies constrained by a strict JSON schema (--structured-output)
+    structured: int = 0
+    # Paid replies discarded as invalid JSON or failing schema validation
+    fallbacks: int = 0
+    # Concurrent requests of one step (e.g. translation chunks) share it
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def record_request(self, tokens: Optional[Dict[str, int]] = None) -> None:
+        """Count one API call and the token counts reported for it."""
+        with self._lock:
+            self.requests += 1
+        if tokens:
+            self.record_tokens(tokens)
+
+    def record_tokens(self, tokens: Dict[str, int]) -> None:
+        """Add token counts (see completion_usage) without counting a call."""
+        with self._lock:
+            self.prompt_tokens += tokens.get("prompt_tokens", 0)
+            self.completion_tokens += tokens.get("completion_tokens", 0)
+            self.cached_tokens += tokens.get("cached_tokens", 0)
+
+    def record_retry(self, sleep_s: float) -> None:
+        """Count one retry and the backoff slept before it."""
+        with self._lock:
+            self.retries += 1
+            self.sleep_s += sleep_s
+
+    def record_cache_hit(self) -> None:
+        with self._lock:
+            self.cache_hits += 1
+
+    def record_hedge(self) -> None:
+        """Count one hedged duplicate request."""
+        with self._lock:
+            self.hedges += 1
+            self.requests += 1
+
+    def record_structured(self) -> None:
+        with self._lock:
+            self.structured += 1
+
+    def record_fallback(self) -> None:
+        """Count one reply discarded in favour of the original data."""
+        with self._lock:
+            self.fallbacks += 1
+
+    def add(self, other: "OpenAIUsage") -> "OpenAIUsage":
+        with self._lock:
+            self.requests += other.requests
+            self.retries += other.retries
+            self.prompt_tokens += other.prompt_tokens
+            self.completion_tokens += other.completion_tokens
+            self.cached_tokens += other.cached_tokens
+            self.sleep_s += other.sleep_s
+            self.cache_hits += other.cache_hits
+            self.hedges += other.hedges
+            self.structured += other.structured
+            self.fallbacks += other.fallbacks
+        return self
+
+    def __bool__(self) -> bool:
+        return self.requests > 0 or self.cache_hits > 0
+
+    def format(self) -> str:
+        return (
+            f"{self.requests} requests, {self.prompt_tokens} prompt tokens "
+            f"({self.cached_tokens} cached), {self.completion_tokens} completion "
+            f"tokens, {self.retries} retries, {self.sleep_s:.1f}s backoff"
+            + (f", {self.cache_hits} cached responses" if self.cache_hits else "")
+            + (f", {self.hedges} hedged" if self.hedges else "")
+            + (f", {self.structured} structured" if self.structured else "")
+            + (f", {self.fallbacks} fallbacks" if self.fallbacks else "")
+        )
+
+
 @dataclass
 class StepStatus:
     step: StepName
@@ -182,12 +332,72 @@ class StepStatus:
     warnings: List[str] = field(default_factory=list)
     errors: List[str] = field(default_factory=list)
     ConfiguredExecutorAvailable: bool = True
+    usage: OpenAIUsage = field(default_factory=OpenAIUsage)
+    # time.monotonic() after which OpenAI retries of the step stop (see
+    # request_policy.step_deadline)
+    deadline: Optional[float] = None
+    # LLM cache entry the step's output was made from, evicted when the
+    # output fails verification (see llm_cache.evict_step_response)
+    llm_cache_key: Optional[str] = None
 
     @property
     def ok(self) -> bool:
         return not self.warnings and not self.errors
 
 
+def merge_step_states(
+    work: UnitOfWork,
+    variants: Sequence[Tuple[str, UnitOfWork]],
+    steps: Iterable[StepName],
+) -> UnitOfWork:
+    """
+    Fold the statuses of fan-out variants back into one UnitOfWork.
+
+    Warnings and errors are prefixed with the variant label; input and
+    output paths come from the first variant that ran the step.
+    """
+    for step in steps:
+        merged: Optional[StepStatus] = None
+        for label, variant in variants:
+            status = variant.step_states.get(step)
+            if status is None:
+                continue
+            if merged is None:
+                merged = StepStatus(step=step, input=status.input, output=status.output)
+            merged.usage.add(status.usage)
+            merged.warnings.extend(f"{label}: {w}" for w in status.warnings)
+            merged.errors.extend(f"{label}: {e}" for e in status.errors)
+        if merged is not None:
+            work.step_states[step] = merged
+    return work
+
+
+def collect_usage(
+    work: UnitOfWork, totals: Optional[Dict[StepName, OpenAIUsage]] = None
+) -> Dict[StepName, OpenAIUsage]:
+    """Add the OpenAI usage of each step of work to per-step totals."""
+    totals = {} if totals is None else totals
+    for step, status in work.step_states.items():
+        if status.usage:
+            totals.setdefault(step, OpenAIUsage()).add(status.usage)
+    return totals
+
+
+def format_usage_report(totals: Dict[StepName, OpenAIUsage]) -> List[str]:
+    """One line per step with OpenAI usage, plus a total when several did."""
+    lines = [
+        f"🔢 OpenAI {step.value}: {usage.format()}"
+        for step, usage in totals.items()
+        if usage
+    ]
+    if len(lines) > 1:
+        overall = OpenAIUsage()
+        for usage in totals.values():
+            overall.add(usage)
+        lines.append(f"🔢 OpenAI total: {overall.format()}")
+    return lines
+
+
 def get_status_icons(work: "UnitOfWork") -> Dict[StepName, str]:
     """Generate status icons for pipeline steps based on UnitOfWork statuses."""
 
@@ -361,10 +571,14 @@ def sanitize_for_xml_in_obj(obj: Any) -> Any:
     return _sanitize(obj)
 
 
-def url_to_cache_filename(url: str) -> str:
+def url_to_cache_filename(url: str, kind: str = "research") -> str:
     """
     Convert a URL to a safe, deterministic filename for caching.
 
+    Args:
+        url: URL to convert
+        kind: Cache kind used as the filename suffix (e.g., "research", "job")
+
     Returns:
         "example.com-abc123.research.json"
     """
@@ -375,7 +589,7 @@ def url_to_cache_filename(url: str) -> str:
 
     url_hash = hashlib.md5(url.lower().encode()).hexdigest()[:8]
     safe_domain = re.sub(r"[^a-z0-9.-]", "_", domain)
-    return f"{safe_domain}-{url_hash}.research.json"
+    return f"{safe_domain}-{url_hash}.{kind}.json"
 
 
 # ---------------------- Prompt Loading ----------------------
@@ -460,3 +674,23 @@ def format_prompt(prompt_name: str, **kwargs) -> Optional[str]:
     except Exception as e:
         LOG.error("Failed to format prompt %s: %s", prompt_name, e)
         return None
+
+
+# ---------------------- Plugin Loading ----------------------
+
+
+def load_entry_point(entry_point: str) -> Any:
+    """
+    Import and return the object referenced by a "module:attribute" entry point.
+
+    Registries store built-in plugins as entry points so that heavy
+    dependencies (openai, requests, docxtpl) are only imported on first use.
+
+    Example:
+        >>> load_entry_point("cvextract.renderers.docx_renderer:DocxCVRenderer")
+    """
+    module_name, _, attribute = entry_point.partition(":")
+    if not module_name or not attribute:
+        raise ValueError(f"Invalid entry point: {entry_point!r}")
+    module = importlib.import_module(module_name)
+    return getattr(module, attribute)
@@ -6,10 +6,9 @@ Validates completeness and basic structure of extracted CV data.
 
 from __future__ import annotations
 
-import json
 from typing import Any, Dict, List
 
-from ..shared import StepName, UnitOfWork
+from ..shared import StepName, UnitOfWork, read_json
 from .base import CVVerifier
 
 
@@ -105,8 +104,7 @@ class DefaultExpectedCvDataVerifier(CVVerifier):
         if not output_path.exists():
             return None, [f"verification input JSON not found: {output_path}"]
         try:
-            with output_path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = read_json(output_path)
         except Exception as e:
             return None, [f"verification input JSON unreadable: {type(e).__name__}"]
         if not isinstance(data, dict):
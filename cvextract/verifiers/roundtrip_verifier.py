@@ -7,11 +7,10 @@ handling for certain fields like environment lists.
 
 from __future__ import annotations
 
-import json
 import re
 from typing import Any, List
 
-from ..shared import StepName, UnitOfWork, clean_text
+from ..shared import StepName, UnitOfWork, clean_text, read_json
 from .base import CVVerifier
 
 
@@ -50,8 +49,7 @@ class RoundtripVerifier(CVVerifier):
         if not hasattr(path, "exists") or not path.exists():
             return None, [f"{label} not found: {path}"]
         try:
-            with path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = read_json(path)
         except Exception as e:
             return None, [f"{label} unreadable: {type(e).__name__}"]
         return data, []
@@ -0,0 +1,314 @@
+"""
+Compiled JSON schema validation.
+
+Compiles the JSON schemas in cvextract/contracts into nested validator
+closures once, so validating a document only walks the data instead of
+re-interpreting the schema. The compiled validators are shared by the
+schema verifier and the OpenAI adjusters.
+
+Supported keywords: type, required, properties, additionalProperties,
+items, enum, const, minimum, maximum, minLength, maxLength, minItems,
+maxItems and uniqueItems. Annotations (description, format, title) are
+ignored.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# A compiled validator appends error messages for a value at a path.
+_Check = Callable[[Any, str, List[str]], None]
+SchemaValidator = Callable[[Any], List[str]]
+
+_CONTRACTS_DIR = Path(__file__).parent.parent / "contracts"
+
+_TYPE_NAMES = {
+    "string": ("a string", "strings"),
+    "object": ("an object", "objects"),
+    "array": ("an array", "arrays"),
+    "number": ("a number", "numbers"),
+    "integer": ("an integer", "integers"),
+    "boolean": ("a boolean", "booleans"),
+    "null": ("null", "null"),
+}
+
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "string": lambda v: isinstance(v, str),
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "null": lambda v: v is None,
+}
+
+# Keywords that carry no validation semantics.
+_ANNOTATIONS = {"$schema", "$id", "title", "description", "format", "examples"}
+
+
+def _join(path: str, key: str) -> str:
+    return f"{path}.{key}" if path else key
+
+
+def _prefix(path: str) -> str:
+    return f"{path} " if path else ""
+
+
+def _types_of(schema: Dict[str, Any]) -> List[str]:
+    declared = schema.get("type")
+    if declared is None:
+        return []
+    return [declared] if isinstance(declared, str) else list(declared)
+
+
+def _is_plain_type(schema: Dict[str, Any]) -> bool:
+    """Return True for item schemas that only constrain a single type."""
+    types = _types_of(schema)
+    return (
+        len(types) == 1
+        and types[0] != "object"
+        and types[0] != "array"
+        and set(schema) - _ANNOTATIONS == {"type"}
+    )
+
+
+def _compile(
+    schema: Dict[str, Any], nullable_optional: bool, allow_null: bool = False
+) -> _Check:
+    checks: List[_Check] = []
+
+    types = _types_of(schema)
+    if allow_null and types and "null" not in types:
+        types = types + ["null"]
+    if types:
+        type_checks = [_TYPE_CHECKS[t] for t in types if t in _TYPE_CHECKS]
+        expected = " or ".join(_TYPE_NAMES.get(t, (t, t))[0] for t in types)
+
+        def check_type(value: Any, path: str, errs: List[str]) -> bool:
+            if any(check(value) for check in type_checks):
+                return True
+            errs.append(f"{path or 'value'} must be {expected}")
+            return False
+
+    else:
+
+        def check_type(value: Any, path: str, errs: List[str]) -> bool:
+            return True
+
+    if "enum" in schema:
+        allowed = list(schema["enum"])
+        if allow_null and None not in allowed:
+            allowed.append(None)
+        listed = ", ".join(repr(v) for v in allowed if v is not None)
+        if None in allowed:
+            listed += ", or null"
+
+        def check_enum(value: Any, path: str, errs: List[str]) -> None:
+            if value not in allowed:
+                errs.append(f"{path or 'value'} must be one of {listed}")
+
+        checks.append(check_enum)
+
+    if "const" in schema:
+        const = schema["const"]
+
+        def check_const(value: Any, path: str, errs: List[str]) -> None:
+            if value != const:
+                errs.append(f"{path or 'value'} must be {const!r}")
+
+        checks.append(check_const)
+
+    minimum = schema.get("minimum")
+    maximum = schema.get("maximum")
+    if minimum is not None or maximum is not None:
+
+        def check_range(value: Any, path: str, errs: List[str]) -> None:
+            if not _TYPE_CHECKS["number"](value):
+                return
+            if minimum is not None and value < minimum:
+                errs.append(f"{path or 'value'} must be >= {minimum}")
+            if maximum is not None and value > maximum:
+                errs.append(f"{path or 'value'} must be <= {maximum}")
+
+        checks.append(check_range)
+
+    min_length = schema.get("minLength")
+    max_length = schema.get("maxLength")
+    if min_length is not None or max_length is not None:
+
+        def check_length(value: Any, path: str, errs: List[str]) -> None:
+            if not isinstance(value, str):
+                return
+            if min_length is not None and len(value) < min_length:
+                if min_length == 1:
+                    errs.append(f"{path or 'value'} must be a non-empty string")
+                else:
+                    errs.append(
+                        f"{path or 'value'} must have at least {min_length} characters"
+                    )
+            if max_length is not None and len(value) > max_length:
+                errs.append(
+                    f"{path or 'value'} must have at most {max_length} characters"
+                )
+
+        checks.append(check_length)
+
+    if (
+        "properties" in schema
+        or "required" in schema
+        or "additionalProperties" in schema
+    ):
+        required: Tuple[str, ...] = tuple(schema.get("required", []))
+        properties = {
+            key: _compile(
+                sub, nullable_optional, nullable_optional and key not in required
+            )
+            for key, sub in schema.get("properties", {}).items()
+        }
+        additional = schema.get("additionalProperties", True)
+        additional_check: Optional[_Check] = (
+            _compile(additional, nullable_optional)
+            if isinstance(additional, dict)
+            else None
+        )
+
+        def check_object(value: Any, path: str, errs: List[str]) -> None:
+            if not isinstance(value, dict):
+                return
+            for field in required:
+                if field not in value:
+                    errs.append(f"{_prefix(path)}missing required field: {field}")
+            for key, check in properties.items():
+                if key in value:
+                    check(value[key], _join(path, key), errs)
+            for key in value:
+                if key in properties:
+                    continue
+                if additional is False:
+                    errs.append(f"{_prefix(path)}has unexpected field: {key}")
+                elif additional_check is not None:
+                    additional_check(value[key], _join(path, key), errs)
+
+        checks.append(check_object)
+
+    items = schema.get("items")
+    if isinstance(items, dict):
+        if _is_plain_type(items):
+            item_type = _types_of(items)[0]
+            item_check = _TYPE_CHECKS.get(item_type, lambda v: True)
+            plural = _TYPE_NAMES.get(item_type, (item_type, item_type))[1]
+
+            def check_items(value: Any, path: str, errs: List[str]) -> None:
+                if isinstance(value, list) and not all(item_check(v) for v in value):
+                    errs.append(f"{path or 'value'} items must be {plural}")
+
+        else:
+            item_validator = _compile(items, nullable_optional)
+
+            def check_items(value: Any, path: str, errs: List[str]) -> None:
+                if not isinstance(value, list):
+                    return
+                for idx, item in enumerate(value):
+                    item_validator(item, f"{path}[{idx}]", errs)
+
+        checks.append(check_items)
+
+    min_items = schema.get("minItems")
+    max_items = schema.get("maxItems")
+    unique_items = bool(schema.get("uniqueItems"))
+    if min_items is not None or max_items is not None or unique_items:
+
+        def check_array(value: Any, path: str, errs: List[str]) -> None:
+            if not isinstance(value, list):
+                return
+            if min_items is not None and len(value) < min_items:
+                noun = "item" if min_items == 1 else "items"
+                errs.append(f"{path or 'value'} must have at least {min_items} {noun}")
+            if max_items is not None and len(value) > max_items:
+                errs.append(f"{path or 'value'} must have at most {max_items} items")
+            if unique_items:
+                seen = set()
+                for item in value:
+                    key = json.dumps(item, sort_keys=True)
+                    if key in seen:
+                        errs.append(f"{path or 'value'} items must be unique")
+                        break
+                    seen.add(key)
+
+        checks.append(check_array)
+
+    def validate(value: Any, path: str, errs: List[str]) -> None:
+        if not check_type(value, path, errs):
+            return
+        if value is None and allow_null:
+            return
+        for check in checks:
+            check(value, path, errs)
+
+    return validate
+
+
+def compile_schema(
+    schema: Dict[str, Any], *, nullable_optional: bool = False
+) -> SchemaValidator:
+    """
+    Compile a JSON schema into a validator function.
+
+    Args:
+        schema: Parsed JSON schema.
+        nullable_optional: Accept null for properties that are not required
+            (model responses often use null for unknown optional values).
+
+    Returns:
+        Function returning the list of validation errors for a document.
+    """
+    check = _compile(schema, nullable_optional)
+
+    def validator(data: Any) -> List[str]:
+        errs: List[str] = []
+        check(data, "", errs)
+        return errs
+
+    return validator
+
+
+# Compiled validators keyed by schema identity; the schema object is kept
+# alive alongside its validator so ids are never reused while cached.
+_COMPILED: Dict[Tuple[int, bool], Tuple[Dict[str, Any], SchemaValidator]] = {}
+_CONTRACTS: Dict[str, Dict[str, Any]] = {}
+_LOCK = threading.Lock()
+
+
+def get_schema_validator(
+    schema: Dict[str, Any], *, nullable_optional: bool = False
+) -> SchemaValidator:
+    """Return the compiled validator for a schema, compiling it on first use."""
+    key = (id(schema), nullable_optional)
+    with _LOCK:
+        cached = _COMPILED.get(key)
+        if cached is not None and cached[0] is schema:
+            return cached[1]
+    validator = compile_schema(schema, nullable_optional=nullable_optional)
+    with _LOCK:
+        _COMPILED[key] = (schema, validator)
+    return validator
+
+
+def load_contract_schema(name: str) -> Dict[str, Any]:
+    """
+    Load a schema from cvextract/contracts once per process.
+
+    Args:
+        name: Schema filename, e.g. "cv_schema.json".
+    """
+    with _LOCK:
+        schema = _CONTRACTS.get(name)
+    if schema is None:
+        with (_CONTRACTS_DIR / name).open("r", encoding="utf-8") as f:
+            schema = json.load(f)
+        with _LOCK:
+            schema = _CONTRACTS.setdefault(name, schema)
+    return schema
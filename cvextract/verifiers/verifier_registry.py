@@ -7,23 +7,46 @@ different verification strategies via the CLI.
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Type
+from typing import Dict, List, Optional, Type, Union
 
+from ..shared import load_entry_point
 from .base import CVVerifier
 
-# Global verifier registry
-_VERIFIER_REGISTRY: Dict[str, Type[CVVerifier]] = {}
+# Global verifier registry (classes, or lazy "module:Class" entry points)
+_VERIFIER_REGISTRY: Dict[str, Union[Type[CVVerifier], str]] = {}
+_VERIFIER_DESCRIPTIONS: Dict[str, str] = {}
 
 
-def register_verifier(name: str, verifier_class: Type[CVVerifier]) -> None:
+def register_verifier(
+    name: str,
+    verifier_class: Union[Type[CVVerifier], str],
+    *,
+    description: Optional[str] = None,
+) -> None:
     """
     Register a verifier class in the global registry.
 
     Args:
         name: The name to register the verifier under (e.g., "data-verifier")
-        verifier_class: The verifier class to register
+        verifier_class: The verifier class, or a "module:Class" entry point that is
+            imported on first use
+        description: Optional description for list_verifiers(), so listing does
+            not import a lazy entry point
     """
     _VERIFIER_REGISTRY[name] = verifier_class
+    if description is None:
+        _VERIFIER_DESCRIPTIONS.pop(name, None)
+    else:
+        _VERIFIER_DESCRIPTIONS[name] = description
+
+
+def _resolve_verifier(name: str) -> Optional[Type[CVVerifier]]:
+    """Return the registered class, importing a lazy entry point on first use."""
+    entry = _VERIFIER_REGISTRY.get(name)
+    if isinstance(entry, str):
+        entry = load_entry_point(entry)
+        _VERIFIER_REGISTRY[name] = entry
+    return entry
 
 
 def get_verifier(name: str, **kwargs) -> Optional[CVVerifier]:
@@ -37,7 +60,7 @@ def get_verifier(name: str, **kwargs) -> Optional[CVVerifier]:
     Returns:
         Verifier instance, or None if not found
     """
-    verifier_class = _VERIFIER_REGISTRY.get(name)
+    verifier_class = _resolve_verifier(name)
     if verifier_class:
         return verifier_class(**kwargs)
     return None
@@ -51,11 +74,13 @@ def list_verifiers() -> List[Dict[str, str]]:
         List of dicts with 'name' and 'description' keys
     """
     verifiers = []
-    for name, verifier_class in _VERIFIER_REGISTRY.items():
-        # Try to get description from class docstring
-        description = verifier_class.__doc__ or "No description available"
-        # Extract first line of docstring
-        description = description.strip().split("\n")[0]
+    for name in list(_VERIFIER_REGISTRY):
+        description = _VERIFIER_DESCRIPTIONS.get(name)
+        if description is None:
+            # Try to get description from class docstring
+            description = _resolve_verifier(name).__doc__ or "No description available"
+            # Extract first line of docstring
+            description = description.strip().split("\n")[0]
         verifiers.append({"name": name, "description": description})
     return sorted(verifiers, key=lambda x: x["name"])
 
@@ -68,6 +93,7 @@ def unregister_verifier(name: str) -> None:
         name: The verifier name to unregister
     """
     _VERIFIER_REGISTRY.pop(name, None)
+    _VERIFIER_DESCRIPTIONS.pop(name, None)
 
 
 __all__ = [
@@ -1,11 +1,17 @@
 import itertools
 import json
 import sys
+import threading
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
-from cvextract.cli_config import RenderStage, UserConfig
+from cvextract import request_policy
+from cvextract.adjusters import openai_company_research_adjuster as research_module
+from cvextract.adjusters import openai_job_specific_adjuster as job_module
+from cvextract.cli_config import ExtractStage, RenderStage, UserConfig
 from cvextract.shared import StepName, UnitOfWork
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
@@ -13,6 +19,15 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 
+@pytest.fixture(autouse=True)
+def _fresh_openai_guards():
+    # The circuit breaker, retry budget and request slots are process-wide;
+    # keep failures simulated by one test from tripping them for the next
+    request_policy._BREAKERS.clear()
+    request_policy._BUDGETS.clear()
+    request_policy._SLOTS.clear()
+
+
 @pytest.fixture
 def make_render_work(tmp_path: Path):
     counter = itertools.count()
@@ -44,3 +59,90 @@ def make_render_work(tmp_path: Path):
         return work
 
     return _make
+
+
+@pytest.fixture
+def make_adjust_work(tmp_path: Path):
+    def _make(
+        cv_data: dict, *, name: str = "cv", structured: bool = False
+    ) -> UnitOfWork:
+        input_path = tmp_path / f"{name}.json"
+        input_path.write_text(json.dumps(cv_data), encoding="utf-8")
+        work = UnitOfWork(
+            config=UserConfig(
+                target_dir=tmp_path,
+                extract=ExtractStage(source=input_path),
+                llm_cache=False,
+                structured_output=structured,
+            ),
+            initial_input=input_path,
+        )
+        work.set_step_paths(
+            StepName.Adjust,
+            input_path=input_path,
+            output_path=tmp_path / f"{name}_out.json",
+        )
+        return work
+
+    return _make
+
+
+@pytest.fixture
+def read_adjust_output():
+    def _read(work: UnitOfWork) -> dict:
+        return json.loads(work.get_step_output(StepName.Adjust).read_text())
+
+    return _read
+
+
+class _FakeOpenAI:
+    """
+    Stands in for the OpenAI client of the adjusters.
+
+    Records every request and answers with `reply`: a string, a JSON value
+    (sent dumped), or a callable taking the request and returning either or
+    a ready completion built with `completion()`.
+    """
+
+    requests: list = []
+    reply = ""
+    _lock = threading.Lock()
+
+    def __init__(self, api_key=None):
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    @staticmethod
+    def completion(reply, *, prompt_tokens: int = 0, cached_tokens: int = 0):
+        content = reply if isinstance(reply, str) else json.dumps(reply)
+        return SimpleNamespace(
+            choices=[
+                SimpleNamespace(
+                    finish_reason="stop", message=SimpleNamespace(content=content)
+                )
+            ],
+            usage=SimpleNamespace(
+                prompt_tokens=prompt_tokens,
+                completion_tokens=10,
+                prompt_tokens_details=SimpleNamespace(cached_tokens=cached_tokens),
+            ),
+        )
+
+    def create(self, **request):
+        with self._lock:
+            _FakeOpenAI.requests.append(request)
+        reply = _FakeOpenAI.reply
+        if callable(reply):
+            reply = reply(request)
+        if hasattr(reply, "choices"):
+            return reply
+        return self.completion(reply)
+
+
+@pytest.fixture
+def fake_openai():
+    _FakeOpenAI.requests = []
+    _FakeOpenAI.reply = ""
+    with patch.object(job_module, "OpenAI", _FakeOpenAI), patch.object(
+        research_module, "OpenAI", _FakeOpenAI
+    ), patch.object(job_module, "_PACKERS", {}):
+        yield _FakeOpenAI
@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+import cvextract.adjusters.openai_job_specific_adjuster as job_module
 from cvextract.adjusters import (
     CVAdjuster,
     OpenAICompanyResearchAdjuster,
@@ -20,6 +21,14 @@ from cvextract.cli_config import ExtractStage, UserConfig
 from cvextract.shared import StepName, UnitOfWork, load_input_json, write_output_json
 
 
+@pytest.fixture(autouse=True)
+def _reset_job_description_cache(monkeypatch):
+    """Isolate the process-wide job description cache and HTTP session."""
+    monkeypatch.setattr(job_module, "_HTTP_SESSION", None)
+    monkeypatch.setattr(job_module, "_JOB_DESCRIPTION_CACHE", {})
+    monkeypatch.setattr(job_module, "_JOB_DESCRIPTION_CHECKED_AT", {})
+
+
 def make_work(tmp_path: Path, cv_data: dict) -> UnitOfWork:
     input_path = tmp_path / "input.json"
     input_path.write_text(json.dumps(cv_data, indent=2))
@@ -169,13 +178,13 @@ class TestFetchJobDescription:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.text = "Senior Software Engineer position..."
-        mock_requests.get.return_value = mock_response
+        mock_requests.Session.return_value.get.return_value = mock_response
 
         result = _fetch_job_description("https://example.com/job/123")
 
         assert result == "Senior Software Engineer position..."
         # Verify the call was made with the URL, timeout, and headers
-        call_args = mock_requests.get.call_args
+        call_args = mock_requests.Session.return_value.get.call_args
         assert call_args[0][0] == "https://example.com/job/123"  # URL
         assert call_args[1]["timeout"] == 15
         assert "User-Agent" in call_args[1]["headers"]
@@ -191,12 +200,12 @@ class TestFetchJobDescription:
         """Test when response status is not 200."""
         mock_response = MagicMock()
         mock_response.status_code = 404
-        mock_requests.get.return_value = mock_response
+        mock_requests.Session.return_value.get.return_value = mock_response
 
         result = _fetch_job_description("https://example.com/job/notfound")
 
         assert result == ""
-        mock_requests.get.assert_called_once()
+        mock_requests.Session.return_value.get.assert_called_once()
 
     @patch("cvextract.adjusters.openai_job_specific_adjuster.requests")
     def test_fetch_job_description_empty_text(self, mock_requests):
@@ -204,7 +213,7 @@ class TestFetchJobDescription:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.text = ""
-        mock_requests.get.return_value = mock_response
+        mock_requests.Session.return_value.get.return_value = mock_response
 
         result = _fetch_job_description("https://example.com/job/123")
 
@@ -216,7 +225,7 @@ class TestFetchJobDescription:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.text = None
-        mock_requests.get.return_value = mock_response
+        mock_requests.Session.return_value.get.return_value = mock_response
 
         result = _fetch_job_description("https://example.com/job/123")
 
@@ -225,7 +234,9 @@ class TestFetchJobDescription:
     @patch("cvextract.adjusters.openai_job_specific_adjuster.requests")
     def test_fetch_job_description_connection_error(self, mock_requests):
         """Test when network error occurs during fetch."""
-        mock_requests.get.side_effect = Exception("Connection timeout")
+        mock_requests.Session.return_value.get.side_effect = Exception(
+            "Connection timeout"
+        )
 
         result = _fetch_job_description("https://example.com/job/123")
 
@@ -234,13 +245,123 @@ class TestFetchJobDescription:
     @patch("cvextract.adjusters.openai_job_specific_adjuster.requests")
     def test_fetch_job_description_request_exception(self, mock_requests):
         """Test when requests library raises an exception."""
-        mock_requests.get.side_effect = RuntimeError("Request failed")
+        mock_requests.Session.return_value.get.side_effect = RuntimeError(
+            "Request failed"
+        )
 
         result = _fetch_job_description("https://example.com/job/123")
 
         assert result == ""
 
 
+class TestJobDescriptionCache:
+    """Tests for the job description fetch cache."""
+
+    @patch("cvextract.adjusters.openai_job_specific_adjuster.requests")
+    def test_repeated_fetch_hits_memory_cache(self, mock_requests):
+        """A URL is fetched once per process and reused afterwards."""
+        mock_response = MagicMock(status_code=200, text="<p>Data Engineer</p>")
+        mock_response.headers = {}
+        mock_requests.Session.return_value.get.return_value = mock_response
+
+        for _ in range(5):
+            result = _fetch_job_description("https://example.com/job/1")
+
+        assert result == "Data Engineer"
+        mock_requests.Session.assert_called_once()
+        mock_requests.Session.return_value.get.assert_called_once()
+
+    @patch("cvextract.adjusters.openai_job_specific_adjuster.requests")
+    def test_disk_cache_stores_validators(self, mock_requests, tmp_path: Path):
+        """Fetched descriptions are written to disk with ETag/Last-Modified."""
+        mock_response = MagicMock(status_code=200, text="Data Engineer")
+        mock_response.headers = {
+            "ETag": '"abc"',
+            "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT",
+        }
+        mock_requests.Session.return_value.get.return_value = mock_response
+
+        _fetch_job_description("https://example.com/job/1", cache_dir=tmp_path)
+
+        cache_files = list(tmp_path.glob("*.job.json"))
+        assert len(cache_files) == 1
+        entry = json.loads(cache_files[0].read_text(encoding="utf-8"))
+        assert entry["text"] == "Data Engineer"
+        assert entry["etag"] == '"abc"'
+        assert entry["last_modified"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+
+    @patch("cvextract.adjusters.openai_job_specific_adjuster.requests")
+    def test_disk_cache_revalidates_with_conditional_get(
+        self, mock_requests, tmp_path: Path
+    ):
+        """A disk-cached entry is revalidated and reused on 304."""
+        from cvextract.shared import url_to_cache_filename
+
+        url = "https://example.com/job/1"
+        (tmp_path / url_to_cache_filename(url, kind="job")).write_text(
+            json.dumps(
+                {
+                    "url": url,
+                    "etag": '"abc"',
+                    "last_modified": "Wed, 01 Jan 2025 00:00:00 GMT",
+                    "text": "Cached description",
+                }
+            ),
+            encoding="utf-8",
+        )
+        mock_requests.Session.return_value.get.return_value = MagicMock(status_code=304)
+
+        result = _fetch_job_description(url, cache_dir=tmp_path)
+
+        assert result == "Cached description"
+        headers = mock_requests.Session.return_value.get.call_args[1]["headers"]
+        assert headers["If-None-Match"] == '"abc"'
+        assert headers["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+
+    @patch("cvextract.adjusters.openai_job_specific_adjuster.requests")
+    def test_disk_cache_used_when_fetch_fails(self, mock_requests, tmp_path: Path):
+        """A stale disk-cached entry is used when the network fetch fails."""
+        from cvextract.shared import url_to_cache_filename
+
+        url = "https://example.com/job/1"
+        (tmp_path / url_to_cache_filename(url, kind="job")).write_text(
+            json.dumps({"url": url, "text": "Cached description"}),
+            encoding="utf-8",
+        )
+        mock_requests.Session.return_value.get.side_effect = Exception("offline")
+
+        assert _fetch_job_description(url, cache_dir=tmp_path) == "Cached description"
+
+    @patch("cvextract.adjusters.openai_job_specific_adjuster.requests")
+    def test_memory_cache_revalidated_after_ttl(self, mock_requests, monkeypatch):
+        """A long-lived process revalidates its in-memory entry once it expires."""
+        url = "https://example.com/job/1"
+        mock_response = MagicMock(status_code=200, text="Data Engineer")
+        mock_response.headers = {"ETag": '"abc"'}
+        get = mock_requests.Session.return_value.get
+        get.return_value = mock_response
+
+        _fetch_job_description(url)
+        assert _fetch_job_description(url) == "Data Engineer"
+        assert get.call_count == 1
+
+        monkeypatch.setattr(job_module, "_JOB_DESCRIPTION_TTL_S", 0.0)
+        get.return_value = MagicMock(status_code=304)
+
+        assert _fetch_job_description(url) == "Data Engineer"
+        assert get.call_count == 2
+        assert get.call_args[1]["headers"]["If-None-Match"] == '"abc"'
+
+    @patch("cvextract.adjusters.openai_job_specific_adjuster.requests")
+    def test_failed_fetch_is_not_cached(self, mock_requests):
+        """Failed fetches are retried on the next call."""
+        mock_requests.Session.return_value.get.return_value = MagicMock(status_code=503)
+
+        assert _fetch_job_description("https://example.com/job/1") == ""
+        assert _fetch_job_description("https://example.com/job/1") == ""
+        assert mock_requests.Session.return_value.get.call_count == 2
+
+
 class TestAdjusterRegistry:
     """Tests for the adjuster registry system."""
 
@@ -1794,7 +1915,7 @@ class TestOpenAIJobSpecificAdjuster:
         """_fetch_job_description should return empty string if status code is not 200."""
         mock_response = MagicMock()
         mock_response.status_code = 404
-        mock_requests.get.return_value = mock_response
+        mock_requests.Session.return_value.get.return_value = mock_response
 
         from cvextract.adjusters.openai_job_specific_adjuster import (
             _fetch_job_description,
@@ -1810,7 +1931,7 @@ class TestOpenAIJobSpecificAdjuster:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.text = ""
-        mock_requests.get.return_value = mock_response
+        mock_requests.Session.return_value.get.return_value = mock_response
 
         from cvextract.adjusters.openai_job_specific_adjuster import (
             _fetch_job_description,
@@ -1826,7 +1947,7 @@ class TestOpenAIJobSpecificAdjuster:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.text = "<html><body><p>Senior  Engineer</p><script>alert('x')</script></body></html>"
-        mock_requests.get.return_value = mock_response
+        mock_requests.Session.return_value.get.return_value = mock_response
 
         from cvextract.adjusters.openai_job_specific_adjuster import (
             _fetch_job_description,
@@ -1840,24 +1961,27 @@ class TestOpenAIJobSpecificAdjuster:
 
     @patch("cvextract.adjusters.openai_job_specific_adjuster.requests")
     def test_fetch_job_description_truncates_long_content(self, mock_requests):
-        """_fetch_job_description should truncate content to 5000 chars."""
+        """_fetch_job_description should truncate content to the token cap."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = "A" * 10000  # 10000 characters
-        mock_requests.get.return_value = mock_response
+        mock_response.text = "word " * 10000
+        mock_requests.Session.return_value.get.return_value = mock_response
 
         from cvextract.adjusters.openai_job_specific_adjuster import (
+            _JOB_DESCRIPTION_MAX_TOKENS,
             _fetch_job_description,
         )
+        from cvextract.adjusters.token_budget import estimate_tokens
 
         result = _fetch_job_description("https://example.com/job")
 
-        assert len(result) == 5000
+        assert 0 < estimate_tokens(result) <= _JOB_DESCRIPTION_MAX_TOKENS
+        assert result.endswith("word")
 
     @patch("cvextract.adjusters.openai_job_specific_adjuster.requests")
     def test_fetch_job_description_request_exception(self, mock_requests):
         """_fetch_job_description should return empty string on request exception."""
-        mock_requests.get.side_effect = Exception("Network error")
+        mock_requests.Session.return_value.get.side_effect = Exception("Network error")
 
         from cvextract.adjusters.openai_job_specific_adjuster import (
             _fetch_job_description,
@@ -2206,12 +2330,8 @@ class TestOpenAICompanyResearchHelpers:
             _validate_research_data,
         )
 
-        with patch(
-            "cvextract.adjusters.openai_company_research_adjuster._load_research_schema",
-            return_value={"required": []},
-        ):
-            assert _validate_research_data({"name": 123, "domains": ["x"]}) is False
-            assert _validate_research_data({"name": "", "domains": ["x"]}) is False
+        assert _validate_research_data({"name": 123, "domains": ["x"]}) is False
+        assert _validate_research_data({"name": "", "domains": ["x"]}) is False
 
     def test_validate_research_data_rejects_invalid_description(self):
         """_validate_research_data() rejects invalid description values."""
@@ -2219,13 +2339,9 @@ class TestOpenAICompanyResearchHelpers:
             _validate_research_data,
         )
 
-        with patch(
-            "cvextract.adjusters.openai_company_research_adjuster._load_research_schema",
-            return_value={"required": []},
-        ):
-            result = _validate_research_data(
-                {"name": "Test", "domains": ["x"], "description": 123}
-            )
+        result = _validate_research_data(
+            {"name": "Test", "domains": ["x"], "description": 123}
+        )
         assert result is False
 
     def test_validate_research_data_rejects_invalid_domains(self):
@@ -2234,13 +2350,9 @@ class TestOpenAICompanyResearchHelpers:
             _validate_research_data,
         )
 
-        with patch(
-            "cvextract.adjusters.openai_company_research_adjuster._load_research_schema",
-            return_value={"required": []},
-        ):
-            assert _validate_research_data({"name": "Test", "domains": "bad"}) is False
-            assert _validate_research_data({"name": "Test", "domains": []}) is False
-            assert _validate_research_data({"name": "Test", "domains": [1]}) is False
+        assert _validate_research_data({"name": "Test", "domains": "bad"}) is False
+        assert _validate_research_data({"name": "Test", "domains": []}) is False
+        assert _validate_research_data({"name": "Test", "domains": [1]}) is False
 
     def test_validate_research_data_rejects_invalid_technology_signals(self):
         """_validate_research_data() rejects invalid technology_signals values."""
@@ -2248,71 +2360,67 @@ class TestOpenAICompanyResearchHelpers:
             _validate_research_data,
         )
 
-        with patch(
-            "cvextract.adjusters.openai_company_research_adjuster._load_research_schema",
-            return_value={"required": []},
-        ):
-            assert (
-                _validate_research_data(
-                    {"name": "Test", "domains": ["x"], "technology_signals": "bad"}
-                )
-                is False
+        assert (
+            _validate_research_data(
+                {"name": "Test", "domains": ["x"], "technology_signals": "bad"}
             )
-            assert (
-                _validate_research_data(
-                    {"name": "Test", "domains": ["x"], "technology_signals": ["bad"]}
-                )
-                is False
+            is False
+        )
+        assert (
+            _validate_research_data(
+                {"name": "Test", "domains": ["x"], "technology_signals": ["bad"]}
             )
-            assert (
-                _validate_research_data(
-                    {
-                        "name": "Test",
-                        "domains": ["x"],
-                        "technology_signals": [{}],
-                    }
-                )
-                is False
+            is False
+        )
+        assert (
+            _validate_research_data(
+                {
+                    "name": "Test",
+                    "domains": ["x"],
+                    "technology_signals": [{}],
+                }
             )
-            assert (
-                _validate_research_data(
-                    {
-                        "name": "Test",
-                        "domains": ["x"],
-                        "technology_signals": [{"technology": 1}],
-                    }
-                )
-                is False
+            is False
+        )
+        assert (
+            _validate_research_data(
+                {
+                    "name": "Test",
+                    "domains": ["x"],
+                    "technology_signals": [{"technology": 1}],
+                }
             )
-            assert (
-                _validate_research_data(
-                    {
-                        "name": "Test",
-                        "domains": ["x"],
-                        "technology_signals": [
-                            {
-                                "technology": "X",
-                                "category": 1,
-                                "interest_level": "extreme",
-                                "confidence": 2,
-                                "signals": "bad",
-                                "notes": 1,
-                            }
-                        ],
-                    }
-                )
-                is False
+            is False
+        )
+        assert (
+            _validate_research_data(
+                {
+                    "name": "Test",
+                    "domains": ["x"],
+                    "technology_signals": [
+                        {
+                            "technology": "X",
+                            "category": 1,
+                            "interest_level": "extreme",
+                            "confidence": 2,
+                            "signals": "bad",
+                            "notes": 1,
+                        }
+                    ],
+                }
             )
-            assert (
-                _validate_research_data(
-                    {
-                        "name": "Test",
-                        "domains": ["x"],
-                        "technology_signals": [{"technology": "X", "signals": [1]}],
-                    }
-                )
-                is False
+            is False
+        )
+        assert (
+            _validate_research_data(
+                {
+                    "name": "Test",
+                    "domains": ["x"],
+                    "technology_signals": [{"technology": "X", "signals": [1]}],
+                }
             )
+            is False
+        )
 
     def test_validate_research_data_rejects_invalid_industry_classification(self):
         """_validate_research_data() rejects invalid industry classification."""
@@ -2320,30 +2428,26 @@ class TestOpenAICompanyResearchHelpers:
             _validate_research_data,
         )
 
-        with patch(
-            "cvextract.adjusters.openai_company_research_adjuster._load_research_schema",
-            return_value={"required": []},
-        ):
-            assert (
-                _validate_research_data(
-                    {
-                        "name": "Test",
-                        "domains": ["x"],
-                        "industry_classification": "bad",
-                    }
-                )
-                is False
+        assert (
+            _validate_research_data(
+                {
+                    "name": "Test",
+                    "domains": ["x"],
+                    "industry_classification": "bad",
+                }
             )
-            assert (
-                _validate_research_data(
-                    {
-                        "name": "Test",
-                        "domains": ["x"],
-                        "industry_classification": {"naics": 1, "sic": 2},
-                    }
-                )
-                is False
+            is False
+        )
+        assert (
+            _validate_research_data(
+                {
+                    "name": "Test",
+                    "domains": ["x"],
+                    "industry_classification": {"naics": 1, "sic": 2},
+                }
             )
+            is False
+        )
 
     def test_validate_research_data_rejects_invalid_founded_year(self):
         """_validate_research_data() rejects founded_year out of range."""
@@ -2351,13 +2455,9 @@ class TestOpenAICompanyResearchHelpers:
             _validate_research_data,
         )
 
-        with patch(
-            "cvextract.adjusters.openai_company_research_adjuster._load_research_schema",
-            return_value={"required": []},
-        ):
-            result = _validate_research_data(
-                {"name": "Test", "domains": ["x"], "founded_year": 1500}
-            )
+        result = _validate_research_data(
+            {"name": "Test", "domains": ["x"], "founded_year": 1500}
+        )
         assert result is False
 
     def test_validate_research_data_rejects_invalid_headquarters(self):
@@ -2366,32 +2466,28 @@ class TestOpenAICompanyResearchHelpers:
             _validate_research_data,
         )
 
-        with patch(
-            "cvextract.adjusters.openai_company_research_adjuster._load_research_schema",
-            return_value={"required": []},
-        ):
-            assert (
-                _validate_research_data(
-                    {"name": "Test", "domains": ["x"], "headquarters": "bad"}
-                )
-                is False
+        assert (
+            _validate_research_data(
+                {"name": "Test", "domains": ["x"], "headquarters": "bad"}
             )
-            assert (
-                _validate_research_data(
-                    {"name": "Test", "domains": ["x"], "headquarters": {}}
-                )
-                is False
+            is False
+        )
+        assert (
+            _validate_research_data(
+                {"name": "Test", "domains": ["x"], "headquarters": {}}
             )
-            assert (
-                _validate_research_data(
-                    {
-                        "name": "Test",
-                        "domains": ["x"],
-                        "headquarters": {"city": 1, "state": 2, "country": 3},
-                    }
-                )
-                is False
+            is False
+        )
+        assert (
+            _validate_research_data(
+                {
+                    "name": "Test",
+                    "domains": ["x"],
+                    "headquarters": {"city": 1, "state": 2, "country": 3},
+                }
             )
+            is False
+        )
 
     def test_validate_research_data_rejects_invalid_company_size(self):
         """_validate_research_data() rejects invalid company_size values."""
@@ -2399,13 +2495,9 @@ class TestOpenAICompanyResearchHelpers:
             _validate_research_data,
         )
 
-        with patch(
-            "cvextract.adjusters.openai_company_research_adjuster._load_research_schema",
-            return_value={"required": []},
-        ):
-            result = _validate_research_data(
-                {"name": "Test", "domains": ["x"], "company_size": "gigantic"}
-            )
+        result = _validate_research_data(
+            {"name": "Test", "domains": ["x"], "company_size": "gigantic"}
+        )
         assert result is False
 
     def test_validate_research_data_rejects_invalid_employee_count(self):
@@ -2992,7 +3084,9 @@ class TestFetchJobDescriptionEdgeCases:
     @patch("cvextract.adjusters.openai_job_specific_adjuster.requests")
     def test_fetch_job_description_timeout_exception(self, mock_requests):
         """Test when request times out."""
-        mock_requests.get.side_effect = TimeoutError("Request timed out")
+        mock_requests.Session.return_value.get.side_effect = TimeoutError(
+            "Request timed out"
+        )
 
         result = _fetch_job_description("https://example.com/job/123")
         assert result == ""
@@ -3002,7 +3096,7 @@ class TestFetchJobDescriptionEdgeCases:
         """Test non-200 status codes."""
         mock_response = MagicMock()
         mock_response.status_code = 404
-        mock_requests.get.return_value = mock_response
+        mock_requests.Session.return_value.get.return_value = mock_response
 
         result = _fetch_job_description("https://example.com/job/notfound")
         assert result == ""
@@ -3013,7 +3107,7 @@ class TestFetchJobDescriptionEdgeCases:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.text = ""
-        mock_requests.get.return_value = mock_response
+        mock_requests.Session.return_value.get.return_value = mock_response
 
         result = _fetch_job_description("https://example.com/job/123")
         assert result == ""
@@ -3024,7 +3118,7 @@ class TestFetchJobDescriptionEdgeCases:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.text = "<h1>Job Title</h1><p>Description</p>"
-        mock_requests.get.return_value = mock_response
+        mock_requests.Session.return_value.get.return_value = mock_response
 
         result = _fetch_job_description("https://example.com/job/123")
         assert "Job Title" in result
@@ -3038,7 +3132,7 @@ class TestFetchJobDescriptionEdgeCases:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.text = "<script>alert('xss')</script><p>Content</p>"
-        mock_requests.get.return_value = mock_response
+        mock_requests.Session.return_value.get.return_value = mock_response
 
         result = _fetch_job_description("https://example.com/job/123")
         assert "alert" not in result
@@ -3050,7 +3144,7 @@ class TestFetchJobDescriptionEdgeCases:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.text = "<style>body{color:red;}</style><p>Content</p>"
-        mock_requests.get.return_value = mock_response
+        mock_requests.Session.return_value.get.return_value = mock_response
 
         result = _fetch_job_description("https://example.com/job/123")
         assert "color:red" not in result
@@ -3062,7 +3156,7 @@ class TestFetchJobDescriptionEdgeCases:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.text = "<p>Title &amp; Description &quot;quoted&quot;</p>"
-        mock_requests.get.return_value = mock_response
+        mock_requests.Session.return_value.get.return_value = mock_response
 
         result = _fetch_job_description("https://example.com/job/123")
         assert "&amp;" not in result
@@ -3076,7 +3170,7 @@ class TestFetchJobDescriptionEdgeCases:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.text = "<p>Multiple    spaces    and\n\nnewlines</p>"
-        mock_requests.get.return_value = mock_response
+        mock_requests.Session.return_value.get.return_value = mock_response
 
         result = _fetch_job_description("https://example.com/job/123")
         # Should collapse multiple spaces
@@ -3085,14 +3179,14 @@ class TestFetchJobDescriptionEdgeCases:
 
     @patch("cvextract.adjusters.openai_job_specific_adjuster.requests")
     def test_fetch_job_description_length_limit(self, mock_requests):
-        """Test that result is limited to 5000 chars."""
+        """Test that result is limited by estimated tokens, not characters."""
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.text = "x" * 10000
-        mock_requests.get.return_value = mock_response
+        mock_requests.Session.return_value.get.return_value = mock_response
 
         result = _fetch_job_description("https://example.com/job/123")
-        assert len(result) == 5000
+        assert result == "x" * 10000
 
     @patch("cvextract.adjusters.openai_job_specific_adjuster.requests", None)
     def test_fetch_job_description_requests_unavailable(self):
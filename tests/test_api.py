@@ -0,0 +1,104 @@
+"""Tests for the in-process batch API."""
+
+import io
+import threading
+import time
+
+import docx
+import pytest
+
+from cvextract import api
+
+
+def _docx_bytes(*paragraphs: str, header: str = "") -> bytes:
+    document = docx.Document()
+    if header:
+        document.sections[0].header.paragraphs[0].text = header
+    for text in paragraphs:
+        document.add_paragraph(text)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def test_extract_many_returns_cv_data_per_document():
+    blobs = [
+        _docx_bytes("OVERVIEW", f"Engineer number {i}", header="SKILLS\nPython")
+        for i in range(3)
+    ]
+
+    results = sorted(api.extract_many(blobs, workers=2), key=lambda r: r.index)
+
+    assert [r.index for r in results] == [0, 1, 2]
+    for i, result in enumerate(results):
+        assert result.value["overview"] == f"Engineer number {i}"
+        assert result.value["sidebar"]["skills"] == ["Python"]
+
+
+def test_extract_many_reports_schema_errors_and_failures():
+    results = list(
+        api.extract_many([_docx_bytes("OVERVIEW", "Text"), b"not a docx"], ordered=True)
+    )
+
+    assert results[0].value is not None
+    assert "identity.full_name must be a non-empty string" in results[0].errors
+    assert results[1].value is None
+    assert results[1].errors == ["exception: BadZipFile"]
+
+
+def test_extract_many_without_verify_skips_schema():
+    (result,) = api.extract_many([_docx_bytes("OVERVIEW", "Text")], verify=False)
+    assert result.ok
+
+
+def test_render_many_returns_docx_bytes():
+    template = _docx_bytes("Name: {{ identity.full_name }}")
+    data = [{"identity": {"full_name": name}} for name in ("Ada", "A & B")]
+
+    results = list(api.render_many(data, template, ordered=True))
+
+    texts = [docx.Document(io.BytesIO(r.value)).paragraphs[0].text for r in results]
+    assert texts == ["Name: Ada", "Name: A & B"]
+    assert all(r.ok for r in results)
+
+
+def test_run_many_streams_in_completion_order():
+    release = threading.Event()
+
+    def work(item):
+        if item == "slow":
+            release.wait(5)
+        return item, []
+
+    stream = api._run_many(work, ["slow", "fast"], workers=2, ordered=False)
+    first = next(stream)
+    release.set()
+    assert first.value == "fast"
+    assert next(stream).value == "slow"
+
+
+def test_run_many_ordered_preserves_input_order():
+    def work(item):
+        time.sleep(item)
+        return item, []
+
+    results = api._run_many(work, [0.05, 0.0, 0.01], workers=3, ordered=True)
+    assert [r.index for r in results] == [0, 1, 2]
+
+
+def test_run_many_consumes_input_lazily():
+    consumed = []
+
+    def items():
+        for i in range(100):
+            consumed.append(i)
+            yield i
+
+    stream = api._run_many(lambda item: (item, []), items(), workers=2, ordered=True)
+    next(stream)
+    assert len(consumed) <= 4 + 1
+
+
+def test_run_many_rejects_invalid_worker_count():
+    with pytest.raises(ValueError, match="workers"):
+        api.extract_many([], workers=0)
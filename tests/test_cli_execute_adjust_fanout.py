@@ -0,0 +1,202 @@
+"""Tests for fan-out adjust branches."""
+
+import json
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import docx
+import pytest
+
+from cvextract.adjusters import openai_utils, register_adjuster
+from cvextract.adjusters.adjuster_registry import unregister_adjuster
+from cvextract.adjusters.base import CVAdjuster
+from cvextract.cli_config import AdjusterConfig, AdjustStage, UserConfig
+from cvextract.cli_execute_single import execute_single
+from cvextract.cli_gather import gather_user_requirements
+from cvextract.cli_prepare import prepare_execution_environment
+from cvextract.request_policy import request_slots_for
+from cvextract.shared import StepName, UnitOfWork, load_input_json, write_output_json
+
+
+class SuffixAdjuster(CVAdjuster):
+    """Appends a suffix to the full name; fails on suffix=boom."""
+
+    def __init__(self, **kwargs):
+        pass
+
+    def name(self) -> str:
+        return "test-suffix"
+
+    def description(self) -> str:
+        return "Append a suffix to the full name"
+
+    def adjust(self, work, **kwargs):
+        if kwargs["suffix"] == "boom":
+            raise RuntimeError("boom")
+        data = load_input_json(work)
+        data["identity"]["full_name"] += kwargs["suffix"]
+        return write_output_json(work, data)
+
+
+@pytest.fixture(autouse=True)
+def suffix_adjuster():
+    register_adjuster(SuffixAdjuster)
+    yield
+    unregister_adjuster("test-suffix")
+
+
+@pytest.fixture
+def cv_json(tmp_path: Path) -> Path:
+    path = tmp_path / "cv.json"
+    cv = {
+        "identity": {
+            "title": "Engineer",
+            "full_name": "Ada",
+            "first_name": "Ada",
+            "last_name": "Lovelace",
+        },
+        "sidebar": {},
+        "overview": "",
+        "experiences": [],
+    }
+    path.write_text(json.dumps(cv), encoding="utf-8")
+    return path
+
+
+def _adjust_args(suffix: str, branch: str) -> list:
+    return ["--adjust", "name=test-suffix", f"suffix={suffix}", f"branch={branch}"]
+
+
+def test_gather_groups_adjusters_by_branch(tmp_path: Path):
+    config = gather_user_requirements(
+        _adjust_args(" (de)", "de")
+        + _adjust_args(" (job)", "job")
+        + _adjust_args(" (fr)", "de")
+        + ["--target", str(tmp_path)]
+    )
+
+    branches = config.adjust.branches
+    assert list(branches) == ["de", "job"]
+    assert [a.params["suffix"] for a in branches["de"]] == [" (de)", " (fr)"]
+    assert "branch" not in branches["job"][0].params
+
+
+def test_unbranched_stage_has_no_branches():
+    stage = AdjustStage(adjusters=[AdjusterConfig(name="x", params={})])
+    assert stage.branches == {}
+
+
+@pytest.mark.parametrize(
+    "extra, message",
+    [
+        (["--adjust", "name=test-suffix", "suffix=x"], "every --adjust"),
+        (_adjust_args("x", "../up"), "Invalid branch label"),
+        (["--render", "template=t.docx", "output=cv.docx"], "output="),
+    ],
+)
+def test_gather_rejects_invalid_branch_setups(tmp_path: Path, extra, message):
+    with pytest.raises(ValueError, match=message):
+        gather_user_requirements(
+            _adjust_args("x", "a") + extra + ["--target", str(tmp_path)]
+        )
+
+
+def test_branches_write_and_render_their_own_outputs(tmp_path: Path, cv_json: Path):
+    template = tmp_path / "template.docx"
+    document = docx.Document()
+    document.add_paragraph("{{ identity.full_name }}")
+    document.save(str(template))
+    target = tmp_path / "out"
+
+    config = gather_user_requirements(
+        ["--adjust", "name=test-suffix", "suffix= (de)", "branch=de", f"data={cv_json}"]
+        + _adjust_args(" (job)", "job")
+        + _adjust_args(" + fr", "job")
+        + ["--render", f"template={template}", "--target", str(target)]
+    )
+    with patch("cvextract.cli_execute_adjust.time.sleep"):
+        rc, work = execute_single(prepare_execution_environment(config))
+
+    assert rc == 0
+    adjusted = target / "adjusted_structured_data"
+    names = {
+        path.stem: json.loads(path.read_text())["identity"]["full_name"]
+        for path in adjusted.glob("*.json")
+    }
+    assert names == {"cv_de": "Ada (de)", "cv_job": "Ada (job) + fr"}
+    texts = {
+        path.stem: docx.Document(str(path)).paragraphs[0].text
+        for path in (target / "documents").glob("*.docx")
+    }
+    assert texts == {"cv_NEW_de": "Ada (de)", "cv_NEW_job": "Ada (job) + fr"}
+    assert work.step_states[StepName.Adjust].ok
+
+
+def test_failing_branch_does_not_stop_the_others(tmp_path: Path, cv_json: Path):
+    target = tmp_path / "out"
+    config = gather_user_requirements(
+        ["--adjust", "name=test-suffix", "suffix=boom", "branch=bad", f"data={cv_json}"]
+        + _adjust_args(" ok", "good")
+        + ["--target", str(target)]
+    )
+
+    rc, work = execute_single(prepare_execution_environment(config))
+
+    assert rc == 1
+    assert (target / "adjusted_structured_data" / "cv_good.json").exists()
+    errors = work.step_states[StepName.VerifyAdjust].errors
+    assert errors and all(e.startswith("bad: ") for e in errors)
+
+
+def test_request_limiter_caps_concurrent_calls(tmp_path: Path):
+    config = UserConfig(target_dir=tmp_path, openai_max_concurrency=3)
+    retry = openai_utils.OpenAIRetry(
+        retry=openai_utils.RetryConfig(),
+        sleep=lambda _: None,
+        slots=request_slots_for(UnitOfWork(config=config)),
+    )
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+    release = threading.Event()
+
+    def request():
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        release.wait(0.2)
+        with lock:
+            active -= 1
+        return "ok"
+
+    threads = [
+        threading.Thread(
+            target=retry.call,
+            args=(request,),
+            kwargs={"is_write": False, "op_name": "t"},
+        )
+        for _ in range(7)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak == 3
+
+
+def test_request_limiter_is_unbounded_by_default(tmp_path: Path):
+    assert request_slots_for(UnitOfWork(config=UserConfig(target_dir=tmp_path))) is None
+    config = gather_user_requirements(
+        [
+            "--extract",
+            f"source={tmp_path / 'cv.docx'}",
+            "--target",
+            str(tmp_path),
+            "--openai-max-concurrency",
+            "4",
+        ]
+    )
+    assert config.openai_max_concurrency == 4
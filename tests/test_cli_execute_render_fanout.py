@@ -0,0 +1,134 @@
+"""Tests for multi-template fan-out rendering."""
+
+import io
+import json
+from pathlib import Path
+
+import docx
+import pytest
+
+from cvextract import cli
+from cvextract.cli_config import RenderStage, UserConfig
+from cvextract.cli_execute_single import execute_single
+from cvextract.cli_gather import gather_user_requirements
+from cvextract.cli_prepare import prepare_execution_environment
+from cvextract.renderers import docx_renderer
+from cvextract.shared import StepName
+
+
+def _write_template(path: Path, text: str) -> Path:
+    document = docx.Document()
+    document.add_paragraph(text)
+    document.save(str(path))
+    return path
+
+
+@pytest.fixture
+def cv_json(tmp_path: Path) -> Path:
+    path = tmp_path / "cv.json"
+    path.write_text(
+        json.dumps({"identity": {"full_name": "Ada Lovelace"}}), encoding="utf-8"
+    )
+    return path
+
+
+def test_gather_splits_comma_separated_templates(tmp_path: Path):
+    config = gather_user_requirements(
+        ["--render", "template=a.docx,b.docx", "data=cv.json", "--target", "out"]
+    )
+    assert config.render.template == Path("a.docx")
+    assert config.render.templates == [Path("a.docx"), Path("b.docx")]
+
+
+def test_prepare_expands_template_directory(tmp_path: Path, cv_json: Path):
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    _write_template(templates / "b.docx", "B")
+    _write_template(templates / "a.docx", "A")
+    (templates / "~$a.docx").write_bytes(b"lock")
+
+    config = UserConfig(
+        target_dir=tmp_path / "out",
+        render=RenderStage(template=templates, data=cv_json),
+    )
+    config = prepare_execution_environment(config)
+
+    assert config.render.templates == [templates / "a.docx", templates / "b.docx"]
+    assert config.render.template == templates / "a.docx"
+
+
+def test_render_fans_out_to_every_template(tmp_path: Path, cv_json: Path):
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    _write_template(templates / "acme.docx", "ACME {{ identity.full_name }}")
+    _write_template(templates / "globex.docx", "GLOBEX {{ identity.full_name }}")
+    target = tmp_path / "out"
+
+    rc = cli.main(
+        [
+            "--render",
+            f"template={templates}",
+            f"data={cv_json}",
+            "skip-verify",
+            "--target",
+            str(target),
+        ]
+    )
+
+    assert rc == 0
+    texts = {}
+    for name in ("cv_NEW_acme.docx", "cv_NEW_globex.docx"):
+        document = docx.Document(str(target / "documents" / name))
+        texts[name] = document.paragraphs[0].text
+    assert texts == {
+        "cv_NEW_acme.docx": "ACME Ada Lovelace",
+        "cv_NEW_globex.docx": "GLOBEX Ada Lovelace",
+    }
+
+
+def test_render_fanout_reports_failing_template_by_name(tmp_path: Path, cv_json: Path):
+    good = _write_template(tmp_path / "good.docx", "{{ identity.full_name }}")
+    bad = _write_template(tmp_path / "bad.docx", "{{ identity.full_name ")
+    target = tmp_path / "out"
+
+    config = gather_user_requirements(
+        [
+            "--render",
+            f"template={good},{bad}",
+            f"data={cv_json}",
+            "skip-verify",
+            "--target",
+            str(target),
+        ]
+    )
+    _, work = execute_single(prepare_execution_environment(config))
+
+    render_status = work.step_states[StepName.Render]
+    assert (target / "documents" / "cv_NEW_good.docx").exists()
+    assert any(w.startswith("bad.docx: render:") for w in render_status.warnings)
+
+
+def test_renderer_reads_template_and_data_once(tmp_path: Path, cv_json: Path):
+    template = _write_template(tmp_path / "t.docx", "x")
+
+    assert docx_renderer.load_template_bytes(
+        template
+    ) is docx_renderer.load_template_bytes(template)
+    assert docx_renderer.load_cv_data(cv_json) is docx_renderer.load_cv_data(cv_json)
+
+    cv_json.write_text(json.dumps({"identity": {}, "extra": 1}), encoding="utf-8")
+    assert docx_renderer.load_cv_data(cv_json)["extra"] == 1
+
+
+def test_render_docx_template_accepts_buffers():
+    template = io.BytesIO()
+    document = docx.Document()
+    document.add_paragraph("{{ overview }}")
+    document.save(template)
+
+    output = io.BytesIO()
+    docx_renderer.render_docx_template(
+        io.BytesIO(template.getvalue()), {"overview": "Hi"}, output
+    )
+
+    assert docx.Document(io.BytesIO(output.getvalue())).paragraphs[0].text == "Hi"
@@ -0,0 +1,191 @@
+"""Tests for cli_execute_watch module - hot folder watch mode."""
+
+import errno
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from cvextract import cli_execute_watch
+from cvextract.cli_config import ExtractStage, ParallelStage, UserConfig, WatchStage
+from cvextract.cli_execute_watch import (
+    _Debouncer,
+    _InotifyWatcher,
+    _is_candidate,
+    _PollingWatcher,
+    execute_watch_pipeline,
+)
+from cvextract.cli_gather import gather_user_requirements
+from cvextract.shared import StepName, StepStatus, UnitOfWork
+
+
+def _wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+class TestGatherWatch:
+    def test_watch_params(self, tmp_path: Path):
+        config = gather_user_requirements(
+            [
+                "--parallel",
+                f"source={tmp_path}",
+                "--watch",
+                "debounce=0.5",
+                "poll=3",
+                "--extract",
+                "--target",
+                str(tmp_path / "out"),
+            ]
+        )
+        assert config.parallel.watch == WatchStage(debounce=0.5, poll=3.0)
+
+    def test_watch_requires_parallel(self, tmp_path: Path):
+        with pytest.raises(ValueError, match="--watch requires --parallel"):
+            gather_user_requirements(
+                ["--extract", "source=cv.docx", "--watch", "--target", str(tmp_path)]
+            )
+
+    def test_watch_rejects_bad_debounce(self, tmp_path: Path):
+        with pytest.raises(ValueError, match="debounce"):
+            gather_user_requirements(
+                [
+                    "--parallel",
+                    f"source={tmp_path}",
+                    "--watch",
+                    "debounce=soon",
+                    "--extract",
+                    "--target",
+                    str(tmp_path),
+                ]
+            )
+
+
+class TestDebouncer:
+    def test_file_ready_after_quiet_period(self, tmp_path: Path):
+        path = tmp_path / "cv.docx"
+        path.write_bytes(b"a")
+        debouncer = _Debouncer(2.0)
+        debouncer.touch(path, 100.0)
+
+        assert debouncer.ready(101.0) == []
+        assert debouncer.ready(102.0) == [path]
+        assert len(debouncer) == 0
+
+    def test_growing_file_restarts_quiet_period(self, tmp_path: Path):
+        path = tmp_path / "cv.docx"
+        path.write_bytes(b"a")
+        debouncer = _Debouncer(1.0)
+        debouncer.touch(path, 100.0)
+        path.write_bytes(b"abc")
+
+        assert debouncer.ready(101.0) == []
+        assert debouncer.ready(102.0) == [path]
+
+    def test_vanished_file_is_dropped(self, tmp_path: Path):
+        debouncer = _Debouncer(0.0)
+        debouncer.touch(tmp_path / "gone.docx", 0.0)
+        assert debouncer.ready(1.0) == []
+        assert len(debouncer) == 0
+
+
+def test_is_candidate_filters_temp_pattern_and_target(tmp_path: Path):
+    target = tmp_path / "out"
+    target.mkdir()
+    assert _is_candidate(tmp_path / "cv.docx", "*.docx", [target])
+    assert not _is_candidate(tmp_path / "~$cv.docx", "*.docx", [target])
+    assert not _is_candidate(tmp_path / "cv.txt", "*.docx", [target])
+    assert not _is_candidate(target / "cv.docx", "*.docx", [target.resolve()])
+
+
+def test_polling_watcher_reports_new_and_changed_files(tmp_path: Path):
+    existing = tmp_path / "old.docx"
+    existing.write_bytes(b"a")
+    watcher = _PollingWatcher(tmp_path, interval=0.01)
+
+    new = tmp_path / "new.docx"
+    new.write_bytes(b"b")
+    assert watcher.poll(0.05) == [new]
+    assert watcher.poll(0.05) == []
+
+
+@pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="inotify is Linux only"
+)
+def test_inotify_watcher_reports_files_in_new_subdirectories(tmp_path: Path):
+    watcher = _InotifyWatcher(tmp_path)
+    try:
+        subdir = tmp_path / "team"
+        subdir.mkdir()
+        seen = set(watcher.poll(1.0))
+        (subdir / "cv.docx").write_bytes(b"a")
+        assert _wait_for(
+            lambda: seen.update(watcher.poll(0.1)) or subdir / "cv.docx" in seen
+        )
+    finally:
+        watcher.close()
+
+
+@pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="inotify is Linux only"
+)
+def test_inotify_watcher_skips_directories_it_cannot_watch(tmp_path: Path):
+    watcher = _InotifyWatcher(tmp_path)
+    try:
+        watch_limit = OSError(errno.ENOSPC, "inotify_add_watch failed")
+        with patch.object(watcher, "_add_watch", side_effect=watch_limit):
+            subdir = tmp_path / "team"
+            subdir.mkdir()
+            (subdir / "cv.docx").write_bytes(b"a")
+            seen = set()
+            assert _wait_for(
+                lambda: seen.update(watcher.poll(0.1)) or subdir / "cv.docx" in seen
+            )
+    finally:
+        watcher.close()
+
+
+def test_execute_watch_pipeline_processes_existing_and_new_files(tmp_path: Path):
+    source = tmp_path / "inbox"
+    source.mkdir()
+    (source / "existing.docx").write_bytes(b"a")
+    (source / "~$existing.docx").write_bytes(b"lock")
+    config = UserConfig(
+        target_dir=tmp_path / "out",
+        extract=ExtractStage(source=Path(".")),
+        parallel=ParallelStage(
+            source=source, n=2, watch=WatchStage(debounce=0.05, poll=0.05)
+        ),
+    )
+    processed = []
+
+    def fake_execute_file(file_path, cfg):
+        processed.append(file_path.name)
+        work = UnitOfWork(config=cfg, initial_input=file_path)
+        work.step_states[StepName.Extract] = StepStatus(
+            step=StepName.Extract, input=file_path
+        )
+        return 0, work
+
+    stop = threading.Event()
+    with patch.object(cli_execute_watch, "_execute_file", fake_execute_file):
+        thread = threading.Thread(
+            target=execute_watch_pipeline, args=(config,), kwargs={"stop": stop}
+        )
+        thread.start()
+        try:
+            assert _wait_for(lambda: processed == ["existing.docx"])
+            (source / "dropped.docx").write_bytes(b"b")
+            assert _wait_for(lambda: "dropped.docx" in processed)
+        finally:
+            stop.set()
+            thread.join(timeout=5)
+
+    assert sorted(processed) == ["dropped.docx", "existing.docx"]
@@ -0,0 +1,143 @@
+"""Tests for server mode (--serve) and the thin --server client."""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from cvextract import cli, cli_server
+from cvextract.cli_config import ServeStage
+from cvextract.cli_gather import gather_user_requirements
+from cvextract.shared import StepName, StepStatus, UnitOfWork
+
+
+@pytest.fixture
+def running_server():
+    """Start a server on a free local port and stop it after the test."""
+    server = cli_server.CvextractServer(ServeStage(port=0, n=2))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    yield server, f"http://{host}:{port}"
+    server.shutdown()
+    server.server_close()
+    thread.join(timeout=5)
+
+
+def _fake_execute_single(config):
+    work = UnitOfWork(config=config, initial_input=config.extract.source)
+    work.step_states[StepName.Extract] = StepStatus(
+        step=StepName.Extract, output=Path("out.json")
+    )
+    return 0, work
+
+
+class TestGatherServe:
+    def test_serve_defaults(self):
+        config = gather_user_requirements(["--serve"])
+        assert config.serve == ServeStage()
+
+    def test_serve_params(self):
+        config = gather_user_requirements(
+            ["--serve", "host=0.0.0.0", "port=9000", "n=8"]
+        )
+        assert config.serve == ServeStage(host="0.0.0.0", port=9000, n=8)
+
+    def test_serve_rejects_bad_workers(self):
+        with pytest.raises(ValueError, match="'n'"):
+            gather_user_requirements(["--serve", "n=0"])
+
+
+class TestAbsolutizeArgv:
+    def test_makes_paths_absolute(self, tmp_path):
+        argv = [
+            "--extract",
+            "source=cv.docx",
+            "output=data/cv.json",
+            "--render",
+            "template=tpl.docx",
+            "--target",
+            "out",
+            "--log-file=run.log",
+        ]
+        result = cli_server.absolutize_argv(argv, tmp_path)
+        assert result == [
+            "--extract",
+            f"source={tmp_path / 'cv.docx'}",
+            "output=data/cv.json",
+            "--render",
+            f"template={tmp_path / 'tpl.docx'}",
+            "--target",
+            str(tmp_path / "out"),
+            f"--log-file={tmp_path / 'run.log'}",
+        ]
+
+    def test_makes_each_template_absolute(self, tmp_path):
+        result = cli_server.absolutize_argv(["template=a.docx,b.docx"], tmp_path)
+        assert result == [f"template={tmp_path / 'a.docx'},{tmp_path / 'b.docx'}"]
+
+    def test_keeps_absolute_paths(self, tmp_path):
+        source = str(tmp_path / "cv.docx")
+        argv = ["--extract", f"source={source}"]
+        assert cli_server.absolutize_argv(argv, Path("/elsewhere")) == argv
+
+
+class TestServer:
+    def test_health(self, running_server):
+        _, url = running_server
+        with urllib.request.urlopen(url + "/health") as response:
+            assert json.loads(response.read()) == {"status": "ok", "workers": 2}
+
+    def test_forward_runs_request(self, running_server, tmp_path):
+        _, url = running_server
+        source = tmp_path / "cv.docx"
+        source.write_bytes(b"docx")
+        argv = ["--extract", "source=cv.docx", "--target", "out"]
+
+        with patch.object(
+            cli_server, "execute_single", side_effect=_fake_execute_single
+        ) as mock_exec:
+            exit_code = cli_server.forward_to_server(url, argv, cwd=tmp_path)
+
+        assert exit_code == 0
+        config = mock_exec.call_args.args[0]
+        assert config.extract.source == source
+        assert config.target_dir == tmp_path / "out"
+
+    def test_rejects_parallel(self, running_server, tmp_path, caplog):
+        _, url = running_server
+        argv = ["--parallel", f"source={tmp_path}", "--extract", "--target", "out"]
+        with patch.object(cli_server, "execute_single") as mock_exec:
+            exit_code = cli_server.forward_to_server(url, argv, cwd=tmp_path)
+        assert exit_code == 1
+        mock_exec.assert_not_called()
+        assert "not supported" in caplog.text
+
+    def test_rejects_invalid_body(self, running_server):
+        _, url = running_server
+        request = urllib.request.Request(url + "/run", data=b'{"argv": "x"}')
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            urllib.request.urlopen(request)
+        assert exc_info.value.code == 400
+
+    def test_unreachable_server_returns_error(self, caplog):
+        exit_code = cli_server.forward_to_server(
+            "http://127.0.0.1:9", ["--extract", "source=cv.docx", "--target", "out"]
+        )
+        assert exit_code == 1
+        assert "Could not reach" in caplog.text
+
+
+def test_main_forwards_with_server_flag():
+    with patch("cvextract.cli_server.forward_to_server", return_value=3) as mock_fwd:
+        exit_code = cli.main(
+            ["--server", "http://localhost:1", "--extract", "source=a.docx"]
+        )
+    assert exit_code == 3
+    mock_fwd.assert_called_once_with(
+        "http://localhost:1", ["--extract", "source=a.docx"]
+    )
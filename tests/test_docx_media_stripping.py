@@ -0,0 +1,125 @@
+"""Tests for stripping media from DOCX packages before upload."""
+
+import os
+import zipfile
+from io import BytesIO
+from unittest.mock import MagicMock
+
+from cvextract.extractors.docx_utils import (
+    iter_document_paragraphs,
+    strip_docx_media,
+)
+from cvextract.extractors.openai_extractor import OpenAICVExtractor
+
+_W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+_PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Default Extension="png" ContentType="image/png"/>'
+        '<Override PartName="/word/document.xml" ContentType="doc"/>'
+        '<Override PartName="/docProps/thumbnail.jpeg" ContentType="image/jpeg"/>'
+        "</Types>"
+    ),
+    "_rels/.rels": (
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="doc" Target="word/document.xml"/>'
+        '<Relationship Id="rId2" Type="thumb" Target="docProps/thumbnail.jpeg"/>'
+        "</Relationships>"
+    ),
+    "word/_rels/document.xml.rels": (
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="image" Target="media/image1.png"/>'
+        '<Relationship Id="rId2" Type="styles" Target="styles.xml"/>'
+        '<Relationship Id="rId3" Type="link" Target="media/x.png" TargetMode="External"/>'
+        "</Relationships>"
+    ),
+    "word/_rels/fontTable.xml.rels": (
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="font" Target="/word/fonts/font1.odttf"/>'
+        "</Relationships>"
+    ),
+    "word/document.xml": (
+        f'<w:document xmlns:w="{_W}" xmlns:r="{_REL}"><w:body>'
+        "<w:p><w:r><w:t>Ada Lovelace</w:t></w:r></w:p>"
+        "</w:body></w:document>"
+    ),
+    "word/styles.xml": f'<w:styles xmlns:w="{_W}"/>',
+    "word/media/image1.png": os.urandom(200_000),
+    "word/fonts/font1.odttf": os.urandom(100_000),
+    "docProps/thumbnail.jpeg": os.urandom(20_000),
+}
+
+
+def _docx(parts=_PARTS) -> bytes:
+    out = BytesIO()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as z:
+        for name, content in parts.items():
+            z.writestr(name, content)
+    return out.getvalue()
+
+
+def test_media_fonts_and_thumbnail_are_removed():
+    original = _docx()
+    stripped = strip_docx_media(original)
+
+    assert len(stripped) < len(original) // 10
+    with zipfile.ZipFile(BytesIO(stripped)) as z:
+        names = set(z.namelist())
+        doc_rels = z.read("word/_rels/document.xml.rels").decode()
+        font_rels = z.read("word/_rels/fontTable.xml.rels").decode()
+        root_rels = z.read("_rels/.rels").decode()
+        content_types = z.read("[Content_Types].xml").decode()
+
+    assert names == set(_PARTS) - {
+        "word/media/image1.png",
+        "word/fonts/font1.odttf",
+        "docProps/thumbnail.jpeg",
+    }
+    assert "image1.png" not in doc_rels
+    assert 'Target="styles.xml"' in doc_rels
+    assert 'TargetMode="External"' in doc_rels
+    assert "font1.odttf" not in font_rels
+    assert "thumbnail" not in root_rels and "word/document.xml" in root_rels
+    assert "thumbnail" not in content_types and "/word/document.xml" in content_types
+
+
+def test_text_survives_stripping():
+    stripped = strip_docx_media(_docx())
+    assert [t for t, _, _ in iter_document_paragraphs(BytesIO(stripped))] == [
+        "Ada Lovelace"
+    ]
+
+
+def test_docx_without_media_is_returned_unchanged():
+    parts = {
+        name: content
+        for name, content in _PARTS.items()
+        if not isinstance(content, bytes)
+    }
+    data = _docx(parts)
+    assert strip_docx_media(data) is data
+
+
+def test_extractor_uploads_stripped_docx(tmp_path):
+    docx = tmp_path / "cv.docx"
+    docx.write_bytes(_docx())
+    broken = tmp_path / "broken.docx"
+    broken.write_bytes(b"not a zip")
+    text = tmp_path / "cv.txt"
+    text.write_text("Ada")
+
+    extractor = OpenAICVExtractor(api_key="k")
+    extractor._client = MagicMock()
+    extractor._client.files.create.return_value = MagicMock(id="file_1")
+
+    assert extractor._upload_file(docx) == "file_1"
+    name, payload = extractor._client.files.create.call_args.kwargs["file"]
+    assert name == "cvextract-cv.docx"
+    assert payload == strip_docx_media(docx.read_bytes())
+
+    assert extractor._upload_payload(broken) == b"not a zip"
+    assert extractor._upload_payload(text) == b"Ada"
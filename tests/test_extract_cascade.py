@@ -0,0 +1,140 @@
+"""Tests for the verifier-aware extractor cascade."""
+
+from pathlib import Path
+
+import pytest
+
+from cvextract.cli_config import ExtractStage, UserConfig
+from cvextract.cli_gather import gather_user_requirements
+from cvextract.extractors import CVExtractor, register_extractor
+from cvextract.extractors.extractor_registry import unregister_extractor
+from cvextract.llm_cache import llm_cache_for
+from cvextract.pipeline_helpers import extract_single
+from cvextract.shared import StepName, UnitOfWork, write_output_json
+
+_VALID = {
+    "identity": {
+        "title": "Engineer",
+        "full_name": "Ada Lovelace",
+        "first_name": "Ada",
+        "last_name": "Lovelace",
+    },
+    "sidebar": {"languages": ["English"]},
+    "overview": "Engineer",
+    "experiences": [
+        {
+            "heading": "2020 - Now | Engineer",
+            "description": "Builds",
+            "bullets": ["Shipped"],
+        }
+    ],
+}
+
+CALLS = []
+
+
+class CheapExtractor(CVExtractor):
+    def extract(self, work: UnitOfWork) -> UnitOfWork:
+        CALLS.append("cheap")
+        # Fails the schema verifier: identity is incomplete
+        return write_output_json(work, {"identity": {}}, step=StepName.Extract)
+
+
+class CachedCheapExtractor(CVExtractor):
+    """A cheap extractor whose reply was served from the LLM cache."""
+
+    def extract(self, work: UnitOfWork) -> UnitOfWork:
+        CALLS.append("cached")
+        llm_cache_for(work).put("k" * 64, '{"identity": {}}')
+        work.ensure_step_status(StepName.Extract).llm_cache_key = "k" * 64
+        return write_output_json(work, {"identity": {}}, step=StepName.Extract)
+
+
+class GoodExtractor(CVExtractor):
+    def extract(self, work: UnitOfWork) -> UnitOfWork:
+        CALLS.append("good")
+        return write_output_json(work, _VALID, step=StepName.Extract)
+
+
+class BrokenExtractor(CVExtractor):
+    def extract(self, work: UnitOfWork) -> UnitOfWork:
+        CALLS.append("broken")
+        raise RuntimeError("unavailable")
+
+
+@pytest.fixture(autouse=True)
+def extractors():
+    CALLS.clear()
+    for name, cls in (
+        ("cheap-test", CheapExtractor),
+        ("cached-test", CachedCheapExtractor),
+        ("good-test", GoodExtractor),
+        ("broken-test", BrokenExtractor),
+    ):
+        register_extractor(name, cls)
+    yield
+    for name in ("cheap-test", "cached-test", "good-test", "broken-test"):
+        unregister_extractor(name)
+
+
+def _run(tmp_path: Path, names: str, **stage) -> UnitOfWork:
+    source = tmp_path / "cv.docx"
+    source.write_bytes(b"")
+    config = UserConfig(
+        target_dir=tmp_path,
+        extract=ExtractStage(source=source, name=names, **stage),
+    )
+    work = UnitOfWork(config=config, initial_input=source)
+    work.set_step_paths(
+        StepName.Extract, input_path=source, output_path=tmp_path / "cv.json"
+    )
+    return extract_single(work)
+
+
+def test_without_cascade_first_successful_extractor_wins(tmp_path: Path):
+    _run(tmp_path, "cheap-test,good-test")
+    assert CALLS == ["cheap"]
+
+
+def test_cascade_escalates_when_verification_fails(tmp_path: Path):
+    result = _run(tmp_path, "cheap-test,good-test", cascade=True)
+    assert CALLS == ["cheap", "good"]
+    assert result.has_no_errors(StepName.Extract)
+    assert StepName.VerifyExtract not in result.step_states
+
+
+def test_cascade_evicts_cached_output_that_fails_verification(tmp_path: Path):
+    result = _run(tmp_path, "cached-test,good-test", cascade=True)
+    assert CALLS == ["cached", "good"]
+    assert llm_cache_for(result).get("k" * 64) is None
+
+
+def test_cascade_stops_at_first_verified_output(tmp_path: Path):
+    _run(tmp_path, "good-test,cheap-test", cascade=True)
+    assert CALLS == ["good"]
+
+
+def test_cascade_keeps_unverified_output_when_later_extractors_fail(tmp_path: Path):
+    result = _run(tmp_path, "cheap-test,broken-test", cascade=True)
+    assert CALLS == ["cheap", "broken"]
+    assert result.has_no_errors(StepName.Extract)
+    assert result.get_step_output(StepName.Extract) == tmp_path / "cv.json"
+
+
+def test_cascade_is_inert_when_verification_is_skipped(tmp_path: Path):
+    _run(tmp_path, "cheap-test,good-test", cascade=True, skip_verify=True)
+    assert CALLS == ["cheap"]
+
+
+def test_gather_parses_cascade_flag(tmp_path: Path):
+    config = gather_user_requirements(
+        [
+            "--extract",
+            f"source={tmp_path / 'cv.docx'}",
+            "name=default-docx-cv-extractor,openai-extractor",
+            "cascade",
+            "--target",
+            str(tmp_path),
+        ]
+    )
+    assert config.extract.cascade
@@ -0,0 +1,258 @@
+"""Tests for bulk job-match mode of the job-specific adjuster."""
+
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from cvextract.adjusters import openai_job_specific_adjuster as job_module
+from cvextract.adjusters.openai_job_specific_adjuster import (
+    OpenAIJobSpecificAdjuster,
+    _JobMatchPacker,
+)
+from cvextract.adjusters.openai_utils import OpenAIRetry, RetryConfig, completion_usage
+from cvextract.shared import OpenAIUsage, StepName, UnitOfWork
+
+
+def _cv(name: str) -> dict:
+    return {
+        "identity": {
+            "title": "Engineer",
+            "full_name": name,
+            "first_name": name,
+            "last_name": "Doe",
+        },
+        "sidebar": {},
+        "overview": "",
+        "experiences": [],
+    }
+
+
+def _usage(work: UnitOfWork) -> OpenAIUsage:
+    return work.step_states[StepName.Adjust].usage
+
+
+class _Tailor:
+    """Reply of the fake client: marks each CV's overview as tailored."""
+
+    def __init__(self, completion):
+        self._completion = completion
+        self.packed_reply_size = None  # Set to return a wrong number of CVs
+        self.packed_reply_edit = None  # Set to alter the packed reply items
+
+    def __call__(self, request):
+        user = json.loads(request["messages"][-1]["content"])
+
+        def tag(cv):
+            cv = json.loads(json.dumps(cv))
+            cv["overview"] = "tailored"
+            return cv
+
+        if "original_jsons" in user:
+            cvs = [tag(cv) for cv in user["original_jsons"]]
+            if self.packed_reply_size is not None:
+                cvs = cvs[: self.packed_reply_size]
+            if self.packed_reply_edit is not None:
+                self.packed_reply_edit(cvs)
+            return self._completion({"adjusted_jsons": cvs}, prompt_tokens=2000)
+        return self._completion(
+            tag(user["original_json"]), prompt_tokens=1500, cached_tokens=1024
+        )
+
+
+@pytest.fixture(autouse=True)
+def tailor(fake_openai):
+    fake_openai.reply = _Tailor(fake_openai.completion)
+    return fake_openai.reply
+
+
+def _sent(fake_openai) -> list:
+    return [request["messages"] for request in fake_openai.requests]
+
+
+def test_bulk_prompt_puts_job_description_first_and_cv_last(
+    fake_openai, make_adjust_work, read_adjust_output
+):
+    adjuster = OpenAIJobSpecificAdjuster(api_key="k")
+
+    work = adjuster.adjust(
+        make_adjust_work(_cv("Ada")), job_description="Rust engineer", bulk=""
+    )
+
+    (messages,) = _sent(fake_openai)
+    assert [m["role"] for m in messages] == ["system", "user"]
+    assert "Rust engineer" in messages[0]["content"]
+    assert json.loads(messages[1]["content"]) == {"original_json": _cv("Ada")}
+    assert read_adjust_output(work)["overview"] == "tailored"
+
+    usage = _usage(work)
+    assert (usage.requests, usage.prompt_tokens, usage.cached_tokens) == (
+        1,
+        1500,
+        1024,
+    )
+
+
+def test_bulk_prefix_is_identical_across_cvs(fake_openai, make_adjust_work):
+    adjuster = OpenAIJobSpecificAdjuster(api_key="k")
+    for name in ("a", "b"):
+        adjuster.adjust(
+            make_adjust_work(_cv(name), name=name), job_description="Go", bulk=""
+        )
+
+    first, second = _sent(fake_openai)
+    assert first[0] == second[0]
+    assert first[1] != second[1]
+
+
+def _adjust_concurrently(make_adjust_work, names, **params) -> list:
+    adjuster = OpenAIJobSpecificAdjuster(api_key="k", pack_window_s=0.3)
+    works = [make_adjust_work(_cv(name), name=name) for name in names]
+    threads = [
+        threading.Thread(target=adjuster.adjust, args=(work,), kwargs=params)
+        for work in works
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return works
+
+
+def test_pack_sends_concurrent_cvs_in_one_request(
+    fake_openai, make_adjust_work, read_adjust_output
+):
+    works = _adjust_concurrently(
+        make_adjust_work, ("a", "b"), job_description="Go", pack="2"
+    )
+
+    (messages,) = _sent(fake_openai)
+    assert [m["role"] for m in messages] == ["system", "system", "user"]
+    assert len(json.loads(messages[-1]["content"])["original_jsons"]) == 2
+    for work, name in zip(works, ("a", "b")):
+        output = read_adjust_output(work)
+        assert (output["identity"]["full_name"], output["overview"]) == (
+            name,
+            "tailored",
+        )
+    # The one request is counted once; its tokens are split across the CVs
+    assert sum(_usage(w).requests for w in works) == 1
+    assert [_usage(w).prompt_tokens for w in works] == [1000, 1000]
+
+
+def test_packed_items_of_other_cvs_are_retried_alone(
+    tailor, fake_openai, make_adjust_work, read_adjust_output
+):
+    tailor.packed_reply_edit = list.reverse
+
+    works = _adjust_concurrently(
+        make_adjust_work, ("a", "b"), job_description="Go", pack="2"
+    )
+
+    assert len(_sent(fake_openai)) == 3
+    for work, name in zip(works, ("a", "b")):
+        assert read_adjust_output(work)["identity"]["full_name"] == name
+        assert read_adjust_output(work)["overview"] == "tailored"
+        assert _usage(work).fallbacks == 1
+
+
+def test_packed_item_failing_the_schema_is_retried_alone(
+    tailor, fake_openai, make_adjust_work, read_adjust_output
+):
+    def drop_title(cvs):
+        for cv in cvs:
+            if cv["identity"]["full_name"] == "b":
+                del cv["identity"]["title"]
+
+    tailor.packed_reply_edit = drop_title
+
+    works = _adjust_concurrently(
+        make_adjust_work, ("a", "b"), job_description="Go", pack="2"
+    )
+
+    assert len(_sent(fake_openai)) == 2
+    single = json.loads(_sent(fake_openai)[1][-1]["content"])["original_json"]
+    assert single["identity"]["full_name"] == "b"
+    assert [_usage(w).fallbacks for w in works] == [0, 1]
+    assert [read_adjust_output(w)["overview"] for w in works] == ["tailored"] * 2
+
+
+def test_pack_mismatch_falls_back_to_single_requests(
+    tailor, fake_openai, make_adjust_work, read_adjust_output
+):
+    tailor.packed_reply_size = 0
+    adjuster = OpenAIJobSpecificAdjuster(api_key="k", pack_window_s=0)
+
+    work = adjuster.adjust(make_adjust_work(_cv("Ada")), job_description="Go", pack="4")
+
+    assert len(_sent(fake_openai)) == 2
+    assert "original_json" in json.loads(_sent(fake_openai)[1][-1]["content"])
+    assert read_adjust_output(work)["overview"] == "tailored"
+    assert _usage(work).fallbacks == 1
+
+
+def test_large_cv_is_not_packed(fake_openai, make_adjust_work):
+    cv = _cv("Ada")
+    cv["overview"] = "x" * 4 * (job_module._PACK_MAX_TOKENS + 1)
+    adjuster = OpenAIJobSpecificAdjuster(api_key="k", pack_window_s=0)
+
+    adjuster.adjust(make_adjust_work(cv), job_description="Go", pack="4")
+
+    (messages,) = _sent(fake_openai)
+    assert "original_json" in json.loads(messages[-1]["content"])
+
+
+def test_packer_drains_batches_queued_by_other_threads():
+    packer = _JobMatchPacker(pack_size=2, window_s=0)
+    sent = []
+
+    def send(cvs, shared):
+        sent.append(len(cvs))
+        return [{"n": cv["n"] * 10} for cv in cvs]
+
+    retryer = OpenAIRetry(retry=RetryConfig(), sleep=lambda _: None)
+    assert packer.adjust({"n": 1}, retryer, send, lambda _: None) == {"n": 10}
+    assert sent == [1]
+
+
+def test_pack_request_is_detached_from_the_draining_step():
+    packer = _JobMatchPacker(pack_size=2, window_s=0.2)
+    usages = [OpenAIUsage(), OpenAIUsage()]
+    deadlines = [time.monotonic() + 60, time.monotonic() + 30]
+    seen = []
+
+    def send(cvs, shared):
+        seen.append((shared.usage, shared.deadline))
+        shared.usage.record_request({"prompt_tokens": 101})
+        return cvs
+
+    def adjust(idx):
+        retryer = OpenAIRetry(
+            retry=RetryConfig(),
+            sleep=lambda _: None,
+            usage=usages[idx],
+            deadline=deadlines[idx],
+        )
+        packer.adjust({"n": idx}, retryer, send, time.sleep)
+
+    threads = [threading.Thread(target=adjust, args=(idx,)) for idx in (0, 1)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    ((usage, deadline),) = seen
+    assert usage not in usages
+    assert deadline == deadlines[1]
+    assert sum(u.requests for u in usages) == 1
+    assert sorted(u.prompt_tokens for u in usages) == [50, 51]
+
+
+def test_completion_usage_ignores_missing_fields():
+    assert completion_usage(SimpleNamespace()) == {
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "cached_tokens": 0,
+    }
@@ -0,0 +1,146 @@
+"""Tests for intermediate JSON serialization."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from cvextract.benchmarks import json_io as json_io_benchmark
+from cvextract.cli_config import AdjustStage, ExtractStage, RenderStage, UserConfig
+from cvextract.cli_gather import gather_user_requirements
+from cvextract.shared import (
+    StepName,
+    UnitOfWork,
+    dumps_json,
+    load_input_json,
+    read_json,
+    write_output_json,
+)
+
+_CV = {
+    "identity": {"title": "Engineer", "full_name": "Ada Lövelace"},
+    "sidebar": {"languages": ["English", "Français"], "tools": ["Python"] * 10},
+    "overview": "Builds things. " * 20,
+    "experiences": [
+        {
+            "heading": f"2020 - 2024 | Role {n}",
+            "description": "Did things. " * 15,
+            "bullets": [f"Bullet {b} with some detail" for b in range(6)],
+            "environment": ["Python", "AWS", "Kubernetes"],
+        }
+        for n in range(12)
+    ],
+}
+
+
+def _config(tmp_path: Path, fmt: str, **stages) -> UserConfig:
+    return UserConfig(target_dir=tmp_path, intermediate_json=fmt, **stages)
+
+
+def _write(tmp_path: Path, config: UserConfig, step: StepName) -> Path:
+    work = UnitOfWork(config=config)
+    output = tmp_path / f"{step.value}.json"
+    work.set_step_paths(step, output_path=output)
+    write_output_json(work, _CV, step=step)
+    return output
+
+
+def test_dumps_json_formats_round_trip():
+    pretty = dumps_json(_CV)
+    compact = dumps_json(_CV, compact=True)
+    assert pretty.startswith(b'{\n  "identity"')
+    assert b"\n" not in compact
+    assert len(compact) < len(pretty)
+    assert json.loads(pretty) == json.loads(compact) == _CV
+    assert "Lövelace".encode("utf-8") in compact
+
+
+def test_intermediate_extract_json_is_compact_when_rendering(tmp_path: Path):
+    config = _config(
+        tmp_path,
+        "compact",
+        extract=ExtractStage(source=tmp_path / "cv.docx"),
+        render=RenderStage(template=tmp_path / "t.docx"),
+    )
+    output = _write(tmp_path, config, StepName.Extract)
+    assert b"\n" not in output.read_bytes()
+    assert read_json(output) == _CV
+
+
+@pytest.mark.parametrize(
+    "stages",
+    [
+        # Extract only: the JSON is the final output
+        {"extract": ExtractStage(source=Path("cv.docx"))},
+        # Explicit output= paths are meant to be read by people
+        {
+            "extract": ExtractStage(source=Path("cv.docx"), output=Path("cv.json")),
+            "render": RenderStage(template=Path("t.docx")),
+        },
+    ],
+)
+def test_final_extract_json_stays_pretty(tmp_path: Path, stages):
+    output = _write(tmp_path, _config(tmp_path, "compact", **stages), StepName.Extract)
+    assert output.read_bytes().startswith(b'{\n  "identity"')
+
+
+def test_adjusted_json_is_compact_only_when_rendered(tmp_path: Path):
+    adjust = AdjustStage(adjusters=[])
+    rendered = _config(
+        tmp_path, "compact", adjust=adjust, render=RenderStage(template=Path("t"))
+    )
+    final = _config(tmp_path, "compact", adjust=adjust)
+    assert b"\n" not in _write(tmp_path, rendered, StepName.Adjust).read_bytes()
+    assert b"\n" in _write(tmp_path, final, StepName.Adjust).read_bytes()
+
+
+def test_pretty_is_the_default(tmp_path: Path):
+    config = UserConfig(
+        target_dir=tmp_path,
+        adjust=AdjustStage(adjusters=[]),
+        render=RenderStage(template=Path("t")),
+    )
+    assert b"\n" in _write(tmp_path, config, StepName.Adjust).read_bytes()
+
+
+def test_load_input_json_reads_compact_files(tmp_path: Path):
+    path = tmp_path / "cv.json"
+    path.write_bytes(dumps_json(_CV, compact=True))
+    work = UnitOfWork(config=UserConfig(target_dir=tmp_path))
+    work.set_step_paths(StepName.Adjust, input_path=path)
+    assert load_input_json(work) == _CV
+
+
+def test_gather_parses_intermediate_json_flag(tmp_path: Path):
+    config = gather_user_requirements(
+        [
+            "--extract",
+            f"source={tmp_path / 'cv.docx'}",
+            "--intermediate-json",
+            "compact",
+            "--target",
+            str(tmp_path),
+        ]
+    )
+    assert config.intermediate_json == "compact"
+
+
+def test_compact_intermediate_json_is_smaller(tmp_path: Path):
+    sizes = {}
+    for fmt, compact in (("pretty", False), ("compact", True)):
+        path = tmp_path / f"{fmt}.json"
+        path.write_bytes(dumps_json(_CV, compact=compact))
+        assert read_json(path) == _CV
+        sizes[fmt] = path.stat().st_size
+
+    assert sizes["compact"] < sizes["pretty"]
+
+
+def test_throughput_benchmark_runs(tmp_path: Path, capsys):
+    # Timings are only printed (python -m cvextract.benchmarks.json_io)
+    results = json_io_benchmark.run(tmp_path, count=2, data=_CV)
+
+    assert set(results) == {"pretty", "compact"}
+    assert results["compact"]["bytes"] < results["pretty"]["bytes"]
+    assert json_io_benchmark.main(["--count", "2"]) == 0
+    assert "compact: write" in capsys.readouterr().out
@@ -0,0 +1,233 @@
+"""Tests for the persistent LLM response cache."""
+
+import json
+import os
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from cvextract.adjusters.openai_utils import OpenAIRetry, RetryConfig
+from cvextract.cli_config import ExtractStage, UserConfig
+from cvextract.cli_execute_single import execute_single
+from cvextract.cli_gather import gather_user_requirements
+from cvextract.extractors.openai_extractor import OpenAICVExtractor
+from cvextract.llm_cache import LLMResponseCache, get_llm_cache, llm_cache_for
+from cvextract.shared import OpenAIUsage, StepName, UnitOfWork
+
+_MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+class FakeClient:
+    def __init__(self, content='{"ok": true}', finish_reason="stop"):
+        self.calls = 0
+        self.content = content
+        self.finish_reason = finish_reason
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, **request):
+        self.calls += 1
+        return SimpleNamespace(
+            choices=[
+                SimpleNamespace(
+                    finish_reason=self.finish_reason,
+                    message=SimpleNamespace(content=self.content),
+                )
+            ]
+        )
+
+
+def _retryer(cache, usage=None):
+    return OpenAIRetry(
+        retry=RetryConfig(), sleep=lambda _: None, usage=usage, cache=cache
+    )
+
+
+def _complete(retryer, client, **overrides):
+    request = {
+        "model": "gpt-4o-mini",
+        "messages": _MESSAGES,
+        "temperature": 0.2,
+        "timeout": 60,
+    }
+    request.update(overrides)
+    completion = retryer.create_completion(client, op_name="t", **request)
+    return completion.choices[0].message.content
+
+
+def test_key_depends_on_model_messages_and_temperature(tmp_path: Path):
+    cache = LLMResponseCache(tmp_path)
+    base = cache.key(model="m", messages=_MESSAGES, temperature=0.2)
+    assert base == cache.key(model="m", messages=_MESSAGES, temperature=0.2)
+    assert base != cache.key(model="n", messages=_MESSAGES, temperature=0.2)
+    assert base != cache.key(model="m", messages=_MESSAGES, temperature=0.0)
+    assert base != cache.key(
+        model="m", messages=[{"role": "user", "content": "bye"}], temperature=0.2
+    )
+
+
+def test_second_identical_request_is_served_from_cache(tmp_path: Path):
+    client = FakeClient()
+    usage = OpenAIUsage()
+    retryer = _retryer(LLMResponseCache(tmp_path), usage)
+
+    assert _complete(retryer, client) == '{"ok": true}'
+    # A different timeout is the same request
+    assert _complete(retryer, client, timeout=5) == '{"ok": true}'
+
+    assert client.calls == 1
+    assert (usage.requests, usage.cache_hits) == (1, 1)
+    assert "1 cached responses" in usage.format()
+
+
+def test_unfinished_or_non_json_replies_are_not_cached(tmp_path: Path):
+    cache = LLMResponseCache(tmp_path)
+    for client in (FakeClient(finish_reason="length"), FakeClient(content="sorry")):
+        _complete(_retryer(cache), client)
+        _complete(_retryer(cache), client)
+        assert client.calls == 2
+
+
+def test_rejected_replies_are_evicted(tmp_path: Path):
+    cache = LLMResponseCache(tmp_path)
+    client = FakeClient()
+    retryer = _retryer(cache)
+    _complete(retryer, client)
+    # The caller rejects the reply (e.g. it fails schema validation)
+    retryer.record_fallback()
+
+    _complete(_retryer(cache), client)
+    assert client.calls == 2
+
+    # A reply served from the cache is evicted the same way
+    retryer = _retryer(cache)
+    _complete(retryer, client)
+    retryer.record_fallback()
+    _complete(_retryer(cache), client)
+    assert client.calls == 3
+
+
+def test_cache_persists_across_instances(tmp_path: Path):
+    _complete(_retryer(LLMResponseCache(tmp_path)), FakeClient())
+    client = FakeClient()
+    _complete(_retryer(LLMResponseCache(tmp_path)), client)
+    assert client.calls == 0
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path: Path):
+    cache = LLMResponseCache(tmp_path, max_bytes=300)
+    keys = [cache.key(model="m", messages=[{"content": str(n)}]) for n in range(3)]
+    for n, key in enumerate(keys[:2]):
+        cache.put(key, "x" * 100)
+        path = tmp_path / key[:2] / f"{key}.json"
+        os.utime(path, (n, n))
+    # Reading the oldest entry makes it the most recently used
+    assert cache.get(keys[0]) == "x" * 100
+
+    cache.put(keys[2], "x" * 100)
+
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) is not None
+
+
+def test_corrupt_entries_are_misses(tmp_path: Path):
+    cache = LLMResponseCache(tmp_path)
+    key = cache.key(model="m", messages=_MESSAGES)
+    path = tmp_path / key[:2] / f"{key}.json"
+    path.parent.mkdir(parents=True)
+    path.write_text("{not json")
+    assert cache.get(key) is None
+    path.write_text(json.dumps({"content": 1}))
+    assert cache.get(key) is None
+
+
+def test_no_llm_cache_flag_disables_the_cache(tmp_path: Path):
+    args = ["--extract", f"source={tmp_path / 'cv.docx'}", "--target", str(tmp_path)]
+    enabled = gather_user_requirements(args)
+    disabled = gather_user_requirements(args + ["--no-llm-cache"])
+
+    assert llm_cache_for(UnitOfWork(config=enabled)) is get_llm_cache(
+        tmp_path / "llm_cache"
+    )
+    assert llm_cache_for(UnitOfWork(config=disabled)) is None
+    assert UserConfig(target_dir=tmp_path).llm_cache
+
+
+# Passes the CV schema but not the default extract verifier
+_EXTRACTED = {
+    "identity": {
+        "title": "Engineer",
+        "full_name": "Ada Lovelace",
+        "first_name": "Ada",
+        "last_name": "Lovelace",
+    },
+    "sidebar": {},
+    "overview": "",
+    "experiences": [],
+}
+
+
+def test_extractor_reuses_cached_response_for_unchanged_document(tmp_path: Path):
+    source = tmp_path / "cv.txt"
+    source.write_text("Ada Lovelace, Engineer")
+    reply = json.dumps(_EXTRACTED)
+
+    def run():
+        work = UnitOfWork(config=UserConfig(target_dir=tmp_path))
+        work.set_step_paths(
+            StepName.Extract, input_path=source, output_path=tmp_path / "cv.json"
+        )
+        return OpenAICVExtractor(api_key="k").extract(work)
+
+    with patch.object(
+        OpenAICVExtractor, "_extract_with_openai", return_value=reply
+    ) as call:
+        run()
+        work = run()
+        source.write_text("Ada Lovelace, Senior Engineer")
+        run()
+
+    assert call.call_count == 2
+    assert work.step_states[StepName.Extract].usage.cache_hits == 1
+    assert json.loads((tmp_path / "cv.json").read_text())["identity"]["last_name"] == (
+        "Lovelace"
+    )
+
+
+def test_extractor_does_not_cache_schema_invalid_extractions(tmp_path: Path):
+    source = tmp_path / "cv.txt"
+    source.write_text("Ada Lovelace, Engineer")
+
+    def run():
+        work = UnitOfWork(config=UserConfig(target_dir=tmp_path))
+        work.set_step_paths(
+            StepName.Extract, input_path=source, output_path=tmp_path / "cv.json"
+        )
+        return OpenAICVExtractor(api_key="k").extract(work)
+
+    with patch.object(
+        OpenAICVExtractor, "_extract_with_openai", return_value='{"identity": {}}'
+    ) as call:
+        run()
+        work = run()
+
+    assert call.call_count == 2
+    assert work.step_states[StepName.Extract].llm_cache_key is None
+
+
+def test_extraction_failing_verification_is_evicted(tmp_path: Path):
+    source = tmp_path / "cv.txt"
+    source.write_text("Ada Lovelace, Engineer")
+    config = UserConfig(
+        target_dir=tmp_path / "out",
+        extract=ExtractStage(source=source, name="openai-extractor"),
+    )
+
+    with patch.dict(os.environ, {"OPENAI_API_KEY": "k"}), patch.object(
+        OpenAICVExtractor, "_extract_with_openai", return_value=json.dumps(_EXTRACTED)
+    ) as call:
+        _, work = execute_single(config)
+        assert not work.has_no_errors(StepName.VerifyExtract)
+        execute_single(config)
+
+    assert call.call_count == 2
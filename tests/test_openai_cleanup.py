@@ -0,0 +1,147 @@
+"""Tests for background cleanup and the openai-gc sweep."""
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from cvextract.cli import main
+from cvextract.extractors.openai_cleanup import (
+    ASSISTANT_NAME,
+    CleanupQueue,
+    sweep_openai_resources,
+    upload_filename,
+)
+
+NOW = 1_000_000.0
+HOUR = 3600
+
+
+def test_queue_runs_jobs_off_the_calling_thread():
+    queue = CleanupQueue(linger_s=0)
+    threads = []
+    for _ in range(3):
+        queue.submit(lambda: threads.append(threading.current_thread().name))
+
+    assert queue.flush(timeout=5)
+    assert threads == ["cvextract-openai-cleanup"] * 3
+    assert queue.pending == 0
+
+
+def test_failing_job_does_not_stop_the_queue():
+    queue = CleanupQueue(linger_s=0)
+    done = []
+
+    def fail():
+        raise RuntimeError("429")
+
+    queue.submit(fail)
+    queue.submit(lambda: done.append(1))
+
+    assert queue.flush(timeout=5)
+    assert done == [1]
+
+
+def test_jobs_run_in_submission_order():
+    queue = CleanupQueue(batch_size=2, linger_s=0.05)
+    release = threading.Event()
+    seen = []
+    queue.submit(lambda: release.wait(5))
+    for n in range(3):
+        queue.submit(lambda n=n: seen.append(n))
+    release.set()
+
+    assert queue.flush(timeout=5)
+    assert seen == [0, 1, 2]
+
+
+def _client(assistants, files):
+    client = MagicMock()
+    client.beta.assistants.list.return_value = assistants
+    client.files.list.return_value = files
+    return client
+
+
+def _item(item_id, age_h, name=None):
+    return SimpleNamespace(id=item_id, created_at=NOW - age_h * HOUR, name=name)
+
+
+def _file(file_id, age_h, filename=None):
+    return SimpleNamespace(
+        id=file_id,
+        created_at=NOW - age_h * HOUR,
+        filename=upload_filename("cv.docx") if filename is None else filename,
+    )
+
+
+def test_sweep_deletes_only_old_extractor_resources():
+    client = _client(
+        [
+            _item("a_old", 48, ASSISTANT_NAME),
+            _item("a_new", 1, ASSISTANT_NAME),
+            _item("a_other", 48, "Someone else's assistant"),
+        ],
+        [_file("f_old", 48), _file("f_new", 1), _file("f_other", 48, "report.pdf")],
+    )
+
+    result = sweep_openai_resources(client, older_than_s=24 * HOUR, now=NOW)
+
+    client.beta.assistants.delete.assert_called_once_with("a_old")
+    client.files.delete.assert_called_once_with("f_old")
+    client.files.list.assert_called_once_with(purpose="assistants")
+    assert (result.assistants, result.files, result.failed) == (1, 1, 0)
+
+
+def test_sweep_dry_run_deletes_nothing():
+    client = _client([_item("a_old", 48, ASSISTANT_NAME)], [_file("f_old", 48)])
+
+    result = sweep_openai_resources(client, older_than_s=HOUR, dry_run=True, now=NOW)
+
+    client.beta.assistants.delete.assert_not_called()
+    client.files.delete.assert_not_called()
+    assert (result.assistants, result.files) == (1, 1)
+
+
+def test_sweep_counts_failed_deletions():
+    client = _client([], [_file("f_old", 48)])
+    client.files.delete.side_effect = RuntimeError("500")
+
+    result = sweep_openai_resources(client, older_than_s=HOUR, now=NOW)
+
+    assert (result.files, result.failed) == (0, 1)
+
+
+def test_sweep_deletes_unmarked_files_only_when_asked():
+    client = _client([], [_file("f_marked", 48), _file("f_other", 48, "report.pdf")])
+
+    result = sweep_openai_resources(
+        client, older_than_s=HOUR, include_unmarked=True, now=NOW
+    )
+
+    assert [c.args for c in client.files.delete.call_args_list] == [
+        ("f_marked",),
+        ("f_other",),
+    ]
+    assert result.files == 2
+
+
+def test_openai_gc_command(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "k")
+    client = _client([_item("a_old", 48, ASSISTANT_NAME)], [])
+    with patch("openai.OpenAI", return_value=client):
+        assert main(["openai-gc", "--older-than", "12"]) == 0
+    client.beta.assistants.delete.assert_called_once_with("a_old")
+
+
+def test_openai_gc_requires_api_key(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    assert main(["openai-gc"]) == 1
+
+
+def test_openai_gc_include_unmarked_files_flag(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "k")
+    client = _client([], [_file("f_other", 48, "report.pdf")])
+    with patch("openai.OpenAI", return_value=client):
+        assert main(["openai-gc"]) == 0
+        client.files.delete.assert_not_called()
+        assert main(["openai-gc", "--include-unmarked-files"]) == 0
+    client.files.delete.assert_called_once_with("f_other")
@@ -3,15 +3,17 @@
 import builtins
 import json
 import tempfile
+import threading
 import time
 from importlib.metadata import PackageNotFoundError
 from pathlib import Path
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import ANY, MagicMock, call, patch
 
 import pytest
 
 from cvextract.cli_config import UserConfig
 from cvextract.extractors import CVExtractor, OpenAICVExtractor
+from cvextract.extractors.openai_cleanup import CLEANUP_QUEUE
 from cvextract.extractors.openai_extractor import _RetryConfig
 from cvextract.shared import StepName, UnitOfWork
 
@@ -421,38 +423,26 @@ class TestOpenAIOperations:
             asst_id = extractor._create_assistant("test prompt")
             assert asst_id == "asst_123"
 
-    def test_create_thread_success(self):
-        """_create_thread() creates and returns thread_id."""
+    def test_create_and_run_sends_thread_message_and_run_at_once(self):
+        """_create_and_run() creates thread, message and run in one streaming call."""
         with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
             extractor = OpenAICVExtractor()
-            mock_response = MagicMock(id="thread_123")
-            extractor.client.beta.threads.create = MagicMock(return_value=mock_response)
-
-            thread_id = extractor._create_thread()
-            assert thread_id == "thread_123"
-
-    def test_create_message_success(self):
-        """_create_message() creates message without error."""
-        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
-            extractor = OpenAICVExtractor()
-            extractor.client.beta.threads.messages.create = MagicMock()
-
-            extractor._create_message(
-                thread_id="t_123", user_prompt="test", file_id="f_123"
+            stream = MagicMock()
+            extractor.client.beta.threads.create_and_run = MagicMock(
+                return_value=stream
             )
-            extractor.client.beta.threads.messages.create.assert_called_once()
 
-    def test_create_run_success(self):
-        """_create_run() creates and returns run_id."""
-        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
-            extractor = OpenAICVExtractor()
-            mock_response = MagicMock(id="run_123")
-            extractor.client.beta.threads.runs.create = MagicMock(
-                return_value=mock_response
+            result = extractor._create_and_run(
+                assistant_id="a_123", user_prompt="test", file_id="f_123"
             )
 
-            run_id = extractor._create_run(thread_id="t_123", assistant_id="a_123")
-            assert run_id == "run_123"
+            assert result is stream
+            kwargs = extractor.client.beta.threads.create_and_run.call_args.kwargs
+            assert kwargs["assistant_id"] == "a_123"
+            assert kwargs["stream"] is True
+            message = kwargs["thread"]["messages"][0]
+            assert message["content"] == "test"
+            assert message["attachments"][0]["file_id"] == "f_123"
 
     def test_delete_assistant_gracefully_handles_error(self):
         """_delete_assistant() doesn't raise on cleanup errors."""
@@ -689,13 +679,13 @@ class TestFullExtractionFlow:
                 ):
                     extractor._upload_file = MagicMock(return_value="file_123")
                     extractor._create_assistant = MagicMock(return_value="asst_123")
-                    extractor._create_thread = MagicMock(return_value="thread_123")
-                    extractor._create_message = MagicMock()
-                    extractor._create_run = MagicMock(return_value="run_123")
 
-                    # Mock successful run completion
-                    run = MagicMock(status="completed")
-                    extractor._wait_for_run = MagicMock(return_value=run)
+                    # Run completes during the stream
+                    run = MagicMock(status="completed", thread_id="thread_123")
+                    extractor._create_and_run = MagicMock(
+                        return_value=[_event("thread.run.completed", run)]
+                    )
+                    extractor._wait_for_run = MagicMock()
 
                     # Mock message retrieval
                     text_obj = MagicMock(
@@ -714,10 +704,13 @@ class TestFullExtractionFlow:
                     assert result
                     extractor._upload_file.assert_called_once()
                     extractor._create_assistant.assert_called_once()
-                    extractor._create_thread.assert_called_once()
-                    extractor._create_message.assert_called_once()
-                    extractor._create_run.assert_called_once()
-                    extractor._wait_for_run.assert_called_once()
+                    extractor._create_and_run.assert_called_once()
+                    extractor._wait_for_run.assert_not_called()
+                    extractor._list_messages.assert_called_once_with(
+                        thread_id="thread_123"
+                    )
+                    # Deletions run on the background cleanup queue
+                    assert CLEANUP_QUEUE.flush(timeout=5)
                     extractor._delete_assistant.assert_called_once()
                     extractor._delete_file.assert_called_once()
 
@@ -776,6 +769,7 @@ class TestFullExtractionFlow:
                     with pytest.raises(Exception, match="Assistant creation failed"):
                         extractor._extract_with_openai(test_file, schema)
 
+                    assert CLEANUP_QUEUE.flush(timeout=5)
                     # Should clean up the file that was uploaded
                     extractor._delete_file.assert_called_once_with("file_123")
                     # Assistant was never created, so cleanup shouldn't be called for it
@@ -822,6 +816,164 @@ class TestBackoffWithMultiplier:
             mock_sleep.assert_called_with(1.0)
 
 
+def _event(name, data):
+    return MagicMock(event=name, data=data)
+
+
+def _assistant_message(text):
+    part = MagicMock(type="text", text=MagicMock(value=text))
+    return MagicMock(role="assistant", content=[part])
+
+
+class TestRunStream:
+    """Tests for following a run through its event stream."""
+
+    def test_stream_returns_terminal_run_and_completed_messages(self):
+        """_follow_run_stream() stops at the terminal run event."""
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            extractor = OpenAICVExtractor()
+            message = _assistant_message("{}")
+            done = MagicMock(status="completed")
+            events = [
+                _event("thread.created", MagicMock()),
+                _event("thread.run.created", MagicMock(status="queued")),
+                _event("thread.run.step.created", MagicMock(status="in_progress")),
+                _event("thread.message.completed", message),
+                _event("thread.run.completed", done),
+                _event("done", "[DONE]"),
+            ]
+
+            run, messages = extractor._follow_run_stream(iter(events))
+
+            assert run is done
+            assert messages == [message]
+
+    def test_stream_messages_are_used_without_listing(self, tmp_path):
+        """_extract_with_openai() skips List messages when the stream has them."""
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            extractor = OpenAICVExtractor()
+            test_file = tmp_path / "cv.txt"
+            test_file.write_text("content")
+            extractor._upload_file = MagicMock(return_value="file_123")
+            extractor._create_assistant = MagicMock(return_value="asst_123")
+            extractor._create_and_run = MagicMock(
+                return_value=[
+                    _event("thread.message.completed", _assistant_message('{"a": 1}')),
+                    _event("thread.run.completed", MagicMock(status="completed")),
+                ]
+            )
+            extractor._list_messages = MagicMock()
+            extractor._delete_assistant = MagicMock()
+            extractor._delete_file = MagicMock()
+
+            text = extractor._extract_with_openai(
+                test_file, extractor._load_cv_schema()
+            )
+
+            assert text == '{"a": 1}'
+            extractor._list_messages.assert_not_called()
+
+    def test_broken_stream_falls_back_to_polling(self, tmp_path):
+        """A stream that breaks off after the run was created is polled."""
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            extractor = OpenAICVExtractor()
+            test_file = tmp_path / "cv.txt"
+            test_file.write_text("content")
+
+            def broken_stream():
+                yield _event(
+                    "thread.run.created",
+                    MagicMock(status="queued", id="run_123", thread_id="thread_123"),
+                )
+                raise ConnectionError("stream reset")
+
+            extractor._upload_file = MagicMock(return_value="file_123")
+            extractor._create_assistant = MagicMock(return_value="asst_123")
+            extractor._create_and_run = MagicMock(return_value=broken_stream())
+            extractor._wait_for_run = MagicMock(
+                return_value=MagicMock(status="completed")
+            )
+            extractor._list_messages = MagicMock(
+                return_value=MagicMock(data=[_assistant_message('{"a": 1}')])
+            )
+            extractor._delete_assistant = MagicMock()
+            extractor._delete_file = MagicMock()
+
+            text = extractor._extract_with_openai(
+                test_file, extractor._load_cv_schema()
+            )
+
+            assert text == '{"a": 1}'
+            extractor._wait_for_run.assert_called_once_with(
+                thread_id="thread_123", run_id="run_123", start=ANY
+            )
+
+    @pytest.mark.parametrize("deadline_s", [None, 0.2])
+    def test_stalled_stream_gives_up_within_the_run_timeout(self, tmp_path, deadline_s):
+        """A stream that stops sending events is bounded by one run budget."""
+        run_timeout_s = 0.3 if deadline_s is None else 180.0
+        extractor = OpenAICVExtractor(
+            api_key="k", run_timeout_s=run_timeout_s, _sleep=lambda _: None
+        )
+        if deadline_s is not None:
+            extractor._deadline = time.monotonic() + deadline_s
+        test_file = tmp_path / "cv.txt"
+        test_file.write_text("content")
+        queued = MagicMock(status="queued", id="run_123", thread_id="thread_123")
+        requests = []
+
+        def create_and_run(**request):
+            requests.append(request)
+
+            def stalled_stream():
+                yield _event("thread.run.created", queued)
+                # The client gives up on a read after its timeout
+                threading.Event().wait(request["timeout"])
+                raise TimeoutError("Request timed out.")
+
+            return stalled_stream()
+
+        client = MagicMock()
+        client.beta.threads.create_and_run.side_effect = create_and_run
+        client.beta.threads.runs.retrieve.return_value = queued
+        extractor._client = client
+        extractor._upload_file = MagicMock(return_value="file_123")
+        extractor._create_assistant = MagicMock(return_value="asst_123")
+        extractor._delete_assistant = MagicMock()
+        extractor._delete_file = MagicMock()
+
+        start = time.monotonic()
+        with pytest.raises(RuntimeError, match="timed out|deadline"):
+            extractor._extract_with_openai(test_file, extractor._load_cv_schema())
+
+        assert time.monotonic() - start < 2
+        (request,) = requests
+        assert 0 < request["timeout"] <= (deadline_s or run_timeout_s)
+        # The stream spent the run budget: polling does not start a new one
+        assert client.beta.threads.runs.retrieve.call_count <= 1
+
+    def test_stream_failure_before_run_raises(self):
+        """Without a run to poll, a stream failure is an error."""
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            extractor = OpenAICVExtractor()
+
+            def broken_stream():
+                raise ConnectionError("stream reset")
+                yield
+
+            with pytest.raises(RuntimeError, match="stream failed"):
+                extractor._follow_run_stream(broken_stream())
+
+    def test_stream_error_event_raises(self):
+        """An error event fails the run."""
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            extractor = OpenAICVExtractor()
+            events = [_event("error", MagicMock(message="server_error"))]
+
+            with pytest.raises(RuntimeError, match="server_error"):
+                extractor._follow_run_stream(iter(events))
+
+
 class TestPollingSchedule:
     """Tests for adaptive polling schedule."""
 
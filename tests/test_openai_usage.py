@@ -0,0 +1,161 @@
+"""Tests for per-step OpenAI usage accounting."""
+
+from concurrent.futures import Future
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from cvextract.adjusters.openai_utils import OpenAIRetry, RetryConfig
+from cvextract.cli_config import UserConfig
+from cvextract.cli_execute_parallel import (
+    _emit_parallel_summary,
+    _process_future_result,
+)
+from cvextract.extractors.openai_extractor import OpenAICVExtractor
+from cvextract.shared import (
+    OpenAIUsage,
+    StepName,
+    StepStatus,
+    UnitOfWork,
+    collect_usage,
+    format_usage_report,
+    merge_step_states,
+)
+
+
+class _RateLimited(Exception):
+    status_code = 429
+
+
+def _completion(prompt_tokens=100, completion_tokens=20, cached_tokens=64):
+    return SimpleNamespace(
+        usage=SimpleNamespace(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            prompt_tokens_details=SimpleNamespace(cached_tokens=cached_tokens),
+        )
+    )
+
+
+def _work(tmp_path: Path, **usage_by_step) -> UnitOfWork:
+    work = UnitOfWork(config=UserConfig(target_dir=tmp_path))
+    for step, usage in usage_by_step.items():
+        work.step_states[StepName(step)] = StepStatus(step=StepName(step), usage=usage)
+    return work
+
+
+def test_retry_records_requests_tokens_and_backoff():
+    usage = OpenAIUsage()
+    sleeps = []
+    retry = OpenAIRetry(
+        retry=RetryConfig(base_delay_s=1.0, deterministic=True),
+        sleep=sleeps.append,
+        usage=usage,
+    )
+    outcomes = iter([_RateLimited("slow down"), _completion()])
+
+    def request():
+        outcome = next(outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    retry.call(request, is_write=False, op_name="t")
+
+    assert usage.requests == 2
+    assert usage.retries == 1
+    assert usage.sleep_s == sum(sleeps) == 1.0
+    assert (usage.prompt_tokens, usage.completion_tokens, usage.cached_tokens) == (
+        100,
+        20,
+        64,
+    )
+
+
+def test_extractor_records_every_attempt_and_backoff():
+    extractor = OpenAICVExtractor(api_key="k", _sleep=lambda _: None)
+    extractor._usage = OpenAIUsage()
+    attempts = iter([_RateLimited("slow down"), "ok"])
+
+    def request():
+        outcome = next(attempts)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    assert extractor._call_with_retry(request, is_write=False, op_name="t") == "ok"
+    assert extractor._usage.requests == 2
+    assert extractor._usage.retries == 1
+    assert extractor._usage.sleep_s > 0
+
+
+def test_usage_is_empty_until_a_request_is_recorded():
+    usage = OpenAIUsage()
+    assert not usage
+    usage.record_request({"prompt_tokens": 5})
+    assert usage and usage.prompt_tokens == 5
+
+
+def test_merge_step_states_sums_branch_usage(tmp_path: Path):
+    a = _work(tmp_path, Adjust=OpenAIUsage(requests=1, prompt_tokens=10))
+    b = _work(tmp_path, Adjust=OpenAIUsage(requests=2, prompt_tokens=30))
+
+    merged = merge_step_states(_work(tmp_path), [("a", a), ("b", b)], [StepName.Adjust])
+
+    usage = merged.step_states[StepName.Adjust].usage
+    assert (usage.requests, usage.prompt_tokens) == (3, 40)
+
+
+def test_usage_report_lists_steps_and_total(tmp_path: Path):
+    totals = collect_usage(
+        _work(
+            tmp_path,
+            Extract=OpenAIUsage(requests=4),
+            Adjust=OpenAIUsage(requests=1, prompt_tokens=900, cached_tokens=512),
+            Render=OpenAIUsage(),
+        )
+    )
+
+    lines = format_usage_report(totals)
+
+    assert len(lines) == 3
+    assert "Extract: 4 requests" in lines[0]
+    assert "900 prompt tokens (512 cached)" in lines[1]
+    assert lines[2].startswith("🔢 OpenAI total: 5 requests")
+    assert format_usage_report({}) == []
+
+
+def test_parallel_summary_aggregates_usage_across_files(tmp_path: Path):
+    config = UserConfig(target_dir=tmp_path)
+    controller = MagicMock()
+    usage = {}
+    for requests in (1, 2):
+        future = Future()
+        work = _work(tmp_path, Adjust=OpenAIUsage(requests=requests))
+        future.set_result((0, work))
+        _process_future_result(
+            future, tmp_path / "cv.docx", "[1/2]", controller, config, usage
+        )
+
+    _emit_parallel_summary(
+        total_files=2,
+        full_success_count=2,
+        partial_success_count=0,
+        failed_count=0,
+        failed_files=[],
+        config=config,
+        controller=controller,
+        usage=usage,
+    )
+
+    printed = [call.args[0] for call in controller.direct_print.call_args_list]
+    assert any(line.startswith("🔢 OpenAI Adjust: 3 requests") for line in printed)
+
+
+@pytest.mark.parametrize("tokens", [None, {}])
+def test_record_request_without_tokens(tokens):
+    usage = OpenAIUsage()
+    usage.record_request(tokens)
+    assert usage.requests == 1 and usage.prompt_tokens == 0
@@ -0,0 +1,195 @@
+"""Tests for patch-based adjustment responses (`patch` adjuster flag)."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from cvextract.adjusters import openai_company_research_adjuster as research_module
+from cvextract.adjusters.json_patch import JsonPatchError, apply_json_patch
+from cvextract.adjusters.openai_company_research_adjuster import (
+    OpenAICompanyResearchAdjuster,
+)
+from cvextract.adjusters.openai_job_specific_adjuster import OpenAIJobSpecificAdjuster
+from cvextract.adjusters.openai_utils import apply_patch_reply
+from cvextract.shared import StepName
+
+
+def _cv() -> dict:
+    return {
+        "identity": {
+            "title": "Engineer",
+            "full_name": "Ada Lovelace",
+            "first_name": "Ada",
+            "last_name": "Lovelace",
+        },
+        "sidebar": {"skills": ["Python", "Rust", "Go"]},
+        "overview": "Builds things.",
+        "experiences": [
+            {
+                "heading": "2020-now | Acme",
+                "description": "Platform team.",
+                "bullets": ["Ran CI", "Wrote Rust services", "Tuned Postgres"],
+            }
+        ],
+    }
+
+
+class TestApplyJsonPatch:
+    def test_replace_move_remove_add_and_copy(self):
+        doc = _cv()
+        patched = apply_json_patch(
+            doc,
+            [
+                {"op": "replace", "path": "/overview", "value": "Rust engineer."},
+                {
+                    "op": "move",
+                    "from": "/experiences/0/bullets/1",
+                    "path": "/experiences/0/bullets/0",
+                },
+                {"op": "remove", "path": "/sidebar/skills/2"},
+                {"op": "add", "path": "/sidebar/skills/-", "value": "Postgres"},
+                {"op": "copy", "from": "/identity/title", "path": "/identity/alt"},
+            ],
+        )
+
+        assert patched["overview"] == "Rust engineer."
+        assert patched["experiences"][0]["bullets"] == [
+            "Wrote Rust services",
+            "Ran CI",
+            "Tuned Postgres",
+        ]
+        assert patched["sidebar"]["skills"] == ["Python", "Rust", "Postgres"]
+        assert patched["identity"]["alt"] == "Engineer"
+        # The original is untouched
+        assert doc == _cv()
+
+    def test_path_map_is_applied_as_replacements(self):
+        patched = apply_json_patch(_cv(), {"/identity/title": "Staff Engineer"})
+
+        assert patched["identity"]["title"] == "Staff Engineer"
+
+    def test_escaped_pointer_tokens(self):
+        patched = apply_json_patch({"a/b": 1, "c~d": 2}, {"/a~1b": 3, "/c~0d": 4})
+
+        assert patched == {"a/b": 3, "c~d": 4}
+
+    @pytest.mark.parametrize(
+        "operations",
+        [
+            [{"op": "replace", "path": "/missing", "value": 1}],
+            [{"op": "remove", "path": "/experiences/5"}],
+            [{"op": "replace", "path": "overview", "value": ""}],
+            [{"op": "replace", "path": "", "value": {}}],
+            [{"op": "add", "path": "/overview"}],
+            [{"op": "test", "path": "/overview", "value": ""}],
+            [{"op": "move", "from": "/sidebar", "path": "/sidebar/skills/0"}],
+            "not a patch",
+        ],
+    )
+    def test_invalid_patches_raise(self, operations):
+        with pytest.raises(JsonPatchError):
+            apply_json_patch(_cv(), operations)
+
+
+class TestApplyPatchReply:
+    def test_valid_patch_is_applied(self):
+        reply = json.dumps(
+            {"patch": [{"op": "replace", "path": "/overview", "value": "New."}]}
+        )
+
+        assert apply_patch_reply(reply, _cv())["overview"] == "New."
+
+    def test_empty_patch_keeps_cv(self):
+        assert apply_patch_reply('{"patch": []}', _cv()) == _cv()
+
+    def test_schema_violation_is_rejected(self):
+        reply = json.dumps({"patch": [{"op": "remove", "path": "/identity"}]})
+
+        assert apply_patch_reply(reply, _cv()) is None
+
+    def test_unparsable_reply_is_rejected(self):
+        assert apply_patch_reply("not json", _cv()) is None
+
+
+_REORDER = {
+    "patch": [
+        {
+            "op": "move",
+            "from": "/experiences/0/bullets/1",
+            "path": "/experiences/0/bullets/0",
+        }
+    ]
+}
+
+
+@pytest.mark.parametrize("bulk", [False, True])
+def test_job_adjuster_applies_patch_reply(
+    fake_openai, make_adjust_work, read_adjust_output, bulk
+):
+    fake_openai.reply = _REORDER
+    params = {"job_description": "Rust engineer", "patch": ""}
+    if bulk:
+        params["bulk"] = ""
+
+    work = OpenAIJobSpecificAdjuster(api_key="k").adjust(
+        make_adjust_work(_cv()), **params
+    )
+
+    (request,) = fake_openai.requests
+    messages = request["messages"]
+    assert [m["role"] for m in messages] == ["system", "system", "user"]
+    assert '"patch"' in messages[1]["content"]
+    assert json.loads(messages[2]["content"]) == {"original_json": _cv()}
+    bullets = read_adjust_output(work)["experiences"][0]["bullets"]
+    assert bullets == ["Wrote Rust services", "Ran CI", "Tuned Postgres"]
+
+
+def test_job_adjuster_keeps_original_on_bad_patch(
+    fake_openai, make_adjust_work, read_adjust_output
+):
+    fake_openai.reply = {"patch": [{"op": "remove", "path": "/experiences/7"}]}
+
+    work = OpenAIJobSpecificAdjuster(api_key="k").adjust(
+        make_adjust_work(_cv()), job_description="Rust", patch=""
+    )
+
+    assert read_adjust_output(work) == _cv()
+    assert work.step_states[StepName.Adjust].usage.fallbacks == 1
+
+
+def test_patch_mode_ignores_structured_output(fake_openai, make_adjust_work):
+    fake_openai.reply = {"patch": []}
+
+    OpenAIJobSpecificAdjuster(api_key="k").adjust(
+        make_adjust_work(_cv(), structured=True),
+        job_description="Rust",
+        patch="",
+    )
+
+    (request,) = fake_openai.requests
+    assert "response_format" not in request
+
+
+def test_company_adjuster_applies_patch_reply(
+    fake_openai, make_adjust_work, read_adjust_output
+):
+    fake_openai.reply = {"/overview": "Cloud-native platform engineer."}
+    research = {"name": "Acme", "description": "Cloud", "domains": ["cloud"]}
+
+    with patch.object(
+        research_module, "_research_company_profile", return_value=research
+    ):
+        work = OpenAICompanyResearchAdjuster(api_key="k").adjust(
+            make_adjust_work(_cv()),
+            customer_url="https://acme.example",
+            patch="",
+        )
+
+    (request,) = fake_openai.requests
+    assert [m["role"] for m in request["messages"]] == ["system", "system", "user"]
+    payload = json.loads(request["messages"][2]["content"])
+    assert "adjusted_json" not in payload
+    output = read_adjust_output(work)
+    assert output["overview"] == "Cloud-native platform engineer."
+    assert output["experiences"] == _cv()["experiences"]
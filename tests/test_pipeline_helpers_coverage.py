@@ -303,7 +303,7 @@ class TestPipelineHelpersCoverage:
         work.set_step_paths(StepName.Extract, input_path=docx, output_path=output)
 
         with patch("cvextract.pipeline_helpers.extract_cv_data") as mock_process, patch(
-            "cvextract.pipeline_helpers.dump_body_sample"
+            "cvextract.extractors.docx_utils.dump_body_sample"
         ) as mock_dump:
             mock_process.side_effect = RuntimeError("Test error")
 
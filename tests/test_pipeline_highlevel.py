@@ -38,7 +38,7 @@ class TestExtractCvData:
         mock_docx.touch()
 
         with patch(
-            "cvextract.pipeline_helpers.DocxCVExtractor"
+            "cvextract.extractors.docx_extractor.DocxCVExtractor"
         ) as mock_extractor_class:
             work = UnitOfWork(
                 config=UserConfig(target_dir=tmp_path),
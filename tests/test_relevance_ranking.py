@@ -0,0 +1,202 @@
+"""Tests for local relevance pre-ranking of job-specific adjustments."""
+
+import json
+
+import pytest
+
+from cvextract.adjusters.openai_job_specific_adjuster import OpenAIJobSpecificAdjuster
+from cvextract.adjusters.relevance import RelevanceFilter, bm25_scores, tokenize
+
+_JOB = "Senior Rust engineer for Kubernetes platform work"
+
+
+def _experience(heading: str, *bullets: str) -> dict:
+    return {"heading": heading, "description": "", "bullets": list(bullets)}
+
+
+def _cv() -> dict:
+    return {
+        "identity": {
+            "title": "Engineer",
+            "full_name": "Ada Lovelace",
+            "first_name": "Ada",
+            "last_name": "Lovelace",
+        },
+        "sidebar": {},
+        "overview": "",
+        "experiences": [
+            _experience("2023 | Bank", "Excel reporting", "Stakeholder meetings"),
+            _experience("2021 | Shop", "Sold shoes"),
+            _experience(
+                "2019 | Cloud", "Wrote Rust services", "Ran Kubernetes", "Team lunches"
+            ),
+            _experience("2017 | Cafe", "Made coffee"),
+            _experience("2015 | Infra", "Kubernetes operators in Rust"),
+        ],
+    }
+
+
+def test_tokenize_keeps_technical_terms():
+    assert tokenize("Built C++ and Node.js apps, with C#.") == [
+        "built",
+        "c++",
+        "node.js",
+        "apps",
+        "c#",
+    ]
+
+
+def test_bm25_ranks_matching_documents_first():
+    scores = bm25_scores(["rust rust kubernetes", "excel", "rust"], "rust kubernetes")
+
+    assert scores[0] > scores[2] > scores[1] == 0.0
+
+
+def test_bm25_without_query_terms_scores_zero():
+    assert bm25_scores(["rust"], "the and of") == [0.0]
+
+
+def test_fit_sends_latest_and_most_relevant_experiences():
+    cv = _cv()
+    relevance = RelevanceFilter(_JOB, top_experiences=3)
+
+    sent = relevance.fit(cv)
+
+    headings = [e["heading"] for e in sent["experiences"]]
+    assert headings == ["2023 | Bank", "2019 | Cloud", "2015 | Infra"]
+    assert cv == _cv()
+
+
+def test_restore_puts_unsent_experiences_back_in_place():
+    relevance = RelevanceFilter(_JOB, top_experiences=3)
+    sent = relevance.fit(_cv())
+    adjusted = json.loads(json.dumps(sent))
+    for experience in adjusted["experiences"]:
+        experience["description"] = "tailored"
+
+    restored = relevance.restore(adjusted)
+
+    assert [e["heading"] for e in restored["experiences"]] == [
+        e["heading"] for e in _cv()["experiences"]
+    ]
+    descriptions = [e["description"] for e in restored["experiences"]]
+    assert descriptions == ["tailored", "", "tailored", "", "tailored"]
+
+
+def test_top_bullets_are_sent_and_the_rest_appended():
+    relevance = RelevanceFilter(_JOB, top_bullets=1)
+
+    sent = relevance.fit(_cv())
+    cloud = sent["experiences"][2]
+    assert len(cloud["bullets"]) == 1
+    assert cloud["bullets"][0] in ("Wrote Rust services", "Ran Kubernetes")
+
+    adjusted = json.loads(json.dumps(sent))
+    adjusted["experiences"][2]["bullets"] = ["Rewritten"]
+    restored = relevance.restore(adjusted)
+
+    bullets = restored["experiences"][2]["bullets"]
+    assert bullets[0] == "Rewritten"
+    assert bullets[-1] == "Team lunches"
+    assert len(bullets) == 3
+
+
+def test_restore_rejects_missing_experiences():
+    relevance = RelevanceFilter(_JOB, top_experiences=2)
+    sent = relevance.fit(_cv())
+
+    assert relevance.restore({**sent, "experiences": sent["experiences"][:1]}) is None
+
+
+def test_restore_matches_reordered_experiences_by_heading():
+    relevance = RelevanceFilter(_JOB, top_experiences=3, top_bullets=1)
+    sent = relevance.fit(_cv())
+    adjusted = json.loads(json.dumps(sent))
+    for experience in adjusted["experiences"]:
+        experience["description"] = experience["heading"]
+    adjusted["experiences"].reverse()
+
+    restored = relevance.restore(adjusted)
+
+    assert [e["heading"] for e in restored["experiences"]] == [
+        e["heading"] for e in _cv()["experiences"]
+    ]
+    descriptions = [e["description"] for e in restored["experiences"]]
+    assert descriptions == ["2023 | Bank", "", "2019 | Cloud", "", "2015 | Infra"]
+    # Held-back bullets go back to their own experience
+    assert restored["experiences"][0]["bullets"][-1] in (
+        "Excel reporting",
+        "Stakeholder meetings",
+    )
+    assert restored["experiences"][2]["bullets"][-1] == "Team lunches"
+
+
+def test_restore_rejects_unknown_headings():
+    relevance = RelevanceFilter(_JOB, top_experiences=2)
+    adjusted = json.loads(json.dumps(relevance.fit(_cv())))
+    adjusted["experiences"][1]["heading"] = "2019 | Cloud Inc."
+
+    assert relevance.restore(adjusted) is None
+
+
+def test_inactive_filter_returns_cv_unchanged():
+    cv = _cv()
+    relevance = RelevanceFilter(_JOB)
+
+    assert relevance.fit(cv) is cv
+    assert relevance.restore(cv) is cv
+
+
+def _tailor(reverse: bool):
+    def reply(request):
+        cv = json.loads(request["messages"][-1]["content"])["original_json"]
+        for experience in cv["experiences"]:
+            experience["description"] = "tailored"
+        if reverse:
+            cv["experiences"].reverse()
+        return cv
+
+    return reply
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("bulk", [False, True])
+def test_adjuster_sends_top_experiences_and_keeps_the_rest(
+    fake_openai, make_adjust_work, read_adjust_output, bulk, reverse
+):
+    # The model may return the experiences in another order
+    fake_openai.reply = _tailor(reverse)
+    params = {"job_description": _JOB, "top-experiences": "3"}
+    if bulk:
+        params["bulk"] = ""
+
+    work = OpenAIJobSpecificAdjuster(api_key="k").adjust(
+        make_adjust_work(_cv()), **params
+    )
+
+    (request,) = fake_openai.requests
+    sent = json.loads(request["messages"][-1]["content"])["original_json"]
+    assert len(sent["experiences"]) == 3
+    output = read_adjust_output(work)
+    assert [e["heading"] for e in output["experiences"]] == [
+        e["heading"] for e in _cv()["experiences"]
+    ]
+    assert [e["description"] for e in output["experiences"]] == [
+        "tailored",
+        "",
+        "tailored",
+        "",
+        "tailored",
+    ]
+
+
+def test_adjuster_ignores_invalid_limits(fake_openai, make_adjust_work):
+    fake_openai.reply = _tailor(False)
+
+    OpenAIJobSpecificAdjuster(api_key="k").adjust(
+        make_adjust_work(_cv()), job_description=_JOB, **{"top-experiences": "many"}
+    )
+
+    (request,) = fake_openai.requests
+    sent = json.loads(request["messages"][-1]["content"])["original_json"]
+    assert len(sent["experiences"]) == 5
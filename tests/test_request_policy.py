@@ -0,0 +1,406 @@
+"""Tests for OpenAI tail-latency and outage controls."""
+
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from cvextract.adjusters.openai_utils import OpenAIRetry, RetryConfig
+from cvextract.cli_config import ParallelStage, UserConfig
+from cvextract.cli_gather import gather_user_requirements
+from cvextract.extractors.openai_extractor import OpenAICVExtractor, _RetryConfig
+from cvextract.request_policy import (
+    CircuitBreaker,
+    HedgePolicy,
+    LatencyTracker,
+    RetryBudget,
+    circuit_breaker_for,
+    request_pool_for,
+    request_timeout_s,
+    retry_budget_for,
+    run_bounded,
+    step_deadline,
+)
+from cvextract.shared import OpenAIUsage, StepName, UnitOfWork
+
+_FAST_HEDGE = HedgePolicy(initial_delay_s=0.05, min_delay_s=0.01)
+
+
+class Transient(Exception):
+    status_code = 503
+
+
+def _first_call_hangs(release: threading.Event):
+    calls = []
+
+    def fn():
+        calls.append(len(calls))
+        if len(calls) == 1:
+            release.wait(2)
+            return "slow"
+        return "fast"
+
+    return fn, calls
+
+
+def test_slow_request_is_hedged_and_first_response_wins():
+    release = threading.Event()
+    fn, calls = _first_call_hangs(release)
+    usage = OpenAIUsage()
+    try:
+        result = run_bounded(
+            fn,
+            op_name="op",
+            hedge=_FAST_HEDGE,
+            usage=usage,
+            tracker=LatencyTracker(),
+        )
+    finally:
+        release.set()
+    assert result == "fast"
+    assert len(calls) == 2
+    assert (usage.hedges, usage.requests) == (1, 1)
+    assert "1 hedged" in usage.format()
+
+
+def test_fast_request_is_not_hedged():
+    usage = OpenAIUsage()
+    result = run_bounded(
+        lambda: "ok",
+        op_name="op",
+        hedge=HedgePolicy(initial_delay_s=5),
+        usage=usage,
+        tracker=LatencyTracker(),
+    )
+    assert result == "ok"
+    assert usage.hedges == 0
+
+
+def test_hedge_delay_follows_observed_percentile():
+    tracker = LatencyTracker()
+    policy = HedgePolicy(quantile=0.9, min_samples=10, min_delay_s=0.1)
+    assert tracker.hedge_delay("op", policy) == policy.initial_delay_s
+    for n in range(1, 11):
+        tracker.record("op", float(n))
+    assert tracker.hedge_delay("op", policy) == 10.0
+    assert tracker.hedge_delay("other", policy) == policy.initial_delay_s
+
+
+def test_hung_request_times_out_at_deadline():
+    release = threading.Event()
+    try:
+        with pytest.raises(TimeoutError, match="deadline"):
+            run_bounded(
+                lambda: release.wait(2),
+                op_name="op",
+                deadline=time.monotonic() + 0.05,
+            )
+    finally:
+        release.set()
+
+
+def test_retries_stop_when_backoff_would_pass_deadline():
+    calls = []
+
+    def fail():
+        calls.append(1)
+        raise Transient("service unavailable")
+
+    retryer = OpenAIRetry(
+        retry=RetryConfig(deterministic=True, base_delay_s=1.0),
+        sleep=lambda _: pytest.fail("slept past the deadline"),
+        deadline=time.monotonic() + 0.5,
+    )
+    with pytest.raises(RuntimeError, match="step deadline reached"):
+        retryer.call(fail, is_write=False, op_name="op")
+    assert calls == [1]
+
+
+def test_abandoned_requests_give_back_their_slots():
+    slots = threading.BoundedSemaphore(8)
+    release = threading.Event()
+    retryer = OpenAIRetry(
+        retry=RetryConfig(),
+        sleep=lambda _: None,
+        deadline=time.monotonic() + 0.1,
+        slots=slots,
+    )
+    errors = []
+
+    def hung_call():
+        try:
+            retryer.call(lambda: release.wait(5), is_write=False, op_name="op")
+        except RuntimeError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=hung_call) for _ in range(8)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(2)
+        assert len(errors) == 8
+
+        # The 8 requests still hang, but no longer hold a slot
+        fresh = OpenAIRetry(retry=RetryConfig(), sleep=lambda _: None, slots=slots)
+        start = time.monotonic()
+        assert fresh.call(lambda: "ok", is_write=False, op_name="op") == "ok"
+        assert time.monotonic() - start < 1
+    finally:
+        release.set()
+
+
+def test_hedged_duplicate_shares_the_slot():
+    release = threading.Event()
+    fn, calls = _first_call_hangs(release)
+    usage = OpenAIUsage()
+    retryer = OpenAIRetry(
+        retry=RetryConfig(),
+        sleep=lambda _: None,
+        usage=usage,
+        hedge=_FAST_HEDGE,
+        deadline=time.monotonic() + 1.5,
+        slots=threading.BoundedSemaphore(1),
+    )
+    try:
+        result = retryer.call(fn, is_write=False, op_name="hedged", hedge=True)
+    finally:
+        release.set()
+    assert result == "fast"
+    assert len(calls) == 2
+    assert usage.hedges == 1
+
+
+def test_request_pool_is_sized_for_the_run(tmp_path: Path):
+    config = UserConfig(
+        target_dir=tmp_path,
+        parallel=ParallelStage(source=tmp_path, n=40),
+        openai_hedge=True,
+    )
+    pool = request_pool_for(UnitOfWork(config=config))
+    release = threading.Event()
+    try:
+        # One hung request per worker and hedge but the last
+        for _ in range(79):
+            pool.submit(release.wait, 5)
+        start = time.monotonic()
+        result = run_bounded(
+            lambda: "ok", op_name="op", deadline=time.monotonic() + 1, pool=pool
+        )
+        assert result == "ok"
+        assert time.monotonic() - start < 0.5
+    finally:
+        release.set()
+    assert request_pool_for(UnitOfWork(config=config)) is pool
+
+
+def test_client_timeout_is_cut_to_the_deadline():
+    assert request_timeout_s(60, None) == 60
+    assert request_timeout_s(None, None) is None
+    assert request_timeout_s(2, time.monotonic() + 5) == 2
+    assert 0 < request_timeout_s(60, time.monotonic() + 5) <= 5
+
+    timeouts = []
+
+    def create(**request):
+        timeouts.append(request["timeout"])
+        return SimpleNamespace(choices=[])
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace()))
+    client.chat.completions.create = create
+    retryer = OpenAIRetry(
+        retry=RetryConfig(), sleep=lambda _: None, deadline=time.monotonic() + 5
+    )
+    retryer.create_completion(client, op_name="op", model="m", timeout=60.0)
+    assert 0 < timeouts[0] <= 5
+
+    extractor = OpenAICVExtractor(api_key="k")
+    assert extractor._timeout_kwargs() == {}
+    extractor._deadline = time.monotonic() + 5
+    assert 0 < extractor._timeout_kwargs()["timeout"] <= 5
+
+
+def test_extractor_cleanup_ignores_deadline():
+    extractor = OpenAICVExtractor(api_key="k", _sleep=lambda _: None)
+    extractor._deadline = time.monotonic() - 1
+    deleted = []
+    with pytest.raises(RuntimeError, match="deadline"):
+        extractor._call_with_retry(lambda: "x", is_write=False, op_name="Read")
+    extractor._call_with_retry(
+        lambda: deleted.append(1), is_write=True, op_name="Delete", cleanup=True
+    )
+    assert deleted == [1]
+
+
+def test_extractor_cleanup_is_left_out_of_usage_and_budget():
+    extractor = OpenAICVExtractor(
+        api_key="k",
+        retry_config=_RetryConfig(deterministic=True),
+        _sleep=lambda _: None,
+    )
+    extractor._usage = OpenAIUsage()
+    extractor._budget = RetryBudget(ratio=1.0, max_tokens=5)
+    extractor._budget.try_retry()
+    outcomes = [Transient("service unavailable"), None]
+
+    def delete():
+        error = outcomes.pop(0)
+        if error is not None:
+            raise error
+
+    extractor._call_with_retry(delete, is_write=True, op_name="Delete", cleanup=True)
+
+    assert outcomes == []
+    assert (extractor._usage.requests, extractor._usage.retries) == (0, 0)
+    # Neither topped up by the delete nor drawn for its retry: 4 tokens left
+    assert [extractor._budget.try_retry() for _ in range(5)] == [True] * 4 + [False]
+
+
+def test_step_deadline_is_shared_by_the_step(tmp_path: Path):
+    work = UnitOfWork(config=UserConfig(target_dir=tmp_path, openai_deadline_s=30))
+    first = step_deadline(work, StepName.Adjust)
+    assert first is not None
+    assert step_deadline(work, StepName.Adjust) == first
+    assert (
+        step_deadline(
+            UnitOfWork(config=UserConfig(target_dir=tmp_path)), StepName.Adjust
+        )
+        is None
+    )
+
+
+def test_gather_parses_hedge_and_deadline(tmp_path: Path):
+    args = ["--extract", f"source={tmp_path / 'cv.docx'}", "--target", str(tmp_path)]
+    config = gather_user_requirements(
+        args + ["--openai-hedge", "--openai-deadline", "90"]
+    )
+    assert config.openai_hedge
+    assert config.openai_deadline_s == 90.0
+    with pytest.raises(ValueError, match="positive"):
+        gather_user_requirements(args + ["--openai-deadline", "0"])
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_breaker_opens_on_failure_rate_and_closes_after_probe():
+    clock = FakeClock()
+    breaker = CircuitBreaker(
+        threshold=0.5, window=10, min_requests=4, cooldown_s=30, _time=clock
+    )
+    for failed in (False, True, True):
+        breaker.record(failed=failed)
+    assert breaker.allow()
+    breaker.record(failed=True)
+    assert breaker.is_open
+    assert not breaker.allow()
+
+    clock.now = 31
+    assert breaker.allow()  # the probe
+    assert not breaker.allow()  # only one probe at a time
+    breaker.record(failed=True)
+    assert not breaker.allow()
+
+    clock.now = 62
+    assert breaker.allow()
+    breaker.record(failed=False)
+    assert not breaker.is_open
+    assert breaker.allow()
+
+
+def test_open_breaker_fails_calls_immediately():
+    breaker = CircuitBreaker(min_requests=1)
+    breaker.record(failed=True)
+    calls = []
+    retryer = OpenAIRetry(retry=RetryConfig(), sleep=lambda _: None, breaker=breaker)
+    with pytest.raises(RuntimeError, match="circuit breaker is open"):
+        retryer.call(lambda: calls.append(1), is_write=False, op_name="op")
+    assert calls == []
+
+
+def test_deadline_timeouts_are_not_breaker_failures():
+    breaker = CircuitBreaker(min_requests=1)
+    release = threading.Event()
+    retryer = OpenAIRetry(
+        retry=RetryConfig(),
+        sleep=lambda _: None,
+        deadline=time.monotonic() + 0.05,
+        breaker=breaker,
+    )
+    extractor = OpenAICVExtractor(api_key="k", _sleep=lambda _: None)
+    extractor._deadline = time.monotonic() + 0.05
+    extractor._breaker = breaker
+    try:
+        with pytest.raises(RuntimeError, match="step deadline reached"):
+            retryer.call(lambda: release.wait(2), is_write=False, op_name="op")
+        with pytest.raises(RuntimeError, match="step deadline reached"):
+            extractor._call_with_retry(
+                lambda: release.wait(2), is_write=False, op_name="Read"
+            )
+    finally:
+        release.set()
+    assert not breaker.is_open
+
+
+def test_released_probe_lets_the_next_request_probe():
+    clock = FakeClock()
+    breaker = CircuitBreaker(min_requests=1, cooldown_s=30, _time=clock)
+    breaker.record(failed=True)
+    clock.now = 31
+    assert breaker.allow()
+
+    breaker.release()
+
+    assert breaker.is_open
+    assert breaker.allow()
+
+
+def test_retry_budget_caps_retries_across_calls():
+    budget = RetryBudget(ratio=0.5, max_tokens=2)
+    calls = []
+
+    def fail():
+        calls.append(1)
+        raise Transient("service unavailable")
+
+    retryer = OpenAIRetry(
+        retry=RetryConfig(max_attempts=8), sleep=lambda _: None, budget=budget
+    )
+    with pytest.raises(RuntimeError, match="retry budget exhausted"):
+        retryer.call(fail, is_write=False, op_name="op")
+    # Two stored tokens: one first attempt and two retries
+    assert len(calls) == 3
+
+    retryer.call(lambda: None, is_write=False, op_name="op")
+    retryer.call(lambda: None, is_write=False, op_name="op")
+    # Two successful first attempts refilled one retry
+    calls.clear()
+    with pytest.raises(RuntimeError, match="retry budget exhausted"):
+        retryer.call(fail, is_write=False, op_name="op")
+    assert len(calls) == 2
+
+
+def test_breaker_and_budget_are_shared_per_run_settings(tmp_path: Path):
+    work = UnitOfWork(config=UserConfig(target_dir=tmp_path))
+    other = UnitOfWork(config=UserConfig(target_dir=tmp_path / "other"))
+    assert circuit_breaker_for(work) is circuit_breaker_for(other)
+    assert retry_budget_for(work) is retry_budget_for(other)
+    disabled = UserConfig(target_dir=tmp_path, openai_breaker_threshold=0)
+    assert circuit_breaker_for(UnitOfWork(config=disabled)) is None
+
+
+def test_gather_validates_breaker_and_budget(tmp_path: Path):
+    args = ["--extract", f"source={tmp_path / 'cv.docx'}", "--target", str(tmp_path)]
+    config = gather_user_requirements(
+        args + ["--openai-breaker-threshold", "0.3", "--openai-retry-budget", "0.1"]
+    )
+    assert (config.openai_breaker_threshold, config.openai_retry_budget) == (0.3, 0.1)
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        gather_user_requirements(args + ["--openai-breaker-threshold", "2"])
@@ -0,0 +1,122 @@
+"""Tests for the compiled JSON schema validator."""
+
+from cvextract.verifiers.schema_validator import (
+    compile_schema,
+    get_schema_validator,
+    load_contract_schema,
+)
+
+
+def _valid_cv() -> dict:
+    return {
+        "identity": {
+            "title": "Engineer",
+            "full_name": "Ada Lovelace",
+            "first_name": "Ada",
+            "last_name": "Lovelace",
+        },
+        "sidebar": {"languages": ["Python"], "tools": []},
+        "overview": "Summary",
+        "experiences": [
+            {
+                "heading": "2020 - Present | Engineer",
+                "description": "Built things.",
+                "bullets": ["Did X"],
+                "environment": None,
+            }
+        ],
+    }
+
+
+def test_docx_extractor_sidebar_sections_are_in_contract():
+    from cvextract.extractors.sidebar_parser import SECTION_TITLES
+
+    sidebar = {key: ["x"] for key in SECTION_TITLES.values()}
+    data = dict(_valid_cv(), sidebar=sidebar)
+    assert get_schema_validator(load_contract_schema("cv_schema.json"))(data) == []
+
+
+def test_contract_schema_is_loaded_once():
+    assert load_contract_schema("cv_schema.json") is load_contract_schema(
+        "cv_schema.json"
+    )
+
+
+def test_schema_validator_is_compiled_once_per_schema():
+    schema = load_contract_schema("cv_schema.json")
+    assert get_schema_validator(schema) is get_schema_validator(schema)
+    assert get_schema_validator(schema) is not get_schema_validator(
+        schema, nullable_optional=True
+    )
+
+
+def test_cv_schema_accepts_valid_cv():
+    validate = get_schema_validator(load_contract_schema("cv_schema.json"))
+    assert validate(_valid_cv()) == []
+
+
+def test_cv_schema_reports_nested_errors():
+    validate = get_schema_validator(load_contract_schema("cv_schema.json"))
+    data = _valid_cv()
+    data["identity"]["title"] = ""
+    data["sidebar"]["tools"] = ["ok", 1]
+    data["experiences"][0]["environment"] = "Python"
+    data["experiences"].append({"heading": "H", "description": "D", "extra": 1})
+    data["unknown"] = True
+
+    errs = validate(data)
+
+    assert errs == [
+        "identity.title must be a non-empty string",
+        "sidebar.tools items must be strings",
+        "experiences[0].environment must be an array or null",
+        "experiences[1] has unexpected field: extra",
+        "has unexpected field: unknown",
+    ]
+
+
+def test_research_schema_constraints():
+    validate = get_schema_validator(
+        load_contract_schema("research_schema.json"), nullable_optional=True
+    )
+    data = {
+        "name": "Acme",
+        "domains": ["retail", "retail"],
+        "description": None,
+        "founded_year": 1500,
+        "company_size": "gigantic",
+        "technology_signals": [{"technology": "AI", "confidence": 1.5}],
+        "owned_products": [{"category": "SaaS"}],
+    }
+
+    errs = validate(data)
+
+    assert "domains items must be unique" in errs
+    assert "founded_year must be >= 1600" in errs
+    assert any(e.startswith("company_size must be one of") for e in errs)
+    assert "technology_signals[0].confidence must be <= 1" in errs
+    assert "owned_products[0] missing required field: name" in errs
+    assert not any(e.startswith("description") for e in errs)
+
+
+def test_nullable_optional_keeps_required_fields_strict():
+    validate = compile_schema(
+        {
+            "type": "object",
+            "required": ["name"],
+            "properties": {"name": {"type": "string"}, "note": {"type": "string"}},
+        },
+        nullable_optional=True,
+    )
+
+    assert validate({"name": "x", "note": None}) == []
+    assert validate({"name": None}) == ["name must be a string"]
+    assert validate([]) == ["value must be an object"]
+
+
+def test_integer_rejects_booleans():
+    validate = compile_schema({"type": "integer", "minimum": 1})
+
+    assert validate(True) == ["value must be an integer"]
+    assert validate(0) == ["value must be >= 1"]
+    assert validate(3) == []
@@ -0,0 +1,132 @@
+"""Startup tests: lazy plugin loading keeps heavy dependencies out of the CLI."""
+
+import subprocess
+import sys
+
+import pytest
+
+from cvextract.adjusters import list_adjusters, register_adjuster
+from cvextract.adjusters.adjuster_registry import unregister_adjuster
+from cvextract.extractors import list_extractors
+from cvextract.renderers import get_renderer, list_renderers
+from cvextract.renderers.renderer_registry import (
+    _RENDERER_REGISTRY,
+    register_renderer,
+    unregister_renderer,
+)
+from cvextract.shared import load_entry_point
+
+_HEAVY_MODULES = ("openai", "requests", "docxtpl", "jinja2", "docx", "lxml")
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, check=True
+    )
+
+
+def test_cli_import_does_not_load_heavy_dependencies():
+    result = _run_python(
+        "-c",
+        "import sys, cvextract.cli; "
+        f"print(','.join(m for m in {_HEAVY_MODULES!r} if m in sys.modules))",
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_list_commands_do_not_load_heavy_dependencies():
+    result = _run_python(
+        "-c",
+        "import sys\n"
+        "from cvextract.cli_gather import _handle_list_command\n"
+        "for kind in ('adjusters', 'renderers', 'extractors'):\n"
+        "    _handle_list_command(kind)\n"
+        "print('loaded=' + ','.join(m for m in "
+        f"{_HEAVY_MODULES!r} if m in sys.modules))",
+    )
+    assert result.stdout.strip().splitlines()[-1] == "loaded="
+
+
+def test_cli_help_does_not_import_heavy_dependencies():
+    # -X importtime lists every module imported by the process on stderr
+    result = _run_python("-X", "importtime", "-m", "cvextract.cli", "--help")
+    imported = {
+        line.rsplit("|", 1)[-1].strip().split(".")[0]
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+    assert "cvextract" in imported
+    assert imported.isdisjoint(_HEAVY_MODULES), sorted(
+        imported.intersection(_HEAVY_MODULES)
+    )
+
+
+def test_lazy_descriptions_match_plugin_classes():
+    """Descriptions registered for lazy plugins stay in sync with the classes."""
+    from cvextract.adjusters import (
+        OpenAICompanyResearchAdjuster,
+        OpenAIJobSpecificAdjuster,
+        OpenAITranslateAdjuster,
+    )
+    from cvextract.extractors import DocxCVExtractor, OpenAICVExtractor
+    from cvextract.renderers import DocxCVRenderer
+
+    listed = {a["name"]: a["description"] for a in list_adjusters()}
+    for cls in (
+        OpenAICompanyResearchAdjuster,
+        OpenAIJobSpecificAdjuster,
+        OpenAITranslateAdjuster,
+    ):
+        instance = cls()
+        assert listed[instance.name()] == instance.description()
+
+    def first_doc_line(cls):
+        return cls.__doc__.strip().split("\n")[0]
+
+    extractors = {e["name"]: e["description"] for e in list_extractors()}
+    assert extractors["openai-extractor"] == first_doc_line(OpenAICVExtractor)
+    assert extractors["default-docx-cv-extractor"] == first_doc_line(DocxCVExtractor)
+    renderers = {r["name"]: r["description"] for r in list_renderers()}
+    assert renderers["default-docx-cv-renderer"] == first_doc_line(DocxCVRenderer)
+
+
+def test_registry_resolves_entry_point_on_first_get():
+    register_renderer(
+        "lazy-test-renderer",
+        "cvextract.renderers.docx_renderer:DocxCVRenderer",
+        description="Lazy test renderer",
+    )
+    try:
+        assert isinstance(_RENDERER_REGISTRY["lazy-test-renderer"], str)
+        assert {"name": "lazy-test-renderer", "description": "Lazy test renderer"} in (
+            list_renderers()
+        )
+
+        renderer = get_renderer("lazy-test-renderer")
+
+        assert type(renderer).__name__ == "DocxCVRenderer"
+        assert not isinstance(_RENDERER_REGISTRY["lazy-test-renderer"], str)
+    finally:
+        unregister_renderer("lazy-test-renderer")
+
+
+def test_lazy_adjuster_registration_requires_name_and_description():
+    with pytest.raises(ValueError):
+        register_adjuster("cvextract.adjusters.openai_translate_adjuster:X")
+
+    register_adjuster(
+        "cvextract.adjusters.openai_translate_adjuster:OpenAITranslateAdjuster",
+        name="lazy-test-adjuster",
+        description="Lazy test adjuster",
+    )
+    try:
+        assert {"name": "lazy-test-adjuster", "description": "Lazy test adjuster"} in (
+            list_adjusters()
+        )
+    finally:
+        unregister_adjuster("lazy-test-adjuster")
+
+
+def test_load_entry_point_rejects_malformed_entry_point():
+    with pytest.raises(ValueError):
+        load_entry_point("cvextract.shared")
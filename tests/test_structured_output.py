@@ -0,0 +1,249 @@
+"""Tests for strict JSON-schema structured outputs (--structured-output)."""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from cvextract.adjusters.openai_job_specific_adjuster import OpenAIJobSpecificAdjuster
+from cvextract.adjusters.openai_utils import (
+    OpenAIRetry,
+    RetryConfig,
+    StructuredOutput,
+    strict_json_schema,
+    structured_output_for,
+)
+from cvextract.cli_config import UserConfig
+from cvextract.cli_gather import gather_user_requirements
+from cvextract.shared import OpenAIUsage, StepName, UnitOfWork
+from cvextract.verifiers.schema_validator import load_contract_schema
+
+
+def _walk_objects(node):
+    if isinstance(node, dict):
+        if isinstance(node.get("properties"), dict):
+            yield node
+        for value in node.values():
+            yield from _walk_objects(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _walk_objects(value)
+
+
+def _completion(content: str):
+    return SimpleNamespace(
+        choices=[
+            SimpleNamespace(
+                finish_reason="stop", message=SimpleNamespace(content=content)
+            )
+        ]
+    )
+
+
+class _BadRequest(Exception):
+    status_code = 400
+
+
+@pytest.mark.parametrize("contract", ["cv_schema.json", "research_schema.json"])
+def test_strict_schema_requires_every_property(contract):
+    strict = strict_json_schema(load_contract_schema(contract))
+
+    objects = list(_walk_objects(strict))
+    assert objects
+    for node in objects:
+        assert node["additionalProperties"] is False
+        assert node["required"] == list(node["properties"])
+    text = json.dumps(strict)
+    for keyword in ('"minLength"', '"minItems"', '"format"', '"$schema"'):
+        assert keyword not in text
+
+
+def test_optional_properties_become_nullable():
+    schema = {
+        "type": "object",
+        "required": ["name"],
+        "properties": {
+            "name": {"type": "string", "minLength": 1},
+            "level": {"type": "string", "enum": ["low", "high"]},
+        },
+    }
+
+    strict = strict_json_schema(schema)
+
+    assert strict["properties"]["name"] == {"type": "string"}
+    assert strict["properties"]["level"] == {
+        "type": ["string", "null"],
+        "enum": ["low", "high", None],
+    }
+    # The original schema is left untouched for local validation
+    assert schema["properties"]["name"]["minLength"] == 1
+
+
+def test_clean_drops_nulls_of_optional_fields():
+    schema = {
+        "type": "object",
+        "required": ["items"],
+        "properties": {
+            "items": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "required": ["a"],
+                    "properties": {
+                        "a": {"type": "string"},
+                        "b": {"type": "string"},
+                        "c": {"type": ["string", "null"]},
+                    },
+                },
+            }
+        },
+    }
+    structured = StructuredOutput(schema, "test")
+
+    cleaned = structured.clean({"items": [{"a": "x", "b": None, "c": None}]})
+
+    assert cleaned == {"items": [{"a": "x", "c": None}]}
+
+
+def test_request_carries_strict_json_schema():
+    structured = StructuredOutput({"type": "object", "properties": {}}, "cv_schema")
+
+    response_format = structured.request["response_format"]
+    assert response_format["type"] == "json_schema"
+    assert response_format["json_schema"]["name"] == "cv_schema"
+    assert response_format["json_schema"]["strict"] is True
+
+
+def test_keys_restrict_schema_to_chunk(tmp_path: Path):
+    work = UnitOfWork(config=UserConfig(target_dir=tmp_path, structured_output=True))
+
+    structured = structured_output_for(work, "cv_schema.json", keys=["experiences"])
+
+    schema = structured.request["response_format"]["json_schema"]["schema"]
+    assert list(schema["properties"]) == ["experiences"]
+    assert schema["required"] == ["experiences"]
+
+
+def test_structured_output_is_off_by_default(tmp_path: Path):
+    work = UnitOfWork(config=UserConfig(target_dir=tmp_path))
+
+    assert structured_output_for(work, "cv_schema.json") is None
+
+
+def test_create_completion_counts_structured_replies():
+    usage = OpenAIUsage()
+    retryer = OpenAIRetry(retry=RetryConfig(), sleep=lambda _s: None, usage=usage)
+    requests = []
+
+    def _create(**request):
+        requests.append(request)
+        return _completion("{}")
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace()))
+    client.chat.completions.create = _create
+    structured = StructuredOutput({"type": "object", "properties": {}}, "s")
+
+    retryer.create_completion(client, op_name="op", model="m", **structured.request)
+
+    assert "response_format" in requests[0]
+    assert usage.structured == 1
+    assert "1 structured" in usage.format()
+
+
+def test_rejected_response_format_is_retried_without_it():
+    usage = OpenAIUsage()
+    retryer = OpenAIRetry(retry=RetryConfig(), sleep=lambda _s: None, usage=usage)
+    requests = []
+
+    def _create(**request):
+        requests.append(request)
+        if "response_format" in request:
+            raise _BadRequest("response_format is not supported with this model")
+        return _completion("{}")
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace()))
+    client.chat.completions.create = _create
+    structured = StructuredOutput({"type": "object", "properties": {}}, "s")
+
+    completion = retryer.create_completion(
+        client, op_name="op", model="m", **structured.request
+    )
+
+    assert completion.choices[0].message.content == "{}"
+    assert ["response_format" in r for r in requests] == [True, False]
+    assert usage.structured == 0
+
+
+def test_record_fallback_is_reported():
+    usage = OpenAIUsage()
+    OpenAIRetry(
+        retry=RetryConfig(), sleep=lambda _s: None, usage=usage
+    ).record_fallback()
+
+    assert usage.fallbacks == 1
+    assert "1 fallbacks" in usage.format()
+    assert OpenAIUsage().add(usage).fallbacks == 1
+
+
+def test_job_adjuster_sends_cv_schema_and_cleans_reply(
+    fake_openai, make_adjust_work, read_adjust_output
+):
+    cv = {
+        "identity": {
+            "title": "Engineer",
+            "full_name": "Ada L",
+            "first_name": "Ada",
+            "last_name": "L",
+        },
+        "sidebar": {"skills": ["Rust"]},
+        "overview": "x",
+        "experiences": [],
+    }
+    reply = json.loads(json.dumps(cv))
+    reply["overview"] = "tailored"
+    reply["sidebar"]["tools"] = None
+    fake_openai.reply = json.dumps(reply)
+
+    work = OpenAIJobSpecificAdjuster(api_key="k").adjust(
+        make_adjust_work(cv, structured=True), job_description="Rust"
+    )
+
+    (request,) = fake_openai.requests
+    schema = request["response_format"]["json_schema"]
+    assert schema["name"] == "cv_schema"
+    assert schema["strict"] is True
+    output = read_adjust_output(work)
+    assert output["overview"] == "tailored"
+    assert "tools" not in output["sidebar"]
+    assert work.step_states[StepName.Adjust].usage.structured == 1
+
+
+def test_job_adjuster_records_fallback_on_invalid_reply(
+    fake_openai, make_adjust_work, read_adjust_output
+):
+    cv = {"identity": {}, "sidebar": {}, "overview": "x", "experiences": []}
+    fake_openai.reply = "not json"
+
+    work = OpenAIJobSpecificAdjuster(api_key="k").adjust(
+        make_adjust_work(cv), job_description="Rust"
+    )
+
+    (request,) = fake_openai.requests
+    assert "response_format" not in request
+    assert read_adjust_output(work) == cv
+    assert work.step_states[StepName.Adjust].usage.fallbacks == 1
+
+
+def test_cli_flag_enables_structured_output(tmp_path: Path):
+    config = gather_user_requirements(
+        [
+            "--extract",
+            f"source={tmp_path / 'cv.docx'}",
+            "--target",
+            str(tmp_path),
+            "--structured-output",
+        ]
+    )
+
+    assert config.structured_output is True
@@ -0,0 +1,106 @@
+"""Tests for pre-flight prompt sizing of the OpenAI adjusters."""
+
+import json
+
+from cvextract.adjusters.token_budget import (
+    ModelLimits,
+    PayloadBudget,
+    compact_json,
+    estimate_tokens,
+    fits_output,
+    model_limits,
+    text_budget,
+    truncate_to_tokens,
+)
+
+
+def _experience(n: int, size: int = 400) -> dict:
+    return {"heading": f"Role {n}", "description": "x" * size, "bullets": []}
+
+
+def _cv(experiences: int, size: int = 400) -> dict:
+    return {
+        "identity": {"full_name": "Ada"},
+        "experiences": [_experience(n, size) for n in range(experiences)],
+    }
+
+
+def test_model_limits_match_most_specific_prefix():
+    assert model_limits("gpt-4o-mini") == ModelLimits(128_000, 16_384)
+    assert model_limits("gpt-4-0613").context_tokens == 8_192
+    assert model_limits("gpt-4.1-mini").context_tokens > 1_000_000
+    assert model_limits("some-new-model") == model_limits("gpt-4o")
+
+
+def test_estimate_tokens_counts_non_ascii_denser():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcd" * 100) == 100
+    assert estimate_tokens("ä" * 100) > estimate_tokens("a" * 100)
+
+
+def test_compact_json_is_minified():
+    assert compact_json({"a": [1, 2], "ü": "x"}) == '{"a":[1,2],"ü":"x"}'
+
+
+def test_truncate_to_tokens_cuts_at_word_boundary():
+    text = "alpha beta " * 100
+    cut = truncate_to_tokens(text, 20)
+    assert estimate_tokens(cut) <= 20
+    assert cut.endswith(("alpha", "beta"))
+    assert truncate_to_tokens("short", 20) == "short"
+
+
+def test_text_budget_shrinks_for_small_context_models():
+    assert text_budget("gpt-4o", 3000) == 3000
+    assert text_budget("gpt-4", 3000) == 1024
+
+
+def test_fitting_payload_is_sent_unchanged():
+    payload = {"original_json": _cv(3)}
+    budget = PayloadBudget("gpt-4o", "system", payload)
+    assert budget.fit() is payload
+    assert budget.trimmed == []
+
+
+def test_research_evidence_is_dropped_before_experiences():
+    research = {
+        "name": "Acme",
+        "domains": ["retail"],
+        "technology_signals": [
+            {"technology": "Rust", "signals": ["e" * 4000] * 8, "notes": "n"}
+        ],
+    }
+    payload = {"company_research": research, "original_json": _cv(3)}
+    # gpt-4 has an 8k context window
+    budget = PayloadBudget("gpt-4", "system", payload)
+
+    fitted = budget.fit()
+
+    assert budget.trimmed == ["research evidence"]
+    assert fitted["company_research"]["technology_signals"] == [{"technology": "Rust"}]
+    assert len(fitted["original_json"]["experiences"]) == 3
+    # The caller's payload is left untouched
+    assert "signals" in research["technology_signals"][0]
+
+
+def test_oldest_experiences_are_trimmed_and_restored():
+    cv = _cv(12, size=4000)
+    budget = PayloadBudget("gpt-4", "system", {"original_json": cv})
+
+    fitted = budget.fit()
+    sent = fitted["original_json"]["experiences"]
+
+    assert 1 <= len(sent) < 12
+    assert [e["heading"] for e in sent] == [f"Role {n}" for n in range(len(sent))]
+    assert estimate_tokens(compact_json(fitted)) < 8_192
+
+    adjusted = json.loads(json.dumps(fitted["original_json"]))
+    restored = budget.restore(adjusted)
+    assert [e["heading"] for e in restored["experiences"]] == [
+        f"Role {n}" for n in range(12)
+    ]
+
+
+def test_fits_output_uses_model_output_limit():
+    assert fits_output("gpt-4o", _cv(3))
+    assert not fits_output("gpt-3.5-turbo", _cv(20, size=1000))
@@ -8,11 +8,12 @@ import pytest
 
 from cvextract.adjusters.openai_translate_adjuster import (
     OpenAITranslateAdjuster,
-    _TextProtector,
     _collect_protected_terms,
+    _collect_translatable_strings,
     _load_cv_schema,
     _map_strings,
     _restore_protected_fields,
+    _TextProtector,
     _validate_cv_data,
 )
 from cvextract.cli_config import ExtractStage, UserConfig
@@ -166,9 +167,7 @@ def test_translate_adjuster_empty_completion_returns_original(
     assert output == cv_data
 
 
-def test_translate_adjuster_invalid_json_returns_original(
-    tmp_path: Path, monkeypatch
-):
+def test_translate_adjuster_invalid_json_returns_original(tmp_path: Path, monkeypatch):
     cv_data = _load_fixture("translate_input.json")
 
     completion = MagicMock()
@@ -208,9 +207,7 @@ def test_translate_adjuster_completion_choices_error_returns_original(
     assert output == cv_data
 
 
-def test_translate_adjuster_openai_error_returns_original(
-    tmp_path: Path, monkeypatch
-):
+def test_translate_adjuster_openai_error_returns_original(tmp_path: Path, monkeypatch):
     cv_data = _load_fixture("translate_input.json")
 
     class ExplodingRetry:
@@ -284,7 +281,23 @@ def test_translate_adjuster_requires_language_param(tmp_path: Path):
 def test_text_protector_skips_empty_and_duplicate_terms():
     protector = _TextProtector(["Python", "", "Python", "Go"])
 
-    assert len(protector._term_patterns) == 2
+    assert protector._terms == ["Python", "Go"]
+
+
+def test_text_protector_prefers_longest_term_and_restores():
+    protector = _TextProtector(["Java", "JavaScript", "Java EE", "C", "C++", "C#"])
+
+    text = "Java, JavaScript and Java EE with C, C++ and C# (see a@b.com)."
+    protected = protector.protect(text)
+
+    assert "Java" not in protected and "C#" not in protected
+    assert "a@b.com" not in protected
+    assert sorted(protector._replacements.values()) == sorted(
+        ["Java", "JavaScript", "Java EE", "C", "C++", "C#", "a@b.com"]
+    )
+    assert protector.restore(protected) == text
+    # Terms embedded in longer words stay untouched.
+    assert protector.protect("Javanese") == "Javanese"
 
 
 def test_validate_cv_data_experiences_errors():
@@ -510,3 +523,338 @@ def test_translate_adjuster_prompt_missing_returns_original(
     assert output_path is not None
     output = json.loads(output_path.read_text(encoding="utf-8"))
     assert output == cv_data
+
+
+# --------------------------
+# Batch mode (translation memory)
+# --------------------------
+
+
+@pytest.fixture
+def reset_translation_state(monkeypatch):
+    import cvextract.adjusters.openai_translate_adjuster as translate_module
+    import cvextract.adjusters.translation_memory as memory_module
+
+    monkeypatch.setattr(memory_module, "_MEMORIES", {})
+    monkeypatch.setattr(translate_module, "_BATCHERS", {})
+
+
+def _mock_openai_strings(monkeypatch, drop: tuple = ()) -> MagicMock:
+    """Mock OpenAI so string batches come back prefixed with 'DE:'."""
+    import cvextract.adjusters.openai_translate_adjuster as translate_module
+
+    def _create(**kwargs):
+        payload = json.loads(kwargs["messages"][1]["content"])
+        translations = {
+            idx: f"DE:{text}"
+            for idx, text in payload["strings"].items()
+            if text not in drop
+        }
+        completion = MagicMock()
+        completion.choices = [
+            MagicMock(
+                message=MagicMock(content=json.dumps({"translations": translations})),
+                finish_reason="stop",
+            )
+        ]
+        return completion
+
+    mock_client = MagicMock()
+    mock_client.chat.completions.create.side_effect = _create
+    monkeypatch.setattr(translate_module, "OpenAI", MagicMock(return_value=mock_client))
+    return mock_client
+
+
+def _sent_strings(mock_client: MagicMock) -> list:
+    sent = []
+    for call in mock_client.chat.completions.create.call_args_list:
+        payload = json.loads(call.kwargs["messages"][1]["content"])
+        sent.extend(payload["strings"].values())
+    return sent
+
+
+def _make_named_work(tmp_path: Path, name: str, cv_data: dict) -> UnitOfWork:
+    input_path = tmp_path / f"{name}.json"
+    input_path.write_text(json.dumps(cv_data), encoding="utf-8")
+    work = UnitOfWork(
+        config=UserConfig(target_dir=tmp_path, extract=ExtractStage(source=input_path)),
+        initial_input=input_path,
+    )
+    work.set_step_paths(
+        StepName.Adjust,
+        input_path=input_path,
+        output_path=tmp_path / "out" / f"{name}.json",
+    )
+    return work
+
+
+def test_collect_translatable_strings_skips_protected_fields():
+    cv_data = _load_fixture("translate_input.json")
+    strings = _collect_translatable_strings(cv_data)
+
+    assert "Software Engineer" in strings
+    assert "Led a team of 5 engineers." in strings
+    assert "Ada Lovelace" not in strings
+    assert "Docker" not in strings
+    assert "PostgreSQL" not in strings
+    assert len(strings) == len(set(strings))
+
+
+def test_translate_adjuster_batch_mode_rebuilds_cv(
+    tmp_path: Path, monkeypatch, reset_translation_state
+):
+    cv_data = _load_fixture("translate_input.json")
+    mock_client = _mock_openai_strings(monkeypatch)
+
+    adjuster = OpenAITranslateAdjuster(api_key="test-key", batch_window_s=0)
+    work = _make_named_work(tmp_path, "cv1", cv_data)
+    result = adjuster.adjust(work, language="de", batch="")
+
+    output = json.loads(
+        result.get_step_output(StepName.Adjust).read_text(encoding="utf-8")
+    )
+    assert output["overview"] == "DE:" + cv_data["overview"]
+    assert output["identity"]["title"] == "DE:Software Engineer"
+    assert output["identity"]["full_name"] == "Ada Lovelace"
+    assert output["sidebar"]["tools"] == cv_data["sidebar"]["tools"]
+    assert output["experiences"][0]["environment"] == ["Python", "PostgreSQL"]
+    assert mock_client.chat.completions.create.call_count == 1
+
+
+def test_translate_adjuster_batch_mode_reuses_memory_across_cvs(
+    tmp_path: Path, monkeypatch, reset_translation_state
+):
+    cv_one = _load_fixture("translate_input.json")
+    cv_two = json.loads(json.dumps(cv_one))
+    cv_two["overview"] = "Pragmatic engineer."
+    mock_client = _mock_openai_strings(monkeypatch)
+
+    adjuster = OpenAITranslateAdjuster(api_key="test-key", batch_window_s=0)
+    adjuster.adjust(_make_named_work(tmp_path, "cv1", cv_one), language="de", batch="")
+    first_sent = len(_sent_strings(mock_client))
+    adjuster.adjust(_make_named_work(tmp_path, "cv2", cv_two), language="de", batch="")
+
+    assert _sent_strings(mock_client)[first_sent:] == ["Pragmatic engineer."]
+
+
+def test_translate_adjuster_batch_mode_persists_memory(
+    tmp_path: Path, monkeypatch, reset_translation_state
+):
+    import cvextract.adjusters.openai_translate_adjuster as translate_module
+    import cvextract.adjusters.translation_memory as memory_module
+
+    cv_data = _load_fixture("translate_input.json")
+    mock_client = _mock_openai_strings(monkeypatch)
+    adjuster = OpenAITranslateAdjuster(api_key="test-key", batch_window_s=0)
+    adjuster.adjust(_make_named_work(tmp_path, "cv1", cv_data), language="de", batch="")
+
+    memory_file = tmp_path / "translation_memory" / "gpt-4o-mini.de.json"
+    assert memory_file.exists()
+
+    # Simulate a new process: drop in-memory state and translate again.
+    monkeypatch.setattr(memory_module, "_MEMORIES", {})
+    monkeypatch.setattr(translate_module, "_BATCHERS", {})
+    mock_client.chat.completions.create.reset_mock()
+    result = adjuster.adjust(
+        _make_named_work(tmp_path, "cv1", cv_data), language="de", batch=""
+    )
+
+    mock_client.chat.completions.create.assert_not_called()
+    output = json.loads(
+        result.get_step_output(StepName.Adjust).read_text(encoding="utf-8")
+    )
+    assert output["overview"] == "DE:" + cv_data["overview"]
+
+
+def test_translate_adjuster_batch_mode_splits_requests_by_batch_size(
+    tmp_path: Path, monkeypatch, reset_translation_state
+):
+    cv_data = _load_fixture("translate_input.json")
+    mock_client = _mock_openai_strings(monkeypatch)
+    n_strings = len(_collect_translatable_strings(cv_data))
+
+    adjuster = OpenAITranslateAdjuster(api_key="test-key", batch_window_s=0)
+    adjuster.adjust(
+        _make_named_work(tmp_path, "cv1", cv_data),
+        language="de",
+        batch="",
+        **{"batch-size": "2"},
+    )
+
+    assert mock_client.chat.completions.create.call_count == (n_strings + 1) // 2
+
+
+def test_translate_adjuster_batch_mode_missing_translation_returns_original(
+    tmp_path: Path, monkeypatch, reset_translation_state
+):
+    cv_data = _load_fixture("translate_input.json")
+    _mock_openai_strings(monkeypatch, drop=(cv_data["overview"],))
+
+    adjuster = OpenAITranslateAdjuster(api_key="test-key", batch_window_s=0)
+    result = adjuster.adjust(
+        _make_named_work(tmp_path, "cv1", cv_data), language="de", batch=""
+    )
+
+    output = json.loads(
+        result.get_step_output(StepName.Adjust).read_text(encoding="utf-8")
+    )
+    assert output == cv_data
+
+
+def test_translation_batcher_waits_for_inflight_strings():
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    from cvextract.adjusters.openai_translate_adjuster import _TranslationBatcher
+    from cvextract.adjusters.translation_memory import TranslationMemory
+
+    batcher = _TranslationBatcher(TranslationMemory(), window_s=0)
+    release = threading.Event()
+    sent = []
+
+    def _send(sources, terms):
+        sent.append(list(sources))
+        release.wait(timeout=5)
+        return {s: s.upper() for s in sources}
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first = pool.submit(batcher.translate, ["shared"], [], _send, lambda _: None)
+        while not sent:
+            pass
+        second = pool.submit(batcher.translate, ["shared"], [], _send, lambda _: None)
+        release.set()
+        assert first.result() == {"shared": "SHARED"}
+        assert second.result() == {"shared": "SHARED"}
+
+    assert sent == [["shared"]]
+
+
+def test_translation_memory_ignores_invalid_file(tmp_path: Path):
+    from cvextract.adjusters.translation_memory import TranslationMemory
+
+    path = tmp_path / "memory.json"
+    path.write_text("not json", encoding="utf-8")
+    memory = TranslationMemory(path)
+    assert len(memory) == 0
+
+    memory.put("Hello", "Hallo")
+    memory.save()
+    assert json.loads(path.read_text(encoding="utf-8")) == {"Hello": "Hallo"}
+
+
+def _make_large_cv(count: int) -> dict:
+    cv_data = _load_fixture("translate_input.json")
+    template = cv_data["experiences"][0]
+    cv_data["experiences"] = [
+        dict(template, heading=f"Role {i}", description=f"Description {i}.")
+        for i in range(count)
+    ]
+    return cv_data
+
+
+def _mock_openai_chunks(monkeypatch, truncate_above: int = 0) -> MagicMock:
+    """Echo each chunk with translated descriptions; truncate large chunks."""
+    import cvextract.adjusters.openai_translate_adjuster as translate_module
+
+    def _create(**kwargs):
+        payload = json.loads(kwargs["messages"][1]["content"])
+        chunk = payload["original_json"]
+        experiences = chunk.get("experiences", [])
+        finish_reason = "stop"
+        if truncate_above and len(experiences) > truncate_above:
+            finish_reason = "length"
+        translated = dict(chunk)
+        if "overview" in chunk:
+            translated["overview"] = "DE:" + chunk["overview"]
+        if "experiences" in chunk:
+            translated["experiences"] = [
+                dict(exp, description="DE:" + exp["description"]) for exp in experiences
+            ]
+        completion = MagicMock()
+        completion.choices = [
+            MagicMock(
+                message=MagicMock(content=json.dumps(translated)),
+                finish_reason=finish_reason,
+            )
+        ]
+        return completion
+
+    mock_client = MagicMock()
+    mock_client.chat.completions.create.side_effect = _create
+    monkeypatch.setattr(translate_module, "OpenAI", MagicMock(return_value=mock_client))
+    return mock_client
+
+
+def _sent_chunks(mock_client: MagicMock) -> list:
+    return [
+        json.loads(call.kwargs["messages"][1]["content"])["original_json"]
+        for call in mock_client.chat.completions.create.call_args_list
+    ]
+
+
+def test_translate_adjuster_chunks_large_cv(tmp_path: Path, monkeypatch):
+    cv_data = _make_large_cv(5)
+    mock_client = _mock_openai_chunks(monkeypatch)
+
+    adjuster = OpenAITranslateAdjuster(api_key="test-key")
+    result = adjuster.adjust(
+        _make_work(tmp_path, cv_data), language="de", **{"chunk-size": "2"}
+    )
+
+    chunks = _sent_chunks(mock_client)
+    assert len(chunks) == 4
+    assert sorted(len(c.get("experiences", [])) for c in chunks) == [0, 1, 2, 2]
+
+    output = json.loads(result.get_step_output(StepName.Adjust).read_text())
+    assert output["overview"] == "DE:" + cv_data["overview"]
+    assert output["identity"] == cv_data["identity"]
+    assert [e["heading"] for e in output["experiences"]] == [
+        f"Role {i}" for i in range(5)
+    ]
+    assert all(e["description"].startswith("DE:") for e in output["experiences"])
+
+
+def test_translate_adjuster_small_cv_uses_single_request(tmp_path: Path, monkeypatch):
+    cv_data = _make_large_cv(3)
+    mock_client = _mock_openai_chunks(monkeypatch)
+
+    adjuster = OpenAITranslateAdjuster(api_key="test-key", chunk_size=3)
+    adjuster.adjust(_make_work(tmp_path, cv_data), language="de")
+
+    assert mock_client.chat.completions.create.call_count == 1
+
+
+def test_translate_adjuster_splits_truncated_chunk(tmp_path: Path, monkeypatch):
+    cv_data = _make_large_cv(8)
+    mock_client = _mock_openai_chunks(monkeypatch, truncate_above=1)
+
+    adjuster = OpenAITranslateAdjuster(api_key="test-key", chunk_size=4)
+    result = adjuster.adjust(_make_work(tmp_path, cv_data), language="de")
+
+    output = json.loads(result.get_step_output(StepName.Adjust).read_text())
+    assert [e["heading"] for e in output["experiences"]] == [
+        f"Role {i}" for i in range(8)
+    ]
+    assert all(e["description"].startswith("DE:") for e in output["experiences"])
+    # head + 2 truncated groups of 4 + 2 truncated halves of 2 per group + 8 singles
+    assert mock_client.chat.completions.create.call_count == 1 + 2 + 4 + 8
+
+
+def test_translate_adjuster_chunk_failure_returns_original(tmp_path: Path, monkeypatch):
+    cv_data = _make_large_cv(4)
+    mock_client = _mock_openai_chunks(monkeypatch)
+    original_side_effect = mock_client.chat.completions.create.side_effect
+
+    def _create(**kwargs):
+        payload = json.loads(kwargs["messages"][1]["content"])
+        if "overview" in payload["original_json"]:
+            raise RuntimeError("boom")
+        return original_side_effect(**kwargs)
+
+    mock_client.chat.completions.create.side_effect = _create
+
+    adjuster = OpenAITranslateAdjuster(api_key="test-key", chunk_size=2)
+    result = adjuster.adjust(_make_work(tmp_path, cv_data), language="de")
+
+    output = json.loads(result.get_step_output(StepName.Adjust).read_text())
+    assert output == cv_data